@@ -22,7 +22,8 @@ Single source-of-truth migration for Maestro. Creates:
   Muse — filesystem commit history
   - muse_objects, muse_snapshots, muse_commits
     (includes parent2_commit_id for merge commits; metadata JSON blob for
-    commit-level annotations e.g. tempo_bpm set via ``muse tempo --set``)
+    commit-level annotations e.g. tempo_bpm set via ``muse tempo --set``;
+    changed_paths_bloom for path-limited history)
   - muse_tags (music-semantic tags attached to commits)
 
   Muse Hub — remote collaboration backend
@@ -30,7 +31,11 @@ Single source-of-truth migration for Maestro. Creates:
   - musehub_issue_milestones (many-to-many join: issues ↔ milestones)
   - musehub_pull_requests (PR workflow; merged_at records exact merge timestamp)
   - musehub_pr_comments (inline review comments on musical diffs within PRs)
-  - musehub_objects (content-addressed binary artifact storage)
+  - musehub_objects (per-repo references to content-addressed blobs, keyed by
+    (repo_id, object_id); blob_sha256 names the shared blob file; introduced_by
+    links each object to the push head that uploaded it)
+  - musehub_commit_objects (every object a push carried, keyed by the push's
+    head commit; negotiated pulls select objects through it)
   - musehub_stars (per-user repo starring for the explore/discover page)
   - musehub_profiles (public user profile pages — bio, avatar, pinned repos)
   - musehub_sessions (recording session metadata — participants, intent, commits)
@@ -42,6 +47,11 @@ Single source-of-truth migration for Maestro. Creates:
   - musehub_comments, musehub_reactions, musehub_follows, musehub_watches
   - musehub_notifications, musehub_forks, musehub_view_events, musehub_download_events
   - musehub_events (activity event stream)
+  - musehub_repo_stats (denormalized star/commit/fork/watcher counts per repo,
+    maintained on flush; indexed per explore sort order)
+  - musehub_search_documents (full-text search index over commits, repos,
+    issues and PRs; tsvector + pg_trgm GIN indexes; pg_trgm index on
+    muse_commits.message for in-repo search)
   - musehub_labels, musehub_issue_labels, musehub_pr_labels (label tagging)
   - musehub_collaborators (repo access control beyond owner)
   - musehub_stash, musehub_stash_entries (git-stash-style temporary shelving)
@@ -248,6 +258,7 @@ def upgrade() -> None:
         sa.Column("committed_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("metadata", sa.JSON(), nullable=True),
+        sa.Column("changed_paths_bloom", sa.LargeBinary(), nullable=True),
         sa.ForeignKeyConstraint(["snapshot_id"], ["muse_snapshots.snapshot_id"], ondelete="RESTRICT"),
         sa.PrimaryKeyConstraint("commit_id"),
     )
@@ -293,6 +304,7 @@ def upgrade() -> None:
     op.create_index("ix_musehub_repos_owner", "musehub_repos", ["owner"])
     op.create_index("ix_musehub_repos_slug", "musehub_repos", ["slug"])
     op.create_index("ix_musehub_repos_owner_user_id", "musehub_repos", ["owner_user_id"])
+    op.create_index("ix_musehub_repos_created_at", "musehub_repos", ["created_at"])
 
     op.create_table(
         "musehub_branches",
@@ -388,6 +400,7 @@ def upgrade() -> None:
     op.create_index("ix_musehub_issues_number", "musehub_issues", ["number"])
     op.create_index("ix_musehub_issues_state", "musehub_issues", ["state"])
     op.create_index("ix_musehub_issues_milestone_id", "musehub_issues", ["milestone_id"])
+    op.create_index("ix_musehub_issues_repo_state_number", "musehub_issues", ["repo_id", "state", "number"])
 
     # ── Muse Hub — issue comments ─────────────────────────────────────────
     op.create_table(
@@ -507,6 +520,8 @@ def upgrade() -> None:
         sa.Column("path", sa.String(1024), nullable=False),
         sa.Column("size_bytes", sa.Integer(), nullable=False, server_default="0"),
         sa.Column("disk_path", sa.String(2048), nullable=False),
+        sa.Column("blob_sha256", sa.String(64), nullable=True),
+        sa.Column("introduced_by", sa.String(64), nullable=True),
         sa.Column(
             "created_at",
             sa.DateTime(timezone=True),
@@ -514,9 +529,19 @@ def upgrade() -> None:
             server_default=sa.text("CURRENT_TIMESTAMP"),
         ),
         sa.ForeignKeyConstraint(["repo_id"], ["musehub_repos.repo_id"], ondelete="CASCADE"),
-        sa.PrimaryKeyConstraint("object_id"),
+        sa.PrimaryKeyConstraint("repo_id", "object_id"),
     )
     op.create_index("ix_musehub_objects_repo_id", "musehub_objects", ["repo_id"])
+    op.create_index("ix_musehub_objects_blob_sha256", "musehub_objects", ["blob_sha256"])
+    op.create_index("ix_musehub_objects_introduced_by", "musehub_objects", ["introduced_by"])
+    op.create_table(
+        "musehub_commit_objects",
+        sa.Column("repo_id", sa.String(36), nullable=False),
+        sa.Column("commit_id", sa.String(64), nullable=False),
+        sa.Column("object_id", sa.String(128), nullable=False),
+        sa.ForeignKeyConstraint(["repo_id"], ["musehub_repos.repo_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("repo_id", "commit_id", "object_id"),
+    )
 
     # ── Muse Hub — repo starring (explore/discover page) ─────────────────
     op.create_table(
@@ -839,6 +864,73 @@ def upgrade() -> None:
     op.create_index("ix_musehub_download_events_repo_id", "musehub_download_events", ["repo_id"])
     op.create_index("ix_musehub_download_events_created_at", "musehub_download_events", ["created_at"])
 
+    # ── MuseHub — materialized repo stats ───────────────────────────────
+    op.create_table(
+        "musehub_repo_stats",
+        sa.Column("repo_id", sa.String(36), nullable=False),
+        sa.Column("star_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("commit_count", sa.Integer(), nullable=False, server_default="0"),
+        # Newest commit timestamp; NULL until the first commit lands
+        sa.Column("latest_commit_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("fork_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("watcher_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
+        sa.ForeignKeyConstraint(["repo_id"], ["musehub_repos.repo_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("repo_id"),
+    )
+    op.create_index("ix_musehub_repo_stats_star_count", "musehub_repo_stats", ["star_count"])
+    op.create_index("ix_musehub_repo_stats_commit_count", "musehub_repo_stats", ["commit_count"])
+    op.create_index("ix_musehub_repo_stats_latest_commit_at", "musehub_repo_stats", ["latest_commit_at"])
+    op.create_index("ix_musehub_repo_stats_fork_count", "musehub_repo_stats", ["fork_count"])
+
+    # ── MuseHub — full-text search index ────────────────────────────────
+    op.create_table(
+        "musehub_search_documents",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        # repo | commit | issue | pull_request
+        sa.Column("kind", sa.String(20), nullable=False),
+        sa.Column("ref_id", sa.String(64), nullable=False),
+        sa.Column("repo_id", sa.String(36), nullable=False),
+        sa.Column("is_public", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("title", sa.Text(), nullable=False, server_default=""),
+        sa.Column("body", sa.Text(), nullable=False, server_default=""),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["repo_id"], ["musehub_repos.repo_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("kind", "ref_id", name="uq_musehub_search_documents_kind_ref"),
+    )
+    op.create_index(
+        "ix_musehub_search_documents_repo_kind", "musehub_search_documents", ["repo_id", "kind"]
+    )
+    op.create_index(
+        "ix_musehub_search_documents_public_kind", "musehub_search_documents", ["is_public", "kind"]
+    )
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Title terms rank above body terms; 'simple' keeps musical tokens (Cm7, 120bpm) unstemmed.
+    op.execute(
+        "ALTER TABLE musehub_search_documents ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('simple', title), 'A') || "
+        "setweight(to_tsvector('simple', body), 'B')) STORED"
+    )
+    op.execute(
+        "CREATE INDEX ix_musehub_search_documents_vector "
+        "ON musehub_search_documents USING gin (search_vector)"
+    )
+    op.execute(
+        "CREATE INDEX ix_musehub_search_documents_title_trgm "
+        "ON musehub_search_documents USING gin (title gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_musehub_search_documents_body_trgm "
+        "ON musehub_search_documents USING gin (body gin_trgm_ops)"
+    )
+    # In-repo search filters muse_commits with lower(message) LIKE '%term%'.
+    op.execute(
+        "CREATE INDEX ix_muse_commits_message_trgm "
+        "ON muse_commits USING gin (lower(message) gin_trgm_ops)"
+    )
+
     # ── MuseHub — render pipeline (Phase 5) ──────────────────────────────
     op.create_table(
         "musehub_render_jobs",
@@ -1068,6 +1160,22 @@ def downgrade() -> None:
     op.drop_index("ix_musehub_events_repo_id", table_name="musehub_events")
     op.drop_table("musehub_events")
 
+    # MuseHub — full-text search index
+    op.drop_index("ix_muse_commits_message_trgm", table_name="muse_commits")
+    op.drop_index("ix_musehub_search_documents_body_trgm", table_name="musehub_search_documents")
+    op.drop_index("ix_musehub_search_documents_title_trgm", table_name="musehub_search_documents")
+    op.drop_index("ix_musehub_search_documents_vector", table_name="musehub_search_documents")
+    op.drop_index("ix_musehub_search_documents_public_kind", table_name="musehub_search_documents")
+    op.drop_index("ix_musehub_search_documents_repo_kind", table_name="musehub_search_documents")
+    op.drop_table("musehub_search_documents")
+
+    # MuseHub — materialized repo stats
+    op.drop_index("ix_musehub_repo_stats_fork_count", table_name="musehub_repo_stats")
+    op.drop_index("ix_musehub_repo_stats_latest_commit_at", table_name="musehub_repo_stats")
+    op.drop_index("ix_musehub_repo_stats_commit_count", table_name="musehub_repo_stats")
+    op.drop_index("ix_musehub_repo_stats_star_count", table_name="musehub_repo_stats")
+    op.drop_table("musehub_repo_stats")
+
     # MuseHub — render pipeline (Phase 5)
     op.drop_index("ix_musehub_render_jobs_status", table_name="musehub_render_jobs")
     op.drop_index("ix_musehub_render_jobs_commit_id", table_name="musehub_render_jobs")
@@ -1145,6 +1253,9 @@ def downgrade() -> None:
     op.drop_table("musehub_stars")
 
     # Muse Hub — binary artifact storage (depends on repos)
+    op.drop_table("musehub_commit_objects")
+    op.drop_index("ix_musehub_objects_introduced_by", table_name="musehub_objects")
+    op.drop_index("ix_musehub_objects_blob_sha256", table_name="musehub_objects")
     op.drop_index("ix_musehub_objects_repo_id", table_name="musehub_objects")
     op.drop_table("musehub_objects")
 
@@ -1175,6 +1286,7 @@ def downgrade() -> None:
     op.drop_table("musehub_issue_milestones")
 
     # Muse Hub — issues (depends on repos and milestones)
+    op.drop_index("ix_musehub_issues_repo_state_number", table_name="musehub_issues")
     op.drop_index("ix_musehub_issues_milestone_id", table_name="musehub_issues")
     op.drop_index("ix_musehub_issues_state", table_name="musehub_issues")
     op.drop_index("ix_musehub_issues_number", table_name="musehub_issues")
@@ -1198,6 +1310,7 @@ def downgrade() -> None:
     op.drop_table("musehub_branches")
 
     # Muse Hub — repos (root)
+    op.drop_index("ix_musehub_repos_created_at", table_name="musehub_repos")
     op.drop_index("ix_musehub_repos_owner_user_id", table_name="musehub_repos")
     op.drop_index("ix_musehub_repos_slug", table_name="musehub_repos")
     op.drop_index("ix_musehub_repos_owner", table_name="musehub_repos")
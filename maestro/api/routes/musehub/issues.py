@@ -32,7 +32,11 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, R
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from maestro.auth.dependencies import TokenClaims, optional_token, require_valid_token
-from maestro.api.routes.musehub.pagination import PaginationParams, build_link_header, paginate_list
+from maestro.api.routes.musehub.pagination import (
+    PaginationParams,
+    build_cursor_link_header,
+    build_link_header,
+)
 from maestro.db import get_db
 from maestro.models.musehub import (
     IssueAssignRequest,
@@ -116,6 +120,7 @@ async def list_issues(
     state: str = Query("open", pattern="^(open|closed|all)$", description="Filter by state"),
     label: str | None = Query(None, description="Filter by label string"),
     milestone_id: str | None = Query(None, description="Filter by milestone UUID"),
+    q: str | None = Query(None, max_length=500, description="Words to find in title or body"),
     pagination: PaginationParams = Depends(PaginationParams),
     db: AsyncSession = Depends(get_db),
     claims: TokenClaims | None = Depends(optional_token),
@@ -127,9 +132,16 @@ async def list_issues(
     ``rel="prev"`` (when not on the first page), and ``rel="next"`` (when
     more pages remain).
 
+    For deep pages prefer keyset pagination via ``?cursor=N&limit=N``, where
+    the cursor is the number of the last issue already seen; the ``Link``
+    header then carries only ``rel="next"``. Either way filtering, paging and
+    comment counts run in SQL, so the cost does not grow with repo size.
+
     Use ``?state=all`` to include closed issues, ``?state=closed`` for closed only.
     Use ``?label=<string>`` to filter by a specific label.
     Use ``?milestone_id=<uuid>`` to filter to a specific milestone.
+    Use ``?q=<words>`` to keep issues whose title or body contains any of the
+    words (prefix match via the search index).
     """
     repo = await musehub_repository.get_repo(db, repo_id)
     if repo is None:
@@ -140,10 +152,40 @@ async def list_issues(
             detail="Authentication required to access private repos.",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    all_issues = await musehub_issues.list_issues(
-        db, repo_id, state=state, label=label, milestone_id=milestone_id
+    total = await musehub_issues.count_issues(
+        db, repo_id, state=state, label=label, milestone_id=milestone_id, query=q
+    )
+    if pagination.cursor is not None:
+        try:
+            after_number = int(pagination.cursor)
+        except ValueError:
+            after_number = 0 # malformed cursor — start from the beginning
+        page_issues = await musehub_issues.list_issues(
+            db,
+            repo_id,
+            state=state,
+            label=label,
+            milestone_id=milestone_id,
+            query=q,
+            after_number=after_number,
+            limit=pagination.limit,
+        )
+        if len(page_issues) == pagination.limit:
+            response.headers["Link"] = build_cursor_link_header(
+                request, str(page_issues[-1].number), pagination.limit
+            )
+        return IssueListResponse(issues=page_issues, total=total)
+
+    page_issues = await musehub_issues.list_issues(
+        db,
+        repo_id,
+        state=state,
+        label=label,
+        milestone_id=milestone_id,
+        query=q,
+        offset=(pagination.page - 1) * pagination.per_page,
+        limit=pagination.per_page,
     )
-    page_issues, total = paginate_list(all_issues, pagination.page, pagination.per_page)
     response.headers["Link"] = build_link_header(request, total, pagination.page, pagination.per_page)
     return IssueListResponse(issues=page_issues, total=total)
 
@@ -25,7 +25,7 @@ from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from maestro.auth.dependencies import TokenClaims, optional_token, require_valid_token
@@ -126,6 +126,27 @@ async def _get_label_or_404(db: AsyncSession, repo_id: str, label_id: str) -> La
     return LabelResponse(**dict(row))
 
 
+async def _get_labels_or_404(
+    db: AsyncSession, repo_id: str, label_ids: list[str]
+) -> list[LabelResponse]:
+    """Fetch several labels in one query, in *label_ids* order.
+
+    Raises 404 if any ID is not a label of the repo, before anything is written.
+    """
+    result = await db.execute(
+        text(
+            "SELECT id AS label_id, repo_id, name, color, description "
+            "FROM musehub_labels "
+            "WHERE repo_id = :repo_id AND id IN :label_ids"
+        ).bindparams(bindparam("label_ids", expanding=True)),
+        {"repo_id": repo_id, "label_ids": list(dict.fromkeys(label_ids))},
+    )
+    found = {row["label_id"]: LabelResponse(**dict(row)) for row in result.mappings()}
+    if any(label_id not in found for label_id in label_ids):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Label not found")
+    return [found[label_id] for label_id in label_ids]
+
+
 # ── Label CRUD ────────────────────────────────────────────────────────────────
 
 
@@ -355,19 +376,16 @@ async def assign_labels_to_issue(
     if issue_id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Issue not found")
 
-    assigned: list[LabelResponse] = []
-    for label_id in body.label_ids:
-        label = await _get_label_or_404(db, repo_id, label_id)
-        # Upsert — ignore duplicate assignments.
-        await db.execute(
-            text(
-                "INSERT INTO musehub_issue_labels (issue_id, label_id) "
-                "VALUES (:issue_id, :label_id) "
-                "ON CONFLICT DO NOTHING"
-            ),
-            {"issue_id": issue_id, "label_id": label_id},
-        )
-        assigned.append(label)
+    assigned = await _get_labels_or_404(db, repo_id, body.label_ids)
+    # Upsert — ignore duplicate assignments.
+    await db.execute(
+        text(
+            "INSERT INTO musehub_issue_labels (issue_id, label_id) "
+            "VALUES (:issue_id, :label_id) "
+            "ON CONFLICT DO NOTHING"
+        ),
+        [{"issue_id": issue_id, "label_id": label.label_id} for label in assigned],
+    )
 
     await db.commit()
     logger.info("✅ Assigned %d label(s) to issue #%s in repo %s", len(assigned), number, repo_id)
@@ -447,18 +465,15 @@ async def assign_labels_to_pr(
     if existing_pr_id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pull request not found")
 
-    assigned: list[LabelResponse] = []
-    for label_id in body.label_ids:
-        label = await _get_label_or_404(db, repo_id, label_id)
-        await db.execute(
-            text(
-                "INSERT INTO musehub_pr_labels (pr_id, label_id) "
-                "VALUES (:pr_id, :label_id) "
-                "ON CONFLICT DO NOTHING"
-            ),
-            {"pr_id": pr_id, "label_id": label_id},
-        )
-        assigned.append(label)
+    assigned = await _get_labels_or_404(db, repo_id, body.label_ids)
+    await db.execute(
+        text(
+            "INSERT INTO musehub_pr_labels (pr_id, label_id) "
+            "VALUES (:pr_id, :label_id) "
+            "ON CONFLICT DO NOTHING"
+        ),
+        [{"pr_id": pr_id, "label_id": label.label_id} for label in assigned],
+    )
 
     await db.commit()
     logger.info("✅ Assigned %d label(s) to PR %s in repo %s", len(assigned), pr_id, repo_id)
@@ -515,27 +530,27 @@ async def seed_default_labels(db: AsyncSession, repo_id: str) -> None:
     Skips any label whose name already exists in the repo (safe to call
     multiple times).
     """
-    for label_def in DEFAULT_LABELS:
-        existing = await db.execute(
-            text(
-                "SELECT 1 FROM musehub_labels "
-                "WHERE repo_id = :repo_id AND name = :name"
-            ),
-            {"repo_id": repo_id, "name": label_def["name"]},
-        )
-        if existing.scalar_one_or_none() is not None:
-            continue # Already seeded — skip.
+    existing = await db.execute(
+        text("SELECT name FROM musehub_labels WHERE repo_id = :repo_id"),
+        {"repo_id": repo_id},
+    )
+    seeded = set(existing.scalars())
+    missing = [label_def for label_def in DEFAULT_LABELS if label_def["name"] not in seeded]
+    if missing:
         await db.execute(
             text(
                 "INSERT INTO musehub_labels (id, repo_id, name, color, description, created_at) "
                 "VALUES (:label_id, :repo_id, :name, :color, :description, CURRENT_TIMESTAMP)"
             ),
-            {
-                "label_id": str(uuid.uuid4()),
-                "repo_id": repo_id,
-                "name": label_def["name"],
-                "color": label_def["color"],
-                "description": label_def.get("description"),
-            },
+            [
+                {
+                    "label_id": str(uuid.uuid4()),
+                    "repo_id": repo_id,
+                    "name": label_def["name"],
+                    "color": label_def["color"],
+                    "description": label_def.get("description"),
+                }
+                for label_def in missing
+            ],
         )
     logger.info("✅ Seeded default labels for repo %s", repo_id)
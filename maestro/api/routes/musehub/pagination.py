@@ -14,12 +14,18 @@ Usage (page-based):
         response: Response = None,
         ...
     ) -> IssueListResponse:
-        all_issues = await svc.list_issues(db, repo_id)
-        page_items, total = paginate_list(all_issues, pagination.page, pagination.per_page)
+        total = await svc.count_issues(db, repo_id)
+        page_items = await svc.list_issues(
+            db, repo_id,
+            offset=(pagination.page - 1) * pagination.per_page, limit=pagination.per_page,
+        )
         response.headers["Link"] = build_link_header(request, total, pagination.page, pagination.per_page)
         return IssueListResponse(issues=page_items, total=total)
 
-Usage (cursor-based, e.g. repos list):
+Prefer pushing the page window into the service query as above; use
+``paginate_list`` only when the service must materialize every row anyway.
+
+Usage (cursor-based, e.g. repos list or issues with ``?cursor=<last number>``):
     if result.next_cursor:
         response.headers["Link"] = build_cursor_link_header(request, result.next_cursor, limit)
 """
@@ -120,8 +126,8 @@ def build_cursor_link_header(request: Request, next_cursor: str, limit: int) ->
 def paginate_list(items: list[T], page: int, per_page: int) -> tuple[list[T], int]:
     """Slice a list to the requested page window.
 
-    Used for endpoints where the backing service fetches all matching rows (e.g.
-    after an in-memory label filter) and the route layer applies pagination.
+    Used for endpoints where the backing service has to fetch all matching rows
+    anyway and the route layer applies pagination.
 
     Args:
         items: Full result list from the service layer.
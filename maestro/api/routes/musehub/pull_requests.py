@@ -26,7 +26,7 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, R
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from maestro.auth.dependencies import TokenClaims, optional_token, require_valid_token
-from maestro.api.routes.musehub.pagination import PaginationParams, build_link_header, paginate_list
+from maestro.api.routes.musehub.pagination import PaginationParams, build_link_header
 from maestro.db import get_db
 from maestro.models.musehub import (
     PRCommentCreate,
@@ -128,6 +128,7 @@ async def list_pull_requests(
         pattern="^(open|merged|closed|all)$",
         description="Filter by state (open, merged, closed, all)",
     ),
+    q: str | None = Query(None, max_length=500, description="Words to find in title or body"),
     pagination: PaginationParams = Depends(PaginationParams),
     db: AsyncSession = Depends(get_db),
     claims: TokenClaims | None = Depends(optional_token),
@@ -140,6 +141,8 @@ async def list_pull_requests(
     more pages remain).
 
     Use ?state=open to filter to open PRs only. Defaults to all states.
+    Use ?q=<words> to keep PRs whose title or body contains any of the words
+    (prefix match via the search index).
     """
     repo = await musehub_repository.get_repo(db, repo_id)
     if repo is None:
@@ -150,8 +153,19 @@ async def list_pull_requests(
             detail="Authentication required to access private repos.",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    all_prs = await musehub_pull_requests.list_prs(db, repo_id, state=state)
-    page_prs, total = paginate_list(all_prs, pagination.page, pagination.per_page)
+    if q:
+        total = await musehub_pull_requests.count_prs(db, repo_id, state=state, query=q)
+    else:
+        counts = await musehub_pull_requests.count_prs_by_state(db, repo_id)
+        total = sum(counts.values()) if state == "all" else counts.get(state, 0)
+    page_prs = await musehub_pull_requests.list_prs(
+        db,
+        repo_id,
+        state=state,
+        query=q,
+        offset=(pagination.page - 1) * pagination.per_page,
+        limit=pagination.per_page,
+    )
     response.headers["Link"] = build_link_header(request, total, pagination.page, pagination.per_page)
     return PRListResponse(pull_requests=page_prs, total=total)
 
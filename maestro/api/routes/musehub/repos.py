@@ -767,15 +767,24 @@ async def get_agent_context(
     "/repos/{repo_id}/dag",
     response_model=DagGraphResponse,
     operation_id="getCommitDag",
-    summary="Get the full commit DAG for a repo",
+    summary="Get the commit DAG for a repo, whole or as a window of rows",
     tags=["Commits"],
 )
 async def get_commit_dag(
     repo_id: str,
+    limit: int | None = Query(
+        None, ge=1, le=1000, description="Rows to return (omit for the whole graph)"
+    ),
+    before: str | None = Query(
+        None, description="Return the rows just older than this commit"
+    ),
+    around: str | None = Query(
+        None, description="Return rows centred on this commit"
+    ),
     db: AsyncSession = Depends(get_db),
     claims: TokenClaims | None = Depends(optional_token),
 ) -> DagGraphResponse:
-    """Return the full commit history as a topologically sorted directed acyclic graph.
+    """Return the commit history as a topologically sorted directed acyclic graph.
 
     Nodes are ordered oldest→newest (Kahn's topological sort). Edges express
     child→parent relationships (``source`` = child commit, ``target`` = parent
@@ -785,13 +794,27 @@ async def get_commit_dag(
     Content negotiation: always returns JSON. The UI page fetches this endpoint
     with the stored JWT and renders it client-side with an SVG-based renderer.
 
-    Performance: all commits are fetched (no limit) to ensure the graph is
-    complete. For repos with 100+ commits the response may be several KB; the
-    client-side renderer virtualises visible nodes.
+    Performance: the topological order and lane of every commit are cached
+    per repo and extended when new commits arrive, so a request only loads
+    the commits it returns. Pass ``limit`` to fetch a window — the newest
+    rows, the rows before a commit (``before``) or around one (``around``) —
+    instead of the whole graph. Each node carries its ``row`` and ``lane``
+    in the full layout; ``total`` and ``windowStart`` tell the client what
+    is left to fetch.
     """
     repo = await musehub_repository.get_repo(db, repo_id)
     _guard_visibility(repo, claims)
-    return await musehub_repository.list_commits_dag(db, repo_id)
+    if before is not None and around is not None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="Pass at most one of before and around",
+        )
+    try:
+        return await musehub_repository.list_commits_dag(
+            db, repo_id, limit=limit, before=before, around=around
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
 
 
 @router.get(
@@ -35,11 +35,12 @@ from xml.etree.ElementTree import Element, SubElement, tostring
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import PlainTextResponse, Response
-from sqlalchemy import func, outerjoin, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from maestro.db import get_db
 from maestro.db import musehub_models as db
+from maestro.db.musehub_stats_models import MusehubRepoStats
 
 logger = logging.getLogger(__name__)
 
@@ -157,28 +158,15 @@ async def _fetch_sitemap_entries(
         )
 
     # ── 2. Public repos (with latest commit timestamp) ────────────────────────
-    latest_commit_col = func.max(db.MusehubCommit.timestamp).label("latest_commit")
     repo_q = (
         select(
             db.MusehubRepo.owner,
             db.MusehubRepo.slug,
             db.MusehubRepo.created_at,
-            latest_commit_col,
-        )
-        .select_from(
-            outerjoin(
-                db.MusehubRepo,
-                db.MusehubCommit,
-                db.MusehubRepo.repo_id == db.MusehubCommit.repo_id,
-            )
+            MusehubRepoStats.latest_commit_at,
         )
+        .outerjoin(MusehubRepoStats, MusehubRepoStats.repo_id == db.MusehubRepo.repo_id)
         .where(db.MusehubRepo.visibility == "public")
-        .group_by(
-            db.MusehubRepo.repo_id,
-            db.MusehubRepo.owner,
-            db.MusehubRepo.slug,
-            db.MusehubRepo.created_at,
-        )
         .limit(_SITEMAP_URL_LIMIT)
     )
     repo_rows = await session.execute(repo_q)
@@ -54,6 +54,7 @@ from maestro.db.musehub_models import (
     MusehubViewEvent,
     MusehubWatch,
 )
+from maestro.db.musehub_stats_models import recompute_repo_stats
 from maestro.services import musehub_repository
 
 logger = logging.getLogger(__name__)
@@ -542,6 +543,8 @@ async def unwatch_repo(
             MusehubWatch.repo_id == repo_id,
         )
     )
+    # A Core DELETE skips the stats flush hook; rebuild this repo's counters.
+    await db.run_sync(lambda session: recompute_repo_stats(session.connection(), [repo_id]))
     await db.commit()
 
 
@@ -639,7 +642,8 @@ async def fork_repo(
     """Create a fork of the given repo under the calling user's account.
 
     Creates a new repo owned by the caller, copies all commits and branches
-    from the source into the new repo, then records the fork lineage.
+    from the source into the new repo, references the source's objects
+    (rows only — the blobs are shared), then records the fork lineage.
     The fork's description is prefixed with "Fork of {owner}/{slug}" so the
     repo home page can display a "Forked from" badge.
     """
@@ -690,6 +694,11 @@ async def fork_repo(
             name=branch.name,
             head_commit_id=branch.head_commit_id,
         ))
+    # Object rows reference shared blobs, so the fork gets every file at no
+    # extra disk cost.
+    await mhr.copy_repo_objects(
+        db, source_repo_id=repo_id, target_repo_id=fork_repo_row.repo_id
+    )
 
     await db.commit()
     await db.refresh(fork_record)
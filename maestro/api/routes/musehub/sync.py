@@ -2,9 +2,11 @@
 
 Endpoint summary:
   POST /musehub/repos/{repo_id}/push — batch-commit and object upload
+  POST /musehub/repos/{repo_id}/push/pack — push streamed as a binary pack
   POST /musehub/repos/{repo_id}/pull — fetch missing commits and objects
+  POST /musehub/repos/{repo_id}/pull/pack — negotiated pull, streamed as a binary pack
 
-Both endpoints require a valid JWT Bearer token. No business logic lives
+All endpoints require a valid JWT Bearer token. No business logic lives
 here — all persistence is delegated to maestro.services.musehub_sync.
 
 After a successful push, embeddings are computed for the new commits and
@@ -15,13 +17,15 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from maestro.auth.dependencies import TokenClaims, require_valid_token
 from maestro.db import get_db
 from maestro.models.musehub import (
     CommitInput,
+    PackPullRequest,
     PullRequest,
     PullResponse,
     PushEventPayload,
@@ -29,7 +33,11 @@ from maestro.models.musehub import (
     PushResponse,
 )
 from maestro.services import musehub_repository, musehub_sync
-from maestro.services.musehub_render_pipeline import trigger_render_background
+from maestro.services.musehub_pack import PACK_MEDIA_TYPE, PackFormatError
+from maestro.services.musehub_render_pipeline import (
+    trigger_render_background,
+    trigger_render_from_disk_background,
+)
 from maestro.services.musehub_sync import embed_push_commits
 from maestro.services.musehub_webhook_dispatcher import dispatch_event_background
 
@@ -130,6 +138,99 @@ async def push(
     return result
 
 
+@router.post(
+    "/repos/{repo_id}/push/pack",
+    response_model=PushResponse,
+    operation_id="pushPack",
+    summary="Push commits and objects streamed as a binary pack",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {PACK_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}}},
+        }
+    },
+)
+async def push_pack(
+    repo_id: str,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    claims: TokenClaims = Depends(require_valid_token),
+) -> PushResponse:
+    """Streaming push: the body is an ``application/x-muse-pack`` stream.
+
+    Same semantics and background tasks as ``/push``, but object bytes are
+    never decoded into the request model. Each object is spooled to disk as
+    its frames arrive, SHA-256 verified against its ``object_id`` and moved
+    into place; a malformed pack is rejected with 400, a digest mismatch
+    with 422, and neither stores anything in the database.
+    """
+    repo = await musehub_repository.get_repo(db, repo_id)
+    if repo is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Repo not found")
+
+    author: str = claims.get("sub") or "unknown"
+    is_public = (repo.visibility == "public")
+
+    try:
+        result = await musehub_sync.ingest_push_pack(
+            db,
+            repo_id=repo_id,
+            chunks=request.stream(),
+            author=author,
+        )
+    except PackFormatError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "bad_pack", "message": str(exc)},
+        )
+    except ValueError as exc:
+        if str(exc) == "non_fast_forward":
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={"error": "non_fast_forward"},
+            )
+        if str(exc) == "object_digest_mismatch":
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail={"error": "object_digest_mismatch"},
+            )
+        raise
+
+    await db.commit()
+
+    head_commit_id = result.response.remote_head
+    background_tasks.add_task(
+        embed_push_commits,
+        commits=result.commits,
+        repo_id=repo_id,
+        branch=result.branch,
+        author=author,
+        is_public=is_public,
+    )
+    background_tasks.add_task(
+        trigger_render_from_disk_background,
+        repo_id=repo_id,
+        commit_id=head_commit_id,
+        objects=result.objects,
+    )
+    push_payload: PushEventPayload = {
+        "repoId": repo_id,
+        "branch": result.branch,
+        "headCommitId": head_commit_id,
+        "pushedBy": author,
+        "commitCount": len(result.commits),
+    }
+    background_tasks.add_task(
+        dispatch_event_background,
+        repo_id,
+        "push",
+        push_payload,
+    )
+
+    return result.response
+
+
 @router.post(
     "/repos/{repo_id}/pull",
     response_model=PullResponse,
@@ -163,3 +264,36 @@ async def pull(
         have_commits=body.have_commits,
         have_objects=body.have_objects,
     )
+
+
+@router.post(
+    "/repos/{repo_id}/pull/pack",
+    response_class=StreamingResponse,
+    operation_id="pullPack",
+    summary="Stream missing commits and objects as a binary pack",
+)
+async def pull_pack(
+    repo_id: str,
+    body: PackPullRequest,
+    db: AsyncSession = Depends(get_db),
+    _: TokenClaims = Depends(require_valid_token),
+) -> StreamingResponse:
+    """Negotiated pull: the caller sends its tips, not its full inventory.
+
+    The Hub walks ancestry from the branch head, stopping at any tip it
+    knows, and streams the missing commits and object bytes as an
+    ``application/x-muse-pack`` body (see ``maestro.services.musehub_pack``).
+    The missing set is resolved before the response starts, so the stream
+    itself only reads object files.
+    """
+    repo = await musehub_repository.get_repo(db, repo_id)
+    if repo is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Repo not found")
+
+    plan = await musehub_sync.plan_pull_pack(
+        db,
+        repo_id=repo_id,
+        branch=body.branch,
+        have_tips=body.have_tips,
+    )
+    return StreamingResponse(musehub_sync.stream_pull_pack(plan), media_type=PACK_MEDIA_TYPE)
@@ -28,12 +28,13 @@ from typing import Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import Text, desc, func, outerjoin, select
+from sqlalchemy import Text, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from maestro.auth.dependencies import TokenClaims, optional_token, require_valid_token
 from maestro.db import get_db
 from maestro.db import musehub_models as db
+from maestro.db.musehub_stats_models import MusehubRepoStats
 from maestro.models.musehub import ExploreRepoResult, RepoResponse
 
 logger = logging.getLogger(__name__)
@@ -201,22 +202,10 @@ async def list_repos_by_topic(
     tag_lower = tag.lower()
     offset = (max(page, 1) - 1) * page_size
 
-    star_count_col = func.count(db.MusehubStar.star_id).label("star_count")
-    latest_commit_col = func.max(db.MusehubCommit.timestamp).label("latest_commit")
-
+    stats = MusehubRepoStats
     base_q = (
-        select(db.MusehubRepo, star_count_col, latest_commit_col)
-        .select_from(
-            outerjoin(
-                outerjoin(
-                    db.MusehubRepo,
-                    db.MusehubStar,
-                    db.MusehubRepo.repo_id == db.MusehubStar.repo_id,
-                ),
-                db.MusehubCommit,
-                db.MusehubRepo.repo_id == db.MusehubCommit.repo_id,
-            )
-        )
+        select(db.MusehubRepo, stats.star_count, stats.commit_count, stats.latest_commit_at)
+        .join(stats, stats.repo_id == db.MusehubRepo.repo_id)
         .where(db.MusehubRepo.visibility == "public")
         .where(
             # Cross-engine compat: cast JSON tags to text and check for the tag.
@@ -224,7 +213,6 @@ async def list_repos_by_topic(
             # e.g. "jazz" should not match "jazz-fusion".
             func.cast(db.MusehubRepo.tags, Text).ilike(f'%"{tag_lower}"%')
         )
-        .group_by(db.MusehubRepo.repo_id)
     )
 
     # Count before pagination
@@ -233,9 +221,11 @@ async def list_repos_by_topic(
 
     # Apply sort
     if effective_sort == "stars":
-        base_q = base_q.order_by(desc("star_count"), desc(db.MusehubRepo.created_at))
+        base_q = base_q.order_by(desc(stats.star_count), desc(db.MusehubRepo.created_at))
     else: # "updated"
-        base_q = base_q.order_by(desc("latest_commit"), desc(db.MusehubRepo.created_at))
+        base_q = base_q.order_by(
+            stats.latest_commit_at.desc().nulls_last(), desc(db.MusehubRepo.created_at)
+        )
 
     rows = (await db_session.execute(base_q.offset(offset).limit(page_size))).all()
 
@@ -250,8 +240,8 @@ async def list_repos_by_topic(
             tags=list(row.MusehubRepo.tags or []),
             key_signature=row.MusehubRepo.key_signature,
             tempo_bpm=row.MusehubRepo.tempo_bpm,
-            star_count=row.star_count or 0,
-            commit_count=0,
+            star_count=row.star_count,
+            commit_count=row.commit_count,
             created_at=row.MusehubRepo.created_at,
         )
         for row in rows
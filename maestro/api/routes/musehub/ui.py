@@ -945,29 +945,16 @@ async def pr_list_page(
 ) -> Response:
     """Render the PR list page with SSR data and HTMX fragment support.
 
-    Fetches open, merged, and closed PR counts server-side and renders the
-    active tab's rows. Returns a bare fragment when ``HX-Request: true`` so
+    Fetches open, merged, and closed PR counts in one grouped query and
+    renders the active tab's rows, sorted in SQL. Returns a bare fragment when ``HX-Request: true`` so
     HTMX tab switches only swap the ``#pr-rows`` container.
     """
     repo_id, base_url = await _resolve_repo(owner, repo_slug, db)
 
-    open_prs = await musehub_pull_requests.list_prs(db, repo_id, state="open")
-    merged_prs = await musehub_pull_requests.list_prs(db, repo_id, state="merged")
-    closed_prs = await musehub_pull_requests.list_prs(db, repo_id, state="closed")
-
-    if state == "merged":
-        active_prs = merged_prs
-    elif state == "closed":
-        active_prs = closed_prs
-    elif state == "all":
-        active_prs = open_prs + merged_prs + closed_prs
-    else:
-        active_prs = open_prs
-
-    if sort == "oldest":
-        active_prs = sorted(active_prs, key=lambda p: p.created_at)
-    else:
-        active_prs = sorted(active_prs, key=lambda p: p.created_at, reverse=True)
+    counts = await musehub_pull_requests.count_prs_by_state(db, repo_id)
+    active_prs = await musehub_pull_requests.list_prs(
+        db, repo_id, state=state, newest_first=sort != "oldest"
+    )
 
     ctx: dict[str, object] = {
         "owner": owner,
@@ -976,9 +963,9 @@ async def pr_list_page(
         "base_url": base_url,
         "current_page": "pulls",
         "prs": [p.model_dump() for p in active_prs],
-        "open_count": len(open_prs),
-        "merged_count": len(merged_prs),
-        "closed_count": len(closed_prs),
+        "open_count": counts["open"],
+        "merged_count": counts["merged"],
+        "closed_count": counts["closed"],
         "state": state,
         "active_sort": sort,
         "breadcrumb_data": _breadcrumbs(
@@ -1084,45 +1071,48 @@ async def issue_list_page(
 ) -> Response:
     """Render the issue list page with full server-side data and HTMX fragment support.
 
-    Fetches open/closed counts, applies label/milestone/assignee/author filters
-    server-side, paginates the result, and renders either a full page or a bare
-    HTMX fragment depending on the ``HX-Request`` header.
+    Fetches open/closed counts, then applies label/milestone/assignee/author
+    filters, sorting and pagination in SQL so only the current page is loaded.
+    Renders either a full page or a bare HTMX fragment depending on the
+    ``HX-Request`` header.
 
     No JWT required — issue data is publicly readable.
     """
     repo_id, base_url = await _resolve_repo(owner, repo_slug, db)
 
-    # Fetch all open and closed issues for counts and assignee collection.
-    all_open = await musehub_issues.list_issues(db, repo_id, state="open")
-    all_closed = await musehub_issues.list_issues(db, repo_id, state="closed")
-    open_count = len(all_open)
-    closed_count = len(all_closed)
+    # State counts for the tabs, in one grouped query.
+    state_counts = await musehub_issues.count_issues_by_state(db, repo_id)
+    open_count = state_counts["open"]
+    closed_count = state_counts["closed"]
 
-    # Fetch filtered issues for the active state (label + milestone applied in service).
-    filtered = await musehub_issues.list_issues(
-        db, repo_id, state=state, label=label, milestone_id=milestone_id
+    # Filter, sort and paginate in SQL; only the current page is loaded.
+    total = await musehub_issues.count_issues(
+        db,
+        repo_id,
+        state=state,
+        label=label,
+        milestone_id=milestone_id,
+        assignee=assignee or None,
+        author=author or None,
     )
-
-    # Apply remaining Python-side filters (assignee, author).
-    if assignee:
-        filtered = [i for i in filtered if i.assignee == assignee]
-    if author:
-        q = author.lower()
-        filtered = [i for i in filtered if q in (i.author or "").lower()]
-
-    # Server-side sort.
+    total_pages = max(1, (total + per_page - 1) // per_page)
+    issue_sort: musehub_issues.IssueSort = "newest"
     if sort == "oldest":
-        filtered.sort(key=lambda i: i.created_at)
+        issue_sort = "oldest"
     elif sort == "most-commented":
-        filtered.sort(key=lambda i: i.comment_count, reverse=True)
-    else:
-        filtered.sort(key=lambda i: i.created_at, reverse=True)
-
-    # Pagination.
-    total = len(filtered)
-    offset = (page - 1) * per_page
-    page_issues = filtered[offset : offset + per_page]
-    total_pages = max(1, (total + per_page - 1) // per_page)
+        issue_sort = "most-commented"
+    page_issues = await musehub_issues.list_issues(
+        db,
+        repo_id,
+        state=state,
+        label=label,
+        milestone_id=milestone_id,
+        assignee=assignee or None,
+        author=author or None,
+        sort=issue_sort,
+        offset=(page - 1) * per_page,
+        limit=per_page,
+    )
 
     # Labels for the filter sidebar (all labels in the repo).
     label_rows = (
@@ -1138,9 +1128,8 @@ async def issue_list_page(
     milestone_data = await musehub_issues.list_milestones(db, repo_id, state="open")
     milestones_data = milestone_data.milestones
 
-    # Collect unique assignees from all issues (both states) for the filter dropdown.
-    all_issues_combined = all_open + all_closed
-    assignees = sorted({i.assignee for i in all_issues_combined if i.assignee})
+    # Unique assignees across all issues (both states) for the filter dropdown.
+    assignees = await musehub_issues.list_issue_assignees(db, repo_id)
 
     ctx: dict[str, object] = {
         "owner": owner,
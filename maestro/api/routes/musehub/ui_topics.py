@@ -28,7 +28,7 @@ from pathlib import Path
 from fastapi import APIRouter, Depends, Query, Request
 from fastapi.templating import Jinja2Templates
 from pydantic import Field
-from sqlalchemy import Text, desc, func, outerjoin, select
+from sqlalchemy import Text, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import Response as StarletteResponse
 
@@ -37,6 +37,7 @@ from maestro.api.routes.musehub.topics import TopicItem, TopicReposResponse
 from maestro.auth.dependencies import TokenClaims, optional_token
 from maestro.db import get_db
 from maestro.db import musehub_models as db
+from maestro.db.musehub_stats_models import MusehubRepoStats
 from maestro.models.base import CamelModel
 from maestro.models.musehub import ExploreRepoResult
 
@@ -178,38 +179,27 @@ async def _fetch_topic_repos(
     tag_lower = tag.lower()
     offset = (max(page, 1) - 1) * page_size
 
-    star_count_col = func.count(db.MusehubStar.star_id).label("star_count")
-    latest_commit_col = func.max(db.MusehubCommit.timestamp).label("latest_commit")
-
+    stats = MusehubRepoStats
     base_q = (
-        select(db.MusehubRepo, star_count_col, latest_commit_col)
-        .select_from(
-            outerjoin(
-                outerjoin(
-                    db.MusehubRepo,
-                    db.MusehubStar,
-                    db.MusehubRepo.repo_id == db.MusehubStar.repo_id,
-                ),
-                db.MusehubCommit,
-                db.MusehubRepo.repo_id == db.MusehubCommit.repo_id,
-            )
-        )
+        select(db.MusehubRepo, stats.star_count, stats.commit_count, stats.latest_commit_at)
+        .join(stats, stats.repo_id == db.MusehubRepo.repo_id)
         .where(db.MusehubRepo.visibility == "public")
         .where(
             # Cross-engine compat: cast JSON array to text and search for the
             # tag wrapped in quotes to prevent substring false positives.
             func.cast(db.MusehubRepo.tags, Text).ilike(f'%"{tag_lower}"%')
         )
-        .group_by(db.MusehubRepo.repo_id)
     )
 
     count_q = select(func.count()).select_from(base_q.subquery())
     total: int = (await db_session.execute(count_q)).scalar_one()
 
     if sort == "updated":
-        base_q = base_q.order_by(desc("latest_commit"), desc(db.MusehubRepo.created_at))
+        base_q = base_q.order_by(
+            stats.latest_commit_at.desc().nulls_last(), desc(db.MusehubRepo.created_at)
+        )
     else:
-        base_q = base_q.order_by(desc("star_count"), desc(db.MusehubRepo.created_at))
+        base_q = base_q.order_by(desc(stats.star_count), desc(db.MusehubRepo.created_at))
 
     rows = (await db_session.execute(base_q.offset(offset).limit(page_size))).all()
 
@@ -224,8 +214,8 @@ async def _fetch_topic_repos(
             tags=list(row.MusehubRepo.tags or []),
             key_signature=row.MusehubRepo.key_signature,
             tempo_bpm=row.MusehubRepo.tempo_bpm,
-            star_count=row.star_count or 0,
-            commit_count=0,
+            star_count=row.star_count,
+            commit_count=row.commit_count,
             created_at=row.MusehubRepo.created_at,
         )
         for row in rows
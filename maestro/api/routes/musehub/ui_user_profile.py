@@ -34,6 +34,7 @@ from starlette.responses import Response as StarletteResponse
 
 from maestro.db import get_db
 from maestro.db import musehub_models as dbm
+from maestro.db.musehub_stats_models import MusehubRepoStats
 from maestro.models.base import CamelModel
 
 logger = logging.getLogger(__name__)
@@ -361,58 +362,35 @@ async def _build_pinned_repos(
     if not pinned_repo_ids:
         return []
 
-    repo_result = await session.execute(
-        select(dbm.MusehubRepo).where(
-            dbm.MusehubRepo.repo_id.in_(pinned_repo_ids),
-            dbm.MusehubRepo.deleted_at.is_(None),
+    stats = MusehubRepoStats
+    rows = (
+        await session.execute(
+            select(dbm.MusehubRepo, stats.star_count, stats.fork_count)
+            .outerjoin(stats, stats.repo_id == dbm.MusehubRepo.repo_id)
+            .where(
+                dbm.MusehubRepo.repo_id.in_(pinned_repo_ids),
+                dbm.MusehubRepo.deleted_at.is_(None),
+            )
         )
-    )
-    repos = list(repo_result.scalars())
+    ).all()
 
     # Preserve pinned order
-    repo_map = {r.repo_id: r for r in repos}
-    ordered = [repo_map[rid] for rid in pinned_repo_ids if rid in repo_map][:6]
-
-    if not ordered:
-        return []
-
-    ordered_ids = [r.repo_id for r in ordered]
-
-    # Star counts
-    star_result = await session.execute(
-        select(
-            dbm.MusehubStar.repo_id,
-            func.count(dbm.MusehubStar.star_id).label("cnt"),
-        )
-        .where(dbm.MusehubStar.repo_id.in_(ordered_ids))
-        .group_by(dbm.MusehubStar.repo_id)
-    )
-    star_counts = {row.repo_id: int(row.cnt) for row in star_result}
-
-    # Fork counts (repos forked FROM these repos)
-    fork_result = await session.execute(
-        select(
-            dbm.MusehubFork.source_repo_id,
-            func.count(dbm.MusehubFork.fork_id).label("cnt"),
-        )
-        .where(dbm.MusehubFork.source_repo_id.in_(ordered_ids))
-        .group_by(dbm.MusehubFork.source_repo_id)
-    )
-    fork_counts = {row.source_repo_id: int(row.cnt) for row in fork_result}
+    row_map = {row.MusehubRepo.repo_id: row for row in rows}
+    ordered = [row_map[rid] for rid in pinned_repo_ids if rid in row_map][:6]
 
     return [
         PinnedRepoCard(
-            repo_id=r.repo_id,
-            name=r.name,
-            slug=r.slug,
-            owner=r.owner,
-            description=r.description or "",
-            star_count=star_counts.get(r.repo_id, 0),
-            fork_count=fork_counts.get(r.repo_id, 0),
-            language=next((t for t in (r.tags or []) if "lang:" in t.lower()), ""),
-            primary_genre=_extract_genre(r.tags or []),
+            repo_id=row.MusehubRepo.repo_id,
+            name=row.MusehubRepo.name,
+            slug=row.MusehubRepo.slug,
+            owner=row.MusehubRepo.owner,
+            description=row.MusehubRepo.description or "",
+            star_count=row.star_count or 0,
+            fork_count=row.fork_count or 0,
+            language=next((t for t in (row.MusehubRepo.tags or []) if "lang:" in t.lower()), ""),
+            primary_genre=_extract_genre(row.MusehubRepo.tags or []),
         )
-        for r in ordered
+        for row in ordered
     ]
 
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections.abc import AsyncIterator
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Header, Query
 from fastapi.responses import StreamingResponse
 
 from maestro.auth.dependencies import require_valid_token
@@ -75,37 +75,61 @@ def _envelope_to_protocol_dict(envelope: AnyEnvelope) -> dict[str, object]:
         }
 
 
+def _envelope_to_sse(envelope: AnyEnvelope) -> str:
+    """Emit an envelope as a Wire Protocol SSE event whose ``id`` is its sequence.
+
+    Browsers send the last ``id`` back as ``Last-Event-ID`` when they
+    reconnect, which resumes the stream after that event.
+    """
+    return f"id: {envelope.sequence}\n" + emit(parse_event(_envelope_to_protocol_dict(envelope)))
+
+
+def _resume_sequence(from_sequence: int, last_event_id: str | None) -> int:
+    """Resume point: the later of ``?from_sequence`` and a numeric ``Last-Event-ID``."""
+    if last_event_id is not None and last_event_id.strip().isdigit():
+        return max(from_sequence, int(last_event_id))
+    return from_sequence
+
+
 @router.get("/variation/stream")
 async def stream_variation(
     variation_id: str,
     from_sequence: int = Query(default=0, ge=0, description="Resume from sequence"),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
     token_claims: TokenClaims = Depends(require_valid_token),
 ) -> StreamingResponse:
     """
     Stream variation events via SSE using Wire Protocol.
 
     Emits typed protocol events (meta, phrase, done, error)
-    validated through the protocol emitter.
+    validated through the protocol emitter. Each event carries
+    ``id: <sequence>``.
+
+    Supports late-join replay via ?from_sequence=N or the standard
+    ``Last-Event-ID`` reconnect header, whichever is later.
 
-    Supports late-join replay via ?from_sequence=N.
+    The variation may be generating on another API worker: the
+    broadcaster's history (filled by fan-out) stands in for the
+    record, and its end-of-stream marker for the terminal status.
     """
     vstore = get_variation_store()
     record = vstore.get(variation_id)
-    if record is None:
+    broadcaster = get_sse_broadcaster()
+    if record is None and not broadcaster.has_stream(variation_id):
         raise HTTPException(status_code=404, detail={
             "error": "Variation not found",
             "variationId": variation_id,
         })
 
+    resume_from = _resume_sequence(from_sequence, last_event_id)
     guard = ProtocolGuard()
+    terminal = is_terminal(record.status) if record is not None else broadcaster.is_closed(variation_id)
 
-    if is_terminal(record.status):
+    if terminal:
         async def replay_stream() -> AsyncIterator[str]:
-            broadcaster = get_sse_broadcaster()
-            for envelope in broadcaster.get_history(variation_id, from_sequence):
+            for envelope in broadcaster.get_history(variation_id, resume_from):
                 try:
-                    event_dict = _envelope_to_protocol_dict(envelope)
-                    yield emit(parse_event(event_dict))
+                    yield _envelope_to_sse(envelope)
                 except ProtocolSerializationError as exc:
                     logger.error(f"❌ Variation replay protocol error: {exc}")
                     yield emit(ErrorEvent(message="Protocol serialization failure"))
@@ -117,8 +141,7 @@ async def stream_variation(
             headers=_sse_headers(),
         )
 
-    broadcaster = get_sse_broadcaster()
-    queue = broadcaster.subscribe(variation_id, from_sequence=from_sequence)
+    queue = broadcaster.subscribe(variation_id, from_sequence=resume_from)
 
     async def live_stream() -> AsyncIterator[str]:
         try:
@@ -133,8 +156,7 @@ async def stream_variation(
                     break
 
                 try:
-                    event_dict = _envelope_to_protocol_dict(envelope)
-                    yield emit(parse_event(event_dict))
+                    yield _envelope_to_sse(envelope)
                 except ProtocolSerializationError as exc:
                     logger.error(f"❌ Variation stream protocol error: {exc}")
                     yield emit(ErrorEvent(message="Protocol serialization failure"))
@@ -120,6 +120,7 @@ class Settings(BaseSettings):
     storpheus_max_concurrent: int = 2 # max parallel submit+poll cycles (serializes GPU access)
     storpheus_poll_timeout: int = 30 # seconds — long-poll timeout per /jobs/{id}/wait request
     storpheus_poll_max_attempts: int = 10 # max polls before giving up (~5 min total)
+    storpheus_job_stream: bool = True # receive job results over one /jobs/events stream per worker; polls when unavailable
     storpheus_cb_threshold: int = 3 # consecutive failures before circuit breaker trips
     storpheus_cb_cooldown: int = 120 # seconds before tripped circuit allows a probe request
     storpheus_required: bool = True # hard-gate: abort composition if pre-flight health check fails
@@ -195,10 +196,29 @@ class Settings(BaseSettings):
     maestro_mcp_url: str | None = None # e.g. http://localhost:10001
     mcp_token: str | None = None # JWT for Authorization: Bearer when proxying
 
-    # Muse Hub object storage — binary artifacts (MIDI, MP3, WebP) written here as
-    # flat files under <musehub_objects_dir>/<repo_id>/<object_id>.
+    # Muse Hub object storage — binary artifacts (MIDI, MP3, WebP) written here once
+    # per SHA-256 under <musehub_objects_dir>/blobs/<aa>/<sha256>, shared by all repos.
     # Mount this path on a persistent volume in production.
     musehub_objects_dir: str = "/data/musehub/objects"
+    # Threads that write pushed object bytes to musehub_objects_dir. Bounds both
+    # disk concurrency and how many object chunks a push holds in flight.
+    musehub_object_write_workers: int = 4
+    # Processes that rasterize piano-roll PNGs for pushed MIDI. 0 renders on a
+    # thread in the API process instead (local dev, tests).
+    musehub_render_workers: int = 2
+
+    # Variation SSE replay history, per variation. The oldest events are evicted
+    # once any limit is exceeded; a client resuming with Last-Event-ID can only
+    # replay what is still retained.
+    variation_stream_history_events: int = 1000
+    variation_stream_history_bytes: int = 4 * 1024 * 1024
+    variation_stream_history_seconds: float = 3600.0
+    # Events buffered per SSE subscriber before it catches up from history instead.
+    variation_stream_queue_size: int = 256
+    # Directory of UNIX sockets through which API workers forward variation events
+    # to each other. Required when running more than one worker; unset keeps
+    # events in-process.
+    variation_stream_fanout_dir: str | None = None # e.g. /run/maestro/fanout
 
     # Webhook secret encryption key — AES-256 (Fernet) key for encrypting webhook signing
     # secrets at rest in musehub_webhooks.secret. Generate with:
@@ -21,6 +21,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from maestro.contracts.json_types import JSONValue
 from maestro.contracts.project_types import ProjectContext
+from maestro.core.undo_log import UndoLog
 
 logger = logging.getLogger(__name__)
 
@@ -186,14 +187,18 @@ class EntityRegistry:
             ...
     """
     
-    def __init__(self, project_id: str | None = None):
+    def __init__(self, project_id: str | None = None, undo_log: UndoLog | None = None):
         """
         Initialize a new entity registry.
         
         Args:
             project_id: Optional project ID for scoping. If None, generates one.
+            undo_log: Log that records inverses of registry writes while a
+                transaction is open. StateStore passes its own; standalone
+                registries get a private one that never records.
         """
         self.project_id = project_id or str(uuid.uuid4())
+        self._undo = undo_log if undo_log is not None else UndoLog()
         
         # Entity storage by type
         self._tracks: dict[str, EntityInfo] = {} # id -> EntityInfo
@@ -221,13 +226,11 @@ class EntityRegistry:
         reflects exactly the current project — no stale tracks or regions
         from a previous project or deleted entities.
         """
-        self._tracks.clear()
-        self._regions.clear()
-        self._buses.clear()
-        self._track_names.clear()
-        self._region_names.clear()
-        self._bus_names.clear()
-        self._track_regions.clear()
+        for attr in (
+            "_tracks", "_regions", "_buses",
+            "_track_names", "_region_names", "_bus_names", "_track_regions",
+        ):
+            self._undo.set_attr(self, attr, {})
 
     # =========================================================================
     # Entity Creation
@@ -251,9 +254,9 @@ class EntityRegistry:
             owner_agent_id=owner_agent_id,
         )
         
-        self._tracks[track_id] = entity
-        self._track_names[name.lower()] = track_id
-        self._track_regions[track_id] = []
+        self._undo.set_item(self._tracks, track_id, entity)
+        self._undo.set_item(self._track_names, name.lower(), track_id)
+        self._undo.set_item(self._track_regions, track_id, [])
         
         logger.debug(f"🎹 Registered track: {name} → {track_id[:8]}")
         return track_id
@@ -323,9 +326,9 @@ class EntityRegistry:
             owner_agent_id=owner_agent_id,
         )
         
-        self._regions[region_id] = entity
-        self._region_names[name.lower()] = region_id
-        self._track_regions[parent_track_id].append(region_id)
+        self._undo.set_item(self._regions, region_id, entity)
+        self._undo.set_item(self._region_names, name.lower(), region_id)
+        self._undo.extend(self._track_regions[parent_track_id], [region_id])
         
         logger.debug(f"📍 Registered region: {name} → {region_id[:8]} (track: {parent_track_id[:8]})")
         return region_id
@@ -346,8 +349,8 @@ class EntityRegistry:
             metadata=_coerce_metadata(metadata),
         )
         
-        self._buses[bus_id] = entity
-        self._bus_names[name.lower()] = bus_id
+        self._undo.set_item(self._buses, bus_id, entity)
+        self._undo.set_item(self._bus_names, name.lower(), bus_id)
         
         logger.debug(f"🔊 Registered bus: {name} → {bus_id[:8]}")
         return bus_id
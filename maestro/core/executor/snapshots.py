@@ -25,7 +25,7 @@ def capture_base_snapshot(store: "StateStore") -> SnapshotBundle:
     without observing side effects.
     """
     return SnapshotBundle(
-        notes=deepcopy(store._region_notes),
+        notes=store.get_all_region_notes(),
         cc=deepcopy(store._region_cc),
         pitch_bends=deepcopy(store._region_pitch_bends),
         aftertouch=deepcopy(store._region_aftertouch),
@@ -39,7 +39,7 @@ def capture_proposed_snapshot(store: "StateStore") -> SnapshotBundle:
     distinguishes intent (pre-execution vs post-execution).
     """
     return SnapshotBundle(
-        notes=deepcopy(store._region_notes),
+        notes=store.get_all_region_notes(),
         cc=deepcopy(store._region_cc),
         pitch_bends=deepcopy(store._region_pitch_bends),
         aftertouch=deepcopy(store._region_aftertouch),
@@ -40,7 +40,7 @@ def _get_incomplete_tracks(
         if not regions:
             incomplete.append(track.name)
         elif not any(
-            r.id in regions_with_notes_this_iter or bool(store.get_region_notes(r.id))
+            r.id in regions_with_notes_this_iter or store.get_region_note_count(r.id) > 0
             for r in regions
         ):
             incomplete.append(track.name)
@@ -351,7 +351,7 @@ def _build_tool_result(
         result["regionId"] = _scalar(region_id)
         result["notesAdded"] = len(notes) if isinstance(notes, (list, tuple)) else 0
         rid = region_id if isinstance(region_id, str) else ""
-        result["totalNotes"] = len(store.get_region_notes(rid)) if rid else 0
+        result["totalNotes"] = store.get_region_note_count(rid) if rid else 0
 
     elif tool_name == "stori_clear_notes":
         result["regionId"] = _scalar(params.get("regionId", ""))
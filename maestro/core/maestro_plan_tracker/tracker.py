@@ -646,7 +646,7 @@ class _PlanTracker:
                 continue
             regions = store.registry.get_track_regions(track.id)
             has_notes = any(
-                bool(store.get_region_notes(r.id)) for r in regions
+                store.get_region_note_count(r.id) > 0 for r in regions
             ) if regions else False
             if not has_notes:
                 self.steps.append(_PlanStep(
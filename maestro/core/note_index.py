@@ -0,0 +1,213 @@
+"""Per-region note index for StateStore.
+
+A region's notes are kept ordered by start beat in parallel arrays: start
+beats and insertion sequence numbers in compact ``array`` columns, the note
+dicts themselves in a list. Notes that start on the same beat keep their
+insertion order. A hash from ``(pitch, start tick)`` to entries answers
+"which notes match these removal criteria" without a scan.
+
+- ``add`` — one ``bisect.insort``-style insert per note for small batches,
+  a merge-sort rebuild for large ones.
+- ``remove_matching`` — hash lookup per criterion, then deletion by bisect;
+  large batches are compacted in one pass.
+- ``between`` — notes sounding inside a beat range, found by bisecting on
+  start beats.
+
+Matching follows :func:`notes_match`: same pitch, start and duration equal
+within ``NOTE_MATCH_TOLERANCE`` beats, snake_case keys only. Start ticks are
+``NOTE_MATCH_TOLERANCE`` wide, so candidates for a criterion live in its
+own tick bucket or one of the two neighbouring buckets.
+
+Entries removed by ``remove_matching`` or added by ``add`` can be handed
+back to ``restore`` / ``discard`` to undo the operation exactly, including
+the original order among notes on the same beat.
+"""
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+
+from maestro.contracts.json_types import InternalNoteDict
+
+NOTE_MATCH_TOLERANCE = 1e-6
+
+# Batches larger than this rebuild the arrays in one pass instead of
+# inserting or deleting entries one at a time.
+_BULK_THRESHOLD = 32
+
+_NoteKey = tuple[int | None, int]
+# (sequence number, note) — the sequence number breaks ties between notes
+# that start on the same beat and identifies the entry for undo.
+NoteEntry = tuple[int, InternalNoteDict]
+
+
+def notes_match(existing: InternalNoteDict, criteria: InternalNoteDict) -> bool:
+    """Check if an existing note matches removal criteria.
+
+    Matching on pitch + start_beat + duration_beats (snake_case only).
+    """
+    if existing.get("pitch") != criteria.get("pitch"):
+        return False
+    if abs(existing.get("start_beat", 0) - criteria.get("start_beat", 0)) > NOTE_MATCH_TOLERANCE:
+        return False
+    if abs(existing.get("duration_beats", 0) - criteria.get("duration_beats", 0)) > NOTE_MATCH_TOLERANCE:
+        return False
+    return True
+
+
+def _order_start(note: InternalNoteDict) -> float:
+    """Start beat used for ordering; notes synced from the DAW may be camelCase."""
+    start = note.get("start_beat")
+    if start is None:
+        start = note.get("startBeat", 0.0)
+    return float(start)
+
+
+def _duration(note: InternalNoteDict) -> float:
+    duration = note.get("duration_beats")
+    if duration is None:
+        duration = note.get("durationBeats", 0.0)
+    return float(duration)
+
+
+def _tick(beat: float) -> int:
+    return math.floor(beat / NOTE_MATCH_TOLERANCE)
+
+
+def _match_key(note: InternalNoteDict) -> _NoteKey:
+    return note.get("pitch"), _tick(note.get("start_beat", 0))
+
+
+class RegionNoteIndex:
+    """The notes of one region, ordered by start beat and hashed for matching."""
+
+    __slots__ = ("_starts", "_seqs", "_notes", "_by_key", "_next_seq", "_max_duration")
+
+    def __init__(self, notes: Iterable[InternalNoteDict] = ()) -> None:
+        self._starts = array("d")
+        self._seqs = array("q")
+        self._notes: list[InternalNoteDict] = []
+        self._by_key: dict[_NoteKey, list[NoteEntry]] = {}
+        self._next_seq = 0
+        # Upper bound on note duration; never lowered, so range queries stay correct.
+        self._max_duration = 0.0
+        self.add(list(notes))
+
+    def __len__(self) -> int:
+        return len(self._notes)
+
+    def __bool__(self) -> bool:
+        return bool(self._notes)
+
+    def __iter__(self) -> Iterator[InternalNoteDict]:
+        return iter(self._notes)
+
+    def notes(self) -> list[InternalNoteDict]:
+        """Return the stored notes in order. The dicts are live — copy before handing out."""
+        return list(self._notes)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def between(self, start_beat: float, end_beat: float) -> list[InternalNoteDict]:
+        """Return notes sounding in ``[start_beat, end_beat)``, in order."""
+        lo = bisect_left(self._starts, start_beat - self._max_duration)
+        hi = bisect_left(self._starts, end_beat)
+        return [
+            note
+            for start, note in zip(self._starts[lo:hi], self._notes[lo:hi])
+            if start + _duration(note) > start_beat or start >= start_beat
+        ]
+
+    def find_matching(self, criteria: InternalNoteDict) -> list[NoteEntry]:
+        """Return every entry whose note matches *criteria*."""
+        pitch, tick = _match_key(criteria)
+        found: list[NoteEntry] = []
+        for bucket_tick in (tick - 1, tick, tick + 1):
+            for entry in self._by_key.get((pitch, bucket_tick), ()):
+                if notes_match(entry[1], criteria):
+                    found.append(entry)
+        return found
+
+    # ------------------------------------------------------------------
+    # Mutations
+    # ------------------------------------------------------------------
+
+    def add(self, notes: list[InternalNoteDict]) -> list[NoteEntry]:
+        """Insert *notes* after any notes already on the same beat; return their entries."""
+        entries: list[NoteEntry] = []
+        for note in notes:
+            entries.append((self._next_seq, note))
+            self._next_seq += 1
+        self._insert(entries)
+        return entries
+
+    def restore(self, entries: list[NoteEntry]) -> None:
+        """Re-insert entries previously returned by :meth:`remove_matching`."""
+        self._insert(entries)
+
+    def remove_matching(self, criteria: Iterable[InternalNoteDict]) -> list[NoteEntry]:
+        """Remove every note matching any of *criteria*; return the removed entries."""
+        removed: dict[int, NoteEntry] = {}
+        for criterion in criteria:
+            for entry in self.find_matching(criterion):
+                removed[entry[0]] = entry
+        self.discard(list(removed.values()))
+        return list(removed.values())
+
+    def discard(self, entries: list[NoteEntry]) -> None:
+        """Remove exactly *entries* (as returned by :meth:`add`)."""
+        if not entries:
+            return
+        for entry in entries:
+            key = _match_key(entry[1])
+            bucket = self._by_key[key]
+            bucket.remove(entry)
+            if not bucket:
+                del self._by_key[key]
+        if len(entries) > _BULK_THRESHOLD:
+            gone = {seq for seq, _ in entries}
+            self._rebuild([e for e in self._entries() if e[0] not in gone])
+            return
+        for seq, note in entries:
+            i = self._position(_order_start(note), seq)
+            del self._starts[i]
+            del self._seqs[i]
+            del self._notes[i]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _entries(self) -> Iterator[NoteEntry]:
+        return zip(self._seqs, self._notes)
+
+    def _position(self, start: float, seq: int) -> int:
+        lo = bisect_left(self._starts, start)
+        hi = bisect_right(self._starts, start, lo)
+        return bisect_left(self._seqs, seq, lo, hi)
+
+    def _insert(self, entries: list[NoteEntry]) -> None:
+        if not entries:
+            return
+        for entry in entries:
+            self._by_key.setdefault(_match_key(entry[1]), []).append(entry)
+            self._max_duration = max(self._max_duration, _duration(entry[1]))
+        if len(entries) > _BULK_THRESHOLD:
+            self._rebuild([*self._entries(), *entries])
+            return
+        for seq, note in entries:
+            start = _order_start(note)
+            i = self._position(start, seq)
+            self._starts.insert(i, start)
+            self._seqs.insert(i, seq)
+            self._notes.insert(i, note)
+
+    def _rebuild(self, entries: list[NoteEntry]) -> None:
+        entries.sort(key=lambda e: (_order_start(e[1]), e[0]))
+        self._starts = array("d", (_order_start(note) for _, note in entries))
+        self._seqs = array("q", (seq for seq, _ in entries))
+        self._notes = [note for _, note in entries]
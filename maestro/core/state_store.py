@@ -9,7 +9,7 @@ StateStore MAY:
     - Provide versioned state via ``get_state_id()``.
     - Support transactions with rollback for plan execution.
     - Sync from the DAW via ``sync_from_client()``.
-    - Provide immutable snapshots via ``get_region_notes()`` (returns deepcopy).
+    - Provide immutable snapshots via ``get_region_notes()`` (returns copies).
 
 StateStore MUST NOT:
     - Be accessed directly by Muse commit logic. Muse receives snapshots
@@ -32,19 +32,35 @@ StateStore IS NOT:
 Architecture:
     StateStore (persistent per session, versioned)
         └── EntityRegistry (derived view, fast lookups)
-        └── EventLog (append-only mutation history)
-        └── Snapshots (periodic full state captures)
+        └── EventLog (append-only mutation history, bounded)
+        └── UndoLog (inverse writes of the open transaction)
+
+Each region's notes live in a :class:`~maestro.core.note_index.RegionNoteIndex`,
+ordered by start beat and hashed on (pitch, start), so batch removals and
+beat-range queries do not scan the region. Note readers therefore return
+notes in start-beat order (insertion order only among notes on the same
+beat), not in the order they were added.
+
+Transactions do not copy state. While one is open, every write to the
+registry, note indexes, CC/pitch-bend/aftertouch maps and project metadata records its
+inverse in the shared :class:`~maestro.core.undo_log.UndoLog`; commit drops
+the log and rollback replays it. Begin and commit are O(1), rollback is
+O(writes in the transaction). The event log keeps the most recent
+``_EVENT_LOG_LIMIT`` events — older ones are compacted away, never those of
+the open transaction.
 """
 
 from __future__ import annotations
 
+import bisect
 import logging
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from copy import deepcopy
-from typing_extensions import TypedDict
+from functools import partial
+from typing import TypeVar
 
 from maestro.contracts.project_types import ProjectContext
 from maestro.contracts.json_types import (
@@ -61,9 +77,17 @@ from maestro.contracts.json_types import (
     StateEventData,
 )
 from maestro.core.entity_registry import EntityMetadata, EntityRegistry, EntityInfo, EntityType
+from maestro.core.note_index import RegionNoteIndex
+from maestro.core.undo_log import UndoLog
 
 logger = logging.getLogger(__name__)
 
+# Events retained in StateStore's log. Compaction runs once the log doubles,
+# so appends stay amortized O(1).
+_EVENT_LOG_LIMIT = 1000
+
+_E = TypeVar("_E")
+
 
 class EventType(str, Enum):
     """Types of state mutation events."""
@@ -132,42 +156,6 @@ class Transaction:
         return not self.committed and not self.rolled_back
 
 
-class _ProjectMetadataSnapshot(TypedDict, total=False):
-    """Versioned musical-metadata slice stored inside ``StateSnapshot.project_metadata``.
-
-    All fields are optional (``total=False``) — a snapshot only captures
-    what has been set on the ``StateStore`` at that version. Absent fields
-    should be treated as "unchanged from the previous snapshot".
-
-    Attributes:
-        tempo: Project tempo in BPM (whole integer — see Tempo Convention in
-            ``docs/reference/type_contracts.md``).
-        key: Root key string, e.g. ``"Am"`` or ``"C#"``.
-        time_signature: ``(numerator, denominator)`` tuple, e.g. ``(4, 4)``.
-        _region_notes: Snapshot of all MIDI notes per region ID at this version.
-        _region_cc: Snapshot of all MIDI CC events per region ID.
-        _region_pitch_bends: Snapshot of all pitch bend events per region ID.
-        _region_aftertouch: Snapshot of all aftertouch events per region ID.
-    """
-
-    tempo: int
-    key: str
-    time_signature: tuple[int, int]
-    _region_notes: RegionNotesMap
-    _region_cc: RegionCCMap
-    _region_pitch_bends: RegionPitchBendMap
-    _region_aftertouch: RegionAftertouchMap
-
-
-@dataclass
-class StateSnapshot:
-    """A full snapshot of state at a specific version."""
-    version: int
-    timestamp: datetime
-    registry_data: dict[str, object]
-    project_metadata: _ProjectMetadataSnapshot
-
-
 _CAMEL_TO_SNAKE: dict[str, str] = {
     "startBeat": "start_beat",
     "durationBeats": "duration_beats",
@@ -236,21 +224,6 @@ def _normalize_note(note: NoteDict | InternalNoteDict) -> InternalNoteDict:
     return result
 
 
-def _notes_match(existing: InternalNoteDict, criteria: InternalNoteDict) -> bool:
-    """Check if an existing note matches removal criteria.
-
-    Matching on pitch + start_beat + duration_beats (snake_case only).
-    """
-    _TOL = 1e-6
-    if existing.get("pitch") != criteria.get("pitch"):
-        return False
-    if abs(existing.get("start_beat", 0) - criteria.get("start_beat", 0)) > _TOL:
-        return False
-    if abs(existing.get("duration_beats", 0) - criteria.get("duration_beats", 0)) > _TOL:
-        return False
-    return True
-
-
 @dataclass
 class CompositionState:
     """Tracks evolving Orpheus composition state across sections and instruments.
@@ -304,15 +277,17 @@ class StateStore:
         self.project_id = project_id or str(uuid.uuid4())
         
         # Core state
-        self._registry = EntityRegistry(project_id=self.project_id)
+        self._undo = UndoLog()
+        self._registry = EntityRegistry(project_id=self.project_id, undo_log=self._undo)
         self._version: int = 0
         self._events: list[StateEvent] = []
-        self._snapshots: list[StateSnapshot] = []
         self._active_transaction: Transaction | None = None
+        # Index of the active transaction's TRANSACTION_START in _events
+        self._tx_event_start: int = 0
         
-        # Materialized note store: region_id -> list of note dicts
+        # Materialized note store: region_id -> notes ordered by start beat
         # Maintained by add_notes/remove_notes; queryable after commit
-        self._region_notes: RegionNotesMap = {}
+        self._region_notes: dict[str, RegionNoteIndex] = {}
 
         # MIDI CC, pitch bend, and aftertouch stores: region_id -> list of event dicts
         self._region_cc: RegionCCMap = {}
@@ -381,17 +356,16 @@ class StateStore:
         if self._active_transaction and self._active_transaction.is_active:
             raise RuntimeError("Transaction already active. Commit or rollback first.")
         
-        # Take snapshot FIRST, before any transaction events
-        # This captures the state we'll restore to on rollback
-        self._take_snapshot()
+        # From here on every write records its inverse for rollback
+        self._undo.begin()
         
         tx = Transaction(
             id=str(uuid.uuid4()),
             started_at=datetime.now(timezone.utc),
         )
         self._active_transaction = tx
+        self._tx_event_start = len(self._events)
         
-        # Record transaction start AFTER snapshot
         self._append_event(
             event_type=EventType.TRANSACTION_START,
             entity_type=None,
@@ -425,6 +399,7 @@ class StateStore:
         
         transaction.committed = True
         self._active_transaction = None
+        self._undo.discard()
         
         logger.info(f"✅ Transaction committed: {transaction.id[:8]} ({len(transaction.events)} events)")
     
@@ -439,18 +414,11 @@ class StateStore:
         if not transaction.is_active:
             raise ValueError("Transaction is not active")
         
-        # Find the snapshot before this transaction
-        rollback_snapshot = None
-        for snapshot in reversed(self._snapshots):
-            if snapshot.version < transaction.events[0].version if transaction.events else self._version:
-                rollback_snapshot = snapshot
-                break
-        
-        if rollback_snapshot:
-            self._restore_snapshot(rollback_snapshot)
+        reverted_writes = self._undo.undo()
         
-        # Remove transaction events
-        self._events = [e for e in self._events if e.transaction_id != transaction.id]
+        # Remove transaction events — all of them follow its start marker
+        start = self._tx_event_start
+        self._events[start:] = [e for e in self._events[start:] if e.transaction_id != transaction.id]
         
         # Record rollback event
         self._append_event(
@@ -464,7 +432,10 @@ class StateStore:
         transaction.rolled_back = True
         self._active_transaction = None
         
-        logger.warning(f"⏪ Transaction rolled back: {transaction.id[:8]} ({len(transaction.events)} events reverted)")
+        logger.warning(
+            f"⏪ Transaction rolled back: {transaction.id[:8]} "
+            f"({len(transaction.events)} events, {reverted_writes} writes reverted)"
+        )
     
     # =========================================================================
     # Entity Creation (with event sourcing)
@@ -569,7 +540,7 @@ class StateStore:
                 is tagged with the transaction so it can be rolled back atomically.
         """
         old_tempo = self._tempo
-        self._tempo = tempo
+        self._undo.set_attr(self, "_tempo", tempo)
         
         self._append_event(
             event_type=EventType.TEMPO_CHANGED,
@@ -591,7 +562,7 @@ class StateStore:
             transaction: Optional active transaction for atomic rollback.
         """
         old_key = self._key
-        self._key = key
+        self._undo.set_attr(self, "_key", key)
         
         self._append_event(
             event_type=EventType.KEY_CHANGED,
@@ -610,12 +581,16 @@ class StateStore:
         """Add notes to a region (event + materialized view).
 
         Notes are normalized to snake_case keys on ingress so internal
-        storage is always consistent regardless of wire format.
+        storage is always consistent regardless of wire format. Normalizing
+        builds fresh dicts, so the caller's notes are never aliased.
         """
         normalized = [_normalize_note(n) for n in notes]
-        if region_id not in self._region_notes:
-            self._region_notes[region_id] = []
-        self._region_notes[region_id].extend(deepcopy(normalized))
+        index = self._region_notes.get(region_id)
+        if index is None:
+            index = RegionNoteIndex()
+            self._undo.set_item(self._region_notes, region_id, index)
+        added = index.add(normalized)
+        self._undo.record(partial(index.discard, added))
         
         self._append_event(
             event_type=EventType.NOTES_ADDED,
@@ -635,14 +610,13 @@ class StateStore:
         Remove notes from a region (event + materialized view).
 
         note_criteria is a list of dicts identifying notes to remove.
-        Matching uses pitch + start_beat + duration_beats.
+        Matching uses pitch + start_beat + duration_beats; every note
+        matching any criterion is removed.
         """
-        if region_id in self._region_notes:
-            for criteria in note_criteria:
-                self._region_notes[region_id] = [
-                    n for n in self._region_notes[region_id]
-                    if not _notes_match(n, criteria)
-                ]
+        index = self._region_notes.get(region_id)
+        if index is not None:
+            removed = index.remove_matching(note_criteria)
+            self._undo.record(partial(index.restore, removed))
         
         self._append_event(
             event_type=EventType.NOTES_REMOVED,
@@ -672,8 +646,33 @@ class StateStore:
     # =========================================================================
     
     def get_region_notes(self, region_id: str) -> list[InternalNoteDict]:
-        """Return the current materialized note list for a region."""
-        return deepcopy(self._region_notes.get(region_id, []))
+        """Return copies of a region's notes, ordered by start beat.
+
+        Notes that start on the same beat keep the order they were added in.
+        This is not overall insertion order: a note added after a later one
+        comes back before it.
+        """
+        index = self._region_notes.get(region_id)
+        return [n.copy() for n in index] if index else []
+
+    def get_region_notes_in_range(
+        self, region_id: str, start_beat: float, end_beat: float
+    ) -> list[InternalNoteDict]:
+        """Return copies of a region's notes sounding in ``[start_beat, end_beat)``."""
+        index = self._region_notes.get(region_id)
+        return [n.copy() for n in index.between(start_beat, end_beat)] if index else []
+
+    def get_region_note_count(self, region_id: str) -> int:
+        """Return how many notes a region holds, without copying them."""
+        index = self._region_notes.get(region_id)
+        return len(index) if index else 0
+
+    def get_all_region_notes(self) -> RegionNotesMap:
+        """Return copies of every region's notes, keyed by region ID.
+
+        Each list is in start-beat order, as with :meth:`get_region_notes`.
+        """
+        return {rid: [n.copy() for n in index] for rid, index in self._region_notes.items()}
     
     def get_region_track_id(self, region_id: str) -> str | None:
         """Return the parent track ID for a region (from registry)."""
@@ -695,9 +694,7 @@ class StateStore:
         cc_events: list[CCEventDict],
     ) -> None:
         """Append MIDI CC events to a region."""
-        if region_id not in self._region_cc:
-            self._region_cc[region_id] = []
-        self._region_cc[region_id].extend(deepcopy(cc_events))
+        self._undo.extend(self._region_list(self._region_cc, region_id), [e.copy() for e in cc_events])
 
     def get_region_cc(self, region_id: str) -> list[CCEventDict]:
         """Return CC events for a region."""
@@ -709,9 +706,7 @@ class StateStore:
         pitch_bends: list[PitchBendDict],
     ) -> None:
         """Append pitch bend events to a region."""
-        if region_id not in self._region_pitch_bends:
-            self._region_pitch_bends[region_id] = []
-        self._region_pitch_bends[region_id].extend(deepcopy(pitch_bends))
+        self._undo.extend(self._region_list(self._region_pitch_bends, region_id), [e.copy() for e in pitch_bends])
 
     def get_region_pitch_bends(self, region_id: str) -> list[PitchBendDict]:
         """Return pitch bend events for a region."""
@@ -723,14 +718,20 @@ class StateStore:
         aftertouch: list[AftertouchDict],
     ) -> None:
         """Append aftertouch events (channel or poly) to a region."""
-        if region_id not in self._region_aftertouch:
-            self._region_aftertouch[region_id] = []
-        self._region_aftertouch[region_id].extend(deepcopy(aftertouch))
+        self._undo.extend(self._region_list(self._region_aftertouch, region_id), [e.copy() for e in aftertouch])
 
     def get_region_aftertouch(self, region_id: str) -> list[AftertouchDict]:
         """Return aftertouch events for a region."""
         return deepcopy(self._region_aftertouch.get(region_id, []))
 
+    def _region_list(self, region_map: dict[str, list[_E]], region_id: str) -> list[_E]:
+        """Return *region_id*'s event list in *region_map*, creating it (undoably) if absent."""
+        events = region_map.get(region_id)
+        if events is None:
+            events = []
+            self._undo.set_item(region_map, region_id, events)
+        return events
+
     # =========================================================================
     # Composition State (Orpheus session continuity)
     # =========================================================================
@@ -781,8 +782,8 @@ class StateStore:
         # Preserve existing region notes — the client may report regions
         # without a notes array (only note_count), so we keep what we had
         # from prior tool calls or syncs.
-        previous_notes = dict(self._region_notes)
-        self._region_notes.clear()
+        previous_notes = self._region_notes
+        region_notes: dict[str, RegionNoteIndex] = {}
 
         self._registry.sync_from_project_state(project_state)
 
@@ -793,26 +794,29 @@ class StateStore:
                 if region_id:
                     if "notes" in region:
                         # Client explicitly sent notes (even if empty) — use them
-                        self._region_notes[region_id] = deepcopy(region["notes"])
+                        region_notes[region_id] = RegionNoteIndex(deepcopy(region["notes"]))
                     elif region_id in previous_notes:
                         # Client reported region but omitted notes — keep prior data
-                        self._region_notes[region_id] = previous_notes[region_id]
+                        region_notes[region_id] = previous_notes[region_id]
+        self._undo.set_attr(self, "_region_notes", region_notes)
 
         # Update project metadata
         if "tempo" in project_state:
-            self._tempo = int(project_state["tempo"])
+            self._undo.set_attr(self, "_tempo", int(project_state["tempo"]))
         if "key" in project_state:
-            self._key = project_state["key"]
+            self._undo.set_attr(self, "_key", project_state["key"])
         ts_raw = project_state.get("timeSignature")
         if isinstance(ts_raw, str):
             parts = ts_raw.split("/")
             if len(parts) == 2:
-                self._time_signature = (int(parts[0]), int(parts[1]))
+                self._undo.set_attr(self, "_time_signature", (int(parts[0]), int(parts[1])))
         elif isinstance(ts_raw, dict):
-            self._time_signature = (ts_raw["numerator"], ts_raw["denominator"])
+            self._undo.set_attr(
+                self, "_time_signature", (ts_raw["numerator"], ts_raw["denominator"])
+            )
     
     # =========================================================================
-    # Event & Snapshot Management
+    # Event Log
     # =========================================================================
     
     def _append_event(
@@ -838,49 +842,28 @@ class StateStore:
         )
         
         self._events.append(event)
+        if len(self._events) > 2 * _EVENT_LOG_LIMIT:
+            self._compact_events()
         
         if transaction and transaction.is_active:
             transaction.events.append(event)
         
         return event
     
-    def _take_snapshot(self) -> StateSnapshot:
-        """Take a snapshot of current state (including region notes)."""
-        snapshot = StateSnapshot(
-            version=self._version,
-            timestamp=datetime.now(timezone.utc),
-            registry_data=self._registry.to_dict(),
-            project_metadata=_ProjectMetadataSnapshot(
-                tempo=self._tempo,
-                key=self._key,
-                time_signature=self._time_signature,
-                _region_notes=deepcopy(self._region_notes),
-                _region_cc=deepcopy(self._region_cc),
-                _region_pitch_bends=deepcopy(self._region_pitch_bends),
-                _region_aftertouch=deepcopy(self._region_aftertouch),
-            ),
-        )
-        self._snapshots.append(snapshot)
-        
-        # Keep only last 10 snapshots
-        if len(self._snapshots) > 10:
-            self._snapshots = self._snapshots[-10:]
-        
-        return snapshot
-    
-    def _restore_snapshot(self, snapshot: StateSnapshot) -> None:
-        """Restore state from a snapshot (including region notes)."""
-        self._registry = EntityRegistry.from_dict(snapshot.registry_data)
-        meta = snapshot.project_metadata
-        self._tempo = meta.get("tempo", 120)
-        self._key = meta.get("key", "C")
-        self._time_signature = meta.get("time_signature", (4, 4))
-        self._region_notes = deepcopy(meta.get("_region_notes", {}))
-        self._region_cc = deepcopy(meta.get("_region_cc", {}))
-        self._region_pitch_bends = deepcopy(meta.get("_region_pitch_bends", {}))
-        self._region_aftertouch = deepcopy(meta.get("_region_aftertouch", {}))
-        
-        logger.info(f"📸 Restored to snapshot v{snapshot.version}")
+    def _compact_events(self) -> None:
+        """Drop the oldest events down to ``_EVENT_LOG_LIMIT``.
+
+        Events of the active transaction are kept so that rollback can
+        remove them.
+        """
+        drop = len(self._events) - _EVENT_LOG_LIMIT
+        if self._active_transaction is not None:
+            drop = min(drop, self._tx_event_start)
+        if drop <= 0:
+            return
+        del self._events[:drop]
+        self._tx_event_start -= drop
+        logger.debug(f"🗜️ Compacted event log: dropped {drop} events up to v{self._events[0].version - 1}")
     
     # =========================================================================
     # Serialization
@@ -902,11 +885,16 @@ class StateStore:
         }
     
     def get_events_since(self, version: int) -> list[StateEvent]:
-        """Get all events since a specific version (for sync)."""
-        return [e for e in self._events if e.version > version]
+        """Get all retained events since a specific version (for sync).
+
+        Events are stored in version order, so this is a binary search.
+        Events older than the retained window are not returned.
+        """
+        start = bisect.bisect_right(self._events, version, key=lambda e: e.version)
+        return self._events[start:]
     
     def get_entity_events(self, entity_id: str) -> list[StateEvent]:
-        """Get all events for a specific entity (for audit)."""
+        """Get all retained events for a specific entity (for audit)."""
         return [e for e in self._events if e.entity_id == entity_id]
     
     def get_state_id(self) -> str:
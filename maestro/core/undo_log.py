@@ -0,0 +1,86 @@
+"""Undo log for StateStore transactions.
+
+While a transaction is open, every write to the store's working tree goes
+through an :class:`UndoLog`, which records the inverse of the write before
+applying it. Committing drops the log; rolling back replays it in reverse.
+Both cost O(writes in the transaction), independent of project size. When
+no transaction is open the helpers write directly and record nothing.
+
+Inverses restore *references*, not copies: replacing a map entry records
+the old object, and appending records only the old length. Writers must
+therefore replace or append to the containers they own, never mutate an
+element in place — or :meth:`UndoLog.record` an exact inverse themselves,
+as the note index does.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, MutableMapping
+from functools import partial
+from typing import TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+T = TypeVar("T")
+
+
+def _truncate(items: list[T], length: int) -> None:
+    del items[length:]
+
+
+def _pop(mapping: MutableMapping[K, V], key: K) -> None:
+    mapping.pop(key, None)
+
+
+class UndoLog:
+    """Inverse operations for the writes made since :meth:`begin`."""
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: list[Callable[[], object]] | None = None
+
+    @property
+    def recording(self) -> bool:
+        """``True`` between :meth:`begin` and :meth:`discard` / :meth:`undo`."""
+        return self._entries is not None
+
+    def begin(self) -> None:
+        """Start recording inverses."""
+        self._entries = []
+
+    def discard(self) -> None:
+        """Stop recording and forget every recorded inverse (commit)."""
+        self._entries = None
+
+    def undo(self) -> int:
+        """Replay recorded inverses newest-first, stop recording, and return how many ran."""
+        entries, self._entries = self._entries or [], None
+        for inverse in reversed(entries):
+            inverse()
+        return len(entries)
+
+    def record(self, inverse: Callable[[], object]) -> None:
+        """Record an arbitrary inverse for a write the caller has made."""
+        if self._entries is not None:
+            self._entries.append(inverse)
+
+    def set_attr(self, obj: object, name: str, value: object) -> None:
+        """``setattr(obj, name, value)``, remembering the previous value."""
+        if self._entries is not None:
+            self._entries.append(partial(setattr, obj, name, getattr(obj, name)))
+        setattr(obj, name, value)
+
+    def set_item(self, mapping: MutableMapping[K, V], key: K, value: V) -> None:
+        """``mapping[key] = value``, remembering the previous entry (or its absence)."""
+        if self._entries is not None:
+            if key in mapping:
+                self._entries.append(partial(mapping.__setitem__, key, mapping[key]))
+            else:
+                self._entries.append(partial(_pop, mapping, key))
+        mapping[key] = value
+
+    def extend(self, items: list[T], new_items: list[T]) -> None:
+        """``items.extend(new_items)``, remembering the previous length."""
+        if self._entries is not None:
+            self._entries.append(partial(_truncate, items, len(items)))
+        items.extend(new_items)
@@ -17,6 +17,8 @@ from maestro.db import musehub_models as musehub_models # noqa: F401 — registe
 from maestro.db import musehub_label_models as musehub_label_models # noqa: F401 — register with Base
 from maestro.db import musehub_collaborator_models as musehub_collaborator_models # noqa: F401 — register with Base
 from maestro.db import musehub_stash_models as musehub_stash_models # noqa: F401 — register with Base
+from maestro.db import musehub_stats_models as musehub_stats_models # noqa: F401 — register with Base and its flush hook
+from maestro.db import musehub_search_models as musehub_search_models # noqa: F401 — register with Base and its flush hook
 
 __all__ = [
     "get_db",
@@ -11,7 +11,7 @@ Tables:
 - musehub_pull_requests: Pull requests proposing branch merges
 - musehub_pr_reviews: Formal reviews (approval / changes requested / dismissed) on PRs
 - musehub_pr_comments: Inline review comments on musical diffs within PRs
-- musehub_objects: Content-addressed binary artifact storage
+- musehub_objects: Per-repo references to content-addressed blobs on disk
 - musehub_releases: Tagged releases
 - musehub_stars: Per-user repo starring (one row per user×repo pair)
 - musehub_profiles: Public user profiles (bio, avatar, pinned repos)
@@ -77,8 +77,9 @@ class MusehubRepo(Base):
     # allow_merge_commit, allow_squash_merge, allow_rebase_merge,
     # delete_branch_on_merge, default_branch.
     settings: Mapped[dict[str, object] | None] = mapped_column(JSON, nullable=True)
+    # Indexed for the explore page's "created" sort
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=_utc_now
+        DateTime(timezone=True), nullable=False, default=_utc_now, index=True
     )
     # Soft-delete timestamp; non-null means the repo is logically deleted
     deleted_at: Mapped[datetime | None] = mapped_column(
@@ -173,10 +174,12 @@ class MusehubCommit(Base):
 class MusehubObject(Base):
     """A binary artifact (MIDI, MP3, WebP piano roll) stored in Muse Hub.
 
-    Object content is written to disk at ``disk_path``; only metadata lives in
-    Postgres. ``object_id`` is the canonical content-addressed identifier in
-    the form ``sha256:<hex>`` and doubles as the primary key — upserts are safe
-    by design because the same content always maps to the same ID.
+    Object content lives in the shared blob store on disk (see
+    ``maestro.services.musehub_blobs``) at ``disk_path``; only metadata lives
+    in Postgres. ``object_id`` is the canonical content-addressed identifier
+    in the form ``sha256:<hex>``. The primary key is ``(repo_id, object_id)``
+    so every repo — and every fork — can reference the same bytes, and
+    ``blob_sha256`` names the blob the row points at.
     """
 
     __tablename__ = "musehub_objects"
@@ -186,7 +189,7 @@ class MusehubObject(Base):
     repo_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("musehub_repos.repo_id", ondelete="CASCADE"),
-        nullable=False,
+        primary_key=True,
         index=True,
     )
     # Relative path hint from the client, e.g. "tracks/jazz_4b.mid"
@@ -194,12 +197,40 @@ class MusehubObject(Base):
     size_bytes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     # Absolute path on the Hub server's filesystem where the bytes are stored
     disk_path: Mapped[str] = mapped_column(String(2048), nullable=False)
+    # Hex SHA-256 of the bytes at disk_path when they live in the blob store.
+    # NULL for rows written before the blob store existed (per-repo files).
+    blob_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+    # Head commit of the push that first uploaded this object. Pulls select
+    # objects through MusehubCommitObject; NULL (objects stored before push
+    # heads were recorded) means "always send".
+    introduced_by: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=_utc_now
     )
 
     repo: Mapped[MusehubRepo] = relationship("MusehubRepo", back_populates="objects")
 
+
+class MusehubCommitObject(Base):
+    """Objects carried by a push, keyed by that push's head commit.
+
+    Written for every object in the push, including ones the repo already
+    held, so an object first uploaded on another branch is still linked to
+    each push that references it. Negotiated pulls send the objects linked
+    to any commit the client lacks.
+    """
+
+    __tablename__ = "musehub_commit_objects"
+
+    repo_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("musehub_repos.repo_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    commit_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    object_id: Mapped[str] = mapped_column(String(128), primary_key=True)
+
+
 class MusehubMilestone(Base):
     """A milestone that groups issues within a repo.
 
@@ -294,6 +325,10 @@ class MusehubIssue(Base):
     """
 
     __tablename__ = "musehub_issues"
+    # Serves the issue list: filter by repo and state, keyset-paginate by number.
+    __table_args__ = (
+        Index("ix_musehub_issues_repo_state_number", "repo_id", "state", "number"),
+    )
 
     issue_id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_new_uuid)
     repo_id: Mapped[str] = mapped_column(
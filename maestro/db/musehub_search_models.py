@@ -0,0 +1,358 @@
+"""SQLAlchemy ORM model for the Muse Hub full-text search index.
+
+Global search, and the ``q`` filter on issue and pull-request lists, match
+text across commit messages, repo names and descriptions, and issue and PR
+titles and bodies. Scanning those tables with ``LIKE`` on every query costs
+time proportional to all public content. Instead, each searchable row gets
+one row in ``musehub_search_documents``, and the database indexes that table:
+
+- **PostgreSQL** — a stored generated ``search_vector`` column (``tsvector``,
+  title weighted above body) with a GIN index for ranked keyword search,
+  and ``pg_trgm`` GIN indexes on ``title`` and ``body`` so substring
+  ``LIKE`` patterns use an index too.
+- **SQLite** (local dev and tests) — an external-content FTS5 table,
+  ``musehub_search_fts``, kept in step with the documents table by
+  triggers.
+
+Both are created by ``after_create`` DDL here (for ``create_all``) and by
+the consolidated migration. Queries live in
+:mod:`maestro.services.musehub_search_index`.
+
+The documents are maintained in the same transaction as the change they
+reflect, by a ``Session`` ``after_flush`` hook:
+
+- a new or edited commit, repo, issue or pull request is (re)indexed;
+- a repo whose visibility may have changed updates ``is_public`` on every
+  document of that repo;
+- a deleted row drops its document (a deleted repo drops all of them).
+
+Core ``INSERT``/``UPDATE`` statements bypass the hook; callers using them
+on indexed columns must call :func:`reindex_search_documents` themselves.
+
+Tables:
+- musehub_search_documents: one searchable document per commit, repo,
+  issue and pull request
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import (
+    Boolean,
+    Connection,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    delete,
+    event,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.orm import Mapped, Session, UOWTransaction, mapped_column
+from sqlalchemy.orm.attributes import get_history
+
+from maestro.db.database import Base
+from maestro.db.musehub_models import (
+    MusehubCommit,
+    MusehubIssue,
+    MusehubPullRequest,
+    MusehubRepo,
+)
+
+# Document kinds.
+KIND_REPO = "repo"
+KIND_COMMIT = "commit"
+KIND_ISSUE = "issue"
+KIND_PULL_REQUEST = "pull_request"
+
+# Keep IN lists well under SQLite's bound-parameter limit.
+_IN_BATCH = 500
+
+
+class MusehubSearchDocument(Base):
+    """One searchable piece of Muse Hub content.
+
+    ``ref_id`` is the primary key of the source row (``commit_id``,
+    ``repo_id``, ``issue_id`` or ``pr_id``); ``(kind, ref_id)`` is unique.
+    ``is_public`` mirrors the owning repo's visibility so global search can
+    filter without joining ``musehub_repos``. ``occurred_at`` is the source
+    row's own timestamp, used to break ties between equally ranked hits.
+    """
+
+    __tablename__ = "musehub_search_documents"
+    __table_args__ = (
+        UniqueConstraint("kind", "ref_id", name="uq_musehub_search_documents_kind_ref"),
+        Index("ix_musehub_search_documents_repo_kind", "repo_id", "kind"),
+        Index("ix_musehub_search_documents_public_kind", "is_public", "kind"),
+    )
+
+    # Integer key so SQLite's FTS5 table can use it as its rowid.
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(20), nullable=False)
+    ref_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    repo_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("musehub_repos.repo_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    is_public: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    title: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    body: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    occurred_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+# ---------------------------------------------------------------------------
+# Dialect-specific index DDL
+# ---------------------------------------------------------------------------
+
+_documents = MusehubSearchDocument.__table__
+
+SQLITE_FTS_DDL: tuple[str, ...] = (
+    "CREATE VIRTUAL TABLE musehub_search_fts USING fts5("
+    "title, body, content='musehub_search_documents', content_rowid='id')",
+    "CREATE TRIGGER musehub_search_fts_ai AFTER INSERT ON musehub_search_documents BEGIN "
+    "INSERT INTO musehub_search_fts(rowid, title, body) VALUES (new.id, new.title, new.body); END",
+    "CREATE TRIGGER musehub_search_fts_ad AFTER DELETE ON musehub_search_documents BEGIN "
+    "INSERT INTO musehub_search_fts(musehub_search_fts, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); END",
+    "CREATE TRIGGER musehub_search_fts_au AFTER UPDATE ON musehub_search_documents BEGIN "
+    "INSERT INTO musehub_search_fts(musehub_search_fts, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); "
+    "INSERT INTO musehub_search_fts(rowid, title, body) VALUES (new.id, new.title, new.body); END",
+)
+
+POSTGRES_SEARCH_DDL: tuple[str, ...] = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "ALTER TABLE musehub_search_documents ADD COLUMN search_vector tsvector "
+    "GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', title), 'A') || "
+    "setweight(to_tsvector('simple', body), 'B')) STORED",
+    "CREATE INDEX ix_musehub_search_documents_vector "
+    "ON musehub_search_documents USING gin (search_vector)",
+    "CREATE INDEX ix_musehub_search_documents_title_trgm "
+    "ON musehub_search_documents USING gin (title gin_trgm_ops)",
+    "CREATE INDEX ix_musehub_search_documents_body_trgm "
+    "ON musehub_search_documents USING gin (body gin_trgm_ops)",
+)
+
+
+@event.listens_for(_documents, "after_create")
+def _create_search_indexes(_target: object, conn: Connection, **_kw: object) -> None:
+    statements = {"sqlite": SQLITE_FTS_DDL, "postgresql": POSTGRES_SEARCH_DDL}
+    for stmt in statements.get(conn.dialect.name, ()):
+        conn.exec_driver_sql(stmt)
+
+
+@event.listens_for(_documents, "before_drop")
+def _drop_search_indexes(_target: object, conn: Connection, **_kw: object) -> None:
+    if conn.dialect.name == "sqlite":
+        conn.exec_driver_sql("DROP TABLE IF EXISTS musehub_search_fts")
+
+
+# ---------------------------------------------------------------------------
+# Document builders
+# ---------------------------------------------------------------------------
+
+_Indexed = MusehubCommit | MusehubRepo | MusehubIssue | MusehubPullRequest
+
+# Attributes whose change requires re-indexing a dirty row.
+_INDEXED_ATTRS: dict[type, tuple[str, ...]] = {
+    MusehubRepo: ("name", "description", "tags", "visibility"),
+    MusehubCommit: ("message",),
+    MusehubIssue: ("title", "body"),
+    MusehubPullRequest: ("title", "body"),
+}
+
+
+def _key(obj: _Indexed) -> tuple[str, str]:
+    if isinstance(obj, MusehubRepo):
+        return KIND_REPO, obj.repo_id
+    if isinstance(obj, MusehubCommit):
+        return KIND_COMMIT, obj.commit_id
+    if isinstance(obj, MusehubIssue):
+        return KIND_ISSUE, obj.issue_id
+    return KIND_PULL_REQUEST, obj.pr_id
+
+
+def _document(obj: _Indexed, is_public: bool) -> dict[str, object]:
+    kind, ref_id = _key(obj)
+    title: str
+    body: str
+    occurred_at: datetime
+    if isinstance(obj, MusehubRepo):
+        title = obj.name
+        body = " ".join([obj.description or "", *(obj.tags or [])])
+        occurred_at = obj.created_at
+    elif isinstance(obj, MusehubCommit):
+        title, body, occurred_at = "", obj.message, obj.timestamp
+    else:
+        title, body, occurred_at = obj.title, obj.body or "", obj.created_at
+    return {
+        "kind": kind,
+        "ref_id": ref_id,
+        "repo_id": obj.repo_id,
+        "is_public": is_public,
+        "title": title,
+        "body": body,
+        "occurred_at": occurred_at,
+    }
+
+
+def _batches(keys: list[str]) -> Iterable[list[str]]:
+    for start in range(0, len(keys), _IN_BATCH):
+        yield keys[start : start + _IN_BATCH]
+
+
+def _delete_documents(conn: Connection, keys: Iterable[tuple[str, str]]) -> None:
+    by_kind: defaultdict[str, list[str]] = defaultdict(list)
+    for kind, ref_id in keys:
+        by_kind[kind].append(ref_id)
+    for kind, ref_ids in by_kind.items():
+        for batch in _batches(ref_ids):
+            conn.execute(
+                delete(MusehubSearchDocument).where(
+                    _documents.c.kind == kind, _documents.c.ref_id.in_(batch)
+                )
+            )
+
+
+def _public_repo_ids(conn: Connection, repo_ids: Iterable[str]) -> set[str]:
+    public: set[str] = set()
+    repos = MusehubRepo.__table__
+    for batch in _batches(list(set(repo_ids))):
+        public.update(
+            conn.execute(
+                select(repos.c.repo_id).where(
+                    repos.c.repo_id.in_(batch), repos.c.visibility == "public"
+                )
+            ).scalars()
+        )
+    return public
+
+
+def _index(conn: Connection, objs: list[_Indexed]) -> None:
+    if not objs:
+        return
+    _delete_documents(conn, (_key(o) for o in objs))
+    public = _public_repo_ids(conn, (o.repo_id for o in objs))
+    conn.execute(insert(MusehubSearchDocument), [_document(o, o.repo_id in public) for o in objs])
+
+
+def reindex_search_documents(conn: Connection, repo_ids: Iterable[str] | None = None) -> None:
+    """Rebuild search documents from the source tables.
+
+    With *repo_ids* only those repos' documents are rebuilt; with ``None``
+    every repo's are — the backfill path.
+    """
+    ids = None if repo_ids is None else list(repo_ids)
+    if ids is not None and not ids:
+        return
+    repos = MusehubRepo.__table__
+    public = repos.c.visibility == "public"
+    sources = [
+        select(
+            MusehubRepo.repo_id.label("ref_id"), MusehubRepo.repo_id, public,
+            MusehubRepo.name, MusehubRepo.description, MusehubRepo.tags,
+            MusehubRepo.created_at,
+        ),
+        select(
+            MusehubCommit.commit_id, MusehubCommit.repo_id, public,
+            MusehubCommit.message, MusehubCommit.timestamp,
+        ).join(repos, repos.c.repo_id == MusehubCommit.repo_id),
+        select(
+            MusehubIssue.issue_id, MusehubIssue.repo_id, public,
+            MusehubIssue.title, MusehubIssue.body, MusehubIssue.created_at,
+        ).join(repos, repos.c.repo_id == MusehubIssue.repo_id),
+        select(
+            MusehubPullRequest.pr_id, MusehubPullRequest.repo_id, public,
+            MusehubPullRequest.title, MusehubPullRequest.body, MusehubPullRequest.created_at,
+        ).join(repos, repos.c.repo_id == MusehubPullRequest.repo_id),
+    ]
+    kinds = (KIND_REPO, KIND_COMMIT, KIND_ISSUE, KIND_PULL_REQUEST)
+
+    clear = delete(MusehubSearchDocument)
+    if ids is not None:
+        clear = clear.where(_documents.c.repo_id.in_(ids))
+    conn.execute(clear)
+
+    for kind, source in zip(kinds, sources):
+        if ids is not None:
+            source = source.where(repos.c.repo_id.in_(ids))
+        rows: list[dict[str, object]] = []
+        for result_row in conn.execute(source):
+            row: tuple[object, ...] = tuple(result_row)
+            title: object
+            body: object
+            if kind == KIND_REPO:
+                ref_id, repo_id, is_public, name, description, tags, occurred_at = row
+                tag_list = [str(t) for t in tags] if isinstance(tags, list) else []
+                title, body = name, " ".join([str(description or ""), *tag_list])
+            elif kind == KIND_COMMIT:
+                ref_id, repo_id, is_public, body, occurred_at = row
+                title = ""
+            else:
+                ref_id, repo_id, is_public, title, body, occurred_at = row
+            rows.append({
+                "kind": kind, "ref_id": ref_id, "repo_id": repo_id, "is_public": bool(is_public),
+                "title": title, "body": body or "", "occurred_at": occurred_at,
+            })
+            if len(rows) >= _IN_BATCH:
+                conn.execute(insert(MusehubSearchDocument), rows)
+                rows = []
+        if rows:
+            conn.execute(insert(MusehubSearchDocument), rows)
+
+
+# ---------------------------------------------------------------------------
+# Flush hook
+# ---------------------------------------------------------------------------
+
+
+def _changed(obj: _Indexed) -> bool:
+    return any(get_history(obj, attr).has_changes() for attr in _INDEXED_ATTRS[type(obj)])
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_search_documents(session: Session, _flush_context: UOWTransaction) -> None:
+    to_index: list[_Indexed] = []
+    visibility_changed: list[MusehubRepo] = []
+    for obj in session.new:
+        if isinstance(obj, (MusehubRepo, MusehubCommit, MusehubIssue, MusehubPullRequest)):
+            to_index.append(obj)
+    for obj in session.dirty:
+        if isinstance(obj, (MusehubRepo, MusehubCommit, MusehubIssue, MusehubPullRequest)):
+            if _changed(obj):
+                to_index.append(obj)
+            if isinstance(obj, MusehubRepo) and get_history(obj, "visibility").has_changes():
+                visibility_changed.append(obj)
+
+    gone: list[tuple[str, str]] = []
+    gone_repos: list[str] = []
+    for obj in session.deleted:
+        if isinstance(obj, MusehubRepo):
+            gone_repos.append(obj.repo_id)
+        elif isinstance(obj, (MusehubCommit, MusehubIssue, MusehubPullRequest)):
+            gone.append(_key(obj))
+
+    if not (to_index or gone or gone_repos):
+        return
+
+    conn = session.connection()
+    for repo in visibility_changed:
+        conn.execute(
+            update(MusehubSearchDocument)
+            .where(_documents.c.repo_id == repo.repo_id)
+            .values(is_public=repo.visibility == "public")
+        )
+    _delete_documents(conn, gone)
+    for batch in _batches(gone_repos):
+        conn.execute(delete(MusehubSearchDocument).where(_documents.c.repo_id.in_(batch)))
+    gone_set = set(gone_repos)
+    _index(conn, [o for o in to_index if o.repo_id not in gone_set])
@@ -0,0 +1,212 @@
+"""SQLAlchemy ORM model for materialized Muse Hub repo statistics.
+
+Explore, trending, topic, profile and sitemap pages sort and label repos by
+star, commit, fork and watcher counts. Aggregating those from the source
+tables on every page view costs a join and ``GROUP BY`` over every public
+repo, so the counts are kept in one row per repo instead and read with a
+plain indexed join.
+
+The row is maintained in the same transaction as the change it reflects,
+by a ``Session`` ``after_flush`` hook:
+
+- a new ``MusehubRepo`` gets a zeroed row;
+- new or deleted stars, watches and forks adjust their counter by a delta;
+- new commits bump ``commit_count`` and advance ``latest_commit_at``;
+- anything a delta cannot express (a deleted commit, a repo whose row is
+  missing) triggers :func:`recompute_repo_stats` for that repo.
+
+Core ``DELETE``/``INSERT`` statements bypass the hook; callers using them
+must call :func:`recompute_repo_stats` themselves (see ``unwatch_repo``).
+
+Tables:
+- musehub_repo_stats: one row of denormalized counters per repo
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    Connection,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    case,
+    delete,
+    event,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.orm import Mapped, Session, UOWTransaction, mapped_column
+
+from maestro.db.database import Base
+from maestro.db.musehub_models import (
+    MusehubCommit,
+    MusehubFork,
+    MusehubRepo,
+    MusehubStar,
+    MusehubWatch,
+)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(tz=timezone.utc)
+
+
+class MusehubRepoStats(Base):
+    """Denormalized counters for one repo, kept current on every flush.
+
+    Each sortable counter is indexed so explore and trending queries can walk
+    the index in sort order and stop after one page.
+    """
+
+    __tablename__ = "musehub_repo_stats"
+
+    repo_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("musehub_repos.repo_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    star_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, index=True)
+    commit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, index=True)
+    # Newest commit timestamp; NULL until the first commit lands.
+    latest_commit_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
+    fork_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, index=True)
+    watcher_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=_utc_now, onupdate=_utc_now
+    )
+
+
+def recompute_repo_stats(conn: Connection, repo_ids: Iterable[str] | None = None) -> None:
+    """Rebuild stats rows from the source tables.
+
+    With *repo_ids* only those repos are rebuilt (one indexed count per
+    counter); with ``None`` every repo is — the backfill path.
+    """
+    ids = None if repo_ids is None else list(repo_ids)
+    if ids is not None and not ids:
+        return
+    stats = MusehubRepoStats.__table__
+    repos = MusehubRepo.__table__
+    source = select(
+        repos.c.repo_id,
+        select(func.count()).where(MusehubStar.repo_id == repos.c.repo_id).scalar_subquery(),
+        select(func.count()).where(MusehubCommit.repo_id == repos.c.repo_id).scalar_subquery(),
+        select(func.max(MusehubCommit.timestamp))
+        .where(MusehubCommit.repo_id == repos.c.repo_id)
+        .scalar_subquery(),
+        select(func.count()).where(MusehubFork.source_repo_id == repos.c.repo_id).scalar_subquery(),
+        select(func.count()).where(MusehubWatch.repo_id == repos.c.repo_id).scalar_subquery(),
+        literal(_utc_now(), DateTime(timezone=True)),
+    )
+    clear = delete(MusehubRepoStats)
+    if ids is not None:
+        source = source.where(repos.c.repo_id.in_(ids))
+        clear = clear.where(stats.c.repo_id.in_(ids))
+    conn.execute(clear)
+    conn.execute(
+        insert(MusehubRepoStats).from_select(
+            ["repo_id", "star_count", "commit_count", "latest_commit_at",
+             "fork_count", "watcher_count", "updated_at"],
+            source,
+        )
+    )
+
+
+# ---------------------------------------------------------------------------
+# Flush hook
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Delta:
+    stars: int = 0
+    commits: int = 0
+    forks: int = 0
+    watchers: int = 0
+    latest_commit_at: datetime | None = None
+
+    def saw_commit(self, timestamp: datetime) -> None:
+        self.commits += 1
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        if self.latest_commit_at is None or timestamp > self.latest_commit_at:
+            self.latest_commit_at = timestamp
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_repo_stats(session: Session, _flush_context: UOWTransaction) -> None:
+    new_repos: list[str] = []
+    deltas: defaultdict[str, _Delta] = defaultdict(_Delta)
+    rebuild: set[str] = set()
+
+    for obj in session.new:
+        if isinstance(obj, MusehubRepo):
+            new_repos.append(obj.repo_id)
+        elif isinstance(obj, MusehubStar):
+            deltas[obj.repo_id].stars += 1
+        elif isinstance(obj, MusehubCommit):
+            deltas[obj.repo_id].saw_commit(obj.timestamp)
+        elif isinstance(obj, MusehubFork):
+            deltas[obj.source_repo_id].forks += 1
+        elif isinstance(obj, MusehubWatch):
+            deltas[obj.repo_id].watchers += 1
+
+    gone_repos: set[str] = set()
+    for obj in session.deleted:
+        if isinstance(obj, MusehubRepo):
+            gone_repos.add(obj.repo_id)
+        elif isinstance(obj, MusehubStar):
+            deltas[obj.repo_id].stars -= 1
+        elif isinstance(obj, MusehubCommit):
+            rebuild.add(obj.repo_id)
+        elif isinstance(obj, MusehubFork):
+            deltas[obj.source_repo_id].forks -= 1
+        elif isinstance(obj, MusehubWatch):
+            deltas[obj.repo_id].watchers -= 1
+
+    if not (new_repos or deltas or rebuild):
+        return
+
+    conn = session.connection()
+    stats = MusehubRepoStats.__table__
+    if new_repos:
+        conn.execute(
+            insert(MusehubRepoStats),
+            [{"repo_id": rid, "updated_at": _utc_now()} for rid in new_repos],
+        )
+
+    for repo_id, delta in deltas.items():
+        if repo_id in rebuild or repo_id in gone_repos:
+            continue
+        values: dict[str, object] = {
+            "star_count": stats.c.star_count + delta.stars,
+            "commit_count": stats.c.commit_count + delta.commits,
+            "fork_count": stats.c.fork_count + delta.forks,
+            "watcher_count": stats.c.watcher_count + delta.watchers,
+            "updated_at": _utc_now(),
+        }
+        if delta.latest_commit_at is not None:
+            latest = literal(delta.latest_commit_at, DateTime(timezone=True))
+            values["latest_commit_at"] = case(
+                (
+                    or_(stats.c.latest_commit_at.is_(None), stats.c.latest_commit_at < latest),
+                    latest,
+                ),
+                else_=stats.c.latest_commit_at,
+            )
+        result = conn.execute(update(MusehubRepoStats).where(stats.c.repo_id == repo_id).values(values))
+        if result.rowcount == 0:
+            rebuild.add(repo_id)
+
+    recompute_repo_stats(conn, rebuild - gone_repos)
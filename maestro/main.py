@@ -45,7 +45,9 @@ from maestro.api.routes.musehub import raw as musehub_raw_routes
 from maestro.api.routes.musehub import sitemap as musehub_sitemap_routes
 from maestro.api.routes import mcp as mcp_routes
 from maestro.db import init_db, close_db
+from maestro.services.musehub_render_pipeline import close_render_pool
 from maestro.services.storpheus import get_storpheus_client, close_storpheus_client
+from maestro.variation.streaming.sse_broadcaster import get_sse_broadcaster
 
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
@@ -125,12 +127,18 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # no cold-start TCP/TLS handshake cost.
     await get_storpheus_client().warmup()
 
+    # Receive variation events published by other API workers (no-op unless
+    # VARIATION_STREAM_FANOUT_DIR is set).
+    await get_sse_broadcaster().start()
+
     yield
 
     # Cleanup
     logger.info("Shutting down...")
+    await get_sse_broadcaster().stop()
     await close_db()
     await close_storpheus_client()
+    await close_render_pool()
 
 
 app = FastAPI(
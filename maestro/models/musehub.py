@@ -99,6 +99,18 @@ class PullRequest(CamelModel):
     have_objects: list[str] = Field(default_factory=list)
 
 
+class PackPullRequest(CamelModel):
+    """Body for POST /musehub/repos/{repo_id}/pull/pack.
+
+    Instead of listing every commit and object it holds, the client
+    advertises its tips; the Hub walks ancestry to find what is missing.
+    """
+
+    branch: str
+    # Commit IDs of the client's branch heads and remote-tracking refs
+    have_tips: list[str] = Field(default_factory=list)
+
+
 class ObjectResponse(CamelModel):
     """A binary object returned in a pull response."""
 
@@ -1701,6 +1713,8 @@ class DagNode(CamelModel):
     is_head: bool = False
     branch_labels: list[str] = Field(default_factory=list)
     tag_labels: list[str] = Field(default_factory=list)
+    row: int = Field(0, description="Position in the full topological order (0 = oldest)")
+    lane: int = Field(0, description="Column to draw the node in; one lane per branch")
 
 
 class DagEdge(CamelModel):
@@ -1719,7 +1733,10 @@ class DagGraphResponse(CamelModel):
     """Topologically sorted commit graph for a Muse Hub repo.
 
     ``nodes`` are ordered from oldest ancestor to newest commit (Kahn's
-    algorithm). ``edges`` enumerate every parent→child relationship.
+    algorithm). ``edges`` enumerate every parent→child relationship whose
+    child is in ``nodes``. A windowed request returns a contiguous slice of
+    rows starting at ``window_start``; each node's ``row`` and ``lane`` are
+    positions in the whole graph, so slices can be stitched together.
     Consumers can render this directly as a directed acyclic graph without
     further processing.
 
@@ -1731,6 +1748,9 @@ class DagGraphResponse(CamelModel):
     nodes: list[DagNode]
     edges: list[DagEdge]
     head_commit_id: str | None = None
+    total: int = Field(0, description="Commits in the whole graph, not just this window")
+    window_start: int = Field(0, description="Row of the first node; 0 when nothing older remains")
+    lane_count: int = Field(0, description="Lanes used across the whole graph")
 
 
 # ── Session models ─────────────────────────────────────────────────────────────
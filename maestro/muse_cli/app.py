@@ -3,12 +3,12 @@
 Entry point for the ``muse`` console script. Registers all MVP
 subcommands (amend, arrange, ask, bisect, blame, cat-object, checkout, cherry-pick,
 chord-map, clone, commit, commit-tree, context, contour, describe, diff, divergence,
-dynamics, emotion-diff, export, fetch, find, form, grep, groove-check, harmony,
+dynamics, emotion-diff, export, fetch, find, form, gc, grep, groove-check, harmony,
 hash-object, humanize, import, init, inspect, key, log, merge, meter, motif, open,
 play, pull, push, read-tree, rebase, recall, release, remote, render-preview, rerere,
 subcommands (amend, arrange, ask, attributes, bisect, blame, cat-object, checkout,
 cherry-pick, chord-map, clone, commit, commit-tree, context, contour, describe, diff,
-divergence, dynamics, emotion-diff, export, fetch, find, form, grep, groove-check,
+divergence, dynamics, emotion-diff, export, fetch, find, form, gc, grep, groove-check,
 harmony, hash-object, humanize, import, init, inspect, key, log, merge, meter, motif,
 open, play, pull, push, read-tree, rebase, recall, release, remote, render-preview,
 reset, resolve, restore, rev-parse, revert, session, show, similarity, stash, status,
@@ -44,6 +44,7 @@ from maestro.muse_cli.commands import (
     fetch,
     find,
     form,
+    gc,
     grep_cmd,
     groove_check,
     harmony,
@@ -161,6 +162,7 @@ cli.add_typer(rerere.app, name="rerere", help="Reuse recorded resolutions for mu
 cli.add_typer(resolve.app, name="resolve", help="Mark a conflicted file as resolved (--ours or --theirs).")
 cli.add_typer(restore.app, name="restore", help="Restore specific files from a commit or index into muse-work/.")
 cli.add_typer(groove_check.app, name="groove-check", help="Analyze rhythmic drift across commits to find groove regressions.")
+cli.add_typer(gc.app, name="gc", help="Pack loose objects into a delta-compressed pack file.")
 cli.add_typer(form.app, name="form", help="Analyze or annotate the formal structure (sections) of a commit.")
 cli.add_typer(similarity.app, name="similarity", help="Compare two commits by musical similarity score.")
 cli.add_typer(stash.app, name="stash", help="Temporarily shelve uncommitted muse-work/ changes.")
@@ -0,0 +1,153 @@
+"""Per-commit changed-path Bloom filters.
+
+Path-limited history — ``muse blame <path>``, ``muse log --path <path>`` —
+has to know which commits touched a path. Answering that from snapshots
+means loading two manifests per commit for the whole history. Instead each
+commit carries a small Bloom filter (``muse_commits.changed_paths_bloom``)
+of the paths that differ between its snapshot and its first parent's, plus
+every parent directory of those paths so directory queries work too.
+
+A filter answers "definitely not changed" or "maybe changed"; callers skip
+commits in the first case and confirm the second against manifests, since
+Bloom filters have false positives but never false negatives.
+
+Encoding
+--------
+``bytes([k]) + bit_array`` where *k* is the number of hash functions.
+``k == 0`` marks a filter that was not built because the commit changed
+more than :data:`MAX_CHANGED_PATHS` entries — it answers "maybe" for
+everything, as does a missing (``None``) filter.
+
+Filters are computed by ``muse commit`` and backfilled for any commit
+that lacks one by ``muse push`` (see :func:`backfill_changed_path_blooms`).
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import pathlib
+from collections.abc import Iterable, Mapping, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from maestro.muse_cli.models import MuseCliCommit
+
+logger = logging.getLogger(__name__)
+
+_BITS_PER_ENTRY = 10
+_NUM_HASHES = 7
+#: Commits that change more entries than this get an always-"maybe" filter.
+MAX_CHANGED_PATHS = 512
+
+
+def changed_paths(old_manifest: Mapping[str, str], new_manifest: Mapping[str, str]) -> set[str]:
+    """Paths added, removed or modified between two snapshot manifests."""
+    changed = {p for p, oid in new_manifest.items() if old_manifest.get(p) != oid}
+    changed.update(p for p in old_manifest if p not in new_manifest)
+    return changed
+
+
+def _keys(paths: Iterable[str]) -> set[str]:
+    """*paths* plus every parent directory, e.g. ``drums/a.mid`` → ``drums``."""
+    keys: set[str] = set()
+    for path in paths:
+        keys.add(path)
+        for parent in pathlib.PurePosixPath(path).parents:
+            if str(parent) != ".":
+                keys.add(str(parent))
+    return keys
+
+
+def _bit_positions(key: str, nbits: int, k: int) -> Iterable[int]:
+    digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return ((h1 + i * h2) % nbits for i in range(k))
+
+
+def build_changed_path_bloom(paths: Iterable[str]) -> bytes:
+    """Encode the changed *paths* (and their directories) as a Bloom filter."""
+    keys = _keys(paths)
+    if len(keys) > MAX_CHANGED_PATHS:
+        return bytes([0])
+    nbytes = (len(keys) * _BITS_PER_ENTRY + 7) // 8
+    bits = bytearray(nbytes)
+    nbits = nbytes * 8
+    for key in keys:
+        for pos in _bit_positions(key, nbits, _NUM_HASHES):
+            bits[pos >> 3] |= 1 << (pos & 7)
+    return bytes([_NUM_HASHES]) + bytes(bits)
+
+
+def bloom_may_contain(bloom: bytes | None, path: str) -> bool:
+    """Return ``False`` only when *path* is definitely not in *bloom*."""
+    if not bloom or bloom[0] == 0:
+        return True
+    bits = bloom[1:]
+    nbits = len(bits) * 8
+    if nbits == 0:
+        return False
+    key = normalize_path(path)
+    return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in _bit_positions(key, nbits, bloom[0]))
+
+
+def normalize_path(path: str) -> str:
+    """Turn a user-supplied path into a manifest key (or directory prefix)."""
+    rel = path.strip().strip("/")
+    if rel.startswith("muse-work/"):
+        rel = rel[len("muse-work/"):]
+    return rel
+
+
+def path_changed(
+    old_manifest: Mapping[str, str],
+    new_manifest: Mapping[str, str],
+    path: str,
+) -> bool:
+    """Return ``True`` when *path* (a file or directory) differs between manifests."""
+    key = normalize_path(path)
+    prefix = key + "/"
+
+    def _select(manifest: Mapping[str, str]) -> dict[str, str]:
+        return {p: oid for p, oid in manifest.items() if p == key or p.startswith(prefix)}
+
+    return _select(old_manifest) != _select(new_manifest)
+
+
+async def backfill_changed_path_blooms(
+    session: AsyncSession,
+    commits: Sequence[MuseCliCommit],
+) -> int:
+    """Compute and store filters for *commits* that do not have one yet.
+
+    Commits created before filters existed, or by commands other than
+    ``muse commit``, have a ``NULL`` filter. Manifests are loaded in
+    batched queries. Returns the number of filters written.
+    """
+    from maestro.muse_cli.commit_graph import load_commit_rows
+    from maestro.muse_cli.db import load_snapshot_manifests
+
+    missing = [c for c in commits if c.changed_paths_bloom is None]
+    if not missing:
+        return 0
+
+    parent_ids = sorted({c.parent_commit_id for c in missing if c.parent_commit_id})
+    parents = {p.commit_id: p for p in await load_commit_rows(session, parent_ids)}
+    snapshot_ids = {c.snapshot_id for c in missing} | {p.snapshot_id for p in parents.values()}
+    manifests = await load_snapshot_manifests(session, snapshot_ids)
+
+    written = 0
+    for commit in missing:
+        parent = parents.get(commit.parent_commit_id or "")
+        if commit.parent_commit_id and parent is None:
+            continue  # parent unknown locally — leave the filter unset
+        new_manifest = manifests.get(commit.snapshot_id)
+        if new_manifest is None:
+            continue
+        old_manifest = manifests.get(parent.snapshot_id, {}) if parent else {}
+        commit.changed_paths_bloom = build_changed_path_bloom(
+            changed_paths(old_manifest, new_manifest)
+        )
+        written += 1
+    logger.debug("✅ Backfilled %d changed-path filters", written)
+    return written
@@ -15,16 +15,16 @@ meaningful unit of change is a whole file, not a byte offset.
 
 **Algorithm:**
 
-1. Load all commits from HEAD, following ``parent_commit_id`` links.
-2. For each adjacent pair ``(C_i, C_{i-1})`` (newest to oldest), load their
-   snapshot manifests and compare ``object_id`` values per path.
+1. Load the first-parent chain from HEAD via the commit graph.
+2. For each adjacent pair ``(C_i, C_{i-1})`` (newest to oldest) whose
+   changed-path Bloom filter may contain one of the blamed paths, load
+   their snapshot manifests and compare ``object_id`` values per path.
+   Pairs whose filter rules out every blamed path are skipped without
+   loading any snapshot.
 3. The first pair where a path differs (object_id changed, added, or removed)
    identifies the most recent commit to have touched that path.
 4. Paths present in the initial commit (no parent) are attributed to it.
 
-This is O(N × F) in commits × files, which is acceptable for DAW session
-history (typically <1 000 commits, <100 files per snapshot).
-
 Flags
 -----
 PATH TEXT Positional — relative path within muse-work/ to annotate.
@@ -51,14 +51,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import TypedDict
 
 from maestro.muse_cli._repo import require_repo
-from maestro.muse_cli.db import open_session
+from maestro.muse_cli.commit_graph import commit_graph_for, load_commit_rows
+from maestro.muse_cli.db import load_snapshot_manifests, open_session
 from maestro.muse_cli.errors import ExitCode
-from maestro.muse_cli.models import MuseCliCommit, MuseCliSnapshot
+from maestro.muse_cli.models import MuseCliCommit
 
 logger = logging.getLogger(__name__)
 
 app = typer.Typer()
 
+# Maximum number of first-parent commits examined.
+_CHAIN_LIMIT = 10_000
+
 
 # ---------------------------------------------------------------------------
 # Result types
@@ -103,39 +107,6 @@ class BlameResult(TypedDict):
 # ---------------------------------------------------------------------------
 
 
-async def _load_commit_chain(
-    session: AsyncSession,
-    head_commit_id: str,
-    limit: int = 10_000,
-) -> list[MuseCliCommit]:
-    """Walk the parent chain from *head_commit_id*, returning newest-first.
-
-    Stops when the chain is exhausted or *limit* is reached.
-    """
-    commits: list[MuseCliCommit] = []
-    current_id: str | None = head_commit_id
-    while current_id and len(commits) < limit:
-        commit = await session.get(MuseCliCommit, current_id)
-        if commit is None:
-            logger.warning("⚠️ Commit %s not found — chain broken", current_id[:8])
-            break
-        commits.append(commit)
-        current_id = commit.parent_commit_id
-    return commits
-
-
-async def _load_snapshot_manifest(
-    session: AsyncSession,
-    snapshot_id: str,
-) -> dict[str, str]:
-    """Return the manifest dict for *snapshot_id*, or an empty dict on miss."""
-    snapshot = await session.get(MuseCliSnapshot, snapshot_id)
-    if snapshot is None:
-        logger.warning("⚠️ Snapshot %s not found in DB", snapshot_id[:8])
-        return {}
-    return dict(snapshot.manifest)
-
-
 def _matches_filters(
     path: str,
     path_filter: str | None,
@@ -205,33 +176,49 @@ async def _blame_async(
         typer.echo(f"No commits yet on branch {branch}")
         raise typer.Exit(code=ExitCode.SUCCESS)
 
-    # Load all commits newest-first
-    commits = await _load_commit_chain(session, head_commit_id)
+    # First-parent chain from the commit graph; rows fetched in batches.
+    graph = await commit_graph_for(session, head_commit_id, repo_root=root)
+    chain = graph.first_parent_chain(head_commit_id, limit=_CHAIN_LIMIT)
+    commits = await load_commit_rows(session, chain)
     if not commits:
         typer.echo(f"No commits yet on branch {branch}")
         raise typer.Exit(code=ExitCode.SUCCESS)
 
-    # Load all manifests up-front (one DB query per snapshot)
-    manifests: list[dict[str, str]] = []
-    for commit in commits:
-        manifest = await _load_snapshot_manifest(session, commit.snapshot_id)
-        manifests.append(manifest)
-
     # HEAD snapshot defines which paths exist right now
-    head_manifest = manifests[0]
+    head_manifest = (await load_snapshot_manifests(session, [commits[0].snapshot_id])).get(
+        commits[0].snapshot_id, {}
+    )
+    targets = {
+        path for path in head_manifest
+        if _matches_filters(path, path_filter, track_filter, section_filter)
+    }
+
+    # Only pairs whose changed-path filter may contain a target need their
+    # manifests; everything else is skipped without touching snapshots.
+    candidate_pairs = [
+        i for i in range(len(commits) - 1)
+        if any(graph.may_have_changed(commits[i].commit_id, p) for p in targets)
+    ]
+    needed = {commits[i].snapshot_id for i in candidate_pairs}
+    needed.update(commits[i + 1].snapshot_id for i in candidate_pairs)
+    manifests = await load_snapshot_manifests(session, needed)
 
     # blame_map: path → commit (newest commit that changed this path)
     blame_map: dict[str, tuple[MuseCliCommit, str]] = {} # path → (commit, change_type)
 
-    # Walk pairs newest→oldest: (commits[i], commits[i+1])
-    for i in range(len(commits) - 1):
+    # Walk candidate pairs newest→oldest: (commits[i], commits[i+1])
+    for i in candidate_pairs:
+        if len(blame_map) == len(targets):
+            break
         newer_commit = commits[i]
-        newer_manifest = manifests[i]
-        older_manifest = manifests[i + 1]
+        newer_manifest = manifests.get(newer_commit.snapshot_id, {})
+        older_manifest = manifests.get(commits[i + 1].snapshot_id, {})
 
-        for path in newer_manifest:
-            if path in blame_map:
+        for path in targets:
+            if path in blame_map or path not in newer_manifest:
                 continue # already attributed to a more recent commit
+            if not graph.may_have_changed(newer_commit.commit_id, path):
+                continue
             newer_oid = newer_manifest[path]
             older_oid = older_manifest.get(path)
             if older_oid is None:
@@ -244,15 +231,13 @@ async def _blame_async(
     # Any path still unattributed was present in the initial commit (C_0)
     # and never changed after — attribute it to the oldest commit
     oldest_commit = commits[-1]
-    for path in head_manifest:
+    for path in targets:
         if path not in blame_map:
             blame_map[path] = (oldest_commit, "added")
 
     # Build entries, applying filters
     entries: list[BlameEntry] = []
-    for path in sorted(head_manifest.keys()):
-        if not _matches_filters(path, path_filter, track_filter, section_filter):
-            continue
+    for path in sorted(targets):
         commit, change_type = blame_map.get(path, (oldest_commit, "unchanged"))
         entries.append(
             BlameEntry(
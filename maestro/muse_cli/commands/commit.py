@@ -72,7 +72,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.attributes import flag_modified
 
 from maestro.muse_cli._repo import require_repo
+from maestro.muse_cli.changed_paths import build_changed_path_bloom, changed_paths
+from maestro.muse_cli.commit_graph import append_commit_to_graph_file
 from maestro.muse_cli.db import (
+    get_commit_snapshot_manifest,
     get_head_snapshot_id,
     insert_commit,
     open_session,
@@ -356,6 +359,12 @@ async def _commit_async(
     # commit row's FK constraint is checked on insert.
     await session.flush()
 
+    # ── Changed-path filter for path-limited history ─────────────────────
+    parent_manifest: dict[str, str] = {}
+    if parent_commit_id:
+        parent_manifest = await get_commit_snapshot_manifest(session, parent_commit_id) or {}
+    bloom = build_changed_path_bloom(changed_paths(parent_manifest, manifest))
+
     # ── Persist commit ───────────────────────────────────────────────────
     new_commit = MuseCliCommit(
         commit_id=commit_id,
@@ -367,8 +376,10 @@ async def _commit_async(
         author="",
         committed_at=committed_at,
         commit_metadata=commit_metadata,
+        changed_paths_bloom=bloom,
     )
     await insert_commit(session, new_commit)
+    append_commit_to_graph_file(root, repo_id, commit_id, parent_ids, committed_at, bloom)
 
     # ── Update branch HEAD pointer ────────────────────────────────────────
     ref_path.parent.mkdir(parents=True, exist_ok=True)
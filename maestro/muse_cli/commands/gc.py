@@ -0,0 +1,91 @@
+"""muse gc — pack loose objects into a delta-compressed pack file.
+
+Every ``muse commit`` stores each changed file as a full loose object under
+``.muse/objects/``. Successive revisions of the same MIDI file or stem are
+usually near-identical, so a long history carries many almost-duplicate
+copies. ``muse gc`` folds all loose objects (and any existing packs) into a
+single pack under ``.muse/objects/pack/`` where similar objects are stored
+as binary deltas against each other.
+
+Usage
+-----
+::
+
+    muse gc # repack with the default window and depth
+    muse gc --window 20 # consider more delta bases per object
+    muse gc --depth 5 # cap delta chains at five hops
+
+Design notes
+------------
+- Pure filesystem operation — no DB session needed.
+- Reads through the object store are transparent: ``read_object``,
+  ``has_object`` and ``restore_object`` fall back to packs when a loose
+  object is absent, so every other command keeps working after a gc.
+- Loose objects and old packs are only removed after every object in the
+  new pack has been read back and verified against its SHA-256 ID.
+"""
+from __future__ import annotations
+
+import logging
+
+import typer
+
+from maestro.muse_cli._repo import require_repo
+from maestro.muse_cli.errors import ExitCode
+from maestro.muse_cli.pack import repack
+
+logger = logging.getLogger(__name__)
+
+app = typer.Typer()
+
+
+@app.callback(invoke_without_command=True)
+def gc(
+    ctx: typer.Context,
+    window: int = typer.Option(
+        10,
+        "--window",
+        min=0,
+        help="Number of preceding objects to try as delta bases for each object.",
+    ),
+    depth: int = typer.Option(
+        10,
+        "--depth",
+        min=0,
+        help="Maximum length of a delta chain.",
+    ),
+) -> None:
+    """Pack loose objects into a delta-compressed pack file."""
+    root = require_repo()
+
+    try:
+        result = repack(root, window=window, max_depth=depth)
+    except typer.Exit:
+        raise
+    except Exception as exc:
+        typer.echo(f"❌ muse gc failed: {exc}")
+        logger.error("❌ muse gc error: %s", exc, exc_info=True)
+        raise typer.Exit(code=ExitCode.INTERNAL_ERROR)
+
+    if result.pack_name is None:
+        if result.objects:
+            typer.echo(f"Already packed: {result.objects} object(s) in one pack.")
+        else:
+            typer.echo("Nothing to pack.")
+        return
+
+    saved = result.input_bytes - result.pack_bytes
+    typer.echo(
+        f"✅ Packed {result.objects} object(s) ({result.deltas} as deltas) "
+        f"into {result.pack_name}"
+    )
+    typer.echo(
+        f"   {result.input_bytes} → {result.pack_bytes} bytes "
+        f"({saved} saved); removed {result.loose_removed} loose object(s) "
+        f"and {result.packs_removed} old pack(s)"
+    )
+    if result.corrupt:
+        typer.echo(
+            f"⚠️ Left {len(result.corrupt)} corrupt loose object(s) unpacked: "
+            + ", ".join(oid[:8] for oid in result.corrupt)
+        )
@@ -41,6 +41,7 @@ import typer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from maestro.muse_cli._repo import require_repo
+from maestro.muse_cli.commit_graph import commit_graph_for, load_commit_rows
 from maestro.muse_cli.db import open_session
 from maestro.muse_cli.errors import ExitCode
 from maestro.muse_cli.models import MuseCliCommit
@@ -83,21 +84,17 @@ async def _load_all_commits(
     session: AsyncSession,
     head_commit_id: str,
     limit: int,
+    repo_root: pathlib.Path | None = None,
 ) -> list[MuseCliCommit]:
     """Walk the parent chain from *head_commit_id*, returning newest-first.
 
-    Stops when the chain is exhausted or *limit* is reached.
+    Stops when the chain is exhausted or *limit* is reached. The chain is
+    resolved from the commit graph and rows are fetched in batches rather
+    than one query per commit.
     """
-    commits: list[MuseCliCommit] = []
-    current_id: str | None = head_commit_id
-    while current_id and len(commits) < limit:
-        commit = await session.get(MuseCliCommit, current_id)
-        if commit is None:
-            logger.warning("⚠️ Commit %s not found in DB — chain broken", current_id[:8])
-            break
-        commits.append(commit)
-        current_id = commit.parent_commit_id
-    return commits
+    commit_graph = await commit_graph_for(session, head_commit_id, repo_root=repo_root)
+    chain = commit_graph.first_parent_chain(head_commit_id, limit=max(limit, 0))
+    return await load_commit_rows(session, chain)
 
 
 def _match_commit(
@@ -171,7 +168,9 @@ async def _grep_async(
         typer.echo(f"No commits yet on branch {branch} — nothing to search.")
         return []
 
-    commits = await _load_all_commits(session, head_commit_id=head_commit_id, limit=_DEFAULT_LIMIT)
+    commits = await _load_all_commits(
+        session, head_commit_id=head_commit_id, limit=_DEFAULT_LIMIT, repo_root=root,
+    )
 
     matches: list[GrepMatch] = []
     for commit in commits:
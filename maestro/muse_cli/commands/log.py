@@ -52,6 +52,9 @@ Filters (all combinable with each other and with output modes):
 - ``--emotion TEXT`` — commits tagged ``emotion:<TEXT>``
 - ``--section TEXT`` — commits tagged ``section:<TEXT>``
 - ``--track TEXT`` — commits tagged ``track:<TEXT>``
+- ``--path PATH`` — commits that changed a file or directory; commits whose
+  changed-path Bloom filter rules the path out are skipped without loading
+  their snapshots
 
 ``--graph`` reuses ``maestro.services.muse_log_render.render_ascii_graph``
 by adapting ``MuseCliCommit`` rows to the ``MuseLogGraph``/``MuseLogNode``
@@ -76,7 +79,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from maestro.muse_cli._repo import require_repo
-from maestro.muse_cli.db import open_session
+from maestro.muse_cli.changed_paths import path_changed
+from maestro.muse_cli.commit_graph import CommitGraph, commit_graph_for, load_commit_rows
+from maestro.muse_cli.db import load_snapshot_manifests, open_session
 from maestro.muse_cli.errors import ExitCode
 from maestro.muse_cli.models import MuseCliCommit, MuseCliSnapshot, MuseCliTag
 
@@ -85,6 +90,8 @@ logger = logging.getLogger(__name__)
 app = typer.Typer()
 
 _DEFAULT_LIMIT = 1000
+# Commit rows fetched per query while walking the first-parent chain.
+_ROW_BATCH = 200
 
 
 # ---------------------------------------------------------------------------
@@ -206,54 +213,100 @@ async def _load_commits(
     since: datetime | None = None,
     until: datetime | None = None,
     author: str | None = None,
+    repo_root: pathlib.Path | None = None,
+    path: str | None = None,
 ) -> list[MuseCliCommit]:
     """Walk the parent chain from *head_commit_id*, returning newest-first.
 
-    Applies date and author filters inline while walking so we stop early when
-    walking past the ``--since`` boundary. Tag-based filters (emotion, section,
-    track) are applied afterward by ``_filter_by_tags`` to keep this function
-    focused on chain traversal.
+    The first-parent chain comes from the commit graph (one query, or the
+    ``.muse/commit-graph.json`` cache when *repo_root* is given); commit rows
+    are then fetched in batches, applying date and author filters inline so
+    we stop early when walking past the ``--since`` boundary. Tag-based
+    filters (emotion, section, track) are applied afterward by
+    ``_filter_by_tags`` to keep this function focused on chain traversal.
+
+    When *path* is given only commits that changed that file or directory
+    (against their first parent) are kept; see :func:`_filter_chain_by_path`.
 
     Date comparison uses ``committed_at`` (UTC-aware). Both ``since`` and
     ``until`` should be UTC-aware datetimes (produced by :func:`parse_date_filter`).
     """
+    if limit <= 0:
+        return []
+    commit_graph = await commit_graph_for(session, head_commit_id, repo_root=repo_root)
+    chain = commit_graph.first_parent_chain(head_commit_id)
+    if not chain:
+        logger.warning("⚠️ Commit %s not found in DB — chain broken", head_commit_id[:8])
+        return []
+    if path is not None:
+        chain = await _filter_chain_by_path(session, commit_graph, chain, path)
+
+    since_aware = None
+    if since is not None:
+        since_aware = since if since.tzinfo else since.replace(tzinfo=timezone.utc)
+    until_aware = None
+    if until is not None:
+        until_aware = until if until.tzinfo else until.replace(tzinfo=timezone.utc)
+
     commits: list[MuseCliCommit] = []
-    current_id: str | None = head_commit_id
-    while current_id and len(commits) < limit:
-        commit = await session.get(MuseCliCommit, current_id)
-        if commit is None:
-            logger.warning("⚠️ Commit %s not found in DB — chain broken", current_id[:8])
-            break
-
-        ts = commit.committed_at
-        # Normalise to UTC-aware for comparison
-        if ts.tzinfo is None:
-            ts = ts.replace(tzinfo=timezone.utc)
-
-        # --until: skip commits after the cutoff but keep walking (older commits may qualify)
-        if until is not None:
-            until_aware = until if until.tzinfo else until.replace(tzinfo=timezone.utc)
-            if ts > until_aware:
-                current_id = commit.parent_commit_id
+    for start in range(0, len(chain), _ROW_BATCH):
+        for commit in await load_commit_rows(session, chain[start:start + _ROW_BATCH]):
+            ts = commit.committed_at
+            # Normalise to UTC-aware for comparison
+            if ts.tzinfo is None:
+                ts = ts.replace(tzinfo=timezone.utc)
+
+            # --until: skip commits after the cutoff but keep walking (older commits may qualify)
+            if until_aware is not None and ts > until_aware:
                 continue
 
-        # --since: stop walking — everything older is also out of range
-        if since is not None:
-            since_aware = since if since.tzinfo else since.replace(tzinfo=timezone.utc)
-            if ts < since_aware:
-                break
+            # --since: stop walking — everything older is also out of range
+            if since_aware is not None and ts < since_aware:
+                return commits
 
-        # --author: case-insensitive substring match
-        if author is not None and author.lower() not in commit.author.lower():
-            current_id = commit.parent_commit_id
-            continue
+            # --author: case-insensitive substring match
+            if author is not None and author.lower() not in commit.author.lower():
+                continue
 
-        commits.append(commit)
-        current_id = commit.parent_commit_id
+            commits.append(commit)
+            if len(commits) >= limit:
+                return commits
 
     return commits
 
 
+async def _filter_chain_by_path(
+    session: AsyncSession,
+    commit_graph: CommitGraph,
+    chain: list[str],
+    path: str,
+) -> list[str]:
+    """Keep the commits in *chain* that changed *path* against their first parent.
+
+    Commits whose changed-path Bloom filter rules the path out are dropped
+    without loading anything; the remaining candidates are confirmed
+    against their snapshot manifests (Bloom filters have false positives).
+    """
+    maybe = [cid for cid in chain if commit_graph.may_have_changed(cid, path)]
+    if not maybe:
+        return []
+    first_parent = {cid: next(iter(commit_graph.parent_ids(cid)), None) for cid in maybe}
+    wanted = set(maybe) | {p for p in first_parent.values() if p}
+    rows = {r.commit_id: r for r in await load_commit_rows(session, sorted(wanted))}
+    manifests = await load_snapshot_manifests(session, {r.snapshot_id for r in rows.values()})
+
+    kept: list[str] = []
+    for cid in maybe:
+        row = rows.get(cid)
+        if row is None:
+            continue
+        parent = rows.get(first_parent[cid] or "")
+        old_manifest = manifests.get(parent.snapshot_id, {}) if parent else {}
+        if path_changed(old_manifest, manifests.get(row.snapshot_id, {}), path):
+            kept.append(cid)
+    return kept
+
+
 async def _filter_by_tags(
     session: AsyncSession,
     commits: list[MuseCliCommit],
@@ -473,6 +526,7 @@ async def _log_async(
     emotion: str | None = None,
     section: str | None = None,
     track: str | None = None,
+    path: str | None = None,
 ) -> None:
     """Core log logic — fully injectable for tests.
 
@@ -507,6 +561,8 @@ async def _log_async(
         since=since,
         until=until,
         author=author,
+        repo_root=root,
+        path=path,
     )
 
     # Apply tag-based filters (emotion, section, track)
@@ -602,6 +658,12 @@ def log(
         help="Filter commits tagged with track:<TEXT> (e.g. 'drums').",
         metavar="TEXT",
     ),
+    path: Optional[str] = typer.Option(
+        None,
+        "--path",
+        help="Only show commits that changed PATH (a file or directory in muse-work/).",
+        metavar="PATH",
+    ),
 ) -> None:
     """Display the commit history for the current branch.
 
@@ -643,6 +705,7 @@ def log(
                 emotion=emotion,
                 section=section,
                 track=track,
+                path=path,
             )
 
     try:
@@ -149,7 +149,9 @@ async def _merge_async(
         raise typer.Exit(code=ExitCode.SUCCESS)
 
     # ── Find merge base (LCA) ────────────────────────────────────────────
-    base_commit_id = await find_merge_base(session, ours_commit_id, theirs_commit_id)
+    base_commit_id = await find_merge_base(
+        session, ours_commit_id, theirs_commit_id, repo_root=root,
+    )
 
     # ── Validate strategy ────────────────────────────────────────────────
     _VALID_STRATEGIES = {"ours", "theirs"}
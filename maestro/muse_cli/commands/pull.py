@@ -6,9 +6,14 @@ Pull algorithm
 2. Read current branch from ``.muse/HEAD``.
 3. Resolve ``origin`` URL from ``.muse/config.toml``.
    Exits 1 with an instructive message if no remote is configured.
-4. Collect ``have_commits`` (commit IDs already in local DB) and
-   ``have_objects`` (object IDs already stored) to avoid re-downloading.
-5. POST to ``<remote_url>/pull`` with Bearer auth.
+4. Negotiate a pack: POST ``have_tips`` (local branch heads and
+   remote-tracking heads) to ``<remote_url>/pull/pack``. The Hub walks
+   ancestry for the missing set and streams commits and object bytes back
+   as a binary pack; each commit is stored and each object written to the
+   object store as it arrives.
+5. Fallback for Hubs that do not answer with a pack: collect
+   ``have_commits`` and ``have_objects`` and POST them to
+   ``<remote_url>/pull``, which returns everything else as JSON.
 6. Store returned commits and object descriptors in local Postgres.
 7. Update ``.muse/remotes/origin/<branch>`` tracking pointer.
 8. Apply post-fetch integration strategy based on flags:
@@ -37,13 +42,19 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import hashlib
 import json
 import logging
+import os
 import pathlib
-from collections.abc import Mapping
+import re
+import tempfile
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass
 
 import httpx
 import typer
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from maestro.muse_cli._repo import require_repo
 from maestro.muse_cli.config import get_remote, get_remote_head, set_remote_head
@@ -58,12 +69,23 @@ from maestro.muse_cli.db import (
 from maestro.muse_cli.errors import ExitCode
 from maestro.muse_cli.hub_client import (
     MuseHubClient,
+    PackPullRequest,
     PullRequest,
     PullResponse,
 )
 from maestro.muse_cli.merge_engine import find_merge_base
 from maestro.muse_cli.models import MuseCliCommit
+from maestro.muse_cli.object_store import write_object_from_path
 from maestro.muse_cli.snapshot import compute_commit_tree_id
+from maestro.services.musehub_pack import (
+    FRAME_COMMIT,
+    FRAME_DATA,
+    FRAME_END,
+    FRAME_HEADER,
+    FRAME_OBJECT,
+    PackFormatError,
+    PackFrame,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -188,61 +210,180 @@ def _is_ancestor(
 
 
 # ---------------------------------------------------------------------------
-# Async pull core
+# Transfer: negotiated pack, JSON fallback
 # ---------------------------------------------------------------------------
 
+_SHA256_HEX = re.compile(r"[0-9a-f]{64}")
 
-async def _pull_async(
-    *,
-    root: pathlib.Path,
-    remote_name: str,
-    branch: str | None,
-    rebase: bool = False,
-    ff_only: bool = False,
-) -> None:
-    """Execute the pull pipeline.
 
-    Raises :class:`typer.Exit` with the appropriate code on all error paths.
+@dataclass(frozen=True)
+class _PullResult:
+    """What a pull stored locally, whichever protocol fetched it."""
 
-    After fetching remote commits, the post-fetch integration strategy is
-    determined by *rebase* and *ff_only*:
+    remote_head: str | None
+    new_commits: int
+    new_objects: int
+    diverged: bool = False
 
-    - Default (both False): print divergence warning when branches have
-      diverged; do not touch the local branch ref.
-    - ``ff_only=True``: fast-forward the local branch ref to remote_head if
-      possible; fail with exit 1 if the branches have diverged.
-    - ``rebase=True``: fast-forward if remote is simply ahead; replay local
-      commits onto remote_head when branches have diverged (linear rebase).
 
-    When both *rebase* and *ff_only* are True, *ff_only* takes precedence.
-    """
+def _collect_have_tips(root: pathlib.Path, remote_name: str) -> list[str]:
+    """Commit IDs of every local branch head and *remote_name* tracking head."""
     muse_dir = root / ".muse"
+    tips: set[str] = set()
+    for ref_dir in (muse_dir / "refs" / "heads", muse_dir / "remotes" / remote_name):
+        if not ref_dir.is_dir():
+            continue
+        for ref in ref_dir.rglob("*"):
+            if ref.is_file():
+                commit_id = ref.read_text(encoding="utf-8").strip()
+                if commit_id:
+                    tips.add(commit_id)
+    return sorted(tips)
+
+
+class _IncomingObject:
+    """One object being received: ``D`` frames go to a temp file as they arrive."""
+
+    def __init__(self, root: pathlib.Path, header: Mapping[str, object]) -> None:
+        raw_id = str(header.get("object_id", ""))
+        size_raw = header.get("size_bytes")
+        if not raw_id or not isinstance(size_raw, int):
+            raise PackFormatError("object frame missing object_id or size_bytes")
+        bare_id = raw_id.removeprefix("sha256:")
+        # Hub IDs may carry a "sha256:" prefix; the local store uses bare hex.
+        self.object_id = bare_id if _SHA256_HEX.fullmatch(bare_id) else raw_id
+        self.size_bytes = size_raw
+        self._received = 0
+        self._digest = hashlib.sha256()
+        fd, name = tempfile.mkstemp(prefix="pack-incoming-", dir=root / ".muse")
+        self._tmp = pathlib.Path(name)
+        self._fh = os.fdopen(fd, "wb")
+
+    def write(self, chunk: bytes) -> None:
+        self._received += len(chunk)
+        if self._received > self.size_bytes:
+            raise PackFormatError(f"object {self.object_id[:8]} longer than announced")
+        self._digest.update(chunk)
+        self._fh.write(chunk)
+
+    def finish(self, root: pathlib.Path) -> None:
+        """Verify the received bytes and move them into the object store."""
+        self._fh.close()
+        if self._received != self.size_bytes:
+            raise PackFormatError(f"object {self.object_id[:8]} truncated")
+        if _SHA256_HEX.fullmatch(self.object_id):
+            if self._digest.hexdigest() != self.object_id:
+                raise PackFormatError(f"object {self.object_id[:8]} failed its hash check")
+            write_object_from_path(root, self.object_id, self._tmp)
+        self.discard()
+
+    def discard(self) -> None:
+        if not self._fh.closed:
+            self._fh.close()
+        self._tmp.unlink(missing_ok=True)
+
+
+async def _store_pack(
+    session: AsyncSession,
+    root: pathlib.Path,
+    repo_id: str,
+    frames: AsyncIterator[PackFrame],
+) -> _PullResult:
+    """Store commits and objects from a pack stream as the frames arrive.
+
+    Commits arrive parents-first and are inserted immediately; object bytes
+    are spooled to a temp file, checked against their SHA-256 ID and moved
+    into the object store. A corrupt or truncated stream raises
+    :class:`~maestro.services.musehub_pack.PackFormatError`, and the
+    caller's session rolls back.
+    """
+    remote_head: str | None = None
+    new_commits = 0
+    new_objects = 0
+    commits_seen = 0
+    objects_seen = 0
+    incoming: _IncomingObject | None = None
+    try:
+        async for frame in frames:
+            if incoming is not None and frame.kind != FRAME_DATA:
+                incoming.finish(root)
+                if await store_pulled_object(
+                    session,
+                    {"object_id": incoming.object_id, "size_bytes": incoming.size_bytes},
+                ):
+                    new_objects += 1
+                incoming = None
+
+            if frame.kind == FRAME_HEADER:
+                raw_head = frame.json().get("remote_head")
+                remote_head = raw_head if isinstance(raw_head, str) else None
+            elif frame.kind == FRAME_COMMIT:
+                commit_data = frame.json()
+                commit_data.setdefault("repo_id", repo_id)
+                if await store_pulled_commit(session, commit_data):
+                    new_commits += 1
+                commits_seen += 1
+            elif frame.kind == FRAME_OBJECT:
+                incoming = _IncomingObject(root, frame.json())
+                objects_seen += 1
+            elif frame.kind == FRAME_DATA:
+                if incoming is None:
+                    raise PackFormatError("data frame outside an object")
+                incoming.write(frame.payload)
+            elif frame.kind == FRAME_END:
+                trailer = frame.json()
+                if trailer.get("commits") != commits_seen or trailer.get("objects") != objects_seen:
+                    raise PackFormatError("pack trailer does not match the frames received")
+    finally:
+        if incoming is not None:
+            incoming.discard()
+
+    return _PullResult(
+        remote_head=remote_head, new_commits=new_commits, new_objects=new_objects
+    )
 
-    # ── Repo identity ────────────────────────────────────────────────────
-    repo_data: dict[str, str] = json.loads((muse_dir / "repo.json").read_text())
-    repo_id = repo_data["repo_id"]
 
-    # ── Branch resolution ────────────────────────────────────────────────
-    head_ref = (muse_dir / "HEAD").read_text().strip()
-    effective_branch = branch or head_ref.rsplit("/", 1)[-1]
+async def _pull_pack(
+    hub: MuseHubClient,
+    root: pathlib.Path,
+    *,
+    repo_id: str,
+    branch: str,
+    have_tips: list[str],
+) -> _PullResult | None:
+    """Fetch *branch* over the negotiated pack protocol.
+
+    Returns ``None`` when the Hub does not answer with a pack, so the caller
+    falls back to the JSON ``/pull`` endpoint.
+    """
+    request = PackPullRequest(branch=branch, have_tips=have_tips)
+    async with hub.open_pack("/pull/pack", json=request) as frames:
+        if frames is None:
+            return None
+        async with open_session() as session:
+            return await _store_pack(session, root, repo_id, frames)
 
-    # ── Remote URL ───────────────────────────────────────────────────────
-    remote_url = get_remote(remote_name, root)
-    if not remote_url:
-        typer.echo(_NO_REMOTE_MSG)
-        raise typer.Exit(code=int(ExitCode.USER_ERROR))
 
-    # ── Collect have-sets for delta pull ─────────────────────────────────
+async def _pull_json(
+    hub: MuseHubClient,
+    *,
+    repo_id: str,
+    branch: str,
+    rebase: bool,
+    ff_only: bool,
+) -> _PullResult:
+    """Fetch *branch* over the JSON ``/pull`` endpoint.
+
+    The fallback for Hubs without pack support: sends every local commit
+    and object ID as exclusion lists and stores the descriptors returned.
+    """
     async with open_session() as session:
-        local_commits = await get_commits_for_branch(session, repo_id, effective_branch)
+        local_commits = await get_commits_for_branch(session, repo_id, branch)
         have_commits = [c.commit_id for c in local_commits]
         have_objects = await get_all_object_ids(session, repo_id)
 
-    mode_hint = " (--rebase)" if rebase else " (--ff-only)" if ff_only else ""
-    typer.echo(f"⬇️ Pulling {remote_name}/{effective_branch}{mode_hint} …")
-
     pull_request = PullRequest(
-        branch=effective_branch,
+        branch=branch,
         have_commits=have_commits,
         have_objects=have_objects,
     )
@@ -251,30 +392,17 @@ async def _pull_async(
     if ff_only:
         pull_request["ff_only"] = True
 
-    # ── HTTP pull ────────────────────────────────────────────────────────
-    try:
-        async with MuseHubClient(base_url=remote_url, repo_root=root) as hub:
-            response = await hub.post("/pull", json=pull_request)
+    response = await hub.post("/pull", json=pull_request)
 
-        if response.status_code != 200:
-            typer.echo(
-                f"❌ Hub rejected pull (HTTP {response.status_code}): {response.text}"
-            )
-            logger.error(
-                "❌ muse pull failed: HTTP %d — %s",
-                response.status_code,
-                response.text,
-            )
-            raise typer.Exit(code=int(ExitCode.INTERNAL_ERROR))
-
-    except typer.Exit:
-        raise
-    except httpx.TimeoutException:
-        typer.echo(f"❌ Pull timed out connecting to {remote_url}")
-        raise typer.Exit(code=int(ExitCode.INTERNAL_ERROR))
-    except httpx.HTTPError as exc:
-        typer.echo(f"❌ Network error during pull: {exc}")
-        logger.error("❌ muse pull network error: %s", exc, exc_info=True)
+    if response.status_code != 200:
+        typer.echo(
+            f"❌ Hub rejected pull (HTTP {response.status_code}): {response.text}"
+        )
+        logger.error(
+            "❌ muse pull failed: HTTP %d — %s",
+            response.status_code,
+            response.text,
+        )
         raise typer.Exit(code=int(ExitCode.INTERNAL_ERROR))
 
     # ── Parse response ───────────────────────────────────────────────────
@@ -311,8 +439,100 @@ async def _pull_async(
                 if inserted:
                     new_objects_count += 1
 
+    return _PullResult(
+        remote_head=pull_response["remote_head"],
+        new_commits=new_commits_count,
+        new_objects=new_objects_count,
+        diverged=pull_response["diverged"],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Async pull core
+# ---------------------------------------------------------------------------
+
+
+async def _pull_async(
+    *,
+    root: pathlib.Path,
+    remote_name: str,
+    branch: str | None,
+    rebase: bool = False,
+    ff_only: bool = False,
+) -> None:
+    """Execute the pull pipeline.
+
+    Raises :class:`typer.Exit` with the appropriate code on all error paths.
+
+    After fetching remote commits, the post-fetch integration strategy is
+    determined by *rebase* and *ff_only*:
+
+    - Default (both False): print divergence warning when branches have
+      diverged; do not touch the local branch ref.
+    - ``ff_only=True``: fast-forward the local branch ref to remote_head if
+      possible; fail with exit 1 if the branches have diverged.
+    - ``rebase=True``: fast-forward if remote is simply ahead; replay local
+      commits onto remote_head when branches have diverged (linear rebase).
+
+    When both *rebase* and *ff_only* are True, *ff_only* takes precedence.
+    """
+    muse_dir = root / ".muse"
+
+    # ── Repo identity ────────────────────────────────────────────────────
+    repo_data: dict[str, str] = json.loads((muse_dir / "repo.json").read_text())
+    repo_id = repo_data["repo_id"]
+
+    # ── Branch resolution ────────────────────────────────────────────────
+    head_ref = (muse_dir / "HEAD").read_text().strip()
+    effective_branch = branch or head_ref.rsplit("/", 1)[-1]
+
+    # ── Remote URL ───────────────────────────────────────────────────────
+    remote_url = get_remote(remote_name, root)
+    if not remote_url:
+        typer.echo(_NO_REMOTE_MSG)
+        raise typer.Exit(code=int(ExitCode.USER_ERROR))
+
+    mode_hint = " (--rebase)" if rebase else " (--ff-only)" if ff_only else ""
+    typer.echo(f"⬇️ Pulling {remote_name}/{effective_branch}{mode_hint} …")
+
+    # ── HTTP pull: negotiated pack, JSON fallback ────────────────────────
+    try:
+        async with MuseHubClient(base_url=remote_url, repo_root=root) as hub:
+            result = await _pull_pack(
+                hub,
+                root,
+                repo_id=repo_id,
+                branch=effective_branch,
+                have_tips=_collect_have_tips(root, remote_name),
+            )
+            if result is None:
+                result = await _pull_json(
+                    hub,
+                    repo_id=repo_id,
+                    branch=effective_branch,
+                    rebase=rebase,
+                    ff_only=ff_only,
+                )
+
+    except typer.Exit:
+        raise
+    except PackFormatError as exc:
+        typer.echo(f"❌ Hub sent a corrupt pack: {exc}")
+        logger.error("❌ muse pull pack error: %s", exc, exc_info=True)
+        raise typer.Exit(code=int(ExitCode.INTERNAL_ERROR))
+    except httpx.TimeoutException:
+        typer.echo(f"❌ Pull timed out connecting to {remote_url}")
+        raise typer.Exit(code=int(ExitCode.INTERNAL_ERROR))
+    except httpx.HTTPError as exc:
+        typer.echo(f"❌ Network error during pull: {exc}")
+        logger.error("❌ muse pull network error: %s", exc, exc_info=True)
+        raise typer.Exit(code=int(ExitCode.INTERNAL_ERROR))
+
+    new_commits_count = result.new_commits
+    new_objects_count = result.new_objects
+
     # ── Update remote tracking head ───────────────────────────────────────
-    remote_head_from_hub = pull_response["remote_head"]
+    remote_head_from_hub = result.remote_head
     if remote_head_from_hub:
         set_remote_head(remote_name, effective_branch, remote_head_from_hub, root)
 
@@ -323,7 +543,7 @@ async def _pull_async(
         raw = ref_path.read_text(encoding="utf-8").strip()
         local_head = raw if raw else None
 
-    diverged = pull_response["diverged"]
+    diverged = result.diverged
 
     # Re-check divergence locally using the updated commit graph
     async with open_session() as session:
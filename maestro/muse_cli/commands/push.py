@@ -11,9 +11,15 @@ Push algorithm
 5. Read last known remote HEAD from ``.muse/remotes/origin/<branch>``
    (may not exist on first push).
 6. Query Postgres for all commits on the branch; compute the delta since
-   the last known remote HEAD (or all commits if no prior push).
-7. Build :class:`~maestro.muse_cli.hub_client.PushRequest` payload.
-8. POST to ``<remote_url>/push`` with Bearer auth.
+   the last known remote HEAD (or all commits if no prior push). Commits
+   without a changed-path filter get one computed on the way.
+7. Stream the delta commits plus the objects their snapshots reference to
+   ``<remote_url>/push/pack`` as a binary pack (see
+   :mod:`maestro.services.musehub_pack`) with Bearer auth. Object bytes are
+   read from the local store in chunks, so nothing is buffered in memory.
+8. If the Hub answers 404 (no pack endpoint), fall back to POSTing a
+   :class:`~maestro.muse_cli.hub_client.PushRequest` JSON payload to
+   ``<remote_url>/push``. Any other status is handled as the push result.
 9. On success, update ``.muse/remotes/origin/<branch>`` to the new HEAD.
    If ``--set-upstream`` was given, record the upstream tracking in config.
 
@@ -37,21 +43,30 @@ Exit codes:
 from __future__ import annotations
 
 import asyncio
+import io
 import json
 import logging
 import pathlib
+from collections.abc import Callable, Iterable, Mapping
+from typing import BinaryIO
 
 import httpx
 import typer
 
 from maestro.muse_cli._repo import require_repo
+from maestro.muse_cli.changed_paths import backfill_changed_path_blooms
 from maestro.muse_cli.config import (
     get_remote,
     get_remote_head,
     set_remote_head,
     set_upstream,
 )
-from maestro.muse_cli.db import get_commits_for_branch, get_all_object_ids, open_session
+from maestro.muse_cli.db import (
+    get_all_object_ids,
+    get_commits_for_branch,
+    load_snapshot_manifests,
+    open_session,
+)
 from maestro.muse_cli.errors import ExitCode
 from maestro.muse_cli.hub_client import (
     MuseHubClient,
@@ -61,6 +76,8 @@ from maestro.muse_cli.hub_client import (
     PushTagPayload,
 )
 from maestro.muse_cli.models import MuseCliCommit
+from maestro.muse_cli.object_store import object_path, read_object
+from maestro.services.musehub_pack import PackObject, encode_pack
 
 logger = logging.getLogger(__name__)
 
@@ -210,6 +227,88 @@ def _build_push_request(
     return request
 
 
+def _build_pack_header(request: PushRequest) -> dict[str, object]:
+    """Return the pack ``H`` frame for *request* (everything but commits/objects)."""
+    return {k: v for k, v in request.items() if k not in ("commits", "objects")}
+
+
+def _build_pack_commits(delta: list[MuseCliCommit]) -> list[dict[str, object]]:
+    """Serialize *delta* as pack ``C`` frames in the Hub's ``CommitInput`` shape."""
+    return [
+        {
+            "commit_id": c.commit_id,
+            "parent_ids": [p for p in (c.parent_commit_id, c.parent2_commit_id) if p],
+            "message": c.message,
+            "snapshot_id": c.snapshot_id,
+            "timestamp": c.committed_at.isoformat(),
+            "author": c.author,
+        }
+        for c in delta
+    ]
+
+
+def _remote_snapshot_id(
+    commits: list[MuseCliCommit],
+    remote_head: str | None,
+) -> str | None:
+    """Return the snapshot ID of *remote_head* if it is in *commits*, else ``None``."""
+    for commit in commits:
+        if commit.commit_id == remote_head:
+            return commit.snapshot_id
+    return None
+
+
+def _build_pack_objects(
+    root: pathlib.Path,
+    delta: list[MuseCliCommit],
+    manifests: Mapping[str, Mapping[str, str]],
+    remote_objects: Iterable[str] = (),
+) -> list[PackObject]:
+    """Return one :class:`PackObject` per object referenced by *delta*'s snapshots.
+
+    Unlike the JSON payload (which lists every object ID in the repo with no
+    content), a pack carries object bytes, so only objects the delta
+    introduces are sent: anything in *remote_objects* (the manifest of the
+    remote head's snapshot, which the Hub already stores) is skipped. Each
+    object is sent once, under the first path that references it.
+    """
+    seen: set[str] = set(remote_objects)
+    objects: list[PackObject] = []
+    for commit in delta:
+        for path, object_id in sorted(manifests.get(commit.snapshot_id, {}).items()):
+            if object_id in seen:
+                continue
+            seen.add(object_id)
+            objects.append(
+                PackObject(
+                    object_id=object_id,
+                    path=path,
+                    disk_path=str(object_path(root, object_id)),
+                )
+            )
+    return objects
+
+
+def _local_object_opener(root: pathlib.Path) -> Callable[[PackObject], BinaryIO]:
+    """Return an ``open_object`` hook for :func:`encode_pack`.
+
+    Loose objects are streamed from disk; objects that ``muse gc`` moved into
+    a local pack are read out of it. Objects absent from both raise
+    :class:`FileNotFoundError` so the encoder skips them with a warning.
+    """
+
+    def _open(obj: PackObject) -> BinaryIO:
+        try:
+            return pathlib.Path(obj.disk_path).open("rb")
+        except FileNotFoundError:
+            content = read_object(root, obj.object_id)
+            if content is None:
+                raise
+            return io.BytesIO(content)
+
+    return _open
+
+
 # ---------------------------------------------------------------------------
 # Async push core
 # ---------------------------------------------------------------------------
@@ -267,8 +366,20 @@ async def _push_async(
     async with open_session() as session:
         commits = await get_commits_for_branch(session, repo_id, effective_branch)
         all_object_ids = await get_all_object_ids(session, repo_id)
-
-    delta = _compute_push_delta(commits, remote_head)
+        delta = _compute_push_delta(commits, remote_head)
+        remote_snapshot_id = _remote_snapshot_id(commits, remote_head)
+        manifests = await load_snapshot_manifests(
+            session,
+            [c.snapshot_id for c in delta]
+            + ([remote_snapshot_id] if remote_snapshot_id else []),
+        )
+        remote_manifest = manifests.get(remote_snapshot_id, {}) if remote_snapshot_id else {}
+        # Changed-path filters are advisory — never let a backfill failure
+        # block the push itself.
+        try:
+            await backfill_changed_path_blooms(session, commits)
+        except Exception as exc:
+            logger.warning("⚠️ Could not backfill changed-path filters: %s", exc)
 
     if not delta and remote_head == head_commit_id and not include_tags:
         typer.echo(f"✅ Everything up to date — {remote_name}/{effective_branch} is current.")
@@ -304,7 +415,16 @@ async def _push_async(
     # ── HTTP push ────────────────────────────────────────────────────────
     try:
         async with MuseHubClient(base_url=remote_url, repo_root=root) as hub:
-            response = await hub.post("/push", json=payload)
+            pack = encode_pack(
+                _build_pack_header(payload),
+                _build_pack_commits(delta),
+                _build_pack_objects(root, delta, manifests, remote_manifest.values()),
+                open_object=_local_object_opener(root),
+            )
+            response = await hub.push_pack("/push/pack", pack)
+            if response.status_code == 404:
+                logger.info("⚠️ Hub has no pack push endpoint — falling back to JSON push")
+                response = await hub.post("/push", json=payload)
 
         if response.status_code == 200:
             set_remote_head(remote_name, effective_branch, head_commit_id, root)
@@ -0,0 +1,623 @@
+"""In-memory Muse commit graph with an optional on-disk cache.
+
+History commands (``muse log``, ``muse blame``, ``muse grep``,
+``muse bisect``, merge-base discovery) used to walk the commit DAG with one
+``session.get(MuseCliCommit, id)`` per commit — an N+1 round-trip pattern
+that makes ``muse log`` on a 10k-commit repository take seconds.
+
+:class:`CommitGraph` is the whole parent DAG of a repository held as
+integer-indexed columns:
+
+- ``ids[n]`` — commit ID of node *n*
+- ``parent1[n]`` / ``parent2[n]`` — parent node indices (``-1`` = none)
+- ``generation[n]`` — 1 for a root commit, otherwise 1 + the largest parent
+  generation; a commit's generation is always greater than every ancestor's
+- ``committed_at[n]`` — POSIX timestamp of the commit
+- ``blooms[n]`` — changed-path Bloom filter (see
+  :mod:`maestro.muse_cli.changed_paths`), or ``None`` when not computed
+
+Ancestry, merge-base and range queries run against these arrays without
+touching the database. Merge-base search walks both sides in generation
+order and stops as soon as every remaining candidate is known to be below
+a common ancestor, instead of collecting one side's entire ancestry.
+Path-limited walks consult ``blooms`` to skip commits that definitely did
+not touch a path. Full :class:`MuseCliCommit` rows, when a command needs
+them, are fetched with :func:`load_commit_rows` in batched ``IN`` queries.
+
+Loading
+-------
+:func:`load_commit_graph` selects ``(commit_id, parent ids, committed_at)``
+for every commit of a repository in one query. Parents that live outside
+the repository (rare — e.g. commits imported from another repo) are
+resolved with batched ``IN`` lookups. A parent that does not exist at all is
+kept as a *missing* node with no parents so ancestry sets match what a
+row-by-row walk would have visited.
+
+On-disk cache (``.muse/commit-graph.json``)
+-------------------------------------------
+When a ``repo_root`` is supplied the graph is cached in
+``.muse/commit-graph.json``, stored as JSON lines: a header object, then one
+``[commit_id, parent1, parent2, generation, committed_at, bloom]`` line per
+node. ``muse commit`` appends one line for its new commit instead of
+rewriting the file, so in the steady state loading the graph costs a single
+``COUNT(*)`` query. The cache is used only while that count matches and the
+commit ``HEAD`` resolves to is in it; otherwise (another command such as
+``muse merge``, ``muse pull`` or ``muse reset`` changed history) the graph is
+reloaded from the database and the file rewritten. Like
+``.muse/index.json`` the file is purely advisory: unreadable, torn or
+mismatched files are ignored.
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+import heapq
+import json
+import logging
+import os
+import pathlib
+from array import array
+from collections import deque
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timezone
+
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from maestro.muse_cli.changed_paths import bloom_may_contain
+from maestro.muse_cli.models import MuseCliCommit
+
+logger = logging.getLogger(__name__)
+
+_GRAPH_FILENAME = "commit-graph.json"
+_GRAPH_VERSION = 3
+_IN_BATCH = 500
+
+#: Row shape accepted by :meth:`CommitGraph.from_rows`:
+#: ``(commit_id, parent1, parent2, timestamp, changed_paths_bloom)``.
+GraphRow = tuple[str, str | None, str | None, float, bytes | None]
+
+# Paint flags for merge-base search.
+_PARENT1 = 1
+_PARENT2 = 2
+_STALE = 4
+
+
+def _timestamp(dt: datetime) -> float:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+class CommitGraph:
+    """Column-oriented commit DAG of one repository."""
+
+    def __init__(self) -> None:
+        self.ids: list[str] = []
+        self.parent1: array[int] = array("i")
+        self.parent2: array[int] = array("i")
+        self.generation: array[int] = array("I")
+        self.committed_at: array[float] = array("d")
+        self.blooms: list[bytes | None] = []
+        #: Node indices referenced as parents but absent from the database.
+        self.missing: set[int] = set()
+        #: Number of nodes that belong to the repository the graph was loaded for.
+        self.repo_commits = 0
+        self._index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, commit_id: object) -> bool:
+        if not isinstance(commit_id, str):
+            return False
+        n = self._index.get(commit_id)
+        return n is not None and n not in self.missing
+
+    def node(self, commit_id: str) -> int | None:
+        """Return the node index of *commit_id*, or ``None`` when unknown."""
+        return self._index.get(commit_id)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[GraphRow]) -> CommitGraph:
+        """Build a graph from :data:`GraphRow` tuples.
+
+        Parents not present in *rows* become missing nodes.
+        """
+        graph = cls()
+        pending: list[tuple[str | None, str | None]] = []
+        for commit_id, p1, p2, ts, bloom in rows:
+            if commit_id in graph._index:
+                continue
+            graph._add_node(commit_id, ts, bloom)
+            pending.append((p1, p2))
+        for n, (p1, p2) in enumerate(pending):
+            graph.parent1[n] = graph._parent_node(p1)
+            graph.parent2[n] = graph._parent_node(p2)
+        graph._compute_generations()
+        return graph
+
+    def _add_node(self, commit_id: str, ts: float, bloom: bytes | None = None) -> int:
+        n = len(self.ids)
+        self.ids.append(commit_id)
+        self._index[commit_id] = n
+        self.parent1.append(-1)
+        self.parent2.append(-1)
+        self.generation.append(0)
+        self.committed_at.append(ts)
+        self.blooms.append(bloom)
+        return n
+
+    def _parent_node(self, parent_id: str | None) -> int:
+        if not parent_id:
+            return -1
+        n = self._index.get(parent_id)
+        if n is None:
+            n = self._add_node(parent_id, 0.0)
+            self.missing.add(n)
+        return n
+
+    def _compute_generations(self) -> None:
+        gen = self.generation
+        p1, p2 = self.parent1, self.parent2
+        # Iterative post-order DFS; ``visiting`` guards against corrupt
+        # parent links forming a cycle.
+        visiting: set[int] = set()
+        for start in range(len(self.ids)):
+            if gen[start]:
+                continue
+            stack = [start]
+            while stack:
+                n = stack[-1]
+                visiting.add(n)
+                pending = [
+                    p for p in (p1[n], p2[n])
+                    if p >= 0 and not gen[p] and p not in visiting
+                ]
+                if pending:
+                    stack.extend(pending)
+                    continue
+                stack.pop()
+                visiting.discard(n)
+                if gen[n]:
+                    continue
+                best = 0
+                for p in (p1[n], p2[n]):
+                    if p >= 0 and gen[p] > best:
+                        best = gen[p]
+                gen[n] = best + 1
+
+    def append(
+        self,
+        commit_id: str,
+        parent_ids: Sequence[str],
+        committed_at: datetime,
+        bloom: bytes | None = None,
+    ) -> None:
+        """Add a newly written commit whose parents are already in the graph."""
+        if commit_id in self._index:
+            return
+        parents = [self._parent_node(pid) for pid in parent_ids[:2]]
+        n = self._add_node(commit_id, _timestamp(committed_at), bloom)
+        if parents:
+            self.parent1[n] = parents[0]
+        if len(parents) > 1:
+            self.parent2[n] = parents[1]
+        self.generation[n] = 1 + max(
+            (self.generation[p] for p in parents), default=0,
+        )
+        self.repo_commits += 1
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def parents(self, node: int) -> tuple[int, ...]:
+        """Parent node indices of *node* (first parent first)."""
+        a, b = self.parent1[node], self.parent2[node]
+        if a < 0:
+            return (b,) if b >= 0 else ()
+        return (a, b) if b >= 0 else (a,)
+
+    def parent_ids(self, commit_id: str) -> list[str]:
+        n = self._index.get(commit_id)
+        if n is None:
+            return []
+        return [self.ids[p] for p in self.parents(n)]
+
+    def first_parent_chain(self, commit_id: str, limit: int | None = None) -> list[str]:
+        """Commit IDs from *commit_id* following first parents, newest first.
+
+        Stops at a root commit, at a missing parent, or after *limit* IDs.
+        """
+        chain: list[str] = []
+        n = self._index.get(commit_id, -1)
+        while n >= 0 and (limit is None or len(chain) < limit):
+            if n in self.missing:
+                logger.warning("⚠️ Commit %s not found in DB — chain broken", self.ids[n][:8])
+                break
+            chain.append(self.ids[n])
+            n = self.parent1[n]
+        return chain
+
+    def _ancestor_nodes(self, node: int) -> set[int]:
+        seen = {node}
+        queue = deque([node])
+        while queue:
+            n = queue.popleft()
+            for p in self.parents(n):
+                if p not in seen:
+                    seen.add(p)
+                    queue.append(p)
+        return seen
+
+    def ancestors(self, commit_id: str) -> set[str]:
+        """All commit IDs reachable from *commit_id*, inclusive.
+
+        An unknown *commit_id* yields ``{commit_id}``.
+        """
+        n = self._index.get(commit_id)
+        if n is None:
+            return {commit_id}
+        return {self.ids[a] for a in self._ancestor_nodes(n)}
+
+    def is_ancestor(self, ancestor_id: str, descendant_id: str) -> bool:
+        """Return ``True`` when *ancestor_id* is reachable from *descendant_id*."""
+        return ancestor_id in self.ancestors(descendant_id)
+
+    def range(self, exclude_id: str, include_id: str) -> set[str]:
+        """Commits reachable from *include_id* but not from *exclude_id*."""
+        return self.ancestors(include_id) - self.ancestors(exclude_id)
+
+    def may_have_changed(self, commit_id: str, path: str) -> bool:
+        """Return ``False`` only if *commit_id* definitely did not touch *path*.
+
+        Unknown commits and commits without a filter answer ``True``.
+        """
+        n = self._index.get(commit_id)
+        if n is None:
+            return True
+        return bloom_may_contain(self.blooms[n], path)
+
+    def merge_base(self, commit_id_a: str, commit_id_b: str) -> str | None:
+        """Lowest common ancestor of two commits, or ``None`` when disjoint.
+
+        Paints ancestors of *a* and *b* in descending generation order. The
+        first node reached from both sides is a best common ancestor: no
+        other common ancestor can have a higher generation. Its ancestors
+        are marked stale, and the walk stops once only stale nodes remain —
+        history below the merge base is never visited. Ties between equally
+        good bases (criss-cross merges) go to the newer commit.
+        """
+        na = self._index.get(commit_id_a)
+        nb = self._index.get(commit_id_b)
+        if na is None or nb is None:
+            return commit_id_a if commit_id_a == commit_id_b else None
+        if na == nb:
+            return commit_id_a
+
+        flags: dict[int, int] = {na: _PARENT1, nb: _PARENT2}
+        heap: list[tuple[int, float, int]] = []
+        for n in (na, nb):
+            heapq.heappush(heap, (-self.generation[n], -self.committed_at[n], n))
+
+        best: int | None = None
+        while heap and any(not flags[n] & _STALE for _, _, n in heap):
+            _, _, n = heapq.heappop(heap)
+            paint = flags[n] & (_PARENT1 | _PARENT2 | _STALE)
+            if paint == _PARENT1 | _PARENT2:
+                if best is None:
+                    best = n
+                paint |= _STALE
+                flags[n] |= _STALE
+            for p in self.parents(n):
+                if flags.get(p, 0) & paint == paint:
+                    continue
+                flags[p] = flags.get(p, 0) | paint
+                heapq.heappush(heap, (-self.generation[p], -self.committed_at[p], p))
+        return self.ids[best] if best is not None else None
+
+    # ------------------------------------------------------------------
+    # Serialisation
+    # ------------------------------------------------------------------
+
+    def node_record(self, n: int) -> list[object]:
+        """JSON-serialisable ``commits`` entry of node *n*."""
+        return [
+            self.ids[n], self.parent1[n], self.parent2[n],
+            self.generation[n], self.committed_at[n], _encode_bloom(self.blooms[n]),
+        ]
+
+    def to_json(self, repo_id: str) -> dict[str, object]:
+        return {
+            "version": _GRAPH_VERSION,
+            "repo_id": repo_id,
+            "repo_commits": self.repo_commits,
+            "missing": sorted(self.missing),
+            "commits": [self.node_record(n) for n in range(len(self.ids))],
+        }
+
+    @classmethod
+    def from_json(cls, data: object, repo_id: str) -> CommitGraph | None:
+        """Rebuild a graph from :meth:`to_json` output, or ``None`` if invalid."""
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != _GRAPH_VERSION
+            or data.get("repo_id") != repo_id
+        ):
+            return None
+        graph = cls()
+        try:
+            for commit_id, p1, p2, gen, ts, bloom in data["commits"]:
+                n = graph._add_node(str(commit_id), float(ts), _decode_bloom(bloom))
+                graph.parent1[n] = int(p1)
+                graph.parent2[n] = int(p2)
+                graph.generation[n] = int(gen)
+            graph.missing = {int(n) for n in data["missing"]}
+            graph.repo_commits = int(data["repo_commits"])
+        except (KeyError, TypeError, ValueError, OverflowError, binascii.Error):
+            return None
+        size = len(graph.ids)
+        if any(p >= size for p in graph.parent1) or any(p >= size for p in graph.parent2):
+            return None
+        return graph
+
+
+def _encode_bloom(bloom: bytes | None) -> str | None:
+    return base64.b64encode(bloom).decode("ascii") if bloom is not None else None
+
+
+def _decode_bloom(raw: object) -> bytes | None:
+    if raw is None:
+        return None
+    return base64.b64decode(str(raw), validate=True)
+
+
+# ---------------------------------------------------------------------------
+# Loading from the database
+# ---------------------------------------------------------------------------
+
+
+_GRAPH_COLUMNS = (
+    MuseCliCommit.commit_id,
+    MuseCliCommit.parent_commit_id,
+    MuseCliCommit.parent2_commit_id,
+    MuseCliCommit.committed_at,
+    MuseCliCommit.changed_paths_bloom,
+)
+
+
+async def _fetch_rows_by_id(session: AsyncSession, commit_ids: Iterable[str]) -> list[GraphRow]:
+    wanted = list(commit_ids)
+    rows: list[GraphRow] = []
+    for i in range(0, len(wanted), _IN_BATCH):
+        result = await session.execute(
+            select(*_GRAPH_COLUMNS).where(MuseCliCommit.commit_id.in_(wanted[i:i + _IN_BATCH]))
+        )
+        rows.extend(
+            (cid, p1, p2, _timestamp(ts), bloom) for cid, p1, p2, ts, bloom in result.all()
+        )
+    return rows
+
+
+async def _load_from_db(
+    session: AsyncSession,
+    repo_id: str,
+    extra_ids: Iterable[str] = (),
+) -> CommitGraph:
+    result = await session.execute(
+        select(*_GRAPH_COLUMNS).where(MuseCliCommit.repo_id == repo_id)
+    )
+    rows: list[GraphRow] = [
+        (cid, p1, p2, _timestamp(ts), bloom) for cid, p1, p2, ts, bloom in result.all()
+    ]
+    repo_commits = len(rows)
+
+    # Resolve parents (and requested commits) that live outside the repo.
+    known = {row[0] for row in rows}
+    wanted = {cid for cid in extra_ids if cid not in known}
+    for _, p1, p2, _, _ in rows:
+        for p in (p1, p2):
+            if p and p not in known:
+                wanted.add(p)
+    while wanted:
+        fetched = await _fetch_rows_by_id(session, wanted)
+        rows.extend(fetched)
+        known.update(wanted)
+        wanted = {
+            p for _, p1, p2, _, _ in fetched for p in (p1, p2) if p and p not in known
+        }
+
+    graph = CommitGraph.from_rows(rows)
+    graph.repo_commits = repo_commits
+    return graph
+
+
+def _graph_path(repo_root: pathlib.Path) -> pathlib.Path:
+    return repo_root / ".muse" / _GRAPH_FILENAME
+
+
+def _head_commit_id(repo_root: pathlib.Path) -> str | None:
+    """Return the commit ID ``.muse/HEAD`` resolves to, or ``None``."""
+    muse_dir = repo_root / ".muse"
+    try:
+        head = (muse_dir / "HEAD").read_text().strip()
+        if head.startswith("refs/"):
+            head = (muse_dir / head).read_text().strip()
+    except OSError:
+        return None
+    return head or None
+
+
+def read_commit_graph_file(repo_root: pathlib.Path, repo_id: str) -> CommitGraph | None:
+    """Return the cached graph from ``.muse/commit-graph.json``, if usable.
+
+    Node lines after the header's ``nodes`` count were appended by
+    :func:`append_commit_to_graph_file` and each add one repository commit.
+    """
+    path = _graph_path(repo_root)
+    if not path.exists():
+        return None
+    try:
+        lines = path.read_text().splitlines()
+        header = json.loads(lines[0]) if lines else None
+        commits = [json.loads(line) for line in lines[1:]]
+    except (json.JSONDecodeError, OSError) as exc:
+        logger.warning("⚠️ Ignoring unreadable %s: %s", _GRAPH_FILENAME, exc)
+        return None
+    if not isinstance(header, dict):
+        return None
+    try:
+        appended = len(commits) - int(header["nodes"])
+        repo_commits = int(header["repo_commits"]) + appended
+    except (KeyError, TypeError, ValueError):
+        return None
+    if appended < 0:
+        return None
+    return CommitGraph.from_json(
+        {**header, "repo_commits": repo_commits, "commits": commits}, repo_id,
+    )
+
+
+def write_commit_graph_file(
+    repo_root: pathlib.Path,
+    repo_id: str,
+    graph: CommitGraph,
+) -> None:
+    """Persist *graph* atomically; failures are logged and swallowed."""
+    path = _graph_path(repo_root)
+    if not path.parent.is_dir():
+        return
+    header = {
+        "version": _GRAPH_VERSION,
+        "repo_id": repo_id,
+        "repo_commits": graph.repo_commits,
+        "missing": sorted(graph.missing),
+        "nodes": len(graph),
+    }
+    lines = [json.dumps(header, separators=(",", ":"))]
+    lines.extend(
+        json.dumps(graph.node_record(n), separators=(",", ":")) for n in range(len(graph))
+    )
+    tmp_path = path.with_name(f"{_GRAPH_FILENAME}.tmp")
+    try:
+        tmp_path.write_text("\n".join(lines) + "\n")
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logger.warning("⚠️ Could not write %s: %s", _GRAPH_FILENAME, exc)
+
+
+def append_commit_to_graph_file(
+    repo_root: pathlib.Path,
+    repo_id: str,
+    commit_id: str,
+    parent_ids: Sequence[str],
+    committed_at: datetime,
+    bloom: bytes | None = None,
+) -> None:
+    """Append a freshly written commit to the on-disk graph, if one exists.
+
+    Called by ``muse commit``. Only the new node's line is appended; the
+    rest of the file is left as is. When the file is absent, or one of the
+    parents is not in it, nothing is written — the next
+    :func:`load_commit_graph` with a ``repo_root`` rebuilds it.
+    """
+    graph = read_commit_graph_file(repo_root, repo_id)
+    if (
+        graph is None
+        or graph.node(commit_id) is not None
+        or any(pid not in graph for pid in parent_ids)
+    ):
+        return
+    graph.append(commit_id, parent_ids, committed_at, bloom)
+    record = json.dumps(graph.node_record(len(graph) - 1), separators=(",", ":"))
+    try:
+        with _graph_path(repo_root).open("a") as fh:
+            fh.write(record + "\n")
+    except OSError as exc:
+        logger.warning("⚠️ Could not append to %s: %s", _GRAPH_FILENAME, exc)
+
+
+async def load_commit_graph(
+    session: AsyncSession,
+    repo_id: str,
+    *,
+    repo_root: pathlib.Path | None = None,
+    extra_ids: Iterable[str] = (),
+) -> CommitGraph:
+    """Load the commit DAG of *repo_id*.
+
+    Args:
+        session: Open async DB session.
+        repo_id: Repository whose commits to load.
+        repo_root: When given, use and maintain ``.muse/commit-graph.json``.
+        extra_ids: Commit IDs that must be in the graph even if they belong
+            to another repository.
+    """
+    extra = [cid for cid in extra_ids if cid]
+    if repo_root is not None:
+        cached = read_commit_graph_file(repo_root, repo_id)
+        head = _head_commit_id(repo_root)
+        if (
+            cached is not None
+            and all(cid in cached for cid in extra)
+            and (head is None or head in cached)
+        ):
+            count = await session.scalar(
+                select(func.count()).select_from(MuseCliCommit).where(
+                    MuseCliCommit.repo_id == repo_id
+                )
+            )
+            if count == cached.repo_commits:
+                return cached
+
+    graph = await _load_from_db(session, repo_id, extra)
+    if repo_root is not None:
+        write_commit_graph_file(repo_root, repo_id, graph)
+    logger.debug("✅ Loaded commit graph for %s: %d nodes", repo_id[:8], len(graph))
+    return graph
+
+
+async def commit_graph_for(
+    session: AsyncSession,
+    *commit_ids: str,
+    repo_root: pathlib.Path | None = None,
+) -> CommitGraph:
+    """Load the graph of the repository that owns the first of *commit_ids*.
+
+    Every ID in *commit_ids* is guaranteed to be in the returned graph if it
+    exists in the database. Returns an empty graph when none of them exist.
+    """
+    for commit_id in commit_ids:
+        if not commit_id:
+            continue
+        row = await session.get(MuseCliCommit, commit_id)
+        if row is not None:
+            return await load_commit_graph(
+                session, row.repo_id, repo_root=repo_root, extra_ids=commit_ids,
+            )
+    return CommitGraph()
+
+
+async def load_commit_rows(
+    session: AsyncSession,
+    commit_ids: Sequence[str],
+) -> list[MuseCliCommit]:
+    """Fetch full commit rows for *commit_ids* in batched ``IN`` queries.
+
+    Rows come back in the order of *commit_ids*; unknown IDs are skipped.
+    """
+    by_id: dict[str, MuseCliCommit] = {}
+    for i in range(0, len(commit_ids), _IN_BATCH):
+        batch = list(commit_ids[i:i + _IN_BATCH])
+        result = await session.execute(
+            select(MuseCliCommit).where(MuseCliCommit.commit_id.in_(batch))
+        )
+        for row in result.scalars().all():
+            by_id[row.commit_id] = row
+    return [by_id[cid] for cid in commit_ids if cid in by_id]
@@ -15,7 +15,7 @@ from __future__ import annotations
 
 import contextlib
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.future import select
@@ -104,6 +104,24 @@ async def get_head_snapshot_id(
     return row
 
 
+async def load_snapshot_manifests(
+    session: AsyncSession, snapshot_ids: Iterable[str]
+) -> dict[str, dict[str, str]]:
+    """Return ``{snapshot_id: manifest}`` for *snapshot_ids* in batched queries.
+
+    Unknown snapshot IDs are omitted from the result.
+    """
+    wanted = sorted(set(snapshot_ids))
+    manifests: dict[str, dict[str, str]] = {}
+    for i in range(0, len(wanted), 500):
+        result = await session.execute(
+            select(MuseCliSnapshot).where(MuseCliSnapshot.snapshot_id.in_(wanted[i:i + 500]))
+        )
+        for snap in result.scalars().all():
+            manifests[snap.snapshot_id] = dict(snap.manifest)
+    return manifests
+
+
 async def get_commit_snapshot_manifest(
     session: AsyncSession, commit_id: str
 ) -> dict[str, str] | None:
@@ -270,6 +288,10 @@ async def store_pulled_commit(
     parent_commit_id: str | None = (
         str(parent_commit_id_raw) if parent_commit_id_raw is not None else None
     )
+    parent2_commit_id_raw = commit_data.get("parent2_commit_id")
+    parent2_commit_id: str | None = (
+        str(parent2_commit_id_raw) if parent2_commit_id_raw is not None else None
+    )
     metadata_raw = commit_data.get("metadata")
     commit_metadata: dict[str, object] | None = (
         dict(metadata_raw)
@@ -296,6 +318,7 @@ async def store_pulled_commit(
         repo_id=str(commit_data.get("repo_id", "")),
         branch=branch,
         parent_commit_id=parent_commit_id,
+        parent2_commit_id=parent2_commit_id,
         snapshot_id=snapshot_id,
         message=message,
         author=author,
@@ -9,6 +9,12 @@ Usage::
     async with MuseHubClient(base_url="https://hub.example.com", repo_root=root) as hub:
         response = await hub.post("/push", json=payload)
 
+Negotiated pulls use :meth:`MuseHubClient.open_pack`, which streams a
+binary pack (see :mod:`maestro.services.musehub_pack`) and hands back
+decoded frames as they arrive instead of one JSON body. Pushes go the other
+way through :meth:`MuseHubClient.push_pack`, which uploads an encoded pack
+as a streamed request body.
+
 If ``[auth] token`` is missing or empty in ``.muse/config.toml``, the client
 raises :class:`typer.Exit` with exit-code ``1`` and prints an actionable
 error message via :func:`typer.echo` before raising.
@@ -18,9 +24,11 @@ prevent the token from being committed to version control.
 """
 from __future__ import annotations
 
+import contextlib
 import logging
 import pathlib
 import types
+from collections.abc import AsyncIterable, AsyncIterator, Mapping
 from typing import TypedDict
 
 import httpx
@@ -28,6 +36,7 @@ import typer
 
 from maestro.muse_cli.config import get_auth_token
 from maestro.muse_cli.errors import ExitCode
+from maestro.services.musehub_pack import PACK_MEDIA_TYPE, PackFrame, iter_pack_frames
 
 logger = logging.getLogger(__name__)
 
@@ -138,6 +147,18 @@ class PullRequest(_PullRequestRequired, total=False):
     ff_only: bool
 
 
+class PackPullRequest(TypedDict):
+    """Payload sent to ``POST /musehub/repos/{repo_id}/pull/pack``.
+
+    ``have_tips`` lists the client's branch heads and remote-tracking heads;
+    the Hub walks ancestry from its branch head and stops at any it knows,
+    so the client never sends its full commit or object inventory.
+    """
+
+    branch: str
+    have_tips: list[str]
+
+
 class PullCommitPayload(TypedDict):
     """A single commit record received from the Hub during a pull."""
 
@@ -314,6 +335,46 @@ class MuseHubClient:
         """Issue a DELETE request to *path*."""
         return await self._require_client().delete(path, **kwargs) # type: ignore[arg-type] # httpx stubs use Any for kwargs
 
+    async def push_pack(self, path: str, body: AsyncIterable[bytes]) -> httpx.Response:
+        """POST a pack stream to *path* without buffering it in memory.
+
+        *body* is typically :func:`~maestro.services.musehub_pack.encode_pack`;
+        httpx sends it with chunked transfer encoding as it is produced. Older
+        Hubs without a pack endpoint answer 404, which the caller treats as
+        "use the JSON protocol".
+        """
+        return await self._require_client().post(
+            path, content=body, headers={"Content-Type": PACK_MEDIA_TYPE}
+        )
+
+    @contextlib.asynccontextmanager
+    async def open_pack(
+        self, path: str, *, json: Mapping[str, object]
+    ) -> AsyncIterator[AsyncIterator[PackFrame] | None]:
+        """POST *json* to *path* and yield the pack frames as they stream in.
+
+        The response body is decoded incrementally — only the frame being
+        received is buffered. Yields ``None`` when the Hub answers with
+        anything other than a pack (older Hubs reply 404 or 405), so the
+        caller can fall back to the JSON protocol.
+        """
+        client = self._require_client()
+        async with client.stream(
+            "POST", path, json=dict(json), headers={"Accept": PACK_MEDIA_TYPE}
+        ) as response:
+            content_type = response.headers.get("content-type", "")
+            if response.status_code != 200 or not content_type.startswith(PACK_MEDIA_TYPE):
+                await response.aread()
+                logger.info(
+                    "⚠️ Hub did not return a pack for %s (HTTP %d, %s)",
+                    path,
+                    response.status_code,
+                    content_type or "no content-type",
+                )
+                yield None
+                return
+            yield iter_pack_frames(response.aiter_bytes())
+
 
 class CloneRequest(TypedDict):
     """Payload sent to ``POST /musehub/repos/{repo_id}/clone``.
@@ -375,6 +436,7 @@ __all__ = [
     "PushRequest",
     "PushResponse",
     "PullRequest",
+    "PackPullRequest",
     "PullCommitPayload",
     "PullObjectPayload",
     "PullResponse",
@@ -37,7 +37,6 @@ from __future__ import annotations
 import json
 import logging
 import pathlib
-from collections import deque
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -318,12 +317,18 @@ async def find_merge_base(
     session: AsyncSession,
     commit_id_a: str,
     commit_id_b: str,
+    *,
+    repo_root: pathlib.Path | None = None,
 ) -> str | None:
     """Find the Lowest Common Ancestor (LCA) of two commits.
 
-    Uses BFS to collect all ancestors of *commit_id_a* (inclusive), then
-    walks *commit_id_b*'s ancestor graph (BFS) until the first node found
-    in *a*'s ancestor set is reached.
+    Loads the commit graph once (see :mod:`maestro.muse_cli.commit_graph`)
+    and defers to :meth:`CommitGraph.merge_base`: ancestors of both commits
+    are painted in descending generation-number order, and the walk stops as
+    soon as every remaining candidate is known to be an ancestor of a common
+    ancestor already found — history below the merge base is never visited.
+    Ties between equally good bases (criss-cross merges) go to the newer
+    commit.
 
     Supports merge commits with two parents (``parent_commit_id`` and
     ``parent2_commit_id``).
@@ -332,49 +337,13 @@ async def find_merge_base(
         session: An open async DB session.
         commit_id_a: First commit ID (e.g., current branch HEAD).
         commit_id_b: Second commit ID (e.g., target branch HEAD).
+        repo_root: When given, the ``.muse/commit-graph.json`` cache is used.
 
     Returns:
         The LCA commit ID, or ``None`` if the commits share no common ancestor
         (disjoint histories).
     """
-    from maestro.muse_cli.models import MuseCliCommit
-
-    async def _all_ancestors(start: str) -> set[str]:
-        """BFS from *start*, returning all reachable commit IDs (inclusive)."""
-        visited: set[str] = set()
-        queue: deque[str] = deque([start])
-        while queue:
-            cid = queue.popleft()
-            if cid in visited:
-                continue
-            visited.add(cid)
-            commit: MuseCliCommit | None = await session.get(MuseCliCommit, cid)
-            if commit is None:
-                continue
-            if commit.parent_commit_id:
-                queue.append(commit.parent_commit_id)
-            if commit.parent2_commit_id:
-                queue.append(commit.parent2_commit_id)
-        return visited
-
-    a_ancestors = await _all_ancestors(commit_id_a)
-
-    # BFS from B — return the first node that is in A's ancestor set.
-    visited_b: set[str] = set()
-    queue_b: deque[str] = deque([commit_id_b])
-    while queue_b:
-        cid = queue_b.popleft()
-        if cid in visited_b:
-            continue
-        visited_b.add(cid)
-        if cid in a_ancestors:
-            return cid
-        commit = await session.get(MuseCliCommit, cid)
-        if commit is None:
-            continue
-        if commit.parent_commit_id:
-            queue_b.append(commit.parent_commit_id)
-        if commit.parent2_commit_id:
-            queue_b.append(commit.parent2_commit_id)
-
-    return None
+    from maestro.muse_cli.commit_graph import commit_graph_for
+
+    graph = await commit_graph_for(session, commit_id_a, commit_id_b, repo_root=repo_root)
+    return graph.merge_base(commit_id_a, commit_id_b)
@@ -24,7 +24,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 import uuid
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Integer, LargeBinary, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.types import JSON
 
@@ -112,6 +112,11 @@ class MuseCliCommit(Base):
     commit_metadata: Mapped[dict[str, object] | None] = mapped_column(
         "metadata", JSON, nullable=True, default=None
     )
+    # Bloom filter of paths changed against the first parent; see
+    # maestro.muse_cli.changed_paths. NULL = not computed.
+    changed_paths_bloom: Mapped[bytes | None] = mapped_column(
+        LargeBinary, nullable=True, default=None
+    )
 
     def __repr__(self) -> str:
         return (
@@ -25,6 +25,14 @@ all degrade or hard-limit above ~32,000 entries per directory). Two hex
 characters yield 256 subdirectories — the same trade-off Git settled on after
 years of production use.
 
+Packs
+-----
+``muse gc`` folds loose objects into a delta-compressed pack under
+``.muse/objects/pack/`` (see :mod:`maestro.muse_cli.pack`). Every read
+helper here checks the loose path first and then the packs, so callers never
+need to know whether an object is loose or packed. New writes are always
+loose; an object already present in a pack is never written again.
+
 This module is the single source of truth for all local object I/O.
 The store is append-only: writing the same object twice is always a no-op.
 """
@@ -34,6 +42,8 @@ import logging
 import pathlib
 import shutil
 
+from maestro.muse_cli.pack import find_pack, read_packed_object
+
 logger = logging.getLogger(__name__)
 
 _OBJECTS_DIR = "objects"
@@ -82,11 +92,15 @@ def has_object(repo_root: pathlib.Path, object_id: str) -> bool:
     existence (e.g. to pre-flight a hard reset before touching the working
     tree).
 
+    Both loose and packed objects count as present.
+
     Args:
         repo_root: Root of the Muse repository.
         object_id: SHA-256 hex digest to check.
     """
-    return object_path(repo_root, object_id).exists()
+    if object_path(repo_root, object_id).exists():
+        return True
+    return find_pack(repo_root, object_id) is not None
 
 
 def write_object(repo_root: pathlib.Path, object_id: str, content: bytes) -> bool:
@@ -109,7 +123,7 @@ def write_object(repo_root: pathlib.Path, object_id: str, content: bytes) -> boo
         existed (idempotent).
     """
     dest = object_path(repo_root, object_id)
-    if dest.exists():
+    if has_object(repo_root, object_id):
         logger.debug("⚠️ Object %s already in store — skipped", object_id[:8])
         return False
     dest.parent.mkdir(parents=True, exist_ok=True)
@@ -141,7 +155,7 @@ def write_object_from_path(
         existed (idempotent).
     """
     dest = object_path(repo_root, object_id)
-    if dest.exists():
+    if has_object(repo_root, object_id):
         logger.debug("⚠️ Object %s already in store — skipped", object_id[:8])
         return False
     dest.parent.mkdir(parents=True, exist_ok=True)
@@ -164,10 +178,12 @@ def read_object(repo_root: pathlib.Path, object_id: str) -> bytes | None:
         Raw bytes, or ``None`` when the object is absent from the store.
     """
     dest = object_path(repo_root, object_id)
-    if not dest.exists():
+    if dest.exists():
+        return dest.read_bytes()
+    packed = read_packed_object(repo_root, object_id)
+    if packed is None:
         logger.debug("⚠️ Object %s not found in local store", object_id[:8])
-        return None
-    return dest.read_bytes()
+    return packed
 
 
 def restore_object(
@@ -179,6 +195,7 @@ def restore_object(
 
     Preferred over :func:`read_object` + ``dest.write_bytes()`` for large
     blobs because ``shutil.copy2`` delegates to the OS copy mechanism.
+    Packed objects are inflated in memory and written out.
 
     Creates parent directories of *dest* if they do not exist.
 
@@ -191,12 +208,18 @@ def restore_object(
         ``True`` on success, ``False`` if the object is not in the store.
     """
     src = object_path(repo_root, object_id)
-    if not src.exists():
+    if src.exists():
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src, dest)
+        logger.debug("✅ Restored object %s → %s", object_id[:8], dest)
+        return True
+    packed = read_packed_object(repo_root, object_id)
+    if packed is None:
         logger.debug(
             "⚠️ Object %s not found in local store — cannot restore", object_id[:8]
         )
         return False
     dest.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dest)
+    dest.write_bytes(packed)
     logger.debug("✅ Restored object %s → %s", object_id[:8], dest)
     return True
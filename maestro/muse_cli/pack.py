@@ -0,0 +1,633 @@
+"""Packed object storage for the Muse object store.
+
+Loose objects (``.muse/objects/<sha2>/<sha62>``) cost one inode per blob
+and store every MIDI revision whole, even when two takes differ by a handful
+of events. ``muse gc`` folds them into a single *pack*: one file holding
+every object zlib-compressed, with similar objects stored as binary deltas
+against each other, plus an *index* that maps object IDs to pack offsets.
+
+:mod:`maestro.muse_cli.object_store` reads through loose and packed objects
+transparently; nothing outside this module needs to know the format.
+
+Layout
+------
+::
+
+    .muse/objects/pack/pack-<checksum>.pack
+    .muse/objects/pack/pack-<checksum>.idx
+
+``<checksum>`` is the SHA-256 of the pack body, so rewriting identical
+content produces the same file names.
+
+Pack file (``.pack``)
+---------------------
+::
+
+    b"MPCK" | version:u32 | count:u32
+    entry*  : kind:u8 | size:varint | [base_offset:varint] | zlen:varint | zlib bytes
+    trailer : sha256(header + entries)  (32 bytes)
+
+``kind`` is :data:`_KIND_FULL` (payload is the object) or
+:data:`_KIND_DELTA` (payload is a delta against the entry at
+``base_offset`` in the same pack, which always precedes it). Delta chains
+are capped at ``max_depth`` so a read resolves at most that many bases.
+
+Index file (``.idx``)
+---------------------
+::
+
+    b"MIDX" | version:u32 | count:u32
+    fanout  : 256 × u32   — fanout[b] = number of ids whose first byte <= b
+    ids     : count × 32  — raw SHA-256 digests, sorted
+    offsets : count × u64 — pack offset of each id's entry
+
+The fanout table narrows a lookup to the ids sharing the first byte, then a
+binary search over that slice finds the entry: O(log n) without loading the
+pack.
+
+Delta format
+------------
+``varint(base_len) varint(target_len)`` followed by instructions —
+``0x00 varint(offset) varint(length)`` copies from the base,
+``0x01 varint(length) <bytes>`` inserts literal bytes.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pathlib
+import struct
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import BinaryIO
+
+logger = logging.getLogger(__name__)
+
+_PACK_DIR = "pack"
+_PACK_MAGIC = b"MPCK"
+_IDX_MAGIC = b"MIDX"
+_VERSION = 1
+_HEADER = struct.Struct(">4sII")
+_FANOUT = struct.Struct(">256I")
+_ID_LEN = 32
+_OFFSET = struct.Struct(">Q")
+
+_KIND_FULL = 0
+_KIND_DELTA = 1
+
+_OP_COPY = 0
+_OP_INSERT = 1
+
+#: Block size used to index a delta base. Matches shorter than this are
+#: emitted as literal inserts.
+_DELTA_BLOCK = 16
+
+#: Objects larger than this are always stored whole — :func:`make_delta` is
+#: pure Python (roughly 1 s per MB of target, per window entry) and the win
+#: on big audio renders is small.
+_MAX_DELTA_SIZE = 256 * 1024
+
+#: A window entry is skipped as a delta base when the target is smaller than
+#: this fraction of it: most of the base could not be reused, so the delta
+#: would rarely beat the full object.
+_DELTA_MIN_SIZE_RATIO = 0.5
+
+#: A delta is kept only if it compresses to less than this fraction of the
+#: compressed full object.
+_DELTA_KEEP_RATIO = 0.8
+
+
+class PackError(Exception):
+    """A pack or index file is malformed."""
+
+
+# ---------------------------------------------------------------------------
+# Varints
+# ---------------------------------------------------------------------------
+
+
+def _encode_varint(value: int, out: bytearray) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_varint(data: bytes | memoryview, pos: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise PackError("truncated varint")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+# ---------------------------------------------------------------------------
+# Binary deltas
+# ---------------------------------------------------------------------------
+
+
+def make_delta(base: bytes, target: bytes) -> bytes:
+    """Return a delta that rebuilds *target* from *base* via :func:`apply_delta`.
+
+    Indexes *base* in fixed :data:`_DELTA_BLOCK`-byte blocks and scans
+    *target* for matching blocks, extending each match forwards and
+    backwards. Unmatched bytes are emitted as literal inserts.
+    """
+    out = bytearray()
+    _encode_varint(len(base), out)
+    _encode_varint(len(target), out)
+
+    block = _DELTA_BLOCK
+    index: dict[bytes, int] = {}
+    for off in range(0, len(base) - block + 1, block):
+        index.setdefault(base[off:off + block], off)
+
+    pending_start = 0
+    pos = 0
+    limit = len(target) - block
+    while pos <= limit:
+        base_off = index.get(target[pos:pos + block])
+        if base_off is None:
+            pos += 1
+            continue
+        # Extend backwards into the pending literal run.
+        start, b_start = pos, base_off
+        while start > pending_start and b_start > 0 and target[start - 1] == base[b_start - 1]:
+            start -= 1
+            b_start -= 1
+        # Extend forwards past the matched block.
+        end, b_end = pos + block, base_off + block
+        while end < len(target) and b_end < len(base) and target[end] == base[b_end]:
+            end += 1
+            b_end += 1
+        if start > pending_start:
+            _emit_insert(target[pending_start:start], out)
+        out.append(_OP_COPY)
+        _encode_varint(b_start, out)
+        _encode_varint(end - start, out)
+        pending_start = pos = end
+
+    if pending_start < len(target):
+        _emit_insert(target[pending_start:], out)
+    return bytes(out)
+
+
+def _emit_insert(data: bytes, out: bytearray) -> None:
+    out.append(_OP_INSERT)
+    _encode_varint(len(data), out)
+    out += data
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Rebuild the target object from *base* and a :func:`make_delta` delta."""
+    base_len, pos = _decode_varint(delta, 0)
+    target_len, pos = _decode_varint(delta, pos)
+    if base_len != len(base):
+        raise PackError(f"delta base length mismatch: {base_len} != {len(base)}")
+    out = bytearray()
+    while pos < len(delta):
+        op = delta[pos]
+        pos += 1
+        if op == _OP_COPY:
+            offset, pos = _decode_varint(delta, pos)
+            length, pos = _decode_varint(delta, pos)
+            out += base[offset:offset + length]
+        elif op == _OP_INSERT:
+            length, pos = _decode_varint(delta, pos)
+            out += delta[pos:pos + length]
+            pos += length
+        else:
+            raise PackError(f"unknown delta opcode {op:#x}")
+    if len(out) != target_len:
+        raise PackError(f"delta produced {len(out)} bytes, expected {target_len}")
+    return bytes(out)
+
+
+# ---------------------------------------------------------------------------
+# Reading packs
+# ---------------------------------------------------------------------------
+
+
+def _raw_id(object_id: str) -> bytes | None:
+    """Return the 32-byte digest for a 64-char hex *object_id*, else ``None``."""
+    if len(object_id) != 2 * _ID_LEN:
+        return None
+    try:
+        return bytes.fromhex(object_id)
+    except ValueError:
+        return None
+
+
+class PackIndex:
+    """Parsed ``.idx`` file: fanout table, sorted ids and entry offsets."""
+
+    def __init__(self, data: bytes) -> None:
+        if len(data) < _HEADER.size + _FANOUT.size:
+            raise PackError("index too short")
+        magic, version, count = _HEADER.unpack_from(data, 0)
+        if magic != _IDX_MAGIC or version != _VERSION:
+            raise PackError("not a Muse pack index")
+        self._fanout = _FANOUT.unpack_from(data, _HEADER.size)
+        self._ids_at = _HEADER.size + _FANOUT.size
+        self._offsets_at = self._ids_at + count * _ID_LEN
+        if len(data) < self._offsets_at + count * _OFFSET.size or self._fanout[255] != count:
+            raise PackError("index truncated")
+        self._data = data
+        self.count: int = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _id_at(self, i: int) -> bytes:
+        start = self._ids_at + i * _ID_LEN
+        return self._data[start:start + _ID_LEN]
+
+    def find(self, raw_id: bytes) -> int | None:
+        """Return the pack offset for *raw_id*, or ``None`` if absent."""
+        first = raw_id[0]
+        lo = self._fanout[first - 1] if first else 0
+        hi = self._fanout[first]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = self._id_at(mid)
+            if probe < raw_id:
+                lo = mid + 1
+            elif probe > raw_id:
+                hi = mid
+            else:
+                offset: int = _OFFSET.unpack_from(self._data, self._offsets_at + mid * _OFFSET.size)[0]
+                return offset
+        return None
+
+    def object_ids(self) -> Iterator[str]:
+        """Yield every object ID in the index, in sorted order."""
+        for i in range(self.count):
+            yield self._id_at(i).hex()
+
+
+@dataclass(frozen=True)
+class _EntryHeader:
+    kind: int
+    size: int
+    base_offset: int | None
+    payload_at: int
+    payload_len: int
+
+
+class Pack:
+    """One ``.pack`` file plus its parsed index."""
+
+    def __init__(self, pack_path: pathlib.Path, index: PackIndex) -> None:
+        self.pack_path = pack_path
+        self.index = index
+
+    def __contains__(self, object_id: str) -> bool:
+        raw = _raw_id(object_id)
+        return raw is not None and self.index.find(raw) is not None
+
+    def read(self, object_id: str) -> bytes | None:
+        """Return the bytes of *object_id*, or ``None`` if not in this pack."""
+        raw = _raw_id(object_id)
+        if raw is None:
+            return None
+        offset = self.index.find(raw)
+        if offset is None:
+            return None
+        with self.pack_path.open("rb") as fh:
+            return self._read_at(fh, offset)
+
+    def entry_size(self, object_id: str) -> int | None:
+        """Return the uncompressed size of *object_id* without inflating it."""
+        raw = _raw_id(object_id)
+        offset = self.index.find(raw) if raw is not None else None
+        if offset is None:
+            return None
+        with self.pack_path.open("rb") as fh:
+            return self._header_at(fh, offset).size
+
+    def _header_at(self, fh: BinaryIO, offset: int) -> _EntryHeader:
+        fh.seek(offset)
+        head = fh.read(1 + 3 * 10)
+        if not head:
+            raise PackError(f"no entry at offset {offset}")
+        kind = head[0]
+        size, pos = _decode_varint(head, 1)
+        base_offset: int | None = None
+        if kind == _KIND_DELTA:
+            base_offset, pos = _decode_varint(head, pos)
+        elif kind != _KIND_FULL:
+            raise PackError(f"unknown entry kind {kind}")
+        payload_len, pos = _decode_varint(head, pos)
+        return _EntryHeader(kind, size, base_offset, offset + pos, payload_len)
+
+    def _read_at(self, fh: BinaryIO, offset: int) -> bytes:
+        header = self._header_at(fh, offset)
+        fh.seek(header.payload_at)
+        payload = zlib.decompress(fh.read(header.payload_len))
+        if header.kind == _KIND_FULL:
+            data = payload
+        else:
+            assert header.base_offset is not None
+            data = apply_delta(self._read_at(fh, header.base_offset), payload)
+        if len(data) != header.size:
+            raise PackError(f"entry at {offset} has wrong size")
+        return data
+
+
+def pack_dir(repo_root: pathlib.Path) -> pathlib.Path:
+    """Return ``<repo_root>/.muse/objects/pack`` (may not yet exist)."""
+    return repo_root / ".muse" / "objects" / _PACK_DIR
+
+
+#: pack directory → (directory mtime_ns, loaded packs). Re-listed whenever
+#: the directory changes (a pack was added or removed).
+_pack_cache: dict[pathlib.Path, tuple[int, list[Pack]]] = {}
+
+
+def load_packs(repo_root: pathlib.Path) -> list[Pack]:
+    """Return every readable pack in *repo_root*, newest first."""
+    directory = pack_dir(repo_root)
+    try:
+        mtime_ns = directory.stat().st_mtime_ns
+    except FileNotFoundError:
+        _pack_cache.pop(directory, None)
+        return []
+    cached = _pack_cache.get(directory)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    packs: list[Pack] = []
+    idx_files = sorted(
+        directory.glob("pack-*.idx"), key=lambda p: p.stat().st_mtime_ns, reverse=True,
+    )
+    for idx_path in idx_files:
+        pack_path = idx_path.with_suffix(".pack")
+        if not pack_path.exists():
+            continue
+        try:
+            packs.append(Pack(pack_path, PackIndex(idx_path.read_bytes())))
+        except (PackError, OSError) as exc:
+            logger.warning("⚠️ Skipping unreadable pack %s: %s", idx_path.name, exc)
+    _pack_cache[directory] = (mtime_ns, packs)
+    return packs
+
+
+def find_pack(repo_root: pathlib.Path, object_id: str) -> Pack | None:
+    """Return the pack containing *object_id*, or ``None``."""
+    for pack in load_packs(repo_root):
+        if object_id in pack:
+            return pack
+    return None
+
+
+def read_packed_object(repo_root: pathlib.Path, object_id: str) -> bytes | None:
+    """Return *object_id*'s bytes from any pack, or ``None``."""
+    pack = find_pack(repo_root, object_id)
+    return pack.read(object_id) if pack is not None else None
+
+
+# ---------------------------------------------------------------------------
+# Writing packs
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class RepackResult:
+    """Outcome of :func:`repack`."""
+
+    objects: int = 0
+    deltas: int = 0
+    loose_removed: int = 0
+    packs_removed: int = 0
+    pack_bytes: int = 0
+    input_bytes: int = 0
+    #: Name of the pack written, or ``None`` when nothing needed repacking.
+    pack_name: str | None = None
+    #: Loose objects whose content does not hash to their ID; left in place.
+    corrupt: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _Candidate:
+    object_id: str
+    size: int
+    loose_path: pathlib.Path | None
+    pack: Pack | None
+
+
+@dataclass
+class _WindowEntry:
+    data: bytes
+    offset: int
+    depth: int
+
+
+def _loose_objects(repo_root: pathlib.Path) -> Iterator[tuple[str, pathlib.Path]]:
+    objects = repo_root / ".muse" / "objects"
+    if not objects.is_dir():
+        return
+    for shard in objects.iterdir():
+        if len(shard.name) != 2 or not shard.is_dir():
+            continue
+        for obj in shard.iterdir():
+            object_id = shard.name + obj.name
+            if obj.is_file() and _raw_id(object_id) is not None:
+                yield object_id, obj
+
+
+def repack(
+    repo_root: pathlib.Path,
+    *,
+    window: int = 10,
+    max_depth: int = 10,
+) -> RepackResult:
+    """Fold every loose and packed object into one new delta-compressed pack.
+
+    Objects are ordered largest first so the bigger revision of a pair
+    becomes the base. Each object is tried as a delta against the previous
+    *window* objects, and the smallest delta is kept when it beats the
+    compressed full object. Chains never exceed *max_depth*. Objects over
+    :data:`_MAX_DELTA_SIZE`, and bases much larger than the target, are not
+    tried at all.
+
+    Every object's content is checked against its ID as it is read. A
+    corrupt loose object is left out of the pack and kept on disk (listed
+    in :attr:`RepackResult.corrupt`); a corrupt packed object aborts the
+    repack. The new pack and index are written under temporary names and
+    every object is verified by reading it back before loose objects and
+    old packs are removed, so an interrupted repack never loses data.
+    """
+    result = RepackResult()
+    old_packs = load_packs(repo_root)
+
+    candidates: dict[str, _Candidate] = {}
+    for pack in old_packs:
+        for object_id in pack.index.object_ids():
+            if object_id not in candidates:
+                size = pack.entry_size(object_id) or 0
+                candidates[object_id] = _Candidate(object_id, size, None, pack)
+    for object_id, path in _loose_objects(repo_root):
+        candidates[object_id] = _Candidate(object_id, path.stat().st_size, path, None)
+
+    if not candidates:
+        return result
+    if len(old_packs) == 1 and all(c.loose_path is None for c in candidates.values()):
+        # Already fully packed — nothing to fold in.
+        result.objects = len(candidates)
+        return result
+
+    ordered = sorted(candidates.values(), key=lambda c: (-c.size, c.object_id))
+    directory = pack_dir(repo_root)
+    directory.mkdir(parents=True, exist_ok=True)
+    tmp_pack = directory / f"tmp-{os.getpid()}.pack"
+
+    offsets: dict[str, int] = {}
+    digests: dict[str, bytes] = {}
+    recent: list[_WindowEntry] = []
+    hasher = hashlib.sha256()
+
+    with tmp_pack.open("w+b") as out:
+        header = _HEADER.pack(_PACK_MAGIC, _VERSION, len(ordered))
+        out.write(header)
+        hasher.update(header)
+        offset = len(header)
+
+        for cand in ordered:
+            data = _read_candidate(cand)
+            digest = hashlib.sha256(data).digest()
+            if digest != bytes.fromhex(cand.object_id):
+                if cand.pack is not None:
+                    raise PackError(
+                        f"object {cand.object_id[:8]} is corrupt in {cand.pack.pack_path.name}"
+                    )
+                logger.warning("⚠️ Skipping corrupt loose object %s", cand.object_id[:8])
+                result.corrupt.append(cand.object_id)
+                continue
+            digests[cand.object_id] = digest
+            result.input_bytes += len(data)
+
+            full = zlib.compress(data)
+            best_payload, best_base = full, None
+            if len(data) <= _MAX_DELTA_SIZE:
+                for entry in recent:
+                    if (
+                        entry.depth >= max_depth
+                        or len(entry.data) > _MAX_DELTA_SIZE
+                        or len(data) < len(entry.data) * _DELTA_MIN_SIZE_RATIO
+                    ):
+                        continue
+                    delta = zlib.compress(make_delta(entry.data, data))
+                    if (
+                        len(delta) < len(full) * _DELTA_KEEP_RATIO
+                        and len(delta) < len(best_payload)
+                    ):
+                        best_payload, best_base = delta, entry
+
+            record = bytearray()
+            if best_base is None:
+                record.append(_KIND_FULL)
+                _encode_varint(len(data), record)
+                depth = 0
+            else:
+                record.append(_KIND_DELTA)
+                _encode_varint(len(data), record)
+                _encode_varint(best_base.offset, record)
+                depth = best_base.depth + 1
+                result.deltas += 1
+            _encode_varint(len(best_payload), record)
+            record += best_payload
+
+            out.write(record)
+            hasher.update(record)
+            offsets[cand.object_id] = offset
+            recent.append(_WindowEntry(data, offset, depth))
+            if len(recent) > window:
+                recent.pop(0)
+            offset += len(record)
+
+        if result.corrupt:
+            # The header promised every candidate; fix the count and re-hash.
+            out.seek(0)
+            out.write(_HEADER.pack(_PACK_MAGIC, _VERSION, len(offsets)))
+            out.seek(0)
+            hasher = hashlib.sha256()
+            for chunk in iter(lambda: out.read(1 << 20), b""):
+                hasher.update(chunk)
+        checksum = hasher.digest()
+        out.write(checksum)
+        result.pack_bytes = offset + len(checksum)
+
+    name = f"pack-{checksum.hex()}"
+    pack_path = directory / f"{name}.pack"
+    idx_path = directory / f"{name}.idx"
+    tmp_idx = directory / f"tmp-{os.getpid()}.idx"
+    tmp_idx.write_bytes(_build_index(offsets))
+    os.replace(tmp_pack, pack_path)
+    os.replace(tmp_idx, idx_path)
+
+    new_pack = Pack(pack_path, PackIndex(idx_path.read_bytes()))
+    for object_id, digest in digests.items():
+        packed = new_pack.read(object_id)
+        if packed is None or hashlib.sha256(packed).digest() != digest:
+            raise PackError(f"verification failed for {object_id[:8]} in {name}")
+
+    for pack in old_packs:
+        if pack.pack_path == pack_path:
+            continue
+        pack.pack_path.unlink(missing_ok=True)
+        pack.pack_path.with_suffix(".idx").unlink(missing_ok=True)
+        result.packs_removed += 1
+    for cand in ordered:
+        if cand.loose_path is not None and cand.object_id in digests:
+            cand.loose_path.unlink(missing_ok=True)
+            result.loose_removed += 1
+            try:
+                cand.loose_path.parent.rmdir()
+            except OSError:
+                pass
+
+    _pack_cache.pop(directory, None)
+    result.objects = len(digests)
+    result.pack_name = name
+    logger.info(
+        "✅ Packed %d objects (%d deltas) into %s: %d → %d bytes",
+        result.objects, result.deltas, name, result.input_bytes, result.pack_bytes,
+    )
+    return result
+
+
+def _read_candidate(cand: _Candidate) -> bytes:
+    if cand.loose_path is not None:
+        return cand.loose_path.read_bytes()
+    assert cand.pack is not None
+    data = cand.pack.read(cand.object_id)
+    if data is None:
+        raise PackError(f"object {cand.object_id[:8]} vanished from {cand.pack.pack_path.name}")
+    return data
+
+
+def _build_index(offsets: dict[str, int]) -> bytes:
+    entries = sorted((bytes.fromhex(oid), off) for oid, off in offsets.items())
+    fanout = [0] * 256
+    for raw, _ in entries:
+        fanout[raw[0]] += 1
+    running = 0
+    for i in range(256):
+        running += fanout[i]
+        fanout[i] = running
+
+    out = bytearray(_HEADER.pack(_IDX_MAGIC, _VERSION, len(entries)))
+    out += _FANOUT.pack(*fanout)
+    for raw, _ in entries:
+        out += raw
+    for _, off in entries:
+        out += _OFFSET.pack(off)
+    return bytes(out)
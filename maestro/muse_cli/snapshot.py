@@ -1,8 +1,11 @@
 """Pure filesystem snapshot logic for ``muse commit``.
 
 All functions here are side-effect-free (no DB, no I/O besides reading
-files under ``workdir``). They are kept separate so they can be
-unit-tested without a database.
+files under ``workdir``) with one exception: when ``workdir`` sits next to
+a ``.muse/`` directory, ``walk_workdir`` reads and refreshes the stat cache
+in ``.muse/index.json`` (see ``stat_cache.py``) so unchanged files are not
+re-hashed. They are kept separate so they can be unit-tested without a
+database.
 
 ID derivation contract (deterministic, no random/UUID components):
 
@@ -18,7 +21,15 @@ ID derivation contract (deterministic, no random/UUID components):
 from __future__ import annotations
 
 import hashlib
+import os
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
+
+from maestro.muse_cli.stat_cache import StatCache
+
+#: Default thread count for hashing files whose stat changed. ``hashlib``
+#: releases the GIL on large buffers, so threads overlap I/O and hashing.
+_HASH_WORKERS_ENV = "MUSE_HASH_WORKERS"
 
 
 def hash_file(path: pathlib.Path) -> str:
@@ -39,22 +50,66 @@ def build_snapshot_manifest(workdir: pathlib.Path) -> dict[str, str]:
     return walk_workdir(workdir)
 
 
-def walk_workdir(workdir: pathlib.Path) -> dict[str, str]:
+def _default_hash_workers() -> int:
+    try:
+        return max(1, int(os.environ.get(_HASH_WORKERS_ENV, "1")))
+    except ValueError:
+        return 1
+
+
+def walk_workdir(
+    workdir: pathlib.Path,
+    *,
+    use_index: bool = True,
+    hash_workers: int | None = None,
+) -> dict[str, str]:
     """Walk *workdir* recursively and return ``{rel_path: object_id}``.
 
     Only regular files are included (symlinks and directories are skipped).
     Paths use POSIX separators regardless of host OS for cross-platform
     reproducibility. Hidden files (starting with ``.``) are excluded.
+
+    Args:
+        workdir: Directory to walk (normally ``<repo>/muse-work``).
+        use_index: Reuse object IDs from ``.muse/index.json`` for files whose
+                   ``(size, mtime_ns, inode)`` is unchanged, and refresh the
+                   index afterwards. No effect outside a Muse repository.
+        hash_workers: Threads used to hash changed files. Defaults to the
+                      ``MUSE_HASH_WORKERS`` env var, or 1 (sequential).
     """
-    manifest: dict[str, str] = {}
+    cache = StatCache.for_workdir(workdir) if use_index else None
+
+    found: dict[str, str | None] = {}
+    to_hash: list[tuple[str, pathlib.Path, os.stat_result]] = []
     for file_path in sorted(workdir.rglob("*")):
         if not file_path.is_file():
             continue
         if file_path.name.startswith("."):
             continue
         rel = file_path.relative_to(workdir).as_posix()
-        manifest[rel] = hash_file(file_path)
-    return manifest
+        st = file_path.stat()
+        found[rel] = cache.lookup(rel, st) if cache is not None else None
+        if found[rel] is None:
+            to_hash.append((rel, file_path, st))
+
+    workers = hash_workers if hash_workers is not None else _default_hash_workers()
+    if workers > 1 and len(to_hash) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            digests = list(pool.map(hash_file, (path for _, path, _ in to_hash)))
+    else:
+        digests = [hash_file(path) for _, path, _ in to_hash]
+
+    for (rel, _, st), object_id in zip(to_hash, digests):
+        found[rel] = object_id
+        if cache is not None:
+            cache.record(rel, st, object_id)
+
+    if cache is not None:
+        cache.retain(set(found))
+        cache.save()
+
+    # Every path is resolved by now; rebuilding keeps the walk order.
+    return {rel: oid for rel, oid in found.items() if oid is not None}
 
 
 def compute_snapshot_id(manifest: dict[str, str]) -> str:
@@ -0,0 +1,189 @@
+"""Stat-keyed object-ID cache for the Muse working tree (``.muse/index.json``).
+
+``walk_workdir`` used to SHA-256 every file under ``muse-work/`` on every
+``muse status``, ``muse commit`` and ``diff_workdir_vs_snapshot`` call. On a
+repository holding thousands of stems and renders that means reading every
+byte of the working tree just to discover that nothing changed.
+
+Like Git's index, this cache remembers the ``(size, mtime_ns, inode)`` seen
+the last time each file was hashed together with the resulting object ID.
+When a file's stat tuple is unchanged its cached object ID is reused;
+otherwise it is re-hashed.
+
+Racy-clean entries
+------------------
+A file modified within the filesystem's timestamp granularity of the moment
+it was hashed can keep the same mtime while its content changes. Entries
+whose ``mtime_ns`` is within :data:`_RACY_WINDOW_NS` of the time the index
+is written are therefore not persisted, so such files are always re-hashed
+on the next walk — the same trade-off Git makes for racily-clean entries.
+
+``index.json`` schema
+---------------------
+
+.. code-block:: json
+
+    {
+        "version": 1,
+        "workdir": "muse-work",
+        "entries": {
+            "tracks/bass.mid": [1024, 1700000000000000000, 123456, "ab12..."]
+        }
+    }
+
+The cache is purely an optimisation: a missing, unreadable or
+wrong-version file is treated as empty and rebuilt on the next save.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pathlib
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+_INDEX_FILENAME = "index.json"
+_INDEX_VERSION = 1
+_MUSE_DIR = ".muse"
+
+#: Entries modified this close to the index write time are not persisted.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class StatEntry:
+    """Stat fingerprint of a working-tree file and its object ID."""
+
+    size: int
+    mtime_ns: int
+    inode: int
+    object_id: str
+
+    def matches(self, st: os.stat_result) -> bool:
+        """Return ``True`` if *st* is the same stat tuple this entry recorded."""
+        return (
+            self.size == st.st_size
+            and self.mtime_ns == st.st_mtime_ns
+            and self.inode == st.st_ino
+        )
+
+
+class StatCache:
+    """In-memory view of ``.muse/index.json`` for one working directory.
+
+    Use :meth:`for_workdir` to load the cache belonging to a repository's
+    ``muse-work/`` directory, :meth:`lookup` / :meth:`record` while walking,
+    and :meth:`save` to persist the result. Paths are POSIX paths relative
+    to the working directory, matching snapshot manifest keys.
+    """
+
+    def __init__(self, index_path: pathlib.Path, workdir_name: str) -> None:
+        self.index_path = index_path
+        self.workdir_name = workdir_name
+        self._entries: dict[str, StatEntry] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def for_workdir(cls, workdir: pathlib.Path) -> StatCache | None:
+        """Load the cache for *workdir*, or return ``None`` outside a repo.
+
+        The index lives in the ``.muse/`` directory next to *workdir* (the
+        repository root contains both ``.muse/`` and ``muse-work/``).
+        """
+        muse_dir = workdir.parent / _MUSE_DIR
+        if not muse_dir.is_dir():
+            return None
+        cache = cls(muse_dir / _INDEX_FILENAME, workdir.name)
+        cache._load()
+        return cache
+
+    def _load(self) -> None:
+        if not self.index_path.exists():
+            return
+        try:
+            data = json.loads(self.index_path.read_text())
+        except (json.JSONDecodeError, OSError) as exc:
+            logger.warning("⚠️ Ignoring unreadable %s: %s", _INDEX_FILENAME, exc)
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != _INDEX_VERSION
+            or data.get("workdir") != self.workdir_name
+        ):
+            return
+        raw_entries = data.get("entries")
+        if not isinstance(raw_entries, dict):
+            return
+        for rel, raw in raw_entries.items():
+            if not isinstance(raw, list) or len(raw) != 4:
+                continue
+            size, mtime_ns, inode, object_id = raw
+            try:
+                self._entries[str(rel)] = StatEntry(
+                    int(size), int(mtime_ns), int(inode), str(object_id)
+                )
+            except (TypeError, ValueError):
+                continue
+
+    def lookup(self, rel: str, st: os.stat_result) -> str | None:
+        """Return the cached object ID for *rel* if its stat is unchanged."""
+        entry = self._entries.get(rel)
+        if entry is not None and entry.matches(st):
+            self.hits += 1
+            return entry.object_id
+        self.misses += 1
+        return None
+
+    def record(self, rel: str, st: os.stat_result, object_id: str) -> None:
+        """Remember that *rel* with stat *st* hashed to *object_id*."""
+        entry = StatEntry(st.st_size, st.st_mtime_ns, st.st_ino, object_id)
+        if self._entries.get(rel) != entry:
+            self._entries[rel] = entry
+            self._dirty = True
+
+    def retain(self, paths: set[str]) -> None:
+        """Drop entries for files no longer present in the working tree."""
+        stale = self._entries.keys() - paths
+        for rel in stale:
+            del self._entries[rel]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache atomically, skipping racily-clean entries.
+
+        Write failures are logged and swallowed — the cache is advisory.
+        """
+        if not self._dirty:
+            return
+        now_ns = time.time_ns()
+        persisted = {
+            rel: [e.size, e.mtime_ns, e.inode, e.object_id]
+            for rel, e in sorted(self._entries.items())
+            if now_ns - e.mtime_ns >= _RACY_WINDOW_NS
+        }
+        payload = {
+            "version": _INDEX_VERSION,
+            "workdir": self.workdir_name,
+            "entries": persisted,
+        }
+        tmp_path = self.index_path.with_name(f"{_INDEX_FILENAME}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(payload))
+            os.replace(tmp_path, self.index_path)
+        except OSError as exc:
+            logger.warning("⚠️ Could not write %s: %s", _INDEX_FILENAME, exc)
+            return
+        self._dirty = False
+        logger.debug(
+            "✅ Wrote %s (%d entries, %d hits, %d misses)",
+            _INDEX_FILENAME, len(persisted), self.hits, self.misses,
+        )
@@ -41,7 +41,6 @@ import json
 import logging
 import math
 import pathlib
-from collections import deque
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -191,7 +190,7 @@ async def get_commits_between(
 ) -> list[MuseCliCommit]:
     """Return commits reachable from *bad* but not reachable from *good*.
 
-    Performs two BFS traversals of the Muse commit DAG:
+    Loads the commit graph once and computes both ancestor sets in memory:
     1. All ancestors of *good_commit_id* (inclusive) → ``good_ancestors``.
     2. All ancestors of *bad_commit_id* (inclusive) → filtered by exclusion.
 
@@ -210,43 +209,19 @@ async def get_commits_between(
     Returns:
         Ordered list of :class:`MuseCliCommit` rows to bisect, oldest first.
     """
-    from maestro.muse_cli.models import MuseCliCommit
+    from maestro.muse_cli.commit_graph import commit_graph_for, load_commit_rows
 
-    async def _ancestors(start: str) -> set[str]:
-        """BFS collecting all ancestor commit IDs (inclusive of start)."""
-        visited: set[str] = set()
-        queue: deque[str] = deque([start])
-        while queue:
-            cid = queue.popleft()
-            if cid in visited:
-                continue
-            visited.add(cid)
-            row: MuseCliCommit | None = await session.get(MuseCliCommit, cid)
-            if row is None:
-                continue
-            if row.parent_commit_id:
-                queue.append(row.parent_commit_id)
-            if row.parent2_commit_id:
-                queue.append(row.parent2_commit_id)
-        return visited
-
-    good_set = await _ancestors(good_commit_id)
-    bad_ancestors = await _ancestors(bad_commit_id)
+    graph = await commit_graph_for(session, bad_commit_id, good_commit_id)
 
     # Commits between good and bad: reachable from bad, not from good,
     # and excluding bad itself (bad is known-bad, not a candidate to test).
-    candidate_ids = bad_ancestors - good_set - {bad_commit_id}
+    candidate_ids = graph.range(good_commit_id, bad_commit_id) - {bad_commit_id}
 
     if not candidate_ids:
         return []
 
     # Load and sort by committed_at ascending.
-    rows: list[MuseCliCommit] = []
-    for cid in candidate_ids:
-        row = await session.get(MuseCliCommit, cid)
-        if row is not None:
-            rows.append(row)
-
+    rows = await load_commit_rows(session, sorted(candidate_ids))
     rows.sort(key=lambda r: r.committed_at)
     return rows
 
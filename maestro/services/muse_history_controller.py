@@ -325,12 +325,7 @@ async def merge_variations(
 
 def _capture_working_notes(store: StateStore) -> RegionNotesMap:
     """Extract notes from all regions in the store."""
-    result: RegionNotesMap = {}
-    if hasattr(store, "_region_notes"):
-        for rid, notes in store._region_notes.items():
-            if notes:
-                result[rid] = list(notes)
-    return result
+    return {rid: notes for rid, notes in store.get_all_region_notes().items() if notes}
 
 
 def _capture_working_cc(store: StateStore) -> RegionCCMap:
@@ -1,7 +1,10 @@
 """Muse Merge Base — find the lowest common ancestor of two variations.
 
-Equivalent to ``git merge-base A B``. Walks both lineages and returns
-the closest common ancestor variation_id.
+Equivalent to ``git merge-base A B``. Loads the project's variation history
+in one query, builds a :class:`~maestro.muse_cli.commit_graph.CommitGraph`
+over the ``parent_variation_id`` links, and lets its generation-ordered
+search return the closest common ancestor variation_id without walking
+either lineage to the root.
 
 Boundary rules:
   - Must NOT import StateStore, executor, MCP tools, or handlers.
@@ -14,6 +17,7 @@ import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from maestro.muse_cli.commit_graph import CommitGraph
 from maestro.services import muse_repository
 
 logger = logging.getLogger(__name__)
@@ -26,26 +30,31 @@ async def find_merge_base(
 ) -> str | None:
     """Find the lowest common ancestor of two variation lineages.
 
-    Walks ``parent_variation_id`` chains for both ``a`` and ``b``,
-    then returns the most recent variation_id that appears in both
-    lineages. Returns None if the variations share no common history.
+    Follows ``parent_variation_id`` links for both ``a`` and ``b`` and
+    returns the most recent variation_id that appears in both lineages.
+    Returns None if the variations share no common history.
 
     Deterministic: for the same inputs, always returns the same result.
     """
-    lineage_a = await muse_repository.get_lineage(session, a)
-    lineage_b = await muse_repository.get_lineage(session, b)
-
-    if not lineage_a or not lineage_b:
+    history = await muse_repository.get_project_history(session, a)
+    graph = CommitGraph.from_rows(
+        (
+            node.variation_id,
+            node.parent_variation_id,
+            None,
+            node.created_at.timestamp(),
+            None,
+        )
+        for node in history
+    )
+    if a not in graph or b not in graph:
         return None
 
-    ids_a = {n.variation_id for n in lineage_a}
-
-    for node in reversed(lineage_b):
-        if node.variation_id in ids_a:
-            logger.info(
-                "✅ Merge base found: %s (between %s and %s)",
-                node.variation_id[:8], a[:8], b[:8],
-            )
-            return node.variation_id
-
-    return None
+    base = graph.merge_base(a, b)
+    if base is None or base not in graph:
+        return None
+    logger.info(
+        "✅ Merge base found: %s (between %s and %s)",
+        base[:8], a[:8], b[:8],
+    )
+    return base
@@ -50,7 +50,6 @@ import datetime
 import json
 import logging
 import pathlib
-from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -344,33 +343,24 @@ async def _collect_branch_commits_since_base(
     Returns:
         List of :class:`MuseCliCommit` rows in replay order.
     """
-    commits_reversed: list[MuseCliCommit] = []
-    seen: set[str] = set()
-    queue: deque[str] = deque([head_commit_id])
+    from maestro.muse_cli.commit_graph import commit_graph_for, load_commit_rows
 
-    while queue:
-        cid = queue.popleft()
-        if cid in seen or cid == base_commit_id:
-            continue
-        seen.add(cid)
-        commit = await session.get(MuseCliCommit, cid)
-        if commit is None:
+    graph = await commit_graph_for(session, head_commit_id)
+    chain: list[str] = []
+    for cid in graph.first_parent_chain(head_commit_id):
+        if cid == base_commit_id:
             break
-        commits_reversed.append(commit)
-        if commit.parent_commit_id and commit.parent_commit_id != base_commit_id:
-            queue.append(commit.parent_commit_id)
-        elif commit.parent_commit_id == base_commit_id:
-            # Include this commit but stop traversal here
-            pass
+        chain.append(cid)
 
-    # BFS gives newest-first; reverse to get oldest-first replay order.
-    return list(reversed(commits_reversed))
+    # The chain is newest-first; reverse to get oldest-first replay order.
+    return list(reversed(await load_commit_rows(session, chain)))
 
 
 async def _find_merge_base_rebase(
     session: AsyncSession,
     commit_id_a: str,
     commit_id_b: str,
+    repo_root: pathlib.Path | None = None,
 ) -> str | None:
     """Lowest common ancestor of two commits — thin wrapper used by the rebase.
 
@@ -378,13 +368,14 @@ async def _find_merge_base_rebase(
         session: Open async DB session.
         commit_id_a: First commit ID (current branch HEAD).
         commit_id_b: Second commit ID (upstream tip).
+        repo_root: When given, the ``.muse/commit-graph.json`` cache is used.
 
     Returns:
         LCA commit ID, or ``None`` if histories are disjoint.
     """
     from maestro.muse_cli.merge_engine import find_merge_base
 
-    return await find_merge_base(session, commit_id_a, commit_id_b)
+    return await find_merge_base(session, commit_id_a, commit_id_b, repo_root=repo_root)
 
 
 def apply_autosquash(commits: list[MuseCliCommit]) -> tuple[list[MuseCliCommit], bool]:
@@ -732,7 +723,7 @@ async def _rebase_async(
 
     # ── Find merge base ──────────────────────────────────────────────────
     base_commit_id = await _find_merge_base_rebase(
-        session, ours_commit_id, upstream_commit_id
+        session, ours_commit_id, upstream_commit_id, repo_root=root
     )
     if base_commit_id is None:
         typer.echo(
@@ -480,6 +480,41 @@ async def get_lineage(
 # ── Bulk queries (Phase 13) ───────────────────────────────────────────────
 
 
+async def get_project_history(
+    session: AsyncSession,
+    variation_id: str,
+) -> list[HistoryNode]:
+    """Fetch every variation in *variation_id*'s project in one query.
+
+    Lets callers answer several lineage questions in memory instead of one
+    query per ``get_lineage`` step. Returns an empty list when
+    *variation_id* does not exist.
+    """
+    project_id = (await session.execute(
+        select(db.Variation.project_id).where(db.Variation.variation_id == variation_id)
+    )).scalar_one_or_none()
+    if project_id is None:
+        return []
+
+    result = await session.execute(
+        select(
+            db.Variation.variation_id,
+            db.Variation.parent_variation_id,
+            db.Variation.commit_state_id,
+            db.Variation.created_at,
+        ).where(db.Variation.project_id == project_id)
+    )
+    return [
+        HistoryNode(
+            variation_id=vid,
+            parent_variation_id=parent,
+            commit_state_id=state,
+            created_at=created_at,
+        )
+        for vid, parent, state, created_at in result.all()
+    ]
+
+
 async def get_variations_for_project(
     session: AsyncSession,
     project_id: str,
@@ -39,13 +39,13 @@ import datetime
 import json
 import logging
 import pathlib
-import shutil
 import uuid
 from dataclasses import dataclass, field
 from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from maestro.muse_cli.object_store import restore_object, write_object_from_path
 from maestro.muse_cli.snapshot import hash_file
 
 logger = logging.getLogger(__name__)
@@ -144,15 +144,6 @@ def _entry_path(root: pathlib.Path, stash_id: str) -> pathlib.Path:
     return _stash_dir(root) / f"{stash_id}.json"
 
 
-def _object_path(root: pathlib.Path, object_id: str) -> pathlib.Path:
-    """Return the sharded object store path for *object_id*.
-
-    Matches the layout used by ``muse commit`` and ``muse reset --hard``:
-    ``.muse/objects/<oid[:2]>/<oid[2:]>``.
-    """
-    return root / ".muse" / "objects" / object_id[:2] / object_id[2:]
-
-
 def _read_entry(entry_file: pathlib.Path, index: int) -> StashEntry:
     """Deserialize a stash entry JSON file."""
     raw: dict[str, object] = json.loads(entry_file.read_text())
@@ -239,10 +230,7 @@ def _store_files(
             logger.warning("⚠️ Stash: skipping missing file %s", rel_path)
             continue
         oid = hash_file(abs_path)
-        dest = _object_path(root, oid)
-        if not dest.exists():
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(abs_path, dest)
+        if write_object_from_path(root, oid, abs_path):
             logger.debug("✅ Stash stored object %s ← %s", oid[:8], rel_path)
         manifest[rel_path] = oid
     return manifest
@@ -279,16 +267,12 @@ def _restore_from_manifest(
     written = 0
 
     for rel_path, oid in sorted(paths_to_restore.items()):
-        obj_file = _object_path(root, oid)
-        if not obj_file.exists():
+        if not restore_object(root, oid, workdir / rel_path):
             missing.append(rel_path)
             logger.warning(
                 "⚠️ Stash: object %s missing from store for %s", oid[:8], rel_path
             )
             continue
-        dest = workdir / rel_path
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(obj_file, dest)
         written += 1
 
     # When scope_paths is None (full restore), delete files not in the manifest.
@@ -545,16 +529,12 @@ def apply_stash(
     written = 0
 
     for rel_path, oid in sorted(entry.manifest.items()):
-        obj_file = _object_path(root, oid)
-        if not obj_file.exists():
+        if not restore_object(root, oid, workdir / rel_path):
             missing.append(rel_path)
             logger.warning(
                 "⚠️ Stash apply: object %s missing for %s", oid[:8], rel_path
             )
             continue
-        dest = workdir / rel_path
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(obj_file, dest)
         written += 1
         logger.debug("✅ Stash apply: restored %s from object %s", rel_path, oid[:8])
 
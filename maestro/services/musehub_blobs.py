@@ -0,0 +1,164 @@
+"""Muse Hub blob store — object bytes stored once, shared by every repo.
+
+Object content is keyed by its SHA-256 alone:
+  ``<musehub_objects_dir>/blobs/<first two hex chars>/<sha256>``
+A ``musehub_objects`` row is a per-repo reference to a blob: its
+``blob_sha256`` names the blob and its ``disk_path`` points at the blob file,
+so readers that open ``disk_path`` need no changes. Re-uploading a seed MIDI,
+pushing the same render twice or forking a repo adds rows, never bytes.
+
+There are no reference counts — repo deletion cascades away object rows
+without touching the store. :func:`sweep_blobs` is a mark-and-sweep pass
+instead: every blob no row references is garbage, except blobs younger than a
+grace period, whose rows may belong to a push that has not committed yet.
+
+Functions suffixed ``_sync`` do blocking file I/O; async callers run them on
+a thread. Every function takes the objects directory explicitly so callers
+resolve ``settings.musehub_objects_dir`` themselves.
+
+Boundary rules (same as musehub_sync):
+- Must NOT import state stores, SSE queues, or LLM clients.
+- Must NOT import maestro.core.* modules.
+- May import ORM models from maestro.db.musehub_models.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from maestro.db import musehub_models as db
+
+logger = logging.getLogger(__name__)
+
+BLOBS_DIRNAME = "blobs"
+#: Unreferenced blobs younger than this survive a sweep.
+DEFAULT_SWEEP_GRACE = timedelta(hours=1)
+
+
+@dataclass(frozen=True)
+class StoredBlob:
+    """Where a blob's bytes live once :func:`write_blob_sync` returns."""
+
+    sha256: str
+    size_bytes: int
+    disk_path: Path
+
+
+def blob_disk_path(objects_dir: str | Path, sha256: str) -> Path:
+    """Return the canonical path of the blob with hex digest *sha256*."""
+    return Path(objects_dir) / BLOBS_DIRNAME / sha256[:2] / sha256
+
+
+def blob_temp_path(objects_dir: str | Path, sha256: str) -> Path:
+    """Return a unique temp path beside the blob, for writes renamed into place."""
+    final = blob_disk_path(objects_dir, sha256)
+    return final.with_name(f".{final.name}.{uuid.uuid4().hex}.part")
+
+
+def write_blob_sync(objects_dir: str | Path, data: bytes) -> StoredBlob:
+    """Store *data* unless a blob with the same digest already exists."""
+    sha256 = hashlib.sha256(data).hexdigest()
+    final = blob_disk_path(objects_dir, sha256)
+    if _touch(final):
+        return StoredBlob(sha256=sha256, size_bytes=len(data), disk_path=final)
+    final.parent.mkdir(parents=True, exist_ok=True)
+    tmp = blob_temp_path(objects_dir, sha256)
+    tmp.write_bytes(data)
+    os.replace(tmp, final)
+    return StoredBlob(sha256=sha256, size_bytes=len(data), disk_path=final)
+
+
+def lookup_blob_sync(objects_dir: str | Path, sha256: str) -> StoredBlob | None:
+    """Return the stored blob with digest *sha256*, or ``None`` if it is absent.
+
+    A found blob is touched, as by :func:`write_blob_sync`, so a concurrent
+    sweep spares it while the caller adds a row referencing it.
+    """
+    final = blob_disk_path(objects_dir, sha256)
+    if not _touch(final):
+        return None
+    try:
+        size = final.stat().st_size
+    except FileNotFoundError:
+        return None
+    return StoredBlob(sha256=sha256, size_bytes=size, disk_path=final)
+
+
+def adopt_blob_sync(objects_dir: str | Path, sha256: str, tmp: Path) -> Path:
+    """Move a verified temp file into the store, or drop it if the blob exists.
+
+    Concurrent writers of the same blob are safe: both files hold the same
+    bytes and ``os.replace`` is atomic.
+    """
+    final = blob_disk_path(objects_dir, sha256)
+    if _touch(final):
+        tmp.unlink(missing_ok=True)
+    else:
+        os.replace(tmp, final)
+    return final
+
+
+def _touch(blob: Path) -> bool:
+    """Refresh an existing blob's mtime so a concurrent sweep spares it.
+
+    Returns ``False`` when the blob does not exist.
+    """
+    try:
+        os.utime(blob)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+async def sweep_blobs(
+    session: AsyncSession,
+    objects_dir: str | Path,
+    *,
+    grace: timedelta = DEFAULT_SWEEP_GRACE,
+) -> int:
+    """Delete blobs no ``musehub_objects`` row references; return how many.
+
+    Leftover ``.part`` temp files older than *grace* are removed too.
+    """
+    result = await session.execute(
+        select(db.MusehubObject.blob_sha256)
+        .where(db.MusehubObject.blob_sha256.is_not(None))
+        .distinct()
+    )
+    live = {sha for sha in result.scalars() if sha is not None}
+    removed = await asyncio.to_thread(
+        _sweep_sync, Path(objects_dir) / BLOBS_DIRNAME, live, time.time() - grace.total_seconds()
+    )
+    logger.info("✅ Blob sweep removed %d unreferenced blobs (%d live)", removed, len(live))
+    return removed
+
+
+def _sweep_sync(root: Path, live: set[str], cutoff: float) -> int:
+    removed = 0
+    if not root.is_dir():
+        return removed
+    for fanout in root.iterdir():
+        if not fanout.is_dir():
+            continue
+        for blob in fanout.iterdir():
+            if blob.name in live:
+                continue
+            try:
+                if blob.stat().st_mtime >= cutoff:
+                    continue
+                blob.unlink()
+            except OSError:
+                continue
+            if not blob.name.startswith("."):
+                removed += 1
+    return removed
@@ -0,0 +1,204 @@
+"""Muse Hub commit-DAG layout — cached topological order and lanes per repo.
+
+The graph page and ``GET /repos/{repo_id}/dag`` need every commit in
+parent-before-child order plus a lane (column) per commit. Computing that
+means loading the whole commit graph and running Kahn's algorithm, which is
+wasted work on every view of a repo whose history has not changed.
+
+:class:`DagLayout` holds the result for one repo in compact form — commit
+IDs in topological order, the row of each commit, its lane, and its
+timestamp — and :func:`get_dag_layout` keeps one per repo in a bounded
+in-process LRU. Commits on the hub are append-only, so a cached layout is
+validated with an indexed ``COUNT(*)``:
+
+- same count → the layout is current;
+- more commits → only rows created since the layout's watermark are loaded
+  and appended in topological order after the existing rows, so rows and
+  lanes already handed to clients never move;
+- anything an append cannot express (fewer commits, a newly pushed commit
+  that an existing commit names as its parent) → the layout is rebuilt.
+
+Because validation happens on read, a push handled by another worker is
+picked up on the next request without any cross-process invalidation.
+
+Lanes are assigned per branch name in order of first appearance, matching
+what the graph renderer used to compute client-side.
+
+Boundary rules:
+- Must NOT import state stores, SSE queues, or LLM clients.
+- Must NOT import maestro.core.* modules.
+- May import ORM models from maestro.db.musehub_models.
+"""
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from maestro.db import musehub_models as db
+
+logger = logging.getLogger(__name__)
+
+# Repos whose layout is kept in memory; least recently used is evicted first.
+_MAX_CACHED_REPOS = 128
+
+
+@dataclass(frozen=True)
+class _GraphRow:
+    commit_id: str
+    parent_ids: tuple[str, ...]
+    branch: str
+    timestamp: datetime
+    created_at: datetime
+
+
+@dataclass
+class DagLayout:
+    """Topological order and lane assignment for one repo's commits.
+
+    ``order[row]`` is the commit at ``row`` (oldest ancestor first);
+    ``lanes[row]`` and ``timestamps[row]`` describe the same commit.
+    """
+
+    order: list[str] = field(default_factory=list)
+    row_of: dict[str, int] = field(default_factory=dict)
+    lanes: list[int] = field(default_factory=list)
+    timestamps: list[datetime] = field(default_factory=list)
+    lane_of_branch: dict[str, int] = field(default_factory=dict)
+    # Parent IDs named by some commit but not (yet) present in the repo.
+    missing_parents: set[str] = field(default_factory=set)
+    # Newest ``created_at`` seen; the next extension loads rows from here on.
+    watermark: datetime | None = None
+    newest_row: int | None = None
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    @property
+    def lane_count(self) -> int:
+        return len(self.lane_of_branch)
+
+    def append(self, rows: Sequence[_GraphRow]) -> bool:
+        """Append commits after the existing rows in topological order.
+
+        Rows already in the layout are skipped. Returns ``False`` — leaving
+        the layout untouched — when a new commit is the parent of one that
+        is already placed, since appending it would break parent-before-
+        child order; the caller must rebuild.
+        """
+        fresh = {r.commit_id: r for r in rows if r.commit_id not in self.row_of}
+        if not fresh:
+            return True
+        if not self.missing_parents.isdisjoint(fresh):
+            return False
+
+        # Kahn's algorithm over the new rows only: parents already placed
+        # are satisfied. Roots enter oldest first so the order is stable.
+        in_degree = dict.fromkeys(fresh, 0)
+        children: dict[str, list[str]] = {}
+        for row in fresh.values():
+            for parent_id in row.parent_ids:
+                if parent_id in fresh:
+                    in_degree[row.commit_id] += 1
+                    children.setdefault(parent_id, []).append(row.commit_id)
+
+        def _age(cid: str) -> tuple[datetime, str]:
+            return fresh[cid].timestamp, cid
+
+        queue: deque[str] = deque(sorted((c for c, d in in_degree.items() if d == 0), key=_age))
+        placed: list[str] = []
+        while queue:
+            cid = queue.popleft()
+            placed.append(cid)
+            for child_id in children.get(cid, []):
+                in_degree[child_id] -= 1
+                if in_degree[child_id] == 0:
+                    queue.append(child_id)
+        if len(placed) < len(fresh):
+            # Cycles cannot be ordered; keep them, oldest first.
+            seen = set(placed)
+            placed.extend(sorted((c for c in fresh if c not in seen), key=_age))
+
+        for cid in placed:
+            row = fresh[cid]
+            index = len(self.order)
+            self.order.append(cid)
+            self.row_of[cid] = index
+            lane = self.lane_of_branch.setdefault(row.branch, len(self.lane_of_branch))
+            self.lanes.append(lane)
+            self.timestamps.append(row.timestamp)
+            if self.newest_row is None or row.timestamp > self.timestamps[self.newest_row]:
+                self.newest_row = index
+            if self.watermark is None or row.created_at > self.watermark:
+                self.watermark = row.created_at
+
+        self.missing_parents.difference_update(fresh)
+        for row in fresh.values():
+            self.missing_parents.update(p for p in row.parent_ids if p not in self.row_of)
+        return True
+
+
+_layouts: OrderedDict[str, DagLayout] = OrderedDict()
+
+
+async def _load_rows(
+    session: AsyncSession, repo_id: str, since: datetime | None = None
+) -> list[_GraphRow]:
+    stmt = select(
+        db.MusehubCommit.commit_id,
+        db.MusehubCommit.parent_ids,
+        db.MusehubCommit.branch,
+        db.MusehubCommit.timestamp,
+        db.MusehubCommit.created_at,
+    ).where(db.MusehubCommit.repo_id == repo_id)
+    if since is not None:
+        # ``>=`` so rows sharing the watermark's timestamp are not missed;
+        # already-placed rows are skipped by DagLayout.append.
+        stmt = stmt.where(db.MusehubCommit.created_at >= since)
+    result = await session.execute(stmt)
+    return [
+        _GraphRow(cid, tuple(parents or ()), branch, ts, created)
+        for cid, parents, branch, ts, created in result.tuples()
+    ]
+
+
+async def _build(session: AsyncSession, repo_id: str) -> DagLayout:
+    layout = DagLayout()
+    layout.append(await _load_rows(session, repo_id))
+    return layout
+
+
+async def get_dag_layout(session: AsyncSession, repo_id: str) -> DagLayout:
+    """Return the current layout for *repo_id*, reusing or extending the cache."""
+    count = (
+        await session.execute(
+            select(func.count()).where(db.MusehubCommit.repo_id == repo_id)
+        )
+    ).scalar_one()
+
+    layout = _layouts.get(repo_id)
+    if layout is not None and len(layout) < count:
+        if not layout.append(await _load_rows(session, repo_id, layout.watermark)):
+            layout = None
+    if layout is None or len(layout) != count:
+        layout = await _build(session, repo_id)
+        logger.debug("Rebuilt DAG layout for repo %s: %d commits", repo_id, len(layout))
+
+    _layouts[repo_id] = layout
+    _layouts.move_to_end(repo_id)
+    while len(_layouts) > _MAX_CACHED_REPOS:
+        _layouts.popitem(last=False)
+    return layout
+
+
+def forget_dag_layout(repo_id: str | None = None) -> None:
+    """Drop the cached layout for *repo_id*, or every layout when ``None``."""
+    if repo_id is None:
+        _layouts.clear()
+    else:
+        _layouts.pop(repo_id, None)
@@ -15,6 +15,13 @@ Sort semantics:
   "commits" — repos with the highest total commit count first
   "created" — newest repos first (default for explore page)
 
+Counts and the latest commit time are read from ``musehub_repo_stats``, which
+is maintained on every flush (see ``maestro.db.musehub_stats_models``), so a
+page costs O(page_size) rows rather than an aggregate over every public repo.
+The join is an outer join and the counters are coalesced to 0, so a repo whose
+stats row has not been written yet (e.g. created before the backfill ran) is
+still listed and sorts as if it had no stars or commits.
+
 Tag filtering uses a contains check on the JSON ``tags`` column. For portability
 across Postgres and SQLite (tests), the check is done server-side via a
 ``cast(tags, Text).ilike`` pattern rather than JSON containment operators, which
@@ -25,10 +32,11 @@ from __future__ import annotations
 import logging
 from typing import Literal
 
-from sqlalchemy import Text, desc, func, outerjoin, select
+from sqlalchemy import Text, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from maestro.db import musehub_models as db
+from maestro.db.musehub_stats_models import MusehubRepoStats
 from maestro.models.musehub import (
     ExploreRepoResult,
     ExploreResponse,
@@ -78,33 +86,21 @@ async def list_public_repos(
     page_size = min(page_size, _PAGE_SIZE_MAX)
     offset = (max(page, 1) - 1) * page_size
 
-    # Aggregated sub-expressions ─────────────────────────────────────────────
-    star_count_col = func.count(db.MusehubStar.star_id).label("star_count")
-    commit_count_col = func.count(db.MusehubCommit.commit_id).label("commit_count")
-    latest_commit_col = func.max(db.MusehubCommit.timestamp).label("latest_commit")
-
-    # Build the base aggregated query over public repos.
-    # Left-join stars and commits so repos with zero stars/commits are included.
+    # Counters come from the materialized stats row, so the query is a plain
+    # one-to-one join and each sort can walk an index instead of grouping.
+    # Outer join: a repo without a stats row yet still shows up, with zeros.
+    stats = MusehubRepoStats
+    star_count = func.coalesce(stats.star_count, 0)
+    commit_count = func.coalesce(stats.commit_count, 0)
     base_q = (
         select(
             db.MusehubRepo,
-            star_count_col,
-            commit_count_col,
-            latest_commit_col,
-        )
-        .select_from(
-            outerjoin(
-                outerjoin(
-                    db.MusehubRepo,
-                    db.MusehubStar,
-                    db.MusehubRepo.repo_id == db.MusehubStar.repo_id,
-                ),
-                db.MusehubCommit,
-                db.MusehubRepo.repo_id == db.MusehubCommit.repo_id,
-            )
+            star_count.label("star_count"),
+            commit_count.label("commit_count"),
+            stats.latest_commit_at,
         )
+        .outerjoin(stats, stats.repo_id == db.MusehubRepo.repo_id)
         .where(db.MusehubRepo.visibility == "public")
-        .group_by(db.MusehubRepo.repo_id)
     )
 
     # Apply filters ──────────────────────────────────────────────────────────
@@ -133,11 +129,13 @@ async def list_public_repos(
 
     # Apply sort ─────────────────────────────────────────────────────────────
     if sort == "stars":
-        base_q = base_q.order_by(desc("star_count"), desc(db.MusehubRepo.created_at))
+        base_q = base_q.order_by(desc(star_count), desc(db.MusehubRepo.created_at))
     elif sort == "activity":
-        base_q = base_q.order_by(desc("latest_commit"), desc(db.MusehubRepo.created_at))
+        base_q = base_q.order_by(
+            stats.latest_commit_at.desc().nulls_last(), desc(db.MusehubRepo.created_at)
+        )
     elif sort == "commits":
-        base_q = base_q.order_by(desc("commit_count"), desc(db.MusehubRepo.created_at))
+        base_q = base_q.order_by(desc(commit_count), desc(db.MusehubRepo.created_at))
     else: # "created"
         base_q = base_q.order_by(desc(db.MusehubRepo.created_at))
 
@@ -12,15 +12,18 @@ Boundary rules:
 """
 from __future__ import annotations
 
+import json
 import logging
 import re
 from datetime import datetime
+from typing import Literal
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, Select, Text, cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from maestro.db import musehub_models as db
+from maestro.db.musehub_search_models import KIND_ISSUE
 from maestro.models.musehub import (
     IssueCommentListResponse,
     IssueCommentResponse,
@@ -29,9 +32,13 @@ from maestro.models.musehub import (
     MilestoneResponse,
     MusicalRef,
 )
+from maestro.services import musehub_search_index as search_index
+from maestro.services.musehub_loaders import issue_comment_counts, milestone_issue_counts
 
 logger = logging.getLogger(__name__)
 
+IssueSort = Literal["number", "newest", "oldest", "most-commented"]
+
 # Regex to parse musical context references: track:bass, section:chorus, beats:16-24
 _MUSICAL_REF_RE = re.compile(
     r"\b(track|section|beats):([A-Za-z0-9_\-]+(?:-[A-Za-z0-9_\-]+)*)\b"
@@ -134,12 +141,52 @@ async def _next_milestone_number(session: AsyncSession, repo_id: str) -> int:
 
 async def _count_comments(session: AsyncSession, issue_id: str) -> int:
     """Return the non-deleted comment count for a single issue."""
-    stmt = select(func.count(db.MusehubIssueComment.comment_id)).where(
-        db.MusehubIssueComment.issue_id == issue_id,
-        db.MusehubIssueComment.is_deleted.is_(False),
-    )
-    count: int = (await session.execute(stmt)).scalar_one()
-    return count
+    return (await issue_comment_counts(session, [issue_id]))[issue_id]
+
+
+def _issue_filters(
+    repo_id: str,
+    *,
+    state: str,
+    label: str | None,
+    milestone_id: str | None,
+    assignee: str | None,
+    author: str | None,
+    matching: Select[tuple[str]] | None = None,
+) -> list[ColumnElement[bool]]:
+    """Build the WHERE clauses shared by :func:`list_issues` and :func:`count_issues`.
+
+    ``matching`` selects the issue IDs a text query matched in the search index.
+    """
+    clauses: list[ColumnElement[bool]] = [db.MusehubIssue.repo_id == repo_id]
+    if state != "all":
+        clauses.append(db.MusehubIssue.state == state)
+    if label is not None:
+        # Match the label as a whole JSON string element. json.dumps encodes it
+        # exactly as the JSON column serializer did, so "jazz" cannot match
+        # "jazz-fusion" and non-ASCII labels compare byte-for-byte.
+        clauses.append(
+            cast(db.MusehubIssue.labels, Text).contains(json.dumps(label), autoescape=True)
+        )
+    if milestone_id is not None:
+        clauses.append(db.MusehubIssue.milestone_id == milestone_id)
+    if assignee is not None:
+        clauses.append(db.MusehubIssue.assignee == assignee)
+    if author is not None:
+        clauses.append(
+            func.lower(db.MusehubIssue.author).contains(author.lower(), autoescape=True)
+        )
+    if matching is not None:
+        clauses.append(db.MusehubIssue.issue_id.in_(matching))
+    return clauses
+
+
+def _text_match(
+    session: AsyncSession, repo_id: str, query: str | None
+) -> Select[tuple[str]] | None:
+    if not query:
+        return None
+    return search_index.ref_ids(session, query, kind=KIND_ISSUE, repo_id=repo_id)
 
 
 async def create_issue(
@@ -180,38 +227,128 @@ async def list_issues(
     state: str = "open",
     label: str | None = None,
     milestone_id: str | None = None,
+    assignee: str | None = None,
+    author: str | None = None,
+    query: str | None = None,
+    sort: IssueSort = "number",
+    after_number: int | None = None,
+    limit: int | None = None,
+    offset: int = 0,
 ) -> list[IssueResponse]:
-    """Return issues for a repo, filtered by state, label, and/or milestone.
+    """Return issues for a repo, filtered by state, label, milestone, and people.
 
     ``state`` may be ``"open"``, ``"closed"``, or ``"all"``.
     ``label`` filters to issues whose labels list contains the given string.
     ``milestone_id`` filters to issues assigned to that milestone.
-    Results are ordered by issue number ascending.
+    ``assignee`` matches exactly; ``author`` is a case-insensitive substring.
+    ``query`` keeps issues whose title or body contains any of its words (as
+    a prefix), looked up in the search index.
+
+    ``sort`` is ``"number"`` (ascending, the default), ``"newest"``,
+    ``"oldest"``, or ``"most-commented"``. Every filter and sort runs in SQL,
+    and comment counts for the page come from one grouped query, so a page
+    costs a constant number of queries however many issues the repo has.
+
+    Pagination is either keyset — ``after_number`` returns issues numbered
+    after it, valid only with ``sort="number"`` — or ``offset``; ``limit``
+    caps the page (``None`` returns every match).
     """
+    if after_number is not None and sort != "number":
+        raise ValueError("after_number requires sort='number'")
+
     stmt = (
         select(db.MusehubIssue)
         .options(selectinload(db.MusehubIssue.milestone))
-        .where(db.MusehubIssue.repo_id == repo_id)
+        .where(
+            *_issue_filters(
+                repo_id,
+                state=state,
+                label=label,
+                milestone_id=milestone_id,
+                assignee=assignee,
+                author=author,
+                matching=_text_match(session, repo_id, query),
+            )
+        )
     )
+    if after_number is not None:
+        stmt = stmt.where(db.MusehubIssue.number > after_number)
+
+    if sort == "newest":
+        stmt = stmt.order_by(db.MusehubIssue.created_at.desc(), db.MusehubIssue.number.desc())
+    elif sort == "oldest":
+        stmt = stmt.order_by(db.MusehubIssue.created_at, db.MusehubIssue.number)
+    elif sort == "most-commented":
+        comment_count = (
+            select(func.count(db.MusehubIssueComment.comment_id))
+            .where(
+                db.MusehubIssueComment.issue_id == db.MusehubIssue.issue_id,
+                db.MusehubIssueComment.is_deleted.is_(False),
+            )
+            .scalar_subquery()
+        )
+        stmt = stmt.order_by(comment_count.desc(), db.MusehubIssue.number)
+    else:
+        stmt = stmt.order_by(db.MusehubIssue.number)
 
-    if state != "all":
-        stmt = stmt.where(db.MusehubIssue.state == state)
-
-    if milestone_id is not None:
-        stmt = stmt.where(db.MusehubIssue.milestone_id == milestone_id)
+    if offset:
+        stmt = stmt.offset(offset)
+    if limit is not None:
+        stmt = stmt.limit(limit)
 
-    stmt = stmt.order_by(db.MusehubIssue.number)
     rows = (await session.execute(stmt)).scalars().all()
+    counts = await issue_comment_counts(session, [r.issue_id for r in rows])
+    return [_to_issue_response(r, counts[r.issue_id]) for r in rows]
 
-    results: list[IssueResponse] = []
-    for r in rows:
-        count = await _count_comments(session, r.issue_id)
-        results.append(_to_issue_response(r, count))
 
-    if label is not None:
-        results = [r for r in results if label in r.labels]
+async def count_issues(
+    session: AsyncSession,
+    repo_id: str,
+    *,
+    state: str = "open",
+    label: str | None = None,
+    milestone_id: str | None = None,
+    assignee: str | None = None,
+    author: str | None = None,
+    query: str | None = None,
+) -> int:
+    """Return how many issues :func:`list_issues` would match without pagination."""
+    stmt = select(func.count(db.MusehubIssue.issue_id)).where(
+        *_issue_filters(
+            repo_id,
+            state=state,
+            label=label,
+            milestone_id=milestone_id,
+            assignee=assignee,
+            author=author,
+            matching=_text_match(session, repo_id, query),
+        )
+    )
+    total: int = (await session.execute(stmt)).scalar_one()
+    return total
 
-    return results
+
+async def count_issues_by_state(session: AsyncSession, repo_id: str) -> dict[str, int]:
+    """Return ``{"open": n, "closed": m}`` for a repo in one grouped query."""
+    rows = await session.execute(
+        select(db.MusehubIssue.state, func.count(db.MusehubIssue.issue_id))
+        .where(db.MusehubIssue.repo_id == repo_id)
+        .group_by(db.MusehubIssue.state)
+    )
+    counts = {"open": 0, "closed": 0}
+    counts.update({issue_state: int(n) for issue_state, n in rows.tuples()})
+    return counts
+
+
+async def list_issue_assignees(session: AsyncSession, repo_id: str) -> list[str]:
+    """Return the distinct assignees across all of a repo's issues, sorted."""
+    rows = await session.execute(
+        select(db.MusehubIssue.assignee)
+        .where(db.MusehubIssue.repo_id == repo_id, db.MusehubIssue.assignee.is_not(None))
+        .distinct()
+        .order_by(db.MusehubIssue.assignee)
+    )
+    return [a for a in rows.scalars() if a]
 
 
 async def get_issue(
@@ -615,19 +752,8 @@ async def list_milestones(
 
     rows = (await session.execute(stmt)).scalars().all()
 
-    milestones: list[MilestoneResponse] = []
-    for ms in rows:
-        open_count_stmt = select(func.count(db.MusehubIssue.issue_id)).where(
-            db.MusehubIssue.milestone_id == ms.milestone_id,
-            db.MusehubIssue.state == "open",
-        )
-        closed_count_stmt = select(func.count(db.MusehubIssue.issue_id)).where(
-            db.MusehubIssue.milestone_id == ms.milestone_id,
-            db.MusehubIssue.state == "closed",
-        )
-        open_count: int = (await session.execute(open_count_stmt)).scalar_one()
-        closed_count: int = (await session.execute(closed_count_stmt)).scalar_one()
-        milestones.append(_to_milestone_response(ms, open_count, closed_count))
+    counts = await milestone_issue_counts(session, [ms.milestone_id for ms in rows])
+    milestones = [_to_milestone_response(ms, *counts[ms.milestone_id]) for ms in rows]
 
     if sort == "completeness":
         # Sort descending by fraction of closed issues; fully closed milestones first.
@@ -652,14 +778,5 @@ async def get_milestone(
     row = (await session.execute(stmt)).scalar_one_or_none()
     if row is None:
         return None
-    open_count_stmt = select(func.count(db.MusehubIssue.issue_id)).where(
-        db.MusehubIssue.milestone_id == row.milestone_id,
-        db.MusehubIssue.state == "open",
-    )
-    closed_count_stmt = select(func.count(db.MusehubIssue.issue_id)).where(
-        db.MusehubIssue.milestone_id == row.milestone_id,
-        db.MusehubIssue.state == "closed",
-    )
-    open_count: int = (await session.execute(open_count_stmt)).scalar_one()
-    closed_count: int = (await session.execute(closed_count_stmt)).scalar_one()
-    return _to_milestone_response(row, open_count, closed_count)
+    counts = await milestone_issue_counts(session, [row.milestone_id])
+    return _to_milestone_response(row, *counts[row.milestone_id])
@@ -0,0 +1,76 @@
+"""Muse Hub batch loaders — per-row lookups for a whole page in one query.
+
+List endpoints render a page of issues or milestones and need a little data
+per row that lives in another table: how many comments an issue has, how
+many open and closed issues a milestone tracks. Fetching that with one query
+per row turns a page into N+1 round trips. Each loader here takes the keys
+for the whole page and answers with a single grouped query.
+
+Every loader returns a dict containing *every* requested key — keys with no
+matching rows map to zero — so callers index the result directly. Duplicate
+keys are allowed and fetched once.
+
+Boundary rules:
+- Must NOT import state stores, SSE queues, or LLM clients.
+- Must NOT import maestro.core.* modules.
+- May import ORM models from maestro.db.musehub_models.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from maestro.db import musehub_models as db
+
+# Keep IN lists well under SQLite's bound-parameter limit.
+_IN_BATCH = 500
+
+
+def _unique(keys: Iterable[str]) -> list[str]:
+    return list(dict.fromkeys(keys))
+
+
+def _batches(keys: list[str]) -> Iterable[list[str]]:
+    for start in range(0, len(keys), _IN_BATCH):
+        yield keys[start : start + _IN_BATCH]
+
+
+async def issue_comment_counts(
+    session: AsyncSession, issue_ids: Iterable[str]
+) -> dict[str, int]:
+    """Return the non-deleted comment count for each issue."""
+    ids = _unique(issue_ids)
+    counts = dict.fromkeys(ids, 0)
+    for batch in _batches(ids):
+        rows = await session.execute(
+            select(db.MusehubIssueComment.issue_id, func.count())
+            .where(
+                db.MusehubIssueComment.issue_id.in_(batch),
+                db.MusehubIssueComment.is_deleted.is_(False),
+            )
+            .group_by(db.MusehubIssueComment.issue_id)
+        )
+        counts.update({issue_id: int(n) for issue_id, n in rows.tuples()})
+    return counts
+
+
+async def milestone_issue_counts(
+    session: AsyncSession, milestone_ids: Iterable[str]
+) -> dict[str, tuple[int, int]]:
+    """Return ``(open, closed)`` issue counts for each milestone."""
+    ids = _unique(milestone_ids)
+    counts = dict.fromkeys(ids, (0, 0))
+    is_open = case((db.MusehubIssue.state == "open", 1), else_=0)
+    is_closed = case((db.MusehubIssue.state == "closed", 1), else_=0)
+    for batch in _batches(ids):
+        rows = await session.execute(
+            select(db.MusehubIssue.milestone_id, func.sum(is_open), func.sum(is_closed))
+            .where(db.MusehubIssue.milestone_id.in_(batch))
+            .group_by(db.MusehubIssue.milestone_id)
+        )
+        counts.update(
+            {ms_id: (int(n_open or 0), int(n_closed or 0)) for ms_id, n_open, n_closed in rows.tuples()}
+        )
+    return counts
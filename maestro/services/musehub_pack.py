@@ -0,0 +1,224 @@
+"""Muse Hub pack stream — the binary wire format for negotiated pulls.
+
+The JSON pull protocol base64-encodes every object inside one response body,
+so both ends hold the whole transfer in memory. A pack stream instead frames
+commits and object bytes so the Hub can write them as it reads objects off
+disk and ``muse pull`` can store them as they arrive.
+
+Wire format
+-----------
+::
+
+    MUSEPACK <version:1 byte>
+    frame*  where frame = <kind:1 byte> <length:uint32 BE> <payload:length bytes>
+
+Frame kinds:
+
+- ``H`` — header, JSON ``{"branch", "remote_head"}``. Always first.
+- ``C`` — one commit, JSON in the CLI's ``PullCommitPayload`` shape.
+  Commits are sent parents-first.
+- ``O`` — object header, JSON ``{"object_id", "path", "size_bytes"}``.
+- ``D`` — up to :data:`CHUNK_SIZE` raw bytes of the most recent object.
+  An object is complete when ``size_bytes`` bytes of ``D`` frames arrived.
+- ``E`` — end, JSON ``{"commits": n, "objects": m}``. A stream without an
+  end frame was truncated and must be discarded.
+
+Pushes use the same framing, with an ``H`` frame of
+``{"branch", "head_commit_id", "force"}`` and commits in the Hub's
+``CommitInput`` shape (see ``musehub_sync.ingest_push_pack``).
+
+This module is pure (no DB, no HTTP): the sender encodes with
+:func:`encode_pack` (the Hub for pulls, ``muse push`` for pushes), the
+receiver decodes with :class:`PackDecoder`.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pathlib
+import struct
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import BinaryIO
+
+logger = logging.getLogger(__name__)
+
+PACK_MEDIA_TYPE = "application/x-muse-pack"
+PACK_MAGIC = b"MUSEPACK"
+PACK_VERSION = 1
+#: Object bytes are framed in chunks of at most this size.
+CHUNK_SIZE = 64 * 1024
+
+FRAME_HEADER = b"H"
+FRAME_COMMIT = b"C"
+FRAME_OBJECT = b"O"
+FRAME_DATA = b"D"
+FRAME_END = b"E"
+
+_FRAME_PREFIX = struct.Struct(">cI")
+_PREAMBLE = PACK_MAGIC + bytes([PACK_VERSION])
+_KINDS = frozenset({FRAME_HEADER, FRAME_COMMIT, FRAME_OBJECT, FRAME_DATA, FRAME_END})
+
+
+class PackFormatError(ValueError):
+    """Raised when a pack stream is malformed or truncated."""
+
+
+@dataclass(frozen=True)
+class PackObject:
+    """An object to stream: its identity plus where the sender keeps its bytes.
+
+    ``size_bytes`` is informational; :func:`encode_pack` takes the size from
+    the file itself.
+    """
+
+    object_id: str
+    path: str
+    disk_path: str
+    size_bytes: int = 0
+
+
+@dataclass(frozen=True)
+class PackFrame:
+    """One decoded frame. ``payload`` is raw bytes; JSON kinds use :meth:`json`."""
+
+    kind: bytes
+    payload: bytes
+
+    def json(self) -> dict[str, object]:
+        data: object = json.loads(self.payload)
+        if not isinstance(data, dict):
+            raise PackFormatError(f"frame {self.kind!r} payload is not a JSON object")
+        return data
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+
+def encode_frame(kind: bytes, payload: bytes) -> bytes:
+    """Return the wire bytes for one frame."""
+    return _FRAME_PREFIX.pack(kind, len(payload)) + payload
+
+
+def _json_frame(kind: bytes, data: Mapping[str, object]) -> bytes:
+    return encode_frame(kind, json.dumps(data, separators=(",", ":")).encode())
+
+
+async def encode_pack(
+    header: Mapping[str, object],
+    commits: Iterable[Mapping[str, object]],
+    objects: Iterable[PackObject],
+    open_object: Callable[[PackObject], BinaryIO] | None = None,
+) -> AsyncIterator[bytes]:
+    """Yield a complete pack stream, reading object files in chunks.
+
+    Objects are opened from ``disk_path`` unless *open_object* is given, in
+    which case it returns a readable, seekable binary stream for each one
+    (the CLI uses this for objects that ``muse gc`` moved into a local pack).
+
+    Objects that cannot be opened are skipped with a warning, as the JSON
+    protocol tolerates missing files too; the end frame reports what was
+    actually sent. ``size_bytes`` is taken from the stream itself.
+    """
+    yield _PREAMBLE + _json_frame(FRAME_HEADER, header)
+
+    commit_count = 0
+    for commit in commits:
+        yield _json_frame(FRAME_COMMIT, commit)
+        commit_count += 1
+
+    object_count = 0
+    for obj in objects:
+        try:
+            fh = open_object(obj) if open_object else pathlib.Path(obj.disk_path).open("rb")
+        except OSError:
+            logger.warning(
+                "⚠️ Object file missing on disk: %s (object_id=%s)", obj.disk_path, obj.object_id
+            )
+            continue
+        with fh:
+            size = fh.seek(0, os.SEEK_END)
+            fh.seek(0)
+            yield _json_frame(
+                FRAME_OBJECT,
+                {"object_id": obj.object_id, "path": obj.path, "size_bytes": size},
+            )
+            while chunk := fh.read(CHUNK_SIZE):
+                yield encode_frame(FRAME_DATA, chunk)
+        object_count += 1
+
+    yield _json_frame(FRAME_END, {"commits": commit_count, "objects": object_count})
+
+
+# ---------------------------------------------------------------------------
+# Decoding
+# ---------------------------------------------------------------------------
+
+
+class PackDecoder:
+    """Incremental pack parser: feed it network chunks, get whole frames back.
+
+    Only the bytes of a partially received frame are buffered, so memory use
+    is bounded by :data:`CHUNK_SIZE` plus the largest commit frame.
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._preamble_seen = False
+        self._ended = False
+
+    @property
+    def ended(self) -> bool:
+        """``True`` once the end frame has been decoded."""
+        return self._ended
+
+    def feed(self, data: bytes) -> list[PackFrame]:
+        """Consume *data* and return every frame it completes."""
+        if self._ended and data:
+            raise PackFormatError("data after end frame")
+        self._buf.extend(data)
+        frames: list[PackFrame] = []
+        if not self._preamble_seen:
+            if len(self._buf) < len(_PREAMBLE):
+                return frames
+            if bytes(self._buf[: len(PACK_MAGIC)]) != PACK_MAGIC:
+                raise PackFormatError("not a Muse pack stream")
+            if self._buf[len(PACK_MAGIC)] != PACK_VERSION:
+                raise PackFormatError(f"unsupported pack version {self._buf[len(PACK_MAGIC)]}")
+            del self._buf[: len(_PREAMBLE)]
+            self._preamble_seen = True
+
+        offset = 0
+        while len(self._buf) - offset >= _FRAME_PREFIX.size:
+            kind, length = _FRAME_PREFIX.unpack_from(self._buf, offset)
+            if kind not in _KINDS:
+                raise PackFormatError(f"unknown frame kind {kind!r}")
+            end = offset + _FRAME_PREFIX.size + length
+            if len(self._buf) < end:
+                break
+            frames.append(PackFrame(kind, bytes(self._buf[offset + _FRAME_PREFIX.size : end])))
+            offset = end
+            if kind == FRAME_END:
+                self._ended = True
+                if offset != len(self._buf):
+                    raise PackFormatError("data after end frame")
+                break
+        del self._buf[:offset]
+        return frames
+
+    def close(self) -> None:
+        """Raise :class:`PackFormatError` unless the stream ended cleanly."""
+        if not self._ended:
+            raise PackFormatError("pack stream truncated before end frame")
+
+
+async def iter_pack_frames(chunks: AsyncIterable[bytes]) -> AsyncIterator[PackFrame]:
+    """Decode an async byte stream into frames, raising if it is truncated."""
+    decoder = PackDecoder()
+    async for chunk in chunks:
+        for frame in decoder.feed(chunk):
+            yield frame
+    decoder.close()
@@ -2,8 +2,12 @@
 
 Converts raw MIDI bytes into a static piano roll image (PNG) without any
 browser or external image library dependency. Uses ``mido`` (already a
-project dependency) to parse MIDI and stdlib ``zlib``/``struct`` to encode
-a minimal PNG.
+project dependency) to parse MIDI, a NumPy ``uint8`` array as the canvas,
+and stdlib ``zlib``/``struct`` to encode a minimal PNG.
+
+Each note is painted with one slice assignment into the canvas rather than
+pixel by pixel, so render time is dominated by PNG compression, not by the
+number or length of notes.
 
 The piano roll image layout:
   - Width : ``MAX_WIDTH_PX`` (clamped), representing the MIDI timeline.
@@ -14,11 +18,16 @@ The piano roll image layout:
 
 Design constraints:
   - Zero external image dependencies (no Pillow, no cairo, no Node).
-  - Deterministic: same MIDI bytes → same PNG bytes for a given render width.
+  - Deterministic: same MIDI bytes → same PNG bytes for a given render width
+    and ``RENDER_VERSION``. Callers may cache on that triple; bump
+    ``RENDER_VERSION`` whenever a change alters the pixels.
+  - Picklable inputs and outputs: :func:`render_piano_roll_png` takes bytes
+    and returns a frozen dataclass, so it can run in a process pool.
   - Graceful degradation: a blank canvas is returned when the MIDI has no
     note events, so callers always receive a valid PNG.
 
-Result type: ``PianoRollRenderResult`` — registered in docs/reference/type_contracts.md.
+Result types: ``PianoRollImage``, ``PianoRollRenderResult`` — registered in
+docs/reference/type_contracts.md.
 """
 from __future__ import annotations
 
@@ -30,6 +39,8 @@ from dataclasses import dataclass
 from pathlib import Path
 
 import mido
+import numpy as np
+import numpy.typing as npt
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +48,9 @@ logger = logging.getLogger(__name__)
 # Constants
 # ---------------------------------------------------------------------------
 
+# Version of the rendered pixels; part of every piano-roll cache key.
+RENDER_VERSION: int = 2
+
 NOTE_ROWS: int = 128 # MIDI pitch range: 0–127
 MAX_WIDTH_PX: int = 1920 # maximum render width in pixels
 MIN_WIDTH_PX: int = 64 # minimum render width (very short clips)
@@ -76,6 +90,24 @@ _MIN_NOTE_PX: int = 1
 # ---------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class PianoRollImage:
+    """An encoded piano roll held in memory.
+
+    Attributes:
+        png_bytes: Complete PNG file bytes.
+        width_px: Actual render width in pixels.
+        note_count: Number of MIDI note events rendered.
+        stubbed: True when the MIDI contained no note events (or could not
+            be parsed) and a blank canvas was returned.
+    """
+
+    png_bytes: bytes
+    width_px: int
+    note_count: int
+    stubbed: bool
+
+
 @dataclass(frozen=True)
 class PianoRollRenderResult:
     """Outcome of a single piano roll render operation.
@@ -175,6 +207,8 @@ def _parse_note_events(midi: mido.MidiFile) -> list[_NoteEvent]:
 # PNG magic bytes
 _PNG_SIGNATURE: bytes = b"\x89PNG\r\n\x1a\n"
 
+_Canvas = npt.NDArray[np.uint8]
+
 
 def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
     """Encode a single PNG chunk (length + type + data + CRC)."""
@@ -182,25 +216,25 @@ def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
     return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
 
 
-def _encode_png(pixels: list[bytearray], width: int, height: int) -> bytes:
-    """Encode a list of RGB scanlines as a minimal PNG byte string.
+def _encode_png(pixels: _Canvas) -> bytes:
+    """Encode an RGB canvas as a minimal PNG byte string.
 
     Args:
-        pixels: ``height`` bytearrays, each of length ``width * 3`` (RGB).
-        width: Image width in pixels.
-        height: Image height in pixels.
+        pixels: ``(height, width, 3)`` ``uint8`` array, top row first.
 
     Returns:
         Complete PNG file bytes.
     """
+    height, width, _ = pixels.shape
     # IHDR: width, height, bit-depth=8, colour-type=2 (RGB), compression=0,
     # filter-method=0, interlace=0
     ihdr_data = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
     ihdr = _png_chunk(b"IHDR", ihdr_data)
 
     # IDAT: each scanline prefixed with filter byte 0 (None)
-    raw_rows = b"".join(b"\x00" + row for row in pixels)
-    idat = _png_chunk(b"IDAT", zlib.compress(raw_rows, 6))
+    scanlines = np.zeros((height, 1 + width * 3), dtype=np.uint8)
+    scanlines[:, 1:] = pixels.reshape(height, width * 3)
+    idat = _png_chunk(b"IDAT", zlib.compress(scanlines.tobytes(), 6))
 
     iend = _png_chunk(b"IEND", b"")
 
@@ -212,151 +246,144 @@ def _encode_png(pixels: list[bytearray], width: int, height: int) -> bytes:
 # ---------------------------------------------------------------------------
 
 
-def _build_canvas(width: int) -> list[bytearray]:
+def _build_canvas(width: int) -> _Canvas:
     """Allocate a blank RGB canvas of size ``width × IMAGE_HEIGHT``.
 
-    Rows are stored bottom-first (MIDI pitch 0 at index 0) but will be
-    written top-first (inverted) when encoding the PNG.
+    Rows are stored bottom-first (MIDI pitch 0 at index 0) and flipped when
+    encoding the PNG.
 
     Returns:
-        ``IMAGE_HEIGHT`` bytearrays each of ``width * 3`` bytes filled with
-        ``BG_COLOR``.
+        ``(IMAGE_HEIGHT, width, 3)`` array filled with ``BG_COLOR``, with a
+        ``BOUNDARY_COLOR`` rule along the bottom of every C pitch row.
     """
-    row_template = bytearray(BG_COLOR * width)
-
-    # Draw octave-C boundary lines (every 12 semitones starting at C0 = pitch 0)
-    rows: list[bytearray] = []
-    for note in range(NOTE_ROWS):
-        if note % 12 == 0:
-            rows.append(bytearray(BOUNDARY_COLOR * width))
-        else:
-            rows.append(bytearray(row_template))
-
-    return rows
+    canvas = np.empty((IMAGE_HEIGHT, width, 3), dtype=np.uint8)
+    canvas[:] = BG_COLOR
+    # Octave-C boundary lines (every 12 semitones starting at C0 = pitch 0)
+    canvas[:: 12 * NOTE_ROW_HEIGHT] = BOUNDARY_COLOR
+    return canvas
 
 
-def _draw_note(
-    rows: list[bytearray],
-    note: _NoteEvent,
+def _draw_notes(
+    canvas: _Canvas,
+    notes: list[_NoteEvent],
     total_ticks: int,
-    width: int,
 ) -> None:
-    """Paint a single note event onto the canvas (in-place).
+    """Paint every note event onto the canvas (in-place).
+
+    Pixel extents for all notes are computed as arrays up front; each note is
+    then one slice fill of its pitch row.
 
     Args:
-        rows: Canvas from ``_build_canvas`` (bottom-first ordering).
-        note: Note event with absolute tick positions.
+        canvas: Canvas from ``_build_canvas`` (bottom-first ordering).
+        notes: Note events with absolute tick positions.
         total_ticks: Total MIDI duration in ticks (used to map ticks → pixels).
-        width: Canvas width in pixels.
     """
-    if total_ticks <= 0:
+    if total_ticks <= 0 or not notes:
         return
+    width = canvas.shape[1]
 
-    color = _CHANNEL_COLORS[note.channel % len(_CHANNEL_COLORS)]
-
-    # Map tick → pixel column
-    x_start = int(note.start_tick / total_ticks * width)
-    x_end = max(x_start + _MIN_NOTE_PX, int(note.end_tick / total_ticks * width))
-    x_end = min(x_end, width)
+    starts = np.fromiter((n.start_tick for n in notes), dtype=np.float64, count=len(notes))
+    ends = np.fromiter((n.end_tick for n in notes), dtype=np.float64, count=len(notes))
+    # Map tick → pixel column; very short notes stay _MIN_NOTE_PX wide.
+    x_start = (starts / total_ticks * width).astype(np.int64)
+    x_end = np.maximum(x_start + _MIN_NOTE_PX, (ends / total_ticks * width).astype(np.int64))
+    x_end = np.minimum(x_end, width)
 
-    # Pitch row (bottom-first)
-    row_base = note.pitch * NOTE_ROW_HEIGHT
-    for dy in range(NOTE_ROW_HEIGHT):
-        row_idx = row_base + dy
-        if row_idx >= len(rows):
-            continue
-        row = rows[row_idx]
-        for x in range(x_start, x_end):
-            offset = x * 3
-            row[offset] = color[0]
-            row[offset + 1] = color[1]
-            row[offset + 2] = color[2]
+    palette = np.array(_CHANNEL_COLORS, dtype=np.uint8)
+    for note, x0, x1 in zip(notes, x_start.tolist(), x_end.tolist()):
+        row = note.pitch * NOTE_ROW_HEIGHT
+        canvas[row : row + NOTE_ROW_HEIGHT, x0:x1] = palette[note.channel % len(palette)]
 
 
-def render_piano_roll(
+def render_piano_roll_png(
     midi_bytes: bytes,
-    output_path: Path,
-    track_index: int = 0,
     target_width: int = MAX_WIDTH_PX,
-) -> PianoRollRenderResult:
-    """Render raw MIDI bytes as a piano roll PNG image.
+) -> PianoRollImage:
+    """Render raw MIDI bytes as an in-memory piano roll PNG.
 
-    Parses all tracks from the MIDI file, paints each note as a coloured
-    rectangle proportional to its duration, and writes a PNG file.
+    Parses all tracks from the MIDI file and paints each note as a coloured
+    rectangle proportional to its duration. Unparseable or note-less MIDI
+    yields a blank canvas with ``stubbed=True``.
 
     Args:
         midi_bytes: Raw bytes of a Standard MIDI File (.mid).
-        output_path: Destination path for the output PNG file.
-        track_index: Logical track index for the result metadata (informational
-            only — all tracks are rendered into a single composite image).
         target_width: Desired render width in pixels. Clamped to
             ``[MIN_WIDTH_PX, MAX_WIDTH_PX]``.
 
     Returns:
-        ``PianoRollRenderResult`` describing what was written.
-
-    Raises:
-        OSError: If the output directory cannot be created or the file written.
+        ``PianoRollImage`` holding the encoded PNG.
     """
     width = max(MIN_WIDTH_PX, min(target_width, MAX_WIDTH_PX))
+    canvas = _build_canvas(width)
 
-    # Parse MIDI
     try:
         midi = mido.MidiFile(file=io.BytesIO(midi_bytes))
     except Exception as exc:
         logger.warning("⚠️ Failed to parse MIDI for piano roll: %s", exc)
-        # Write blank canvas so callers always get a valid PNG
-        canvas = _build_canvas(width)
-        png_bytes = _encode_png(list(reversed(canvas)), width, IMAGE_HEIGHT)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_bytes(png_bytes)
-        return PianoRollRenderResult(
-            output_path=output_path,
-            width_px=width,
-            note_count=0,
-            track_index=track_index,
-            stubbed=True,
+        return PianoRollImage(
+            png_bytes=_encode_png(canvas[::-1]), width_px=width, note_count=0, stubbed=True
         )
 
     note_events = _parse_note_events(midi)
-
     if not note_events:
-        logger.info("ℹ️ MIDI has no note events — writing blank piano roll at %s", output_path)
-        canvas = _build_canvas(width)
-        png_bytes = _encode_png(list(reversed(canvas)), width, IMAGE_HEIGHT)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_bytes(png_bytes)
-        return PianoRollRenderResult(
-            output_path=output_path,
-            width_px=width,
-            note_count=0,
-            track_index=track_index,
-            stubbed=True,
+        logger.info("ℹ️ MIDI has no note events — rendering blank piano roll")
+        return PianoRollImage(
+            png_bytes=_encode_png(canvas[::-1]), width_px=width, note_count=0, stubbed=True
         )
 
     total_ticks = max(ev.end_tick for ev in note_events)
-    canvas = _build_canvas(width)
+    _draw_notes(canvas, note_events, total_ticks)
 
-    for ev in note_events:
-        _draw_note(canvas, ev, total_ticks, width)
+    # PNG rows are top-first; MIDI pitches are bottom-first, so flip.
+    return PianoRollImage(
+        png_bytes=_encode_png(canvas[::-1]),
+        width_px=width,
+        note_count=len(note_events),
+        stubbed=False,
+    )
+
+
+def render_piano_roll(
+    midi_bytes: bytes,
+    output_path: Path,
+    track_index: int = 0,
+    target_width: int = MAX_WIDTH_PX,
+) -> PianoRollRenderResult:
+    """Render raw MIDI bytes as a piano roll PNG file.
+
+    Writes the output of :func:`render_piano_roll_png` to ``output_path``.
+
+    Args:
+        midi_bytes: Raw bytes of a Standard MIDI File (.mid).
+        output_path: Destination path for the output PNG file.
+        track_index: Logical track index for the result metadata (informational
+            only — all tracks are rendered into a single composite image).
+        target_width: Desired render width in pixels. Clamped to
+            ``[MIN_WIDTH_PX, MAX_WIDTH_PX]``.
+
+    Returns:
+        ``PianoRollRenderResult`` describing what was written.
 
-    # PNG rows are top-first; MIDI pitches are bottom-first, so reverse.
-    png_bytes = _encode_png(list(reversed(canvas)), width, IMAGE_HEIGHT)
+    Raises:
+        OSError: If the output directory cannot be created or the file written.
+    """
+    image = render_piano_roll_png(midi_bytes, target_width)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_bytes(png_bytes)
-
-    logger.info(
-        "✅ Piano roll rendered: %d notes → %s (%dx%d px)",
-        len(note_events),
-        output_path,
-        width,
-        IMAGE_HEIGHT,
-    )
+    output_path.write_bytes(image.png_bytes)
+
+    if not image.stubbed:
+        logger.info(
+            "✅ Piano roll rendered: %d notes → %s (%dx%d px)",
+            image.note_count,
+            output_path,
+            image.width_px,
+            IMAGE_HEIGHT,
+        )
 
     return PianoRollRenderResult(
         output_path=output_path,
-        width_px=width,
-        note_count=len(note_events),
+        width_px=image.width_px,
+        note_count=image.note_count,
         track_index=track_index,
-        stubbed=False,
+        stubbed=image.stubbed,
     )
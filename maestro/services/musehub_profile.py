@@ -20,6 +20,7 @@ from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from maestro.db import musehub_models as db
+from maestro.db.musehub_stats_models import MusehubRepoStats
 from maestro.models.musehub import (
     ContributionDay,
     ProfileResponse,
@@ -154,46 +155,35 @@ async def get_public_repos(
 ) -> list[ProfileRepoSummary]:
     """Return public repos owned by ``user_id``, newest first.
 
-    Last-activity timestamp is the most recent commit timestamp across all
-    branches in the repo. Star count is always 0 at MVP (no star mechanism).
+    Star count and last-activity timestamp (the most recent commit across all
+    branches) come from the repo's materialized stats row, read in the same
+    query as the repos themselves.
     """
-    repo_rows_result = await session.execute(
-        select(db.MusehubRepo)
-        .where(
-            db.MusehubRepo.owner_user_id == user_id,
-            db.MusehubRepo.visibility == "public",
+    stats = MusehubRepoStats
+    rows = (
+        await session.execute(
+            select(db.MusehubRepo, stats.star_count, stats.latest_commit_at)
+            .outerjoin(stats, stats.repo_id == db.MusehubRepo.repo_id)
+            .where(
+                db.MusehubRepo.owner_user_id == user_id,
+                db.MusehubRepo.visibility == "public",
+            )
+            .order_by(desc(db.MusehubRepo.created_at))
         )
-        .order_by(desc(db.MusehubRepo.created_at))
-    )
-    repo_rows = list(repo_rows_result.scalars())
-
-    if not repo_rows:
-        return []
-
-    # Fetch latest commit timestamp per repo in one query
-    repo_ids = [r.repo_id for r in repo_rows]
-    latest_result = await session.execute(
-        select(
-            db.MusehubCommit.repo_id,
-            func.max(db.MusehubCommit.timestamp).label("last_activity"),
-        )
-        .where(db.MusehubCommit.repo_id.in_(repo_ids))
-        .group_by(db.MusehubCommit.repo_id)
-    )
-    last_activity: dict[str, datetime] = {row.repo_id: row.last_activity for row in latest_result}
+    ).all()
 
     return [
         ProfileRepoSummary(
-            repo_id=r.repo_id,
-            name=r.name,
-            owner=r.owner,
-            slug=r.slug,
-            visibility=r.visibility,
-            star_count=0,
-            last_activity_at=last_activity.get(r.repo_id),
-            created_at=r.created_at,
+            repo_id=row.MusehubRepo.repo_id,
+            name=row.MusehubRepo.name,
+            owner=row.MusehubRepo.owner,
+            slug=row.MusehubRepo.slug,
+            visibility=row.MusehubRepo.visibility,
+            star_count=row.star_count or 0,
+            last_activity_at=row.latest_commit_at,
+            created_at=row.MusehubRepo.created_at,
         )
-        for r in repo_rows
+        for row in rows
     ]
 
 
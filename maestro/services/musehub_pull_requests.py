@@ -24,10 +24,11 @@ import logging
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from maestro.db import musehub_models as db
+from maestro.db.musehub_search_models import KIND_PULL_REQUEST
 from maestro.models.musehub import (
     PRCommentListResponse,
     PRCommentResponse,
@@ -35,6 +36,7 @@ from maestro.models.musehub import (
     PRReviewListResponse,
     PRReviewResponse,
 )
+from maestro.services import musehub_search_index as search_index
 
 logger = logging.getLogger(__name__)
 
@@ -107,26 +109,79 @@ async def create_pr(
     return _to_pr_response(pr)
 
 
+def _pr_filters(
+    session: AsyncSession, repo_id: str, *, state: str, query: str | None
+) -> list[ColumnElement[bool]]:
+    """Build the WHERE clauses shared by :func:`list_prs` and :func:`count_prs`."""
+    clauses: list[ColumnElement[bool]] = [db.MusehubPullRequest.repo_id == repo_id]
+    if state != "all":
+        clauses.append(db.MusehubPullRequest.state == state)
+    matching = (
+        search_index.ref_ids(session, query, kind=KIND_PULL_REQUEST, repo_id=repo_id)
+        if query
+        else None
+    )
+    if matching is not None:
+        clauses.append(db.MusehubPullRequest.pr_id.in_(matching))
+    return clauses
+
+
 async def list_prs(
     session: AsyncSession,
     repo_id: str,
     *,
     state: str = "all",
+    query: str | None = None,
+    newest_first: bool = False,
+    limit: int | None = None,
+    offset: int = 0,
 ) -> list[PRResponse]:
     """Return pull requests for a repo, ordered by created_at ascending.
 
     ``state`` may be ``"open"``, ``"merged"``, ``"closed"``, or ``"all"``.
+    ``query`` keeps PRs whose title or body contains any of its words (as a
+    prefix), looked up in the search index. ``newest_first`` reverses the
+    order. ``limit`` and ``offset`` page the result in SQL; ``limit=None``
+    returns every match.
     """
     stmt = select(db.MusehubPullRequest).where(
-        db.MusehubPullRequest.repo_id == repo_id
+        *_pr_filters(session, repo_id, state=state, query=query)
     )
-    if state != "all":
-        stmt = stmt.where(db.MusehubPullRequest.state == state)
-    stmt = stmt.order_by(db.MusehubPullRequest.created_at)
+    if newest_first:
+        stmt = stmt.order_by(db.MusehubPullRequest.created_at.desc())
+    else:
+        stmt = stmt.order_by(db.MusehubPullRequest.created_at)
+    if offset:
+        stmt = stmt.offset(offset)
+    if limit is not None:
+        stmt = stmt.limit(limit)
     rows = (await session.execute(stmt)).scalars().all()
     return [_to_pr_response(r) for r in rows]
 
 
+async def count_prs(
+    session: AsyncSession, repo_id: str, *, state: str = "all", query: str | None = None
+) -> int:
+    """Return how many PRs :func:`list_prs` would match without pagination."""
+    stmt = select(func.count(db.MusehubPullRequest.pr_id)).where(
+        *_pr_filters(session, repo_id, state=state, query=query)
+    )
+    total: int = (await session.execute(stmt)).scalar_one()
+    return total
+
+
+async def count_prs_by_state(session: AsyncSession, repo_id: str) -> dict[str, int]:
+    """Return PR counts keyed by ``open``, ``merged`` and ``closed`` in one query."""
+    rows = await session.execute(
+        select(db.MusehubPullRequest.state, func.count(db.MusehubPullRequest.pr_id))
+        .where(db.MusehubPullRequest.repo_id == repo_id)
+        .group_by(db.MusehubPullRequest.state)
+    )
+    counts = {"open": 0, "merged": 0, "closed": 0}
+    counts.update({pr_state: int(n) for pr_state, n in rows.tuples()})
+    return counts
+
+
 async def get_pr(
     session: AsyncSession,
     repo_id: str,
@@ -389,13 +444,13 @@ async def request_reviewers(
     """
     await _assert_pr_exists(session, repo_id, pr_id)
 
-    for username in reviewers:
-        existing_stmt = select(db.MusehubPRReview).where(
-            db.MusehubPRReview.pr_id == pr_id,
-            db.MusehubPRReview.reviewer_username == username,
-        )
-        existing = (await session.execute(existing_stmt)).scalar_one_or_none()
-        if existing is None:
+    existing_stmt = select(db.MusehubPRReview.reviewer_username).where(
+        db.MusehubPRReview.pr_id == pr_id,
+        db.MusehubPRReview.reviewer_username.in_(reviewers),
+    )
+    existing = set((await session.execute(existing_stmt)).scalars())
+    for username in dict.fromkeys(reviewers):
+        if username not in existing:
             review = db.MusehubPRReview(pr_id=pr_id, reviewer_username=username, state="pending")
             session.add(review)
             logger.info("✅ Requested review from '%s' on PR %s", username, pr_id)
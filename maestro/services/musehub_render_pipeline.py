@@ -9,13 +9,29 @@ push to MuseHub. For each new commit the pipeline:
 3. Discovers MIDI objects in the push payload (``path`` ends with ``.mid``
    or ``.midi``).
 4. For each MIDI object:
-   a. Generates a piano-roll PNG image via ``musehub_piano_roll_renderer``.
+   a. Generates a piano-roll PNG image via ``musehub_piano_roll_renderer``,
+      unless the render cache already holds one for the same MIDI bytes.
    b. Generates an MP3 audio preview stub via the same logic as
       ``muse_render_preview`` (MIDI copy; replaced with a real Storpheus
       ``POST /render`` call when that endpoint ships).
-5. Stores each generated artifact as a new ``musehub_objects`` row.
+5. Stores each generated artifact in the shared blob store
+   (``musehub_blobs``) and references it from a ``musehub_objects`` row —
+   identical renders across commits or repos share one file.
 6. Updates the job status to ``complete`` or ``failed``.
 
+Piano rolls for all MIDI objects of a commit are rasterized concurrently in a
+process pool of ``settings.musehub_render_workers`` processes, so a push with
+many tracks neither stalls the event loop nor renders one track at a time.
+Workers are started with ``forkserver`` (``spawn`` where that is unavailable)
+rather than forked from the running server, so they do not inherit its event
+loop, DB connections or locks; the app lifespan shuts the pool down via
+:func:`close_render_pool`.
+Results are cached by ``(MIDI content SHA-256, width, RENDER_VERSION)``: a
+small index file under ``<musehub_objects_dir>/render-cache/`` names the PNG
+blob, so identical MIDI in another commit or a fork reuses the stored image
+without rendering or reading it. An entry whose blob has been swept is
+treated as a miss.
+
 The pipeline runs as a FastAPI ``BackgroundTask`` so it never blocks the push
 HTTP response. Failures are logged but not re-raised — a failed render is
 recoverable; the push is not rolled back.
@@ -28,8 +44,16 @@ Boundary rules (same as musehub_sync):
 """
 from __future__ import annotations
 
+import asyncio
+import base64
 import hashlib
+import json
 import logging
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -40,10 +64,22 @@ from maestro.config import settings
 from maestro.db import musehub_models as db
 from maestro.db.database import AsyncSessionLocal
 from maestro.models.musehub import ObjectInput
-from maestro.services.musehub_piano_roll_renderer import render_piano_roll
+from maestro.services.musehub_blobs import StoredBlob, lookup_blob_sync, write_blob_sync
+from maestro.services.musehub_pack import PackObject
+from maestro.services.musehub_piano_roll_renderer import (
+    MAX_WIDTH_PX,
+    RENDER_VERSION,
+    PianoRollImage,
+    render_piano_roll_png,
+)
 
 logger = logging.getLogger(__name__)
 
+RENDER_CACHE_DIRNAME = "render-cache"
+
+# Created on first use, sized by ``settings.musehub_render_workers``.
+_RENDER_POOL: ProcessPoolExecutor | None = None
+
 # ---------------------------------------------------------------------------
 # Public result type
 # ---------------------------------------------------------------------------
@@ -80,21 +116,17 @@ def _content_sha256(data: bytes) -> str:
     return "sha256:" + hashlib.sha256(data).hexdigest()
 
 
-def _render_dir(repo_id: str) -> Path:
-    """Return the directory where rendered artifacts are written for a repo."""
-    return Path(settings.musehub_objects_dir) / repo_id / "renders"
-
-
 def _midi_filter(path: str) -> bool:
     """Return True when the object path looks like a MIDI file."""
     lower = path.lower()
     return lower.endswith(".mid") or lower.endswith(".midi")
 
 
-async def _object_exists(session: AsyncSession, object_id: str) -> bool:
-    """Return True when an object with this ID already exists in the DB."""
+async def _object_exists(session: AsyncSession, *, repo_id: str, object_id: str) -> bool:
+    """Return True when this repo already references an object with this ID."""
     stmt = select(db.MusehubObject.object_id).where(
-        db.MusehubObject.object_id == object_id
+        db.MusehubObject.repo_id == repo_id,
+        db.MusehubObject.object_id == object_id,
     )
     return (await session.execute(stmt)).scalar_one_or_none() is not None
 
@@ -105,18 +137,27 @@ async def _store_object(
     repo_id: str,
     object_id: str,
     path: str,
-    disk_path: Path,
     data: bytes,
 ) -> None:
-    """Write artifact bytes to disk and upsert the musehub_objects row.
+    """Store artifact bytes in the blob store and insert the musehub_objects row.
 
-    Idempotent: if the object already exists (same content-addressed ID) the
-    row is skipped; the disk file is still overwritten to ensure consistency.
+    Idempotent: the blob is written only if no repo holds the same bytes yet,
+    and the row is skipped when this repo already references the object.
     """
-    disk_path.parent.mkdir(parents=True, exist_ok=True)
-    disk_path.write_bytes(data)
+    blob = await asyncio.to_thread(write_blob_sync, settings.musehub_objects_dir, data)
+    await _reference_blob(session, repo_id=repo_id, object_id=object_id, path=path, blob=blob)
+
 
-    if await _object_exists(session, object_id):
+async def _reference_blob(
+    session: AsyncSession,
+    *,
+    repo_id: str,
+    object_id: str,
+    path: str,
+    blob: StoredBlob,
+) -> None:
+    """Insert the musehub_objects row for an already stored blob, once per repo."""
+    if await _object_exists(session, repo_id=repo_id, object_id=object_id):
         logger.info("ℹ️ Object %s already exists — skipping DB insert", object_id)
         return
 
@@ -124,8 +165,9 @@ async def _store_object(
         object_id=object_id,
         repo_id=repo_id,
         path=path,
-        size_bytes=len(data),
-        disk_path=str(disk_path),
+        size_bytes=blob.size_bytes,
+        disk_path=str(blob.disk_path),
+        blob_sha256=blob.sha256,
     )
     session.add(row)
 
@@ -141,28 +183,161 @@ async def _render_job_exists(
     return (await session.execute(stmt)).scalar_one_or_none() is not None
 
 
-def _make_stub_mp3(midi_bytes: bytes, output_path: Path) -> bytes:
-    """Copy MIDI bytes to the output path as an MP3 stub.
+def _make_stub_mp3(midi_bytes: bytes, filename: str) -> bytes:
+    """Return MIDI bytes to store as an MP3 stub.
 
     Storpheus ``POST /render`` (MIDI-in → audio-out) is not yet deployed.
-    Until it ships, the MIDI file is copied verbatim as a placeholder. The
+    Until it ships, the MIDI file is used verbatim as a placeholder. The
     ``stubbed`` contract from ``muse_render_preview`` is mirrored here.
 
     Args:
         midi_bytes: Raw MIDI file bytes.
-        output_path: Destination path for the stub file.
+        filename: Name of the stub artifact, for the log line.
 
     Returns:
-        The bytes written (identical to ``midi_bytes``).
+        The stub bytes (identical to ``midi_bytes``).
     """
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_bytes(midi_bytes)
     logger.warning(
-        "⚠️ Storpheus /render not yet available — writing MIDI stub at %s", output_path
+        "⚠️ Storpheus /render not yet available — storing MIDI stub as %s", filename
     )
     return midi_bytes
 
 
+# ---------------------------------------------------------------------------
+# Piano-roll cache and render pool
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _CachedPianoRoll:
+    """A stored piano-roll PNG and the render facts logged for it."""
+
+    blob: StoredBlob
+    note_count: int
+    stubbed: bool
+
+
+def _piano_roll_cache_path(objects_dir: str | Path, midi_sha256: str, width: int) -> Path:
+    """Return the cache index file for one ``(MIDI, width, RENDER_VERSION)`` key."""
+    return (
+        Path(objects_dir)
+        / RENDER_CACHE_DIRNAME
+        / f"piano-roll-v{RENDER_VERSION}"
+        / str(width)
+        / midi_sha256[:2]
+        / f"{midi_sha256}.json"
+    )
+
+
+def _read_piano_roll_cache_sync(
+    objects_dir: str | Path, midi_sha256: str, width: int
+) -> _CachedPianoRoll | None:
+    """Return the cached render for this key, or ``None`` on a miss.
+
+    Unreadable entries and entries whose blob no longer exists are misses.
+    """
+    try:
+        entry = json.loads(_piano_roll_cache_path(objects_dir, midi_sha256, width).read_text())
+        blob_sha256 = str(entry["blob_sha256"])
+        note_count = int(entry["note_count"])
+        stubbed = bool(entry["stubbed"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    blob = lookup_blob_sync(objects_dir, blob_sha256)
+    if blob is None:
+        return None
+    return _CachedPianoRoll(blob=blob, note_count=note_count, stubbed=stubbed)
+
+
+def _write_piano_roll_cache_sync(
+    objects_dir: str | Path, midi_sha256: str, width: int, render: _CachedPianoRoll
+) -> None:
+    """Record *render* under this key; concurrent writers of a key are safe."""
+    final = _piano_roll_cache_path(objects_dir, midi_sha256, width)
+    final.parent.mkdir(parents=True, exist_ok=True)
+    tmp = final.with_name(f".{final.name}.{uuid.uuid4().hex}.part")
+    tmp.write_text(
+        json.dumps(
+            {
+                "blob_sha256": render.blob.sha256,
+                "note_count": render.note_count,
+                "stubbed": render.stubbed,
+            }
+        )
+    )
+    os.replace(tmp, final)
+
+
+def _render_pool() -> ProcessPoolExecutor | None:
+    """Return the shared render process pool, or ``None`` when rendering in-process."""
+    global _RENDER_POOL
+    if settings.musehub_render_workers <= 0:
+        return None
+    if _RENDER_POOL is None:
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _RENDER_POOL = ProcessPoolExecutor(
+            max_workers=settings.musehub_render_workers,
+            mp_context=multiprocessing.get_context(method),
+        )
+    return _RENDER_POOL
+
+
+async def close_render_pool() -> None:
+    """Shut down the render process pool, if one was started.
+
+    Queued renders are cancelled; renders already running finish first.
+    Called from the app lifespan so worker processes never outlive the server.
+    """
+    global _RENDER_POOL
+    pool, _RENDER_POOL = _RENDER_POOL, None
+    if pool is not None:
+        await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+        logger.info("✅ Piano-roll render pool shut down")
+
+
+async def _rasterize(midi_bytes: bytes, width: int) -> PianoRollImage:
+    """Render one piano roll off the event loop, on the process pool when enabled."""
+    global _RENDER_POOL
+    pool = _render_pool()
+    if pool is None:
+        return await asyncio.to_thread(render_piano_roll_png, midi_bytes, width)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            pool, render_piano_roll_png, midi_bytes, width
+        )
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); release the rest of the broken
+        # pool, start a fresh one next time and finish this render in-process.
+        logger.warning("⚠️ Piano-roll render pool broken — recreating")
+        pool.shutdown(wait=False, cancel_futures=True)
+        if _RENDER_POOL is pool:
+            _RENDER_POOL = None
+        return await asyncio.to_thread(render_piano_roll_png, midi_bytes, width)
+
+
+async def _piano_roll(midi_bytes: bytes) -> _CachedPianoRoll:
+    """Return the stored piano-roll PNG for *midi_bytes*, rendering on a cache miss.
+
+    Stores the PNG in the blob store and records it in the render cache, but
+    does not touch any session, so several can run concurrently.
+    """
+    objects_dir = settings.musehub_objects_dir
+    midi_sha256 = hashlib.sha256(midi_bytes).hexdigest()
+    cached = await asyncio.to_thread(
+        _read_piano_roll_cache_sync, objects_dir, midi_sha256, MAX_WIDTH_PX
+    )
+    if cached is not None:
+        return cached
+
+    image = await _rasterize(midi_bytes, MAX_WIDTH_PX)
+    blob = await asyncio.to_thread(write_blob_sync, objects_dir, image.png_bytes)
+    render = _CachedPianoRoll(blob=blob, note_count=image.note_count, stubbed=image.stubbed)
+    await asyncio.to_thread(
+        _write_piano_roll_cache_sync, objects_dir, midi_sha256, MAX_WIDTH_PX, render
+    )
+    return render
+
+
 # ---------------------------------------------------------------------------
 # Core render logic
 # ---------------------------------------------------------------------------
@@ -183,52 +358,48 @@ async def _render_commit(
     This function creates DB rows but does NOT commit the session — that is the
     caller's responsibility (keeping it composable with the job status update).
     """
-    import base64
-
     midi_objects = [o for o in objects if _midi_filter(o.path)]
-    render_dir = _render_dir(repo_id)
     mp3_ids: list[str] = []
     image_ids: list[str] = []
 
-    for idx, obj in enumerate(midi_objects):
+    decoded: list[tuple[ObjectInput, bytes]] = []
+    for obj in midi_objects:
         try:
-            midi_bytes = base64.b64decode(obj.content_b64)
+            decoded.append((obj, base64.b64decode(obj.content_b64)))
         except Exception as exc:
             logger.warning(
                 "⚠️ Could not decode base64 for object %s: %s", obj.object_id, exc
             )
-            continue
 
+    # Rasterize every track at once; the session is only used afterwards.
+    piano_rolls = await asyncio.gather(
+        *(_piano_roll(midi_bytes) for _, midi_bytes in decoded), return_exceptions=True
+    )
+
+    for (obj, midi_bytes), piano_roll in zip(decoded, piano_rolls):
         stem = Path(obj.path).stem
 
         # ── Piano-roll PNG ──────────────────────────────────────────────────
         pr_filename = f"{commit_id[:8]}_{stem}_piano_roll.png"
-        pr_disk_path = render_dir / pr_filename
 
         try:
-            pr_result = render_piano_roll(
-                midi_bytes=midi_bytes,
-                output_path=pr_disk_path,
-                track_index=idx,
-            )
-            pr_bytes = pr_disk_path.read_bytes()
-            pr_object_id = _content_sha256(pr_bytes)
-            pr_path = f"renders/{pr_filename}"
-            await _store_object(
+            if isinstance(piano_roll, BaseException):
+                raise piano_roll
+            pr_object_id = "sha256:" + piano_roll.blob.sha256
+            await _reference_blob(
                 session,
                 repo_id=repo_id,
                 object_id=pr_object_id,
-                path=pr_path,
-                disk_path=pr_disk_path,
-                data=pr_bytes,
+                path=f"renders/{pr_filename}",
+                blob=piano_roll.blob,
             )
             image_ids.append(pr_object_id)
             logger.info(
                 "✅ Piano-roll rendered: commit=%s track=%s notes=%d stubbed=%s",
                 commit_id[:8],
                 stem,
-                pr_result.note_count,
-                pr_result.stubbed,
+                piano_roll.note_count,
+                piano_roll.stubbed,
             )
         except Exception as exc:
             logger.error(
@@ -240,10 +411,9 @@ async def _render_commit(
 
         # ── MP3 stub ────────────────────────────────────────────────────────
         mp3_filename = f"{commit_id[:8]}_{stem}.mp3"
-        mp3_disk_path = render_dir / mp3_filename
 
         try:
-            mp3_bytes = _make_stub_mp3(midi_bytes, mp3_disk_path)
+            mp3_bytes = _make_stub_mp3(midi_bytes, mp3_filename)
             mp3_object_id = _content_sha256(mp3_bytes)
             mp3_path = f"renders/{mp3_filename}"
             await _store_object(
@@ -251,7 +421,6 @@ async def _render_commit(
                 repo_id=repo_id,
                 object_id=mp3_object_id,
                 path=mp3_path,
-                disk_path=mp3_disk_path,
                 data=mp3_bytes,
             )
             mp3_ids.append(mp3_object_id)
@@ -366,3 +535,36 @@ async def trigger_render_background(
             commit_id[:8],
             exc,
         )
+
+
+async def trigger_render_from_disk_background(
+    *,
+    repo_id: str,
+    commit_id: str,
+    objects: list[PackObject],
+) -> None:
+    """Background task: :func:`trigger_render_background` for stored objects.
+
+    Streamed pushes never hold object bytes in memory, so only the MIDI
+    files among *objects* are read back from disk here before rendering.
+    Unreadable files are skipped with a warning.
+    """
+    midi_inputs: list[ObjectInput] = []
+    for obj in objects:
+        if not _midi_filter(obj.path):
+            continue
+        try:
+            raw = await asyncio.to_thread(Path(obj.disk_path).read_bytes)
+        except OSError:
+            logger.warning(
+                "⚠️ Object file missing on disk: %s (object_id=%s)", obj.disk_path, obj.object_id
+            )
+            continue
+        midi_inputs.append(
+            ObjectInput(
+                object_id=obj.object_id,
+                path=obj.path,
+                content_b64=base64.b64encode(raw).decode(),
+            )
+        )
+    await trigger_render_background(repo_id=repo_id, commit_id=commit_id, objects=midi_inputs)
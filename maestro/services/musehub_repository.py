@@ -14,12 +14,10 @@ from datetime import datetime, timezone
 
 import logging
 import re
-from collections import deque
 
-from sqlalchemy import desc, func, or_, select
+from sqlalchemy import and_, case, desc, func, insert, literal, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
-from sqlalchemy.sql.elements import ColumnElement
 
 from maestro.db import musehub_models as db
 from maestro.db import musehub_collaborator_models as collab_db
@@ -65,6 +63,10 @@ from maestro.models.musehub import (
     UserWatchedRepoEntry,
     UserWatchedResponse,
 )
+from maestro.db.musehub_search_models import KIND_COMMIT, KIND_REPO
+from maestro.db.musehub_stats_models import MusehubRepoStats
+from maestro.services import musehub_search_index as search_index
+from maestro.services.musehub_dag import get_dag_layout
 
 logger = logging.getLogger(__name__)
 
@@ -483,6 +485,45 @@ async def list_objects(
     return [_to_object_meta_response(r) for r in rows]
 
 
+async def copy_repo_objects(
+    session: AsyncSession, *, source_repo_id: str, target_repo_id: str
+) -> int:
+    """Give *target_repo_id* a reference to every object in *source_repo_id*.
+
+    Only rows are copied — they point at the same blob files — so a fork costs
+    no extra disk. Object rows and their push links each take one
+    ``INSERT … SELECT``; returns the number of object rows.
+    """
+    cols = db.MusehubObject.__table__.c
+    stmt = insert(db.MusehubObject).from_select(
+        ["object_id", "repo_id", "path", "size_bytes", "disk_path",
+         "blob_sha256", "introduced_by", "created_at"],
+        select(
+            cols.object_id,
+            literal(target_repo_id),
+            cols.path,
+            cols.size_bytes,
+            cols.disk_path,
+            cols.blob_sha256,
+            cols.introduced_by,
+            cols.created_at,
+        ).where(cols.repo_id == source_repo_id),
+    )
+    result = await session.execute(stmt)
+    copied = int(getattr(result, "rowcount", 0) or 0)
+    links = db.MusehubCommitObject.__table__.c
+    await session.execute(
+        insert(db.MusehubCommitObject).from_select(
+            ["repo_id", "commit_id", "object_id"],
+            select(literal(target_repo_id), links.commit_id, links.object_id).where(
+                links.repo_id == source_repo_id
+            ),
+        )
+    )
+    logger.info("✅ Copied %d object references %s → %s", copied, source_repo_id, target_repo_id)
+    return copied
+
+
 async def get_object_row(
     session: AsyncSession, repo_id: str, object_id: str
 ) -> db.MusehubObject | None:
@@ -808,6 +849,10 @@ async def get_timeline_events(
         tracks=track_events,
         total_commits=total,
     )
+# Commits shown per repo-group in global search results.
+_GLOBAL_SEARCH_GROUP_MATCHES = 20
+
+
 async def global_search(
     session: AsyncSession,
     *,
@@ -823,14 +868,18 @@ async def global_search(
     contract at the persistence layer so no route handler can accidentally
     bypass it.
 
-    ``mode`` controls matching strategy:
-    - ``keyword``: OR-match of whitespace-split query terms against message and
-      repo name using LIKE (case-insensitive via lower()).
+    Matching runs against the search index (``musehub_search_index``), so
+    the cost tracks the number of hits rather than the amount of public
+    content. ``mode`` controls matching strategy:
+    - ``keyword``: any whitespace-split term, matched as a word prefix,
+      against commit messages and repo names and descriptions. A repo whose
+      name or description matches contributes all of its commits.
     - ``pattern``: raw SQL LIKE pattern applied to commit message only.
 
     Results are grouped by repo and paginated by repo-group (``page_size``
-    controls how many repo-groups per page). Within each group, up to 20
-    matching commits are returned newest-first.
+    controls how many repo-groups per page) in the database. Groups are
+    ordered by their best-ranked hit; within each group up to 20 commits are
+    returned, best-ranked and then newest first.
 
     An audio preview object ID is attached when the repo contains any .mp3,
     .ogg, or .wav artifact — the first one found by path ordering is used.
@@ -847,106 +896,160 @@ async def global_search(
     Returns:
         GlobalSearchResult with groups, pagination metadata, and counts.
     """
-    # ── 1. Collect all public repos ─────────────────────────────────────────
-    public_repos_stmt = (
-        select(db.MusehubRepo)
-        .where(db.MusehubRepo.visibility == "public")
-        .order_by(db.MusehubRepo.created_at)
-    )
-    public_repo_rows = (await session.execute(public_repos_stmt)).scalars().all()
-    total_repos_searched = len(public_repo_rows)
-
-    if not public_repo_rows or not query.strip():
-        return GlobalSearchResult(
-            query=query,
-            mode=mode,
-            groups=[],
-            total_repos_searched=total_repos_searched,
-            page=page,
-            page_size=page_size,
+    total_repos_searched = (
+        await session.execute(
+            select(func.count())
+            .select_from(db.MusehubRepo)
+            .where(db.MusehubRepo.visibility == "public")
         )
+    ).scalar_one()
+    empty = GlobalSearchResult(
+        query=query,
+        mode=mode,
+        groups=[],
+        total_repos_searched=total_repos_searched,
+        page=page,
+        page_size=page_size,
+    )
 
-    repo_ids = [r.repo_id for r in public_repo_rows]
-    repo_map: dict[str, db.MusehubRepo] = {r.repo_id: r for r in public_repo_rows}
-
-    # ── 2. Build commit filter predicate ────────────────────────────────────
-    predicate: ColumnElement[bool]
+    # ── 1. Build the index match ────────────────────────────────────────────
+    match: search_index.DocumentMatch | None
     if mode == "pattern":
-        predicate = db.MusehubCommit.message.like(query)
+        match = search_index.pattern_match(query) if query.strip() else None
+        kinds = [KIND_COMMIT]
     else:
-        # keyword: OR-match each whitespace-split term against message (lower)
-        terms = [t for t in query.lower().split() if t]
-        if not terms:
-            return GlobalSearchResult(
-                query=query,
-                mode=mode,
-                groups=[],
-                total_repos_searched=total_repos_searched,
-                page=page,
-                page_size=page_size,
+        match = search_index.keyword_match(session, query)
+        kinds = [KIND_COMMIT, KIND_REPO]
+    if match is None:
+        return empty
+
+    # ── 2. Rank and page repo-groups in SQL ─────────────────────────────────
+    # A repo-document hit (name/description) matches every commit in the
+    # repo, so its group total is the materialized commit count.
+    hits = search_index.hits_cte(search_index.hits(match, kinds=kinds, public_only=True))
+    commit_hits = func.sum(case((hits.c.kind == KIND_COMMIT, 1), else_=0))
+    repo_hit = func.max(case((hits.c.kind == KIND_REPO, 1), else_=0))
+    repo_commits = func.coalesce(MusehubRepoStats.commit_count, 0)
+    group_stmt = (
+        select(hits.c.repo_id, commit_hits, repo_hit, repo_commits)
+        .select_from(
+            hits.outerjoin(MusehubRepoStats, MusehubRepoStats.repo_id == hits.c.repo_id)
+        )
+        .group_by(hits.c.repo_id, MusehubRepoStats.commit_count)
+        .having(or_(commit_hits > 0, and_(repo_hit == 1, repo_commits > 0)))
+        .order_by(
+            func.max(hits.c.score).desc(),
+            func.max(hits.c.occurred_at).desc(),
+            hits.c.repo_id,
+        )
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    )
+    group_rows = (await session.execute(group_stmt)).tuples().all()
+    if not group_rows:
+        return empty
+
+    page_repo_ids = [rid for rid, _, _, _ in group_rows]
+    totals: dict[str, int] = {}
+    browse_ids: list[str] = []
+    hit_ids: list[str] = []
+    for rid, n_hits, is_repo_hit, n_commits in group_rows:
+        if is_repo_hit:
+            browse_ids.append(rid)
+            totals[rid] = int(n_commits)
+        else:
+            hit_ids.append(rid)
+            totals[rid] = int(n_hits or 0)
+
+    # ── 3. Pick up to 20 commits per group ──────────────────────────────────
+    ordered: dict[str, list[str]] = {rid: [] for rid in page_repo_ids}
+    if hit_ids:
+        page_hits = search_index.hits_cte(
+            search_index.hits(match, kinds=[KIND_COMMIT], repo_ids=hit_ids, public_only=True)
+        )
+        ranked = select(
+            page_hits.c.repo_id,
+            page_hits.c.ref_id,
+            func.row_number()
+            .over(
+                partition_by=page_hits.c.repo_id,
+                order_by=(page_hits.c.score.desc(), page_hits.c.occurred_at.desc()),
             )
-        term_predicates = [
-            or_(
-                func.lower(db.MusehubCommit.message).contains(term),
-                func.lower(db.MusehubRepo.name).contains(term),
+            .label("rn"),
+        ).subquery()
+        rows = await session.execute(
+            select(ranked.c.repo_id, ranked.c.ref_id)
+            .where(ranked.c.rn <= _GLOBAL_SEARCH_GROUP_MATCHES)
+            .order_by(ranked.c.repo_id, ranked.c.rn)
+        )
+        for rid, cid in rows.tuples():
+            ordered[rid].append(cid)
+    if browse_ids:
+        newest = select(
+            db.MusehubCommit.repo_id,
+            db.MusehubCommit.commit_id,
+            func.row_number()
+            .over(
+                partition_by=db.MusehubCommit.repo_id,
+                order_by=db.MusehubCommit.timestamp.desc(),
             )
-            for term in terms
-        ]
-        predicate = or_(*term_predicates)
-
-    # ── 3. Query matching commits joined to their repo ───────────────────────
-    commits_stmt = (
-        select(db.MusehubCommit, db.MusehubRepo)
-        .join(db.MusehubRepo, db.MusehubCommit.repo_id == db.MusehubRepo.repo_id)
-        .where(
-            db.MusehubCommit.repo_id.in_(repo_ids),
-            predicate,
+            .label("rn"),
+        ).where(db.MusehubCommit.repo_id.in_(browse_ids)).subquery()
+        rows = await session.execute(
+            select(newest.c.repo_id, newest.c.commit_id)
+            .where(newest.c.rn <= _GLOBAL_SEARCH_GROUP_MATCHES)
+            .order_by(newest.c.repo_id, newest.c.rn)
         )
-        .order_by(desc(db.MusehubCommit.timestamp))
-    )
-    commit_pairs = (await session.execute(commits_stmt)).all()
-
-    # ── 4. Group commits by repo ─────────────────────────────────────────────
-    groups_map: dict[str, list[db.MusehubCommit]] = {}
-    for commit_row, _repo_row in commit_pairs:
-        groups_map.setdefault(commit_row.repo_id, []).append(commit_row)
-
-    # ── 5. Resolve audio preview objects — single batched query (eliminates N+1) ──
-    # Fetch all qualifying audio objects for every matching repo in one round-trip,
-    # ordered by (repo_id, path) so we naturally encounter each repo's
-    # alphabetically-first audio file first when iterating the result set.
-    # Python deduplication (first-seen wins) replicates the previous LIMIT 1
-    # per-repo semantics without issuing N separate queries.
-    audio_map: dict[str, str] = {}
-    if groups_map:
-        audio_batch_stmt = (
-            select(db.MusehubObject.repo_id, db.MusehubObject.object_id)
-            .where(
-                db.MusehubObject.repo_id.in_(list(groups_map.keys())),
-                or_(
-                    db.MusehubObject.path.like("%.mp3"),
-                    db.MusehubObject.path.like("%.ogg"),
-                    db.MusehubObject.path.like("%.wav"),
-                ),
+        for rid, cid in rows.tuples():
+            ordered[rid].append(cid)
+
+    commit_ids = [cid for cids in ordered.values() for cid in cids]
+    commit_map: dict[str, db.MusehubCommit] = {
+        c.commit_id: c
+        for c in (
+            await session.execute(
+                select(db.MusehubCommit).where(db.MusehubCommit.commit_id.in_(commit_ids))
             )
-            .order_by(db.MusehubObject.repo_id, db.MusehubObject.path)
+        ).scalars()
+    }
+    repo_map: dict[str, db.MusehubRepo] = {
+        r.repo_id: r
+        for r in (
+            await session.execute(
+                select(db.MusehubRepo).where(db.MusehubRepo.repo_id.in_(page_repo_ids))
+            )
+        ).scalars()
+    }
+
+    # ── 4. Resolve audio preview objects — single batched query (eliminates N+1) ──
+    # Fetch all qualifying audio objects for every repo on the page in one
+    # round-trip, ordered by (repo_id, path) so we naturally encounter each
+    # repo's alphabetically-first audio file first when iterating the result
+    # set. Python deduplication (first-seen wins) replicates LIMIT 1 per repo.
+    audio_map: dict[str, str] = {}
+    audio_batch_stmt = (
+        select(db.MusehubObject.repo_id, db.MusehubObject.object_id)
+        .where(
+            db.MusehubObject.repo_id.in_(page_repo_ids),
+            or_(
+                db.MusehubObject.path.like("%.mp3"),
+                db.MusehubObject.path.like("%.ogg"),
+                db.MusehubObject.path.like("%.wav"),
+            ),
         )
-        audio_rows = (await session.execute(audio_batch_stmt)).all()
-        for audio_row in audio_rows:
-            if audio_row.repo_id not in audio_map:
-                audio_map[audio_row.repo_id] = audio_row.object_id
-
-    # ── 6. Paginate repo-groups ──────────────────────────────────────────────
-    sorted_repo_ids = list(groups_map.keys())
-    offset = (page - 1) * page_size
-    page_repo_ids = sorted_repo_ids[offset : offset + page_size]
+        .order_by(db.MusehubObject.repo_id, db.MusehubObject.path)
+    )
+    for audio_row in (await session.execute(audio_batch_stmt)).all():
+        if audio_row.repo_id not in audio_map:
+            audio_map[audio_row.repo_id] = audio_row.object_id
 
+    # ── 5. Assemble groups in rank order ────────────────────────────────────
     groups: list[GlobalSearchRepoGroup] = []
     for rid in page_repo_ids:
-        repo_row = repo_map[rid]
-        all_matches = groups_map[rid]
+        repo_row = repo_map.get(rid)
+        if repo_row is None:
+            continue
         audio_oid = audio_map.get(rid)
-
         commit_matches = [
             GlobalSearchCommitMatch(
                 commit_id=c.commit_id,
@@ -960,7 +1063,7 @@ async def global_search(
                 repo_visibility=repo_row.visibility,
                 audio_object_id=audio_oid,
             )
-            for c in all_matches[:20]
+            for c in (commit_map[cid] for cid in ordered[rid] if cid in commit_map)
         ]
         groups.append(
             GlobalSearchRepoGroup(
@@ -970,112 +1073,123 @@ async def global_search(
                 repo_slug=repo_row.slug,
                 repo_visibility=repo_row.visibility,
                 matches=commit_matches,
-                total_matches=len(all_matches),
+                total_matches=totals[rid],
             )
         )
 
-    return GlobalSearchResult(
-        query=query,
-        mode=mode,
-        groups=groups,
-        total_repos_searched=total_repos_searched,
-        page=page,
-        page_size=page_size,
-    )
+    return empty.model_copy(update={"groups": groups})
+
+
+# Window size when a DAG request names an anchor commit but no limit.
+_DAG_DEFAULT_WINDOW = 200
+
+
 async def list_commits_dag(
     session: AsyncSession,
     repo_id: str,
+    *,
+    limit: int | None = None,
+    before: str | None = None,
+    around: str | None = None,
 ) -> DagGraphResponse:
-    """Return the full commit graph for a repo as a topologically sorted DAG.
+    """Return the commit graph for a repo as a topologically sorted DAG.
 
-    Fetches every commit for the repo (no limit — required for correct DAG
-    traversal). Applies Kahn's algorithm to produce a topological ordering
-    from oldest ancestor to newest commit, which graph renderers can consume
-    directly without additional sorting.
+    Row order and lanes come from the cached per-repo layout in
+    ``musehub_dag`` — oldest ancestor first, one lane per branch — so only
+    the commits actually returned are loaded in full.
+
+    With no *limit* and no anchor every commit is returned. Otherwise only
+    a window of rows is returned: the newest *limit* commits, the *limit*
+    commits just older than *before*, or *limit* commits centred on
+    *around* (an anchor without a limit uses ``_DAG_DEFAULT_WINDOW``). ``window_start`` is the row of the first node; a client
+    scrolling back passes the first node's ``commit_id`` as *before* until
+    ``window_start`` reaches zero.
 
     Edges flow child → parent (source = child, target = parent) following the
     standard directed graph convention where arrows point toward ancestors.
+    A windowed response includes every edge whose child is in the window,
+    even when the parent lies outside it.
 
     Branch head commits are identified by querying the branches table. The
     highest-timestamp commit across all branches is designated as HEAD for
     display purposes when no explicit HEAD ref exists.
 
+    Raises ``ValueError`` when *before* or *around* names a commit that is
+    not in the repo.
+
     Agent use case: call this to reason about the project's branching topology,
     find common ancestors, or identify which branches contain a given commit.
     """
-    # Fetch all commits for this repo
-    stmt = select(db.MusehubCommit).where(db.MusehubCommit.repo_id == repo_id)
-    all_rows = (await session.execute(stmt)).scalars().all()
+    layout = await get_dag_layout(session, repo_id)
+    total = len(layout)
+    if total == 0:
+        return DagGraphResponse(
+            nodes=[], edges=[], head_commit_id=None, total=0, window_start=0, lane_count=0
+        )
 
-    if not all_rows:
-        return DagGraphResponse(nodes=[], edges=[], head_commit_id=None)
+    if limit is None and (before is not None or around is not None):
+        limit = _DAG_DEFAULT_WINDOW
+    start, stop = 0, total
+    if limit is not None:
+        anchor = before if before is not None else around
+        if anchor is not None and anchor not in layout.row_of:
+            raise ValueError(f"Commit {anchor!r} not found in repo")
+        if before is not None:
+            stop = layout.row_of[before]
+            start = max(0, stop - limit)
+        elif around is not None:
+            start = max(0, min(layout.row_of[around] - limit // 2, total - limit))
+            stop = min(total, start + limit)
+        else:
+            start = max(0, total - limit)
 
-    # Build lookup map
-    row_map: dict[str, db.MusehubCommit] = {r.commit_id: r for r in all_rows}
+    window = layout.order[start:stop]
+    if limit is None:
+        stmt = select(db.MusehubCommit).where(db.MusehubCommit.repo_id == repo_id)
+    else:
+        stmt = select(db.MusehubCommit).where(
+            db.MusehubCommit.repo_id == repo_id,
+            db.MusehubCommit.commit_id.in_(window),
+        )
+    row_map = {r.commit_id: r for r in (await session.execute(stmt)).scalars().all()}
 
-    # Fetch all branches to identify HEAD candidates and branch labels
-    branch_stmt = select(db.MusehubBranch).where(db.MusehubBranch.repo_id == repo_id)
-    branch_rows = (await session.execute(branch_stmt)).scalars().all()
+    branch_stmt = select(db.MusehubBranch.name, db.MusehubBranch.head_commit_id).where(
+        db.MusehubBranch.repo_id == repo_id
+    )
+    branch_heads = [
+        (name, head) for name, head in (await session.execute(branch_stmt)).tuples()
+        if head is not None and head in layout.row_of
+    ]
 
     # Map commit_id → branch names pointing at it
     branch_label_map: dict[str, list[str]] = {}
-    for br in branch_rows:
-        if br.head_commit_id and br.head_commit_id in row_map:
-            branch_label_map.setdefault(br.head_commit_id, []).append(br.name)
+    for name, head in branch_heads:
+        branch_label_map.setdefault(head, []).append(name)
 
     # Identify HEAD: the branch head with the most recent timestamp, or the
     # most recent commit overall when no branches exist
     head_commit_id: str | None = None
-    if branch_rows:
-        latest_ts = None
-        for br in branch_rows:
-            if br.head_commit_id and br.head_commit_id in row_map:
-                ts = row_map[br.head_commit_id].timestamp
-                if latest_ts is None or ts > latest_ts:
-                    latest_ts = ts
-                    head_commit_id = br.head_commit_id
-    if head_commit_id is None:
-        head_commit_id = max(all_rows, key=lambda r: r.timestamp).commit_id
-
-    # Kahn's topological sort (oldest → newest).
-    # in_degree[c] = number of c's parents that are present in this repo's commit set.
-    # Commits with in_degree == 0 are roots (no parents) — they enter the queue first,
-    # producing a parent-before-child ordering (oldest ancestor → newest commit).
-    in_degree: dict[str, int] = {r.commit_id: 0 for r in all_rows}
-    # children_map[parent_id] = list of commit IDs whose parent_ids contains parent_id
-    children_map: dict[str, list[str]] = {r.commit_id: [] for r in all_rows}
-
-    edges: list[DagEdge] = []
-    for row in all_rows:
-        for parent_id in (row.parent_ids or []):
-            if parent_id in row_map:
-                edges.append(DagEdge(source=row.commit_id, target=parent_id))
-                children_map.setdefault(parent_id, []).append(row.commit_id)
-                in_degree[row.commit_id] += 1
-
-    # Kahn's algorithm: start from commits with no parents (roots)
-    queue: deque[str] = deque(
-        cid for cid, deg in in_degree.items() if deg == 0
-    )
-    topo_order: list[str] = []
-
-    while queue:
-        cid = queue.popleft()
-        topo_order.append(cid)
-        for child_id in children_map.get(cid, []):
-            in_degree[child_id] -= 1
-            if in_degree[child_id] == 0:
-                queue.append(child_id)
-
-    # Handle cycles or disconnected commits (append remaining in timestamp order)
-    remaining = set(row_map.keys()) - set(topo_order)
-    if remaining:
-        sorted_remaining = sorted(remaining, key=lambda c: row_map[c].timestamp)
-        topo_order.extend(sorted_remaining)
+    if branch_heads:
+        head_row = max(
+            (layout.row_of[head] for _, head in branch_heads),
+            key=lambda r: layout.timestamps[r],
+        )
+        head_commit_id = layout.order[head_row]
+    elif layout.newest_row is not None:
+        head_commit_id = layout.order[layout.newest_row]
 
     nodes: list[DagNode] = []
-    for cid in topo_order:
-        row = row_map[cid]
+    edges: list[DagEdge] = []
+    for row_index, cid in enumerate(window, start=start):
+        row = row_map.get(cid)
+        if row is None:
+            continue
+        parent_ids = list(row.parent_ids or [])
+        edges.extend(
+            DagEdge(source=cid, target=parent_id)
+            for parent_id in parent_ids
+            if parent_id in layout.row_of
+        )
         nodes.append(
             DagNode(
                 commit_id=row.commit_id,
@@ -1083,15 +1197,24 @@ async def list_commits_dag(
                 author=row.author,
                 timestamp=row.timestamp,
                 branch=row.branch,
-                parent_ids=list(row.parent_ids or []),
+                parent_ids=parent_ids,
                 is_head=(row.commit_id == head_commit_id),
                 branch_labels=branch_label_map.get(row.commit_id, []),
                 tag_labels=[],
+                row=row_index,
+                lane=layout.lanes[row_index],
             )
         )
 
     logger.debug("✅ Built DAG for repo %s: %d nodes, %d edges", repo_id, len(nodes), len(edges))
-    return DagGraphResponse(nodes=nodes, edges=edges, head_commit_id=head_commit_id)
+    return DagGraphResponse(
+        nodes=nodes,
+        edges=edges,
+        head_commit_id=head_commit_id,
+        total=total,
+        window_start=start,
+        lane_count=layout.lane_count,
+    )
 
 
 # ---------------------------------------------------------------------------
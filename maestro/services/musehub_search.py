@@ -12,8 +12,11 @@ Modes and their underlying algorithms:
 All four modes return :class:`~maestro.models.musehub.SearchResponse` so the
 UI can render results with a single shared commit-row template regardless of mode.
 
-Date-range filtering (``since`` / ``until``) is applied at the SQL layer for
-efficiency before any Python-level scoring.
+Date-range and text filtering happen in SQL: pattern mode is ordered and
+limited by the database, and keyword/ask modes rank commits by how many
+query tokens their message contains and load at most
+:data:`_OVERLAP_CANDIDATES` of the best before scoring them exactly, so a
+search never pulls an unbounded slice of the history into memory.
 """
 from __future__ import annotations
 
@@ -21,9 +24,10 @@ import logging
 import re
 from datetime import datetime
 
-from sqlalchemy import and_
+from sqlalchemy import case, func, literal, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.sql.elements import ColumnElement
 
 from maestro.models.musehub import SearchCommitMatch, SearchResponse
 from maestro.muse_cli.models import MuseCliCommit
@@ -32,7 +36,9 @@ from maestro.services import muse_find
 logger = logging.getLogger(__name__)
 
 _DEFAULT_LIMIT = 20
-_TOKEN_RE = re.compile(r"[a-zA-Z0-9]+")
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+#: Upper bound on rows keyword/ask modes load for exact overlap scoring.
+_OVERLAP_CANDIDATES = 5000
 
 # Stop-words stripped during NL ask-mode keyword extraction.
 _STOP_WORDS = frozenset({
@@ -69,35 +75,60 @@ def _overlap_score(query_tokens: set[str], message: str) -> float:
     return len(query_tokens & message_tokens) / len(query_tokens)
 
 
-async def _fetch_candidates(
-    session: AsyncSession,
-    *,
-    repo_id: str,
-    since: datetime | None,
-    until: datetime | None,
-    cap: int = 5000,
-) -> tuple[list[MuseCliCommit], int]:
-    """Fetch candidate commits from DB with optional date range filter.
-
-    Returns ``(rows, total_scanned)`` where ``total_scanned`` is the raw DB count
-    before any Python-level filtering. We over-fetch (up to ``cap``) and let
-    callers apply their own ranking/limit so the SQL stays simple and fast.
-    """
-    stmt = select(MuseCliCommit).where(MuseCliCommit.repo_id == repo_id)
-
-    conditions = []
+def _date_conditions(
+    repo_id: str, since: datetime | None, until: datetime | None
+) -> list[ColumnElement[bool]]:
+    """Return the WHERE conditions scoping a search to *repo_id* and a date range."""
+    conditions: list[ColumnElement[bool]] = [MuseCliCommit.repo_id == repo_id]
     if since is not None:
         conditions.append(MuseCliCommit.committed_at >= since)
     if until is not None:
         conditions.append(MuseCliCommit.committed_at <= until)
-    if conditions:
-        stmt = stmt.where(and_(*conditions))
+    return conditions
 
-    stmt = stmt.order_by(MuseCliCommit.committed_at.desc()).limit(cap)
 
-    result = await session.execute(stmt)
-    rows = list(result.scalars().all())
-    return rows, len(rows)
+async def _count_scanned(
+    session: AsyncSession, conditions: list[ColumnElement[bool]]
+) -> int:
+    """Return how many commits fall inside the search scope."""
+    result = await session.execute(select(func.count()).select_from(MuseCliCommit).where(*conditions))
+    return int(result.scalar_one())
+
+
+async def _rank_by_overlap(
+    session: AsyncSession,
+    conditions: list[ColumnElement[bool]],
+    tokens: set[str],
+    *,
+    threshold: float,
+    limit: int,
+) -> list[tuple[float, MuseCliCommit]]:
+    """Return the top *limit* commits by overlap with *tokens*, best first.
+
+    The database counts how many tokens each message contains as a substring
+    — an upper bound on token overlap that an index (a ``pg_trgm`` index on
+    PostgreSQL) can serve — and returns the best :data:`_OVERLAP_CANDIDATES`
+    commits by that count, newest first on ties. Only those rows are loaded
+    and scored exactly.
+    """
+    message = func.lower(MuseCliCommit.message)
+    contains = [message.contains(t, autoescape=True) for t in sorted(tokens)]
+    match_count: ColumnElement[int] = literal(0)
+    for cond in contains:
+        match_count = match_count + case((cond, 1), else_=0)
+    stmt = (
+        select(MuseCliCommit)
+        .where(*conditions, or_(*contains))
+        .order_by(match_count.desc(), MuseCliCommit.committed_at.desc())
+        .limit(max(limit, _OVERLAP_CANDIDATES))
+    )
+    scored: list[tuple[float, MuseCliCommit]] = []
+    for commit in (await session.execute(stmt)).scalars():
+        score = _overlap_score(tokens, commit.message)
+        if score >= threshold and score > 0.0:
+            scored.append((score, commit))
+    scored.sort(key=lambda x: (x[0], x[1].committed_at.timestamp()), reverse=True)
+    return scored[:limit]
 
 
 def _commit_to_match(
@@ -236,26 +267,24 @@ async def search_by_ask(
     Returns:
         :class:`~maestro.models.musehub.SearchResponse` with mode="ask".
     """
-    rows, total_scanned = await _fetch_candidates(
-        session, repo_id=repo_id, since=since, until=until
-    )
+    conditions = _date_conditions(repo_id, since, until)
+    total_scanned = await _count_scanned(session, conditions)
 
     # Extract meaningful keywords after stop-word removal.
     tokens_raw = re.split(r"[\s\W]+", question.lower())
     keywords: set[str] = {t for t in tokens_raw if t and t not in _STOP_WORDS and len(t) > 1}
 
-    scored: list[tuple[float, MuseCliCommit]] = []
-    for commit in rows:
-        if keywords:
-            score = _overlap_score(keywords, commit.message)
-        else:
-            # No useful tokens → include all commits with neutral score.
-            score = 1.0
-        if score > 0.0:
-            scored.append((score, commit))
-
-    scored.sort(key=lambda x: (x[0], x[1].committed_at.timestamp()), reverse=True)
-    top = scored[:limit]
+    if keywords:
+        top = await _rank_by_overlap(session, conditions, keywords, threshold=0.0, limit=limit)
+    else:
+        # No useful tokens → the newest commits with neutral score.
+        newest = await session.execute(
+            select(MuseCliCommit)
+            .where(*conditions)
+            .order_by(MuseCliCommit.committed_at.desc())
+            .limit(limit)
+        )
+        top = [(1.0, commit) for commit in newest.scalars()]
 
     matches = [_commit_to_match(c, score=s, match_source="message") for s, c in top]
 
@@ -296,19 +325,15 @@ async def search_by_keyword(
     Returns:
         :class:`~maestro.models.musehub.SearchResponse` with mode="keyword".
     """
-    rows, total_scanned = await _fetch_candidates(
-        session, repo_id=repo_id, since=since, until=until
-    )
+    conditions = _date_conditions(repo_id, since, until)
+    total_scanned = await _count_scanned(session, conditions)
 
     query_tokens = _tokenize(keyword)
-    scored: list[tuple[float, MuseCliCommit]] = []
-    for commit in rows:
-        score = _overlap_score(query_tokens, commit.message)
-        if score >= threshold and score > 0.0:
-            scored.append((score, commit))
-
-    scored.sort(key=lambda x: (x[0], x[1].committed_at.timestamp()), reverse=True)
-    top = scored[:limit]
+    top = (
+        await _rank_by_overlap(session, conditions, query_tokens, threshold=threshold, limit=limit)
+        if query_tokens
+        else []
+    )
 
     matches = [_commit_to_match(c, score=s, match_source="message") for s, c in top]
 
@@ -348,22 +373,23 @@ async def search_by_pattern(
     Returns:
         :class:`~maestro.models.musehub.SearchResponse` with mode="pattern".
     """
-    rows, total_scanned = await _fetch_candidates(
-        session, repo_id=repo_id, since=since, until=until
-    )
+    conditions = _date_conditions(repo_id, since, until)
+    total_scanned = await _count_scanned(session, conditions)
 
     pat = pattern.lower()
-    message_matches: list[SearchCommitMatch] = []
-    branch_matches: list[SearchCommitMatch] = []
-
-    for commit in rows:
-        if pat in commit.message.lower():
-            message_matches.append(_commit_to_match(commit, match_source="message"))
-        elif pat in commit.branch.lower():
-            branch_matches.append(_commit_to_match(commit, match_source="branch"))
-
-    # Message matches come first, then branch matches.
-    all_matches = (message_matches + branch_matches)[:limit]
+    in_message = func.lower(MuseCliCommit.message).contains(pat, autoescape=True)
+    in_branch = func.lower(MuseCliCommit.branch).contains(pat, autoescape=True)
+    # Message matches come first, then branch matches; newest first within each.
+    result = await session.execute(
+        select(MuseCliCommit, in_message)
+        .where(*conditions, or_(in_message, in_branch))
+        .order_by(case((in_message, 0), else_=1), MuseCliCommit.committed_at.desc())
+        .limit(limit)
+    )
+    all_matches = [
+        _commit_to_match(commit, match_source="message" if message_hit else "branch")
+        for commit, message_hit in result.tuples()
+    ]
 
     logger.info("✅ musehub search pattern: %d matches (repo=%s)", len(all_matches), repo_id[:8])
     return SearchResponse(
@@ -0,0 +1,166 @@
+"""Muse Hub search index queries — ranked matches over ``musehub_search_documents``.
+
+The documents table and its database-side indexes are defined in
+:mod:`maestro.db.musehub_search_models`. This module turns a user query into
+a :class:`DocumentMatch` — a ``FROM`` clause, a ``WHERE`` condition and a
+rank expression — that callers compose into their own statements, so that
+filtering, ranking, grouping and paging all happen in the database:
+
+- **keyword** — the query is split into Unicode word terms, each matched as
+  a word prefix, any term sufficing (``jazz blues`` finds ``jazzy``). On
+  PostgreSQL this is ``search_vector @@ to_tsquery(...)`` ranked by
+  ``ts_rank_cd``; on SQLite it is an FTS5 ``MATCH`` ranked by ``bm25``. Title
+  hits rank above body hits on both.
+- **pattern** — the query is a raw SQL ``LIKE`` pattern applied to title and
+  body. On PostgreSQL the ``pg_trgm`` indexes serve it; every hit ranks
+  equally.
+
+SQLite only allows ``bm25`` in the statement that holds the ``MATCH``, so a
+caller that aggregates over hits selects them into :func:`hits_cte` first.
+
+Boundary rules:
+- Must NOT import state stores, SSE queues, or LLM clients.
+- Must NOT import maestro.core.* modules.
+- May import ORM models from maestro.db.
+"""
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import (
+    CTE,
+    Float,
+    FromClause,
+    Select,
+    String,
+    column,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnClause, ColumnElement
+
+from maestro.db.musehub_search_models import MusehubSearchDocument
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+# Longer queries are truncated; each term widens the index scan.
+_MAX_TERMS = 16
+
+_fts = table("musehub_search_fts", column("rowid"))
+
+
+@dataclass(frozen=True)
+class DocumentMatch:
+    """A search condition over ``musehub_search_documents`` and its rank.
+
+    Select from ``source`` (which includes the documents table), filter on
+    ``condition`` and order by ``score`` descending.
+    """
+
+    source: FromClause
+    condition: ColumnElement[bool]
+    score: ColumnElement[float]
+
+
+def query_terms(text: str) -> list[str]:
+    """Return the distinct lowercase word terms of *text*, in order."""
+    return list(dict.fromkeys(_TERM_RE.findall(text.lower())))[:_MAX_TERMS]
+
+
+def _is_postgres(session: AsyncSession) -> bool:
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def keyword_match(session: AsyncSession, text: str) -> DocumentMatch | None:
+    """Match documents containing any term of *text* as a word prefix.
+
+    Returns ``None`` when *text* has no searchable terms.
+    """
+    terms = query_terms(text)
+    if not terms:
+        return None
+    docs = MusehubSearchDocument.__table__
+    if _is_postgres(session):
+        vector: ColumnClause[str] = literal_column(
+            "musehub_search_documents.search_vector", type_=TSVECTOR()
+        )
+        tsquery = func.to_tsquery(
+            literal_column("'simple'"), " | ".join(f"{term}:*" for term in terms)
+        )
+        return DocumentMatch(
+            source=docs,
+            condition=vector.op("@@")(tsquery),
+            score=func.ts_rank_cd(vector, tsquery, type_=Float),
+        )
+    fts_table: ColumnClause[str] = literal_column("musehub_search_fts", type_=String())
+    return DocumentMatch(
+        source=docs.join(_fts, _fts.c.rowid == docs.c.id),
+        condition=fts_table.op("MATCH")(" OR ".join(f'"{term}"*' for term in terms)),
+        # bm25 is lower-is-better; weight title hits 4× body hits.
+        score=-func.bm25(fts_table, 4.0, 1.0, type_=Float),
+    )
+
+
+def pattern_match(pattern: str) -> DocumentMatch:
+    """Match documents whose title or body is ``LIKE`` *pattern*."""
+    docs = MusehubSearchDocument.__table__
+    return DocumentMatch(
+        source=docs,
+        condition=or_(docs.c.title.like(pattern), docs.c.body.like(pattern)),
+        score=literal(1.0, Float),
+    )
+
+
+def hits(
+    match: DocumentMatch,
+    *,
+    kinds: Sequence[str],
+    repo_ids: Sequence[str] | None = None,
+    public_only: bool = False,
+) -> Select[tuple[str, str, str, float, datetime]]:
+    """Select ``(kind, ref_id, repo_id, score, occurred_at)`` for every matching document."""
+    docs = MusehubSearchDocument.__table__
+    stmt = (
+        select(
+            docs.c.kind, docs.c.ref_id, docs.c.repo_id, match.score.label("score"), docs.c.occurred_at
+        )
+        .select_from(match.source)
+        .where(match.condition, docs.c.kind.in_(kinds))
+    )
+    if repo_ids is not None:
+        stmt = stmt.where(docs.c.repo_id.in_(repo_ids))
+    if public_only:
+        stmt = stmt.where(docs.c.is_public.is_(True))
+    return stmt
+
+
+def hits_cte(stmt: Select[tuple[str, str, str, float, datetime]], name: str = "search_hits") -> CTE:
+    """Wrap :func:`hits` in a materialized CTE so it can be grouped or windowed."""
+    return stmt.cte(name).prefix_with("MATERIALIZED")
+
+
+def ref_ids(
+    session: AsyncSession, text: str, *, kind: str, repo_id: str
+) -> Select[tuple[str]] | None:
+    """Select the ``ref_id`` of every *kind* document in *repo_id* matching *text*.
+
+    Intended as an ``IN`` subquery for list filters; ``None`` when *text*
+    has no searchable terms.
+    """
+    match = keyword_match(session, text)
+    if match is None:
+        return None
+    docs = MusehubSearchDocument.__table__
+    return (
+        select(docs.c.ref_id)
+        .select_from(match.source)
+        .where(match.condition, docs.c.kind == kind, docs.c.repo_id == repo_id)
+    )
@@ -3,12 +3,20 @@
 Implements the two core data-movement operations:
 - ``ingest_push``: stores commits and objects from a client push, enforcing
   fast-forward semantics and updating the branch head.
+- ``ingest_push_pack``: the same for a push sent as a pack stream; objects
+  are spooled to disk and SHA-256 verified as they arrive instead of being
+  held base64-decoded in the request model.
 - ``compute_pull_delta``: returns commits and objects the client does not yet
   have, keyed by their ``have_commits`` / ``have_objects`` exclusion lists.
+  Kept as the JSON/base64 fallback for clients that do not speak packs.
+- ``plan_pull_pack`` / ``stream_pull_pack``: the negotiated pull. The client
+  advertises its tips, the Hub walks ancestry for the missing set, and the
+  result streams back in the binary format of
+  :mod:`maestro.services.musehub_pack`.
 
-Object content is written to disk under
-  ``settings.musehub_objects_dir/<repo_id>/<object_id>``
-while metadata (path, size, disk_path) is persisted to Postgres.
+Object content is written once per distinct SHA-256 to the shared blob store
+(:mod:`maestro.services.musehub_blobs`) under ``settings.musehub_objects_dir``
+while per-repo metadata (path, size, disk_path, blob) is persisted to Postgres.
 
 Boundary rules (same as musehub_repository):
 - Must NOT import state stores, SSE queues, or LLM clients.
@@ -18,16 +26,24 @@ Boundary rules (same as musehub_repository):
 """
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
 import logging
 import os
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from maestro.config import settings
 from maestro.db import musehub_models as db
+from maestro.muse_cli.commit_graph import CommitGraph, GraphRow
 from maestro.models.musehub import (
     CommitInput,
     CommitResponse,
@@ -36,11 +52,61 @@ from maestro.models.musehub import (
     PullResponse,
     PushResponse,
 )
+from maestro.services.musehub_blobs import (
+    adopt_blob_sync,
+    blob_disk_path,
+    blob_temp_path,
+    write_blob_sync,
+)
 from maestro.services.musehub_embeddings import compute_embedding
+from maestro.services.musehub_pack import (
+    FRAME_COMMIT,
+    FRAME_DATA,
+    FRAME_END,
+    FRAME_HEADER,
+    FRAME_OBJECT,
+    PackDecoder,
+    PackFormatError,
+    PackObject,
+    encode_pack,
+)
 from maestro.services.musehub_qdrant import get_qdrant_client
 
 logger = logging.getLogger(__name__)
 
+# Max IDs per ``IN (...)`` clause when loading commit or object rows.
+_IN_BATCH = 500
+
+_T = TypeVar("_T")
+
+# Created on first use, sized by ``settings.musehub_object_write_workers``.
+_OBJECT_IO_POOL: ThreadPoolExecutor | None = None
+
+
+@dataclass(frozen=True)
+class PullPackPlan:
+    """Everything a negotiated pull will stream, resolved up front.
+
+    Built while the request's DB session is open; :func:`stream_pull_pack`
+    only reads object files, so the streamed response never touches the
+    session after the route handler returns.
+    """
+
+    branch: str
+    remote_head: str | None
+    commits: list[dict[str, object]]
+    objects: list[PackObject]
+
+
+@dataclass(frozen=True)
+class PushPackResult:
+    """Outcome of :func:`ingest_push_pack` plus what the route's background tasks need."""
+
+    response: PushResponse
+    branch: str
+    commits: list[CommitInput]
+    objects: list[PackObject]
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -76,14 +142,31 @@ def _to_object_response(row: db.MusehubObject) -> ObjectResponse:
     )
 
 
-def _object_disk_path(repo_id: str, object_id: str) -> Path:
-    """Return the canonical on-disk path for an object.
-
-    The object_id may contain a colon (e.g. ``sha256:abc…``); replace it with
-    a dash so it is safe on all filesystems.
-    """
-    safe_id = object_id.replace(":", "-")
-    return Path(settings.musehub_objects_dir) / repo_id / safe_id
+def _to_pack_commit(row: db.MusehubCommit) -> dict[str, object]:
+    """Render a commit in the CLI's ``PullCommitPayload`` shape."""
+    parents = list(row.parent_ids or [])
+    return {
+        "commit_id": row.commit_id,
+        "parent_commit_id": parents[0] if parents else None,
+        "parent2_commit_id": parents[1] if len(parents) > 1 else None,
+        "snapshot_id": row.snapshot_id or "",
+        "branch": row.branch,
+        "message": row.message,
+        "author": row.author,
+        "committed_at": row.timestamp.isoformat(),
+        "metadata": None,
+    }
+
+
+def _graph_row(commit_id: str, parent_ids: list[str] | None, timestamp: datetime) -> GraphRow:
+    parents = list(parent_ids or [])
+    return (
+        commit_id,
+        parents[0] if parents else None,
+        parents[1] if len(parents) > 1 else None,
+        timestamp.timestamp(),
+        None,
+    )
 
 
 def _is_fast_forward(
@@ -149,85 +232,170 @@ async def ingest_push(
             non-fast-forward and ``force`` is False. The route handler maps
             this to HTTP 409.
     """
-    # ------------------------------------------------------------------
-    # 1. Resolve (or create) the branch
-    # ------------------------------------------------------------------
-    branch_row = await _get_or_create_branch(session, repo_id=repo_id, branch=branch)
+    branch_row = await _check_push(
+        session,
+        repo_id=repo_id,
+        branch=branch,
+        head_commit_id=head_commit_id,
+        commits=commits,
+        force=force,
+    )
+    await _insert_commits(session, repo_id=repo_id, branch=branch, commits=commits, author=author)
 
-    # ------------------------------------------------------------------
-    # 2. Fast-forward check
-    # ------------------------------------------------------------------
-    if not force and not _is_fast_forward(branch_row.head_commit_id, head_commit_id, commits):
-        logger.warning(
-            "⚠️ Non-fast-forward push rejected for repo=%s branch=%s remote_head=%s new_head=%s",
-            repo_id,
-            branch,
-            branch_row.head_commit_id,
-            head_commit_id,
-        )
-        raise ValueError("non_fast_forward")
+    # Objects: bytes go to disk on the object I/O pool, metadata in one insert.
+    existing_object_ids = await _existing_object_ids(
+        session, repo_id=repo_id, object_ids=[o.object_id for o in objects]
+    )
+    new_objects = {o.object_id: o for o in objects if o.object_id not in existing_object_ids}
+    stored = await asyncio.gather(*(_write_object(obj) for obj in new_objects.values()))
+    await _insert_objects(session, repo_id=repo_id, objects=stored, introduced_by=head_commit_id)
+    await _link_commit_objects(
+        session, repo_id=repo_id, commit_id=head_commit_id,
+        object_ids=[o.object_id for o in objects],
+    )
 
-    # ------------------------------------------------------------------
-    # 3. Upsert commits
-    # ------------------------------------------------------------------
-    existing_commit_ids: set[str] = set()
-    if commits:
-        stmt = select(db.MusehubCommit.commit_id).where(
-            db.MusehubCommit.repo_id == repo_id,
-            db.MusehubCommit.commit_id.in_([c.commit_id for c in commits]),
-        )
-        result = await session.execute(stmt)
-        existing_commit_ids = set(result.scalars().all())
+    _advance_branch(branch_row, repo_id=repo_id, head_commit_id=head_commit_id)
+    await session.flush()
+    return PushResponse(ok=True, remote_head=head_commit_id)
 
-    new_commits: list[db.MusehubCommit] = []
-    for c in commits:
-        if c.commit_id in existing_commit_ids:
-            continue
-        row = db.MusehubCommit(
-            commit_id=c.commit_id,
+
+async def ingest_push_pack(
+    session: AsyncSession,
+    *,
+    repo_id: str,
+    chunks: AsyncIterable[bytes],
+    author: str,
+) -> PushPackResult:
+    """Ingest a push sent as a pack stream, spooling object bytes to disk.
+
+    The stream uses the :mod:`maestro.services.musehub_pack` framing: an
+    ``H`` frame ``{"branch", "head_commit_id", "force"}``, the pushed
+    commits as ``C`` frames in :class:`CommitInput` shape, then ``O``/``D``
+    frames for the objects and a closing ``E`` frame.
+
+    Commits are checked for fast-forward before any object byte is accepted.
+    Each object is written to a temporary file on the object I/O pool while
+    its SHA-256 is computed, then checked against ``object_id`` and moved
+    into place; metadata rows go in with one bulk insert once the stream has
+    ended. Objects land in the shared blob store, so bytes the Hub already
+    holds for any repo are dropped instead of stored again. Only the frame
+    being decoded and the chunks queued for the pool
+    are held in memory.
+
+    Raises:
+        PackFormatError: the stream is malformed, truncated, or an
+            ``object_id`` is not a SHA-256 content address.
+        ValueError: ``"non_fast_forward"`` as for :func:`ingest_push`, or
+            ``"object_digest_mismatch"`` when an object's bytes do not hash
+            to its ``object_id``.
+    """
+    decoder = PackDecoder()
+    header: dict[str, object] | None = None
+    commits: list[CommitInput] = []
+    branch_row: db.MusehubBranch | None = None
+    spool: _ObjectSpool | None = None
+    object_count = 0
+    finishing: list[asyncio.Future[None]] = []
+    stored: dict[str, tuple[PackObject, str]] = {}
+    workers = max(1, settings.musehub_object_write_workers)
+
+    async def _start_objects() -> db.MusehubBranch:
+        assert header is not None
+        row = await _check_push(
+            session,
             repo_id=repo_id,
-            branch=branch,
-            parent_ids=c.parent_ids,
-            message=c.message,
-            author=c.author if c.author else author,
-            timestamp=c.timestamp,
-            snapshot_id=c.snapshot_id,
+            branch=str(header["branch"]),
+            head_commit_id=str(header["head_commit_id"]),
+            commits=commits,
+            force=bool(header.get("force", False)),
         )
-        new_commits.append(row)
-    if new_commits:
-        session.add_all(new_commits)
-        logger.info("✅ Ingested %d new commits for repo=%s", len(new_commits), repo_id)
-
-    # ------------------------------------------------------------------
-    # 4. Upsert objects (write bytes to disk, metadata to DB)
-    # ------------------------------------------------------------------
-    existing_object_ids: set[str] = set()
-    if objects:
-        stmt_obj = select(db.MusehubObject.object_id).where(
-            db.MusehubObject.repo_id == repo_id,
-            db.MusehubObject.object_id.in_([o.object_id for o in objects]),
+        await _insert_commits(
+            session, repo_id=repo_id, branch=str(header["branch"]), commits=commits, author=author
         )
-        res_obj = await session.execute(stmt_obj)
-        existing_object_ids = set(res_obj.scalars().all())
+        return row
 
-    for obj in objects:
-        if obj.object_id in existing_object_ids:
-            continue
-        await _write_object(session, repo_id=repo_id, obj=obj)
+    async def _finish(current: _ObjectSpool) -> None:
+        finishing.append(asyncio.ensure_future(current.commit()))
+        stored[current.obj.object_id] = (current.obj, current.digest)
+        # Bound the objects still being flushed so a push of many small
+        # objects cannot queue unbounded work on the pool.
+        while len(finishing) >= workers:
+            await finishing.pop(0)
 
-    # ------------------------------------------------------------------
-    # 5. Update branch head
-    # ------------------------------------------------------------------
-    branch_row.head_commit_id = head_commit_id
-    logger.info(
-        "✅ Branch '%s' head updated to %s for repo=%s",
-        branch,
-        head_commit_id,
-        repo_id,
+    try:
+        async for chunk in chunks:
+            for frame in decoder.feed(chunk):
+                if header is None:
+                    if frame.kind != FRAME_HEADER:
+                        raise PackFormatError("push pack must start with a header frame")
+                    header = frame.json()
+                    if not isinstance(header.get("branch"), str) or not isinstance(
+                        header.get("head_commit_id"), str
+                    ):
+                        raise PackFormatError("push header needs branch and head_commit_id")
+                elif frame.kind == FRAME_COMMIT:
+                    if branch_row is not None:
+                        raise PackFormatError("commit frame after objects")
+                    commits.append(CommitInput.model_validate(frame.json()))
+                elif frame.kind == FRAME_OBJECT:
+                    if branch_row is None:
+                        branch_row = await _start_objects()
+                    if spool is not None:
+                        await _finish(spool)
+                        spool = None
+                    spool = await _ObjectSpool.open(frame.json())
+                    object_count += 1
+                elif frame.kind == FRAME_DATA:
+                    if spool is None:
+                        raise PackFormatError("data frame outside an object")
+                    await spool.write(frame.payload)
+                elif frame.kind == FRAME_END:
+                    if branch_row is None:
+                        branch_row = await _start_objects()
+                    if spool is not None:
+                        await _finish(spool)
+                        spool = None
+                    sent = frame.json()
+                    if sent.get("commits") != len(commits) or sent.get("objects") != object_count:
+                        raise PackFormatError("end frame counts do not match the stream")
+                else:
+                    raise PackFormatError(f"unexpected frame {frame.kind!r} in push pack")
+        decoder.close()
+        await asyncio.gather(*finishing)
+    except BaseException:
+        if spool is not None:
+            await spool.discard()
+        for pending in finishing:
+            pending.cancel()
+        await asyncio.gather(*finishing, return_exceptions=True)
+        raise
+
+    assert header is not None and branch_row is not None
+    head_commit_id = str(header["head_commit_id"])
+    existing_object_ids = await _existing_object_ids(
+        session, repo_id=repo_id, object_ids=list(stored)
+    )
+    new_objects = [entry for oid, entry in stored.items() if oid not in existing_object_ids]
+    await _insert_objects(session, repo_id=repo_id, objects=new_objects, introduced_by=head_commit_id)
+    await _link_commit_objects(
+        session, repo_id=repo_id, commit_id=head_commit_id, object_ids=list(stored)
     )
 
+    _advance_branch(branch_row, repo_id=repo_id, head_commit_id=head_commit_id)
     await session.flush()
-    return PushResponse(ok=True, remote_head=head_commit_id)
+    logger.info(
+        "✅ Streamed push: %d commits, %d objects (%d new) for repo=%s",
+        len(commits),
+        len(stored),
+        len(new_objects),
+        repo_id,
+    )
+    return PushPackResult(
+        response=PushResponse(ok=True, remote_head=head_commit_id),
+        branch=str(header["branch"]),
+        commits=commits,
+        objects=[obj for obj, _ in stored.values()],
+    )
 
 
 async def compute_pull_delta(
@@ -285,6 +453,114 @@ async def compute_pull_delta(
     )
 
 
+async def plan_pull_pack(
+    session: AsyncSession,
+    *,
+    repo_id: str,
+    branch: str,
+    have_tips: list[str],
+) -> PullPackPlan:
+    """Work out the minimal commit and object set for a negotiated pull.
+
+    The client advertises only its tips. Every commit reachable from the
+    branch head but not from any tip the Hub knows is missing; tips the Hub
+    has never seen (unpushed local work) are ignored. Missing commits are
+    ordered parents-first so the client can insert them as they arrive.
+
+    Objects are those carried by the push of a missing commit (see
+    :class:`~maestro.db.musehub_models.MusehubCommitObject`, which also
+    links objects first uploaded on another branch), plus objects with no
+    recorded push (``introduced_by IS NULL``). When none of the tips is
+    known — a first pull — every object in the repo is sent.
+    """
+    branch_row = await _get_branch(session, repo_id=repo_id, branch=branch)
+    remote_head = branch_row.head_commit_id if branch_row else None
+    if remote_head is None:
+        return PullPackPlan(branch=branch, remote_head=None, commits=[], objects=[])
+
+    graph_rows = (
+        await session.execute(
+            select(
+                db.MusehubCommit.commit_id,
+                db.MusehubCommit.parent_ids,
+                db.MusehubCommit.timestamp,
+            ).where(db.MusehubCommit.repo_id == repo_id)
+        )
+    ).all()
+    graph = CommitGraph.from_rows(_graph_row(cid, p, ts) for cid, p, ts in graph_rows)
+
+    known_tips = [tip for tip in have_tips if tip in graph]
+    have: set[str] = set()
+    for tip in known_tips:
+        if tip not in have:
+            have |= graph.ancestors(tip)
+    missing = [cid for cid in graph.ancestors(remote_head) if cid in graph and cid not in have]
+
+    def _order(cid: str) -> tuple[int, float]:
+        node = graph.node(cid) or 0
+        return graph.generation[node], graph.committed_at[node]
+
+    missing.sort(key=_order)
+
+    commit_rows: dict[str, db.MusehubCommit] = {}
+    for start in range(0, len(missing), _IN_BATCH):
+        result = await session.execute(
+            select(db.MusehubCommit).where(
+                db.MusehubCommit.repo_id == repo_id,
+                db.MusehubCommit.commit_id.in_(missing[start:start + _IN_BATCH]),
+            )
+        )
+        commit_rows.update((row.commit_id, row) for row in result.scalars())
+
+    obj_cols = select(
+        db.MusehubObject.object_id,
+        db.MusehubObject.path,
+        db.MusehubObject.disk_path,
+    ).where(db.MusehubObject.repo_id == repo_id)
+    obj_stmts = [obj_cols]
+    if known_tips:
+        link = db.MusehubCommitObject
+        obj_stmts = [obj_cols.where(db.MusehubObject.introduced_by.is_(None))]
+        obj_stmts += [
+            obj_cols.join(
+                link,
+                (link.repo_id == db.MusehubObject.repo_id)
+                & (link.object_id == db.MusehubObject.object_id),
+            ).where(link.commit_id.in_(missing[start:start + _IN_BATCH]))
+            for start in range(0, len(missing), _IN_BATCH)
+        ]
+    by_id: dict[str, PackObject] = {}
+    for stmt in obj_stmts:
+        for oid, path, disk_path in (await session.execute(stmt)).all():
+            by_id.setdefault(oid, PackObject(object_id=oid, path=path, disk_path=disk_path))
+    objects = list(by_id.values())
+
+    logger.info(
+        "✅ Pull pack planned: %d commits, %d objects for repo=%s branch=%s (%d/%d tips known)",
+        len(missing),
+        len(objects),
+        repo_id,
+        branch,
+        len(known_tips),
+        len(have_tips),
+    )
+    return PullPackPlan(
+        branch=branch,
+        remote_head=remote_head,
+        commits=[_to_pack_commit(commit_rows[cid]) for cid in missing if cid in commit_rows],
+        objects=objects,
+    )
+
+
+def stream_pull_pack(plan: PullPackPlan) -> AsyncIterator[bytes]:
+    """Encode *plan* as a pack stream, reading object files chunk by chunk."""
+    return encode_pack(
+        {"branch": plan.branch, "remote_head": plan.remote_head},
+        plan.commits,
+        plan.objects,
+    )
+
+
 def embed_push_commits(
     *,
     commits: list[CommitInput],
@@ -371,34 +647,264 @@ async def _get_or_create_branch(
     return new_branch
 
 
-async def _write_object(
+async def _check_push(
+    session: AsyncSession,
+    *,
+    repo_id: str,
+    branch: str,
+    head_commit_id: str,
+    commits: list[CommitInput],
+    force: bool,
+) -> db.MusehubBranch:
+    """Resolve (or create) the branch and enforce fast-forward semantics."""
+    branch_row = await _get_or_create_branch(session, repo_id=repo_id, branch=branch)
+    if not force and not _is_fast_forward(branch_row.head_commit_id, head_commit_id, commits):
+        logger.warning(
+            "⚠️ Non-fast-forward push rejected for repo=%s branch=%s remote_head=%s new_head=%s",
+            repo_id,
+            branch,
+            branch_row.head_commit_id,
+            head_commit_id,
+        )
+        raise ValueError("non_fast_forward")
+    return branch_row
+
+
+async def _insert_commits(
     session: AsyncSession,
     *,
     repo_id: str,
-    obj: ObjectInput,
+    branch: str,
+    commits: list[CommitInput],
+    author: str,
 ) -> None:
-    """Decode base64 content, write to disk, and insert metadata row."""
-    disk_path = _object_disk_path(repo_id, obj.object_id)
+    """Add rows for pushed commits the repo does not have yet."""
+    existing_commit_ids: set[str] = set()
+    if commits:
+        stmt = select(db.MusehubCommit.commit_id).where(
+            db.MusehubCommit.repo_id == repo_id,
+            db.MusehubCommit.commit_id.in_([c.commit_id for c in commits]),
+        )
+        result = await session.execute(stmt)
+        existing_commit_ids = set(result.scalars().all())
 
-    # Write bytes to disk (async-safe: use executor for blocking I/O would be
-    # ideal in high-throughput, but for MVP objects are ≤1 MB and this path
-    # runs outside the hot loop).
-    disk_path.parent.mkdir(parents=True, exist_ok=True)
-    raw = base64.b64decode(obj.content_b64)
-    disk_path.write_bytes(raw)
+    new_commits: list[db.MusehubCommit] = []
+    for c in commits:
+        if c.commit_id in existing_commit_ids:
+            continue
+        row = db.MusehubCommit(
+            commit_id=c.commit_id,
+            repo_id=repo_id,
+            branch=branch,
+            parent_ids=c.parent_ids,
+            message=c.message,
+            author=c.author if c.author else author,
+            timestamp=c.timestamp,
+            snapshot_id=c.snapshot_id,
+        )
+        new_commits.append(row)
+    if new_commits:
+        session.add_all(new_commits)
+        logger.info("✅ Ingested %d new commits for repo=%s", len(new_commits), repo_id)
 
-    row = db.MusehubObject(
-        object_id=obj.object_id,
-        repo_id=repo_id,
-        path=obj.path,
-        size_bytes=len(raw),
-        disk_path=str(disk_path),
+
+async def _existing_object_ids(
+    session: AsyncSession, *, repo_id: str, object_ids: list[str]
+) -> set[str]:
+    existing: set[str] = set()
+    for start in range(0, len(object_ids), _IN_BATCH):
+        result = await session.execute(
+            select(db.MusehubObject.object_id).where(
+                db.MusehubObject.repo_id == repo_id,
+                db.MusehubObject.object_id.in_(object_ids[start:start + _IN_BATCH]),
+            )
+        )
+        existing.update(result.scalars().all())
+    return existing
+
+
+async def _insert_objects(
+    session: AsyncSession,
+    *,
+    repo_id: str,
+    objects: list[tuple[PackObject, str]],
+    introduced_by: str,
+) -> None:
+    """Insert rows for ``(object, blob sha256)`` pairs already on disk, in one statement."""
+    if not objects:
+        return
+    await session.execute(
+        insert(db.MusehubObject),
+        [
+            {
+                "object_id": obj.object_id,
+                "repo_id": repo_id,
+                "path": obj.path,
+                "size_bytes": obj.size_bytes,
+                "disk_path": obj.disk_path,
+                "blob_sha256": blob_sha256,
+                "introduced_by": introduced_by,
+            }
+            for obj, blob_sha256 in objects
+        ],
     )
-    session.add(row)
+    logger.info("✅ Stored %d objects for repo=%s", len(objects), repo_id)
+
+
+async def _link_commit_objects(
+    session: AsyncSession, *, repo_id: str, commit_id: str, object_ids: list[str]
+) -> None:
+    """Record every object of a push against its head commit, skipping known links."""
+    wanted = set(object_ids)
+    if not wanted:
+        return
+    link = db.MusehubCommitObject
+    known = set(
+        (
+            await session.execute(
+                select(link.object_id).where(link.repo_id == repo_id, link.commit_id == commit_id)
+            )
+        ).scalars()
+    )
+    rows = [
+        {"repo_id": repo_id, "commit_id": commit_id, "object_id": oid}
+        for oid in sorted(wanted - known)
+    ]
+    if rows:
+        await session.execute(insert(link), rows)
+
+
+def _advance_branch(branch_row: db.MusehubBranch, *, repo_id: str, head_commit_id: str) -> None:
+    branch_row.head_commit_id = head_commit_id
     logger.info(
-        "✅ Stored object %s (%d bytes) for repo=%s at %s",
-        obj.object_id,
-        len(raw),
+        "✅ Branch '%s' head updated to %s for repo=%s",
+        branch_row.name,
+        head_commit_id,
         repo_id,
-        disk_path,
     )
+
+
+async def _run_io(fn: Callable[..., _T], *args: object) -> _T:
+    """Run blocking object-file I/O on the bounded object pool."""
+    return await asyncio.get_running_loop().run_in_executor(_object_io_pool(), fn, *args)
+
+
+def _object_io_pool() -> ThreadPoolExecutor:
+    global _OBJECT_IO_POOL
+    if _OBJECT_IO_POOL is None:
+        _OBJECT_IO_POOL = ThreadPoolExecutor(
+            max_workers=max(1, settings.musehub_object_write_workers),
+            thread_name_prefix="musehub-objects",
+        )
+    return _OBJECT_IO_POOL
+
+
+async def _write_object(obj: ObjectInput) -> tuple[PackObject, str]:
+    """Decode base64 content and store it in the blob store on the object I/O pool."""
+    raw = base64.b64decode(obj.content_b64)
+    blob = await _run_io(write_blob_sync, settings.musehub_objects_dir, raw)
+    logger.info(
+        "✅ Stored object %s (%d bytes) as blob %s",
+        obj.object_id,
+        blob.size_bytes,
+        blob.sha256[:12],
+    )
+    return (
+        PackObject(
+            object_id=obj.object_id,
+            path=obj.path,
+            disk_path=str(blob.disk_path),
+            size_bytes=blob.size_bytes,
+        ),
+        blob.sha256,
+    )
+
+
+def _expected_digest(object_id: str) -> str:
+    """Return the hex SHA-256 named by *object_id* (``sha256:<hex>`` or bare hex)."""
+    digest = object_id.removeprefix("sha256:")
+    if len(digest) != 64 or digest.strip("0123456789abcdef"):
+        raise PackFormatError(f"object_id {object_id!r} is not a SHA-256 content address")
+    return digest
+
+
+class _ObjectSpool:
+    """One streamed object: a temp file, a running SHA-256 and its last write.
+
+    At most one chunk per object is in flight on the pool; the next
+    :meth:`write` waits for it, so reading from the network overlaps with
+    the disk write without buffering the object.
+    """
+
+    def __init__(self, obj: PackObject, digest: str, expected_size: int) -> None:
+        self.obj = obj
+        self.digest = digest
+        self._expected_size = expected_size
+        self._objects_dir = settings.musehub_objects_dir
+        self._tmp = blob_temp_path(self._objects_dir, digest)
+        self._hasher = hashlib.sha256()
+        self._fh: BinaryIO | None = None
+        self._pending: asyncio.Future[None] | None = None
+        self._received = 0
+
+    @classmethod
+    async def open(cls, header: dict[str, object]) -> _ObjectSpool:
+        object_id, path, size = header.get("object_id"), header.get("path"), header.get("size_bytes")
+        if not isinstance(object_id, str) or not isinstance(path, str) or not isinstance(size, int):
+            raise PackFormatError("object frame needs object_id, path and size_bytes")
+        digest = _expected_digest(object_id)
+        disk_path = blob_disk_path(settings.musehub_objects_dir, digest)
+        spool = cls(PackObject(object_id, path, str(disk_path), size), digest, size)
+        await _run_io(spool._open_sync)
+        return spool
+
+    def _open_sync(self) -> None:
+        self._tmp.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = self._tmp.open("wb")
+
+    def _write_sync(self, chunk: bytes) -> None:
+        assert self._fh is not None
+        self._hasher.update(chunk)
+        self._fh.write(chunk)
+
+    async def write(self, chunk: bytes) -> None:
+        self._received += len(chunk)
+        if self._received > self._expected_size:
+            raise PackFormatError(f"object {self.obj.object_id} exceeds its size_bytes")
+        if self._pending is not None:
+            await self._pending
+        self._pending = asyncio.get_running_loop().run_in_executor(
+            _object_io_pool(), self._write_sync, chunk
+        )
+
+    def _commit_sync(self) -> None:
+        assert self._fh is not None
+        self._fh.close()
+        if self._hasher.hexdigest() != self.digest:
+            self._tmp.unlink(missing_ok=True)
+            logger.warning("⚠️ Object %s failed SHA-256 verification", self.obj.object_id)
+            raise ValueError("object_digest_mismatch")
+        adopt_blob_sync(self._objects_dir, self.digest, self._tmp)
+
+    async def commit(self) -> None:
+        """Check size and digest, then move the file into the blob store."""
+        try:
+            if self._pending is not None:
+                await self._pending
+            if self._received != self._expected_size:
+                raise PackFormatError(f"object {self.obj.object_id} truncated")
+        except BaseException:
+            await self.discard()
+            raise
+        await _run_io(self._commit_sync)
+
+    def _discard_sync(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+        self._tmp.unlink(missing_ok=True)
+
+    async def discard(self) -> None:
+        """Drop the temp file; used when the push fails mid-object."""
+        if self._pending is not None:
+            await asyncio.gather(self._pending, return_exceptions=True)
+        await _run_io(self._discard_sync)
@@ -13,8 +13,12 @@ from __future__ import annotations
 
 import asyncio
 import httpx
+import json
 import logging
 import time as _time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
 
 from typing_extensions import TypedDict
 
@@ -39,14 +43,15 @@ class StorpheusRawResponse(TypedDict, total=False):
 
     On success: ``success`` is True plus notes/tool_calls/metadata.
     On failure: ``success`` is False plus ``error`` (and optionally ``message``).
-    ``channel_notes`` is present only on success when Orpheus returns them.
+    ``channel_notes`` is present only on success when Orpheus returns them,
+    keyed as on the wire (JSON object keys are strings).
     """
 
     success: bool
     notes: list[NoteDict]
     tool_calls: list[dict[str, JSONValue]]
     metadata: dict[str, JSONValue]
-    channel_notes: dict[int, list[NoteDict]]
+    channel_notes: dict[str, list[NoteDict]]
     error: str
     message: str
     retry_count: int
@@ -140,6 +145,170 @@ class _CircuitBreaker:
                     f"— failing fast for another {self.cooldown}s"
                 )
 
+class JobStreamLost(Exception):
+    """The Storpheus job stream dropped before a job's result arrived."""
+
+
+# Job statuses after which Storpheus pushes no further updates.
+_TERMINAL_JOB_STATUSES = frozenset({"complete", "failed", "canceled"})
+
+# Terminal updates kept for jobs nobody is awaiting yet (pushed between the
+# submit response and ``expect()``).
+_EARLY_RESULTS_MAX = 256
+
+# Seconds to wait before reconnecting after the stream drops, and before
+# retrying at all against a Storpheus build without /jobs/events.
+_STREAM_RETRY_SECONDS = 5.0
+_STREAM_UNSUPPORTED_RETRY_SECONDS = 300.0
+
+
+class _JobStream:
+    """One ``GET /jobs/events`` SSE connection carrying results for many jobs.
+
+    Jobs submitted with ``X-Job-Stream: <stream_id>`` have every status
+    change pushed here, so a worker holds one connection to Storpheus
+    instead of a long-poll per in-flight job. ``expect(job_id)`` returns a
+    future resolved with the job's terminal ``/jobs/{id}`` payload.
+
+    Connecting never blocks a caller: ``connect()`` reports whether the
+    stream is ready and, if not, (re)opens it in the background. Jobs
+    submitted before the ``ready`` event arrives go without the header and
+    are polled. When the stream drops, every pending future fails with
+    ``JobStreamLost`` and callers fall back to polling; the next
+    ``connect()`` after a short delay reopens it (same id). A 404 means
+    Storpheus predates the endpoint, so reconnects back off for several
+    minutes.
+    """
+
+    def __init__(
+        self,
+        http: Callable[[], httpx.AsyncClient],
+        base_url: str,
+    ) -> None:
+        self.stream_id = uuid.uuid4().hex
+        self._http = http
+        self._base_url = base_url
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._retry_at = 0.0
+        self._waiters: dict[str, asyncio.Future[dict[str, JSONValue]]] = {}
+        self._early: OrderedDict[str, dict[str, JSONValue]] = OrderedDict()
+
+    @property
+    def connected(self) -> bool:
+        return self._ready.is_set()
+
+    def connect(self) -> bool:
+        """``True`` if the stream is ready; otherwise start opening it and return ``False``."""
+        if self._ready.is_set():
+            return True
+        if (self._task is None or self._task.done()) and _time.monotonic() >= self._retry_at:
+            self._task = asyncio.create_task(self._run())
+        return False
+
+    async def wait_ready(self, timeout: float) -> bool:
+        """Start the stream if needed and wait up to *timeout* seconds for ``ready``."""
+        if self.connect():
+            return True
+        if self._task is None or self._task.done():
+            return False
+        ready = asyncio.ensure_future(self._ready.wait())
+        try:
+            await asyncio.wait(
+                {ready, self._task},
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            ready.cancel()
+        return self._ready.is_set()
+
+    def expect(self, job_id: str) -> asyncio.Future[dict[str, JSONValue]]:
+        """Future for *job_id*'s terminal payload. Call ``forget`` when done with it."""
+        future: asyncio.Future[dict[str, JSONValue]] = asyncio.get_running_loop().create_future()
+        early = self._early.pop(job_id, None)
+        if early is not None:
+            future.set_result(early)
+        elif not self._ready.is_set():
+            future.set_exception(JobStreamLost("Job stream is not connected"))
+        else:
+            self._waiters[job_id] = future
+        return future
+
+    def forget(self, job_id: str) -> None:
+        self._waiters.pop(job_id, None)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._early.clear()
+
+    async def _run(self) -> None:
+        # Read timeout comfortably above Storpheus's 15 s keepalive interval.
+        timeout = httpx.Timeout(connect=5.0, read=45.0, write=5.0, pool=5.0)
+        retry_after = _STREAM_RETRY_SECONDS
+        try:
+            async with self._http().stream(
+                "GET",
+                f"{self._base_url}/jobs/events",
+                params={"stream": self.stream_id},
+                timeout=timeout,
+            ) as response:
+                if response.status_code == 404:
+                    retry_after = _STREAM_UNSUPPORTED_RETRY_SECONDS
+                    logger.info("Orpheus has no /jobs/events — polling job results")
+                    return
+                response.raise_for_status()
+                event = ""
+                async for line in response.aiter_lines():
+                    if line.startswith("event:"):
+                        event = line[6:].strip()
+                    elif line.startswith("data:"):
+                        self._dispatch(event, line[5:].strip())
+                    elif not line:
+                        event = ""
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning(f"⚠️ Orpheus job stream dropped: {exc!r}")
+        finally:
+            self._retry_at = _time.monotonic() + retry_after
+            self._ready.clear()
+            waiters, self._waiters = self._waiters, {}
+            for future in waiters.values():
+                if not future.done():
+                    future.set_exception(JobStreamLost("Job stream disconnected"))
+
+    def _dispatch(self, event: str, data: str) -> None:
+        if event == "ready":
+            self._ready.set()
+            logger.info(f"📡 Orpheus job stream {self.stream_id[:8]} connected")
+            return
+        if event != "job":
+            return
+        try:
+            payload = json.loads(data)
+        except ValueError:
+            logger.warning(f"⚠️ Unparseable Orpheus job stream event: {data[:120]}")
+            return
+        if not isinstance(payload, dict) or payload.get("status") not in _TERMINAL_JOB_STATUSES:
+            return
+        job_id = str(payload.get("jobId", ""))
+        future = self._waiters.pop(job_id, None)
+        if future is not None:
+            if not future.done():
+                future.set_result(payload)
+            return
+        self._early[job_id] = payload
+        while len(self._early) > _EARLY_RESULTS_MAX:
+            self._early.popitem(last=False)
+
+
 # Connection pool settings: kept generous because Orpheus calls are sequential
 # within a session but multiple FastAPI workers may hit it concurrently.
 _CONNECTION_LIMITS = httpx.Limits(
@@ -180,6 +349,10 @@ class StorpheusClient:
             threshold=settings.storpheus_cb_threshold,
             cooldown=float(settings.storpheus_cb_cooldown),
         )
+        self._use_job_stream = bool(settings.storpheus_job_stream)
+        self._jobs = _JobStream(lambda: self.client, self.base_url)
+        # Fire-and-forget waiter releases, kept referenced until they finish.
+        self._releases: set[asyncio.Task[None]] = set()
 
     @property
     def circuit_breaker_open(self) -> bool:
@@ -216,12 +389,15 @@ class StorpheusClient:
         Pre-establish the connection to Orpheus during application startup.
 
         A single lightweight health-check opens the keepalive connection so
-        the first real generation request incurs no cold-start latency.
+        the first real generation request incurs no cold-start latency. The
+        job stream is opened in the background so it is usually ready by then.
         """
         try:
             healthy = await self.health_check()
             if healthy:
                 logger.info("Orpheus connection warmed up ✓")
+                if self._use_job_stream:
+                    self._jobs.connect()
             else:
                 logger.warning(
                     "Orpheus warmup: service responded but health check failed"
@@ -233,7 +409,10 @@ class StorpheusClient:
             logger.warning(f"Orpheus warmup failed (service may not be running): {exc}")
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the job stream and the HTTP client."""
+        if self._releases:
+            await asyncio.gather(*self._releases, return_exceptions=True)
+        await self._jobs.close()
         if self._client:
             await self._client.aclose()
             self._client = None
@@ -294,7 +473,9 @@ class StorpheusClient:
 
         1. POST /generate → returns immediately with {jobId, status}.
            Cache hits arrive pre-completed (no queue slot used).
-        2. GET /jobs/{jobId}/wait?timeout=30 in a loop until complete/failed.
+        2. Await the job's result pushed over the worker's shared
+           ``/jobs/events`` stream. When that stream is unavailable or drops,
+           GET /jobs/{jobId}/wait?timeout=30 in a loop until complete/failed.
 
         The full canonical intent blocks (emotion_vector, role_profile_summary,
         generation_constraints, intent_goals) are included so Orpheus
@@ -378,12 +559,16 @@ class StorpheusClient:
             # ── Submit phase ──────────────────────────────────────────
             _submit_timeout = httpx.Timeout(connect=5.0, read=10.0, write=10.0, pool=5.0)
             job_id: str | None = None
+            waiter: str | None = None
+            pushed = self._use_job_stream and self._jobs.connect()
+            _submit_headers = {"X-Job-Stream": self._jobs.stream_id} if pushed else None
 
             for attempt in range(_MAX_RETRIES):
                 try:
                     response = await self.client.post(
                         f"{self.base_url}/generate",
                         json=payload,
+                        headers=_submit_headers,
                         timeout=_submit_timeout,
                     )
 
@@ -438,6 +623,7 @@ class StorpheusClient:
                         return _cache_resp
 
                     job_id = data.get("jobId")
+                    waiter = data.get("waiter")
                     if not job_id:
                         self._cb.record_failure()
                         return {
@@ -494,9 +680,35 @@ class StorpheusClient:
                     "retry_count": _MAX_RETRIES,
                 }
 
-            # ── Poll phase ────────────────────────────────────────────
             poll_timeout = settings.storpheus_poll_timeout
             max_polls = settings.storpheus_poll_max_attempts
+
+            # ── Push phase ────────────────────────────────────────────
+            if pushed:
+                _pushed_result = self._jobs.expect(job_id)
+                try:
+                    data = await asyncio.wait_for(
+                        _pushed_result, timeout=poll_timeout * max_polls,
+                    )
+                    return self._job_result(
+                        data, job_id, instruments, _log_prefix, _gen_start, "pushed",
+                    )
+                except JobStreamLost:
+                    logger.info(
+                        f"[Orpheus] Job stream lost — polling job {job_id[:8]}"
+                    )
+                except asyncio.TimeoutError:
+                    self._release_job(job_id, waiter)
+                    return self._job_timed_out(job_id, poll_timeout * max_polls)
+                except asyncio.CancelledError:
+                    # The stream stays connected after we stop listening, so
+                    # tell Orpheus this submitter is gone or the job still runs.
+                    self._release_job(job_id, waiter)
+                    raise
+                finally:
+                    self._jobs.forget(job_id)
+
+            # ── Poll phase ────────────────────────────────────────────
             _poll_httpx_timeout = httpx.Timeout(
                 connect=5.0,
                 read=float(poll_timeout + 5),
@@ -515,42 +727,11 @@ class StorpheusClient:
                     data = response.json()
                     status = data.get("status")
 
-                    if status in ("complete", "failed"):
-                        result = data.get("result", {})
-                        error_text = result.get("error") or data.get("error", "")
-                        _elapsed = asyncio.get_event_loop().time() - _gen_start
-
-                        if status == "failed" or not result.get("success"):
-                            self._cb.record_failure()
-                            logger.error(
-                                f"❌ Orpheus job {job_id[:8]} failed after "
-                                f"{_elapsed:.1f}s: {error_text[:120]}"
-                            )
-                            return {
-                                "success": False,
-                                "error": error_text or "Generation failed",
-                                "retry_count": 0,
-                            }
-
-                        self._cb.record_success()
-                        logger.info(
-                            f"{_log_prefix}[Orpheus] ✅ Job {job_id[:8]} complete for "
-                            f"{instruments} in {_elapsed:.1f}s "
-                            f"(poll {poll_num + 1}/{max_polls})"
+                    if status in _TERMINAL_JOB_STATUSES:
+                        return self._job_result(
+                            data, job_id, instruments, _log_prefix, _gen_start,
+                            f"poll {poll_num + 1}/{max_polls}",
                         )
-                        _poll_meta = result.get("metadata")
-                        _poll_resp = StorpheusRawResponse(
-                            success=True,
-                            notes=result.get("notes", []),
-                            tool_calls=result.get("tool_calls", []),
-                            metadata={
-                                **(_poll_meta if isinstance(_poll_meta, dict) else {}),
-                                "retry_count": 0,
-                            },
-                        )
-                        if result.get("channel_notes"):
-                            _poll_resp["channel_notes"] = result["channel_notes"]
-                        return _poll_resp
 
                     logger.debug(
                         f"[Orpheus] Job {job_id[:8]} still {status} "
@@ -580,17 +761,101 @@ class StorpheusClient:
                         f"⚠️ Poll error for job {job_id[:8]}: {exc}"
                     )
 
+            return self._job_timed_out(job_id, poll_timeout * max_polls)
+
+    def _release_job(self, job_id: str, waiter: str | None) -> None:
+        """Detach this submitter from *job_id* in the background (best effort).
+
+        Uses the waiter token from ``POST /generate``, so a job coalesced
+        with other submitters keeps running for them. Older Orpheus builds
+        return no token; their jobs are left to the abandoned-job sweep.
+        """
+        if not waiter:
+            return
+        task = asyncio.create_task(self._cancel_waiter(job_id, waiter))
+        self._releases.add(task)
+        task.add_done_callback(self._releases.discard)
+
+    async def _cancel_waiter(self, job_id: str, waiter: str) -> None:
+        try:
+            response = await self.client.post(
+                f"{self.base_url}/jobs/{job_id}/cancel",
+                params={"waiter": waiter},
+                timeout=httpx.Timeout(5.0),
+            )
+            response.raise_for_status()
+            logger.info(f"[Orpheus] 🚪 Released job {job_id[:8]}")
+        except Exception as exc:
+            logger.warning(f"⚠️ Could not release Orpheus job {job_id[:8]}: {exc!r}")
+
+    def _job_result(
+        self,
+        data: dict[str, JSONValue],
+        job_id: str,
+        instruments: list[str],
+        log_prefix: str,
+        gen_start: float,
+        via: str,
+    ) -> StorpheusRawResponse:
+        """Turn a terminal ``/jobs/{id}`` payload (polled or pushed) into a response."""
+        _result = data.get("result")
+        result: dict[str, JSONValue] = _result if isinstance(_result, dict) else {}
+        _error = result.get("error") or data.get("error")
+        error_text = _error if isinstance(_error, str) else ""
+        _elapsed = asyncio.get_event_loop().time() - gen_start
+
+        if data.get("status") != "complete" or not result.get("success"):
             self._cb.record_failure()
-            _total = poll_timeout * max_polls
             logger.error(
-                f"❌ Orpheus job {job_id[:8]} did not complete within {_total}s"
+                f"❌ Orpheus job {job_id[:8]} failed after "
+                f"{_elapsed:.1f}s: {error_text[:120]}"
             )
             return {
                 "success": False,
-                "error": f"Generation did not complete within {_total}s",
+                "error": error_text or "Generation failed",
                 "retry_count": 0,
             }
 
+        self._cb.record_success()
+        logger.info(
+            f"{log_prefix}[Orpheus] ✅ Job {job_id[:8]} complete for "
+            f"{instruments} in {_elapsed:.1f}s ({via})"
+        )
+        _meta = result.get("metadata")
+        _notes = result.get("notes")
+        _tool_calls = result.get("tool_calls")
+        response = StorpheusRawResponse(
+            success=True,
+            notes=[n for n in _notes if is_note_dict(n)] if isinstance(_notes, list) else [],
+            tool_calls=(
+                [tc for tc in _tool_calls if isinstance(tc, dict)]
+                if isinstance(_tool_calls, list) else []
+            ),
+            metadata={
+                **(_meta if isinstance(_meta, dict) else {}),
+                "retry_count": 0,
+            },
+        )
+        _channel_notes = result.get("channel_notes")
+        if isinstance(_channel_notes, dict) and _channel_notes:
+            response["channel_notes"] = {
+                ch: [n for n in ch_notes if is_note_dict(n)]
+                for ch, ch_notes in _channel_notes.items()
+                if isinstance(ch_notes, list)
+            }
+        return response
+
+    def _job_timed_out(self, job_id: str, total: int) -> StorpheusRawResponse:
+        self._cb.record_failure()
+        logger.error(
+            f"❌ Orpheus job {job_id[:8]} did not complete within {total}s"
+        )
+        return {
+            "success": False,
+            "error": f"Generation did not complete within {total}s",
+            "retry_count": 0,
+        }
+
 
 def normalize_storpheus_tool_calls(
     tool_calls: list[dict[str, JSONValue]],
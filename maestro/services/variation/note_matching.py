@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
-from collections.abc import Sequence
+from collections.abc import Hashable, Sequence
 from typing import Callable, Generic, TypeVar
 
 from maestro.contracts.json_types import (
@@ -126,6 +127,11 @@ def match_notes(
     Uses pitch + timing proximity to match notes. Unmatched base notes
     are marked as removed, unmatched proposed notes as added.
 
+    Each base note, in order, takes the first unmatched proposed note (in
+    list order) that ``_notes_match`` accepts. Candidates are found by
+    pitch bucket and a window over sorted start times rather than a scan,
+    so a region costs O((n + m) log m) instead of O(n·m).
+
     Args:
         base_notes: Original notes
         proposed_notes: Notes after transformation
@@ -135,28 +141,32 @@ def match_notes(
     """
     matches: list[NoteMatch] = []
 
-    base_matched: set[int] = set()
+    aligner = _TimingAligner(
+        [_note_pitch(note) for note in proposed_notes],
+        [note.get("start_beat", 0) for note in proposed_notes],
+    )
     proposed_matched: set[int] = set()
 
     # First pass: exact matches (same pitch and timing)
     for bi, base_note in enumerate(base_notes):
-        if bi in base_matched:
+        pitch = _note_pitch(base_note)
+        if pitch is None:
             continue
+        pi = aligner.take(
+            range(pitch - PITCH_TOLERANCE, pitch + PITCH_TOLERANCE + 1),
+            base_note.get("start_beat", 0),
+        )
+        if pi is None:
+            continue
+        matches.append(NoteMatch(
+            base_note=base_note,
+            proposed_note=proposed_notes[pi],
+            base_index=bi,
+            proposed_index=pi,
+        ))
+        proposed_matched.add(pi)
 
-        for pi, proposed_note in enumerate(proposed_notes):
-            if pi in proposed_matched:
-                continue
-
-            if _notes_match(base_note, proposed_note):
-                matches.append(NoteMatch(
-                    base_note=base_note,
-                    proposed_note=proposed_note,
-                    base_index=bi,
-                    proposed_index=pi,
-                ))
-                base_matched.add(bi)
-                proposed_matched.add(pi)
-                break
+    base_matched = {m.base_index for m in matches}
 
     # Remaining base notes are removed
     for bi, base_note in enumerate(base_notes):
@@ -181,6 +191,106 @@ def match_notes(
     return matches
 
 
+def _note_pitch(note: NoteDict) -> int | None:
+    """Bucket key for a note; ``None`` (never matched) when the pitch is absent."""
+    return note.get("pitch")
+
+
+class _TimingAligner:
+    """Finds, for each base item, the first unmatched proposed item within timing tolerance.
+
+    Proposed items are grouped by key and each group is sorted by time, so
+    the items within ``TIMING_TOLERANCE_BEATS`` of a beat form one
+    contiguous slice. A range-minimum tree over proposed indices, laid out
+    in that sorted order, returns the lowest unmatched index in the slice;
+    taking an item clears its slot. This reproduces the greedy "first
+    match in list order" pairing of a nested-loop scan in O(log m) per query.
+    """
+
+    __slots__ = ("_groups", "_tree", "_size", "_unset")
+
+    def __init__(self, keys: Sequence[Hashable | None], times: Sequence[float]) -> None:
+        by_key: dict[Hashable, list[int]] = {}
+        for index, key in enumerate(keys):
+            if key is not None:
+                by_key.setdefault(key, []).append(index)
+
+        # key → (offset of the group in the tree, sorted times of the group)
+        self._groups: dict[Hashable, tuple[int, list[float]]] = {}
+        order: list[int] = []
+        for key, indices in by_key.items():
+            indices.sort(key=lambda i: times[i])
+            self._groups[key] = (len(order), [times[i] for i in indices])
+            order.extend(indices)
+
+        self._unset = len(keys)
+        size = 1
+        while size < len(order):
+            size *= 2
+        self._size = size
+        tree = [self._unset] * (2 * size)
+        tree[size:size + len(order)] = order
+        for node in range(size - 1, 0, -1):
+            tree[node] = min(tree[2 * node], tree[2 * node + 1])
+        self._tree = tree
+
+    def take(self, keys: Sequence[Hashable], beat: float) -> int | None:
+        """Claim and return the lowest unmatched proposed index matching *keys* and *beat*."""
+        best = self._unset
+        best_pos = -1
+        for key in keys:
+            group = self._groups.get(key)
+            if group is None:
+                continue
+            offset, group_times = group
+            # abs(beat - t) <= tolerance holds on one contiguous run of the
+            # sorted times; bisect on each half of the predicate so the
+            # window agrees with the tolerance check bit for bit.
+            lo = bisect_left(group_times, True, key=lambda t: beat - t <= TIMING_TOLERANCE_BEATS)
+            hi = bisect_left(group_times, True, lo, key=lambda t: t - beat > TIMING_TOLERANCE_BEATS)
+            if lo < hi:
+                index, pos = self._min(offset + lo, offset + hi)
+                if index < best:
+                    best, best_pos = index, pos
+        if best_pos < 0:
+            return None
+        self._clear(best_pos)
+        return best
+
+    def _min(self, lo: int, hi: int) -> tuple[int, int]:
+        """Return ``(lowest index, its tree position)`` over positions ``[lo, hi)``."""
+        tree = self._tree
+        best = self._unset
+        lo += self._size
+        hi += self._size
+        node = -1
+        while lo < hi:
+            if lo & 1:
+                if tree[lo] < best:
+                    best, node = tree[lo], lo
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                if tree[hi] < best:
+                    best, node = tree[hi], hi
+            lo >>= 1
+            hi >>= 1
+        if node < 0:
+            return best, -1
+        while node < self._size:
+            node = 2 * node if tree[2 * node] == best else 2 * node + 1
+        return best, node - self._size
+
+    def _clear(self, pos: int) -> None:
+        tree = self._tree
+        node = pos + self._size
+        tree[node] = self._unset
+        node >>= 1
+        while node:
+            tree[node] = min(tree[2 * node], tree[2 * node + 1])
+            node >>= 1
+
+
 # ── Controller event matching ─────────────────────────────────────────────
 
 
@@ -232,57 +342,55 @@ class EventMatch(Generic[_EV]):
         return not self.is_modified
 
 
-def _events_match_by_beat(base: EventDict, proposed: EventDict) -> bool:
-    """Two events are the same if they occur at the same beat (within tolerance)."""
-    b_beat: float = base.get("beat", 0)
-    p_beat: float = proposed.get("beat", 0)
-    return abs(b_beat - p_beat) <= TIMING_TOLERANCE_BEATS
+def _beat_only_key(event: EventDict) -> tuple[()]:
+    """Pitch bends match on beat alone."""
+    return ()
 
 
-def _cc_events_match(base: EventDict, proposed: EventDict) -> bool:
+def _cc_key(event: EventDict) -> tuple[object]:
     """CC events match if same CC number and same beat."""
-    if base.get("cc") != proposed.get("cc"):
-        return False
-    return _events_match_by_beat(base, proposed)
+    return (event.get("cc"),)
 
 
-def _aftertouch_events_match(base: EventDict, proposed: EventDict) -> bool:
+def _aftertouch_key(event: EventDict) -> tuple[object]:
     """Aftertouch events match if same pitch (if poly) and same beat."""
-    if base.get("pitch") != proposed.get("pitch"):
-        return False
-    return _events_match_by_beat(base, proposed)
+    return (event.get("pitch"),)
 
 
 def _match_events(
     base_events: Sequence[_EV],
     proposed_events: Sequence[_EV],
-    match_fn: Callable[[EventDict, EventDict], bool],
+    key_fn: Callable[[EventDict], Hashable],
 ) -> list[EventMatch[_EV]]:
-    """Generic event matcher using a pluggable identity function.
+    """Generic event matcher using a pluggable identity key.
+
+    Two events match when ``key_fn`` gives them equal keys and their beats
+    agree within ``TIMING_TOLERANCE_BEATS``. Each base event takes the
+    first unmatched proposed event in list order, found by key bucket and
+    a window over sorted beats in O(log m).
 
-    The match_fn takes the broader EventDict union (each concrete event type
+    The key_fn takes the broader EventDict union (each concrete event type
     is a member of that union) so the same helpers can be reused across all
     event kinds without duplicating them.
     """
     matches: list[EventMatch[_EV]] = []
-    base_matched: set[int] = set()
+    aligner = _TimingAligner(
+        [key_fn(event) for event in proposed_events],
+        [event.get("beat", 0) for event in proposed_events],
+    )
     proposed_matched: set[int] = set()
+    unmatched_base: list[_EV] = []
 
-    for bi, base in enumerate(base_events):
-        if bi in base_matched:
+    for base in base_events:
+        pi = aligner.take((key_fn(base),), base.get("beat", 0))
+        if pi is None:
+            unmatched_base.append(base)
             continue
-        for pi, proposed in enumerate(proposed_events):
-            if pi in proposed_matched:
-                continue
-            if match_fn(base, proposed):
-                matches.append(EventMatch(base_event=base, proposed_event=proposed))
-                base_matched.add(bi)
-                proposed_matched.add(pi)
-                break
+        matches.append(EventMatch(base_event=base, proposed_event=proposed_events[pi]))
+        proposed_matched.add(pi)
 
-    for bi, base in enumerate(base_events):
-        if bi not in base_matched:
-            matches.append(EventMatch(base_event=base, proposed_event=None))
+    for base in unmatched_base:
+        matches.append(EventMatch(base_event=base, proposed_event=None))
 
     for pi, proposed in enumerate(proposed_events):
         if pi not in proposed_matched:
@@ -296,7 +404,7 @@ def match_cc_events(
     proposed_events: list[CCEventDict],
 ) -> list[EventMatch[CCEventDict]]:
     """Match CC events by CC number + beat timing."""
-    return _match_events(base_events, proposed_events, _cc_events_match)
+    return _match_events(base_events, proposed_events, _cc_key)
 
 
 def match_pitch_bends(
@@ -304,7 +412,7 @@ def match_pitch_bends(
     proposed_events: list[PitchBendDict],
 ) -> list[EventMatch[PitchBendDict]]:
     """Match pitch bend events by beat timing."""
-    return _match_events(base_events, proposed_events, _events_match_by_beat)
+    return _match_events(base_events, proposed_events, _beat_only_key)
 
 
 def match_aftertouch(
@@ -312,4 +420,4 @@ def match_aftertouch(
     proposed_events: list[AftertouchDict],
 ) -> list[EventMatch[AftertouchDict]]:
     """Match aftertouch events by pitch (if poly) + beat timing."""
-    return _match_events(base_events, proposed_events, _aftertouch_events_match)
+    return _match_events(base_events, proposed_events, _aftertouch_key)
@@ -28,13 +28,15 @@ import json
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Generic, Literal, TypeVar, Union
+from typing import Generic, Literal, TypeGuard, TypeVar, Union
 
 from typing_extensions import TypedDict
 
 from maestro.contracts.json_types import (
     AftertouchDict,
     CCEventDict,
+    JSONObject,
+    JSONValue,
     NoteChangeDict,
     NoteChangeEntryDict,
     PitchBendDict,
@@ -337,6 +339,76 @@ fields and the payload is serialized without inspection.
 """
 
 
+_EVENT_TYPES: tuple[EventType, ...] = ("meta", "phrase", "done", "error", "heartbeat")
+
+
+# Payload guards. Every payload TypedDict is ``total=False`` and decoded
+# envelopes come from another Maestro worker's ``to_dict``, so a dict whose
+# discriminating field has the right type is accepted as that payload.
+
+
+def _is_meta_payload(v: JSONValue) -> TypeGuard[MetaPayload]:
+    return isinstance(v, dict) and isinstance(v.get("intent", ""), str)
+
+
+def _is_phrase_payload(v: JSONValue) -> TypeGuard[PhrasePayload]:
+    return isinstance(v, dict) and isinstance(v.get("phraseId", v.get("phrase_id", "")), str)
+
+
+def _is_done_payload(v: JSONValue) -> TypeGuard[DonePayload]:
+    return isinstance(v, dict) and isinstance(v.get("status", ""), str)
+
+
+def _is_error_payload(v: JSONValue) -> TypeGuard[ErrorPayload]:
+    return isinstance(v, dict) and isinstance(v.get("message", ""), str)
+
+
+def _decoded_envelope(data: JSONObject, etype: EventType, payload: _T) -> EventEnvelope[_T]:
+    sequence = data.get("sequence")
+    variation_id = data.get("variationId")
+    timestamp_ms = data.get("timestampMs")
+    if not isinstance(sequence, int) or not isinstance(variation_id, str):
+        raise ValueError("Envelope is missing sequence or variationId")
+    if not isinstance(timestamp_ms, int):
+        raise ValueError("Envelope is missing timestampMs")
+    project_id = data.get("projectId", "")
+    base_state_id = data.get("baseStateId", "")
+    return EventEnvelope(
+        type=etype,
+        sequence=sequence,
+        variation_id=variation_id,
+        project_id=project_id if isinstance(project_id, str) else "",
+        base_state_id=base_state_id if isinstance(base_state_id, str) else "",
+        payload=payload,
+        timestamp_ms=timestamp_ms,
+    )
+
+
+def envelope_from_dict(data: JSONObject) -> AnyEnvelope:
+    """Rebuild an envelope from ``EventEnvelope.to_dict()`` output.
+
+    Used where envelopes cross a process boundary (multi-worker fan-out).
+    The payload is trusted to match ``type`` — it was produced by ``to_dict``
+    in another Maestro worker, not by a client — so it is only checked to be
+    an object of that payload's shape.
+
+    Raises ``ValueError`` for an unknown envelope type or a malformed envelope.
+    """
+    etype = data.get("type")
+    payload = data.get("payload")
+    if etype == "meta" and _is_meta_payload(payload):
+        return _decoded_envelope(data, "meta", payload)
+    if etype == "phrase" and _is_phrase_payload(payload):
+        return _decoded_envelope(data, "phrase", payload)
+    if etype == "done" and _is_done_payload(payload):
+        return _decoded_envelope(data, "done", payload)
+    if etype == "error" and _is_error_payload(payload):
+        return _decoded_envelope(data, "error", payload)
+    if etype in _EVENT_TYPES:
+        raise ValueError(f"Malformed {etype} envelope payload")
+    raise ValueError(f"Unknown envelope type: {etype!r}")
+
+
 # ── Phrase serialization helpers ───────────────────────────────────────────────
 #
 # These live here (not in propose.py / storage.py) so any module that builds
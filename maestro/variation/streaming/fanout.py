@@ -0,0 +1,245 @@
+"""
+Fan-out transports for variation events across API worker processes.
+
+``SSEBroadcaster`` keeps subscribers and replay history in-process. When the
+API runs several uvicorn workers, a client's SSE connection can land on a
+different worker from the one generating the variation, so every worker
+forwards what it publishes to its peers through a ``FanoutTransport``.
+
+Transports move opaque byte messages; the broadcaster owns the encoding.
+A transport never delivers a worker's own messages back to it.
+
+Implementations:
+    LocalFanout — single worker; sends nothing (default)
+    UnixSocketFanout — peer mesh over UNIX sockets in a shared directory
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import struct
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+FanoutHandler = Callable[[bytes], Awaitable[None]]
+"""Callback that receives each message sent by a peer worker."""
+
+_FRAME_HEADER = struct.Struct(">I")
+
+
+class FanoutTransport(Protocol):
+    """Port between the SSE broadcaster and its peer workers."""
+
+    async def start(self, on_message: FanoutHandler) -> None:
+        """Begin receiving peer messages, passing each to *on_message*."""
+        ...
+
+    async def send(self, message: bytes) -> None:
+        """Deliver *message* to every peer worker (best effort, never raises)."""
+        ...
+
+    async def stop(self) -> None:
+        """Stop receiving and release connections."""
+        ...
+
+
+class LocalFanout:
+    """Single-process transport: there are no peers, so nothing is sent."""
+
+    async def start(self, on_message: FanoutHandler) -> None:
+        return None
+
+    async def send(self, message: bytes) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+
+class _PeerLink:
+    """Outbound side of one peer: a bounded frame queue and the task draining it."""
+
+    __slots__ = ("queue", "task")
+
+    def __init__(self, queue: asyncio.Queue[bytes], task: asyncio.Task[None]) -> None:
+        self.queue = queue
+        self.task = task
+
+
+class UnixSocketFanout:
+    """
+    Peer mesh over UNIX sockets in a directory shared by all workers.
+
+    Each worker listens on its own ``<pid>-<id>.sock`` in *directory* and
+    sends every message to each other socket found there, over one
+    persistent connection per peer so messages arrive in send order.
+    Frames are a 4-byte big-endian length followed by the message.
+
+    The peer list is cached and rescanned only when the directory changes
+    (a worker started or exited) or every *peer_refresh* seconds. ``send``
+    never waits on a peer: it queues the frame for that peer's background
+    writer, which connects and drains at the peer's pace. A peer with
+    *max_pending* frames still queued misses new messages until it catches
+    up, and one that does not drain within *send_timeout* seconds is
+    reconnected and misses that message; subscribers on it can resume from
+    history with ``Last-Event-ID``.
+
+    A socket nobody listens on (left by a worker that died) is unlinked on
+    the first refused connection.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        send_timeout: float = 1.0,
+        max_pending: int = 1024,
+        peer_refresh: float = 5.0,
+    ) -> None:
+        self._directory = Path(directory)
+        self._send_timeout = send_timeout
+        self._max_pending = max_pending
+        self._peer_refresh = peer_refresh
+        self._path: Path | None = None
+        self._server: asyncio.Server | None = None
+        self._on_message: FanoutHandler | None = None
+        self._peers: dict[Path, _PeerLink] = {}
+        # Cached peer socket paths and the directory state they were read from.
+        self._peer_paths: list[Path] = []
+        self._scanned_mtime: int | None = None
+        self._scanned_at = 0.0
+
+    @property
+    def path(self) -> Path | None:
+        """This worker's listening socket, once started."""
+        return self._path
+
+    async def start(self, on_message: FanoutHandler) -> None:
+        self._directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self._path = self._directory / f"{os.getpid()}-{uuid.uuid4().hex[:8]}.sock"
+        self._on_message = on_message
+        self._server = await asyncio.start_unix_server(self._serve, path=str(self._path))
+        os.chmod(self._path, 0o600)
+        logger.info(f"Variation fan-out listening on {self._path}")
+
+    async def send(self, message: bytes) -> None:
+        if self._path is None:
+            return
+        frame = _FRAME_HEADER.pack(len(message)) + message
+        for peer in self._current_peers():
+            link = self._peers.get(peer) or self._connect(peer)
+            try:
+                link.queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                logger.warning(f"Variation fan-out to {peer.name} is backed up; dropping message")
+
+    async def stop(self) -> None:
+        links = list(self._peers.values())
+        if links:
+            # Let already-queued frames go out, but never wait on a stuck peer.
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    asyncio.gather(*(link.queue.join() for link in links)),
+                    timeout=self._send_timeout,
+                )
+        for peer in list(self._peers):
+            self._disconnect(peer)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._path is not None:
+            with contextlib.suppress(FileNotFoundError):
+                self._path.unlink()
+            self._path = None
+
+    def _current_peers(self) -> list[Path]:
+        """Return the cached peer sockets, rescanning if the directory changed."""
+        try:
+            mtime: int | None = self._directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        now = time.monotonic()
+        if mtime != self._scanned_mtime or now - self._scanned_at >= self._peer_refresh:
+            self._scanned_mtime, self._scanned_at = mtime, now
+            self._peer_paths = self._scan_peers()
+            for gone in set(self._peers) - set(self._peer_paths):
+                self._disconnect(gone)
+        return self._peer_paths
+
+    def _scan_peers(self) -> list[Path]:
+        return [p for p in self._directory.glob("*.sock") if p != self._path]
+
+    def _connect(self, peer: Path) -> _PeerLink:
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=self._max_pending)
+        link = _PeerLink(queue, asyncio.ensure_future(self._write_loop(peer, queue)))
+        self._peers[peer] = link
+        return link
+
+    async def _write_loop(self, peer: Path, queue: asyncio.Queue[bytes]) -> None:
+        """Send *peer*'s queued frames in order over one (re)opened connection."""
+        writer: asyncio.StreamWriter | None = None
+        try:
+            while True:
+                frame = await queue.get()
+                try:
+                    if writer is None:
+                        _, opened = await asyncio.wait_for(
+                            asyncio.open_unix_connection(str(peer)), timeout=self._send_timeout
+                        )
+                        writer = opened
+                    writer.write(frame)
+                    await asyncio.wait_for(writer.drain(), timeout=self._send_timeout)
+                except ConnectionRefusedError:
+                    logger.info(f"Removing stale variation fan-out socket {peer}")
+                    with contextlib.suppress(FileNotFoundError):
+                        peer.unlink()
+                    self._forget(peer, queue)
+                    return
+                except (OSError, asyncio.TimeoutError) as exc:
+                    logger.warning(f"Variation fan-out to {peer.name} failed: {exc!r}")
+                    if writer is not None:
+                        writer.close()
+                        writer = None
+                finally:
+                    queue.task_done()
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def _forget(self, peer: Path, queue: asyncio.Queue[bytes]) -> None:
+        """Drop a dead peer from within its own writer, discarding what it had queued."""
+        if (link := self._peers.get(peer)) is not None and link.queue is queue:
+            del self._peers[peer]
+        while not queue.empty():
+            queue.get_nowait()
+            queue.task_done()
+
+    def _disconnect(self, peer: Path) -> None:
+        link = self._peers.pop(peer, None)
+        if link is not None:
+            link.task.cancel()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                header = await reader.readexactly(_FRAME_HEADER.size)
+                (length,) = _FRAME_HEADER.unpack(header)
+                message = await reader.readexactly(length)
+                if self._on_message is None:
+                    continue
+                try:
+                    await self._on_message(message)
+                except Exception as exc:
+                    logger.error(f"Variation fan-out handler failed: {exc!r}")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
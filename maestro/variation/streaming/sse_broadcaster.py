@@ -6,6 +6,29 @@ to connected SSE clients. Supports late-join replay from stored events.
 
 Architecture:
     VariationService → publish_event(envelope) → SSEBroadcaster → clients
+                                                      ↕ FanoutTransport
+                                               SSEBroadcaster (other workers)
+
+History:
+    Each variation keeps a bounded replay buffer — oldest events are
+    evicted once it exceeds an event count, a byte budget (serialized
+    JSON size), or an age. Streams nobody is subscribed to are dropped
+    once their newest event is older than the age limit, so ``cleanup()``
+    is no longer required to bound memory.
+
+Backpressure:
+    Each subscriber has a bounded queue and a cursor (the last sequence
+    queued for it). While the queue has room, events are pushed directly.
+    When it fills, the subscriber stops receiving copies and a catch-up
+    task refills its queue from history as the client drains it, so a
+    slow consumer costs one cursor rather than a growing backlog. If the
+    events it needs have already been evicted, the subscriber is ended
+    with the usual ``None`` sentinel and can resume with ``Last-Event-ID``.
+
+Multiple workers:
+    Every publish and close is forwarded through a ``FanoutTransport``;
+    peers record the envelope in their own history and deliver it to
+    their own subscribers, so a client may connect to any worker.
 
 The broadcaster is transport-specific (SSE). A future WebSocket
 broadcaster will consume the same EventEnvelope objects.
@@ -14,57 +37,138 @@ broadcaster will consume the same EventEnvelope objects.
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from typing import AsyncIterator
+import time
+from collections import deque
 
-from maestro.variation.core.event_envelope import AnyEnvelope, EventEnvelope
+from maestro.config import settings
+from maestro.variation.core.event_envelope import AnyEnvelope, envelope_from_dict
+from maestro.variation.streaming.fanout import FanoutTransport, LocalFanout, UnixSocketFanout
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_HISTORY_EVENTS = 1000
+DEFAULT_HISTORY_BYTES = 4 * 1024 * 1024
+DEFAULT_HISTORY_SECONDS = 3600.0
+DEFAULT_QUEUE_SIZE = 256
+
+# How often publish() looks for abandoned streams to drop.
+_SWEEP_INTERVAL_SECONDS = 60.0
+
+# Fan-out message opcodes (first byte of each message).
+_OP_PUBLISH = b"P"
+_OP_CLOSE = b"C"
+
+
+class _StreamHistory:
+    """Bounded replay buffer for one variation, ordered by sequence."""
+
+    __slots__ = ("events", "sizes", "bytes", "evicted_through", "closed", "updated_at")
+
+    def __init__(self) -> None:
+        self.events: deque[AnyEnvelope] = deque()
+        self.sizes: deque[int] = deque()
+        self.bytes = 0
+        # Highest sequence evicted so far; a cursor below it has a gap.
+        self.evicted_through = 0
+        self.closed = False
+        self.updated_at = time.time()
+
+    def append(
+        self,
+        envelope: AnyEnvelope,
+        size: int,
+        max_events: int,
+        max_bytes: int,
+        max_age_seconds: float,
+    ) -> None:
+        self.events.append(envelope)
+        self.sizes.append(size)
+        self.bytes += size
+        self.updated_at = time.time()
+
+        oldest_ms = (self.updated_at - max_age_seconds) * 1000
+        # The newest event is always retained, whatever its size.
+        while len(self.events) > 1 and (
+            len(self.events) > max_events
+            or self.bytes > max_bytes
+            or self.events[0].timestamp_ms < oldest_ms
+        ):
+            evicted = self.events.popleft()
+            self.bytes -= self.sizes.popleft()
+            self.evicted_through = max(self.evicted_through, evicted.sequence)
+
+    def since(self, sequence: int) -> list[AnyEnvelope]:
+        """Retained events with a sequence greater than *sequence*."""
+        return [e for e in self.events if e.sequence > sequence]
+
+
+class _Subscriber:
+    """One SSE client: its queue, replay cursor, and catch-up task."""
+
+    __slots__ = ("queue", "cursor", "catch_up", "closing")
+
+    def __init__(self, queue: asyncio.Queue[AnyEnvelope | None], cursor: int) -> None:
+        self.queue = queue
+        self.cursor = cursor
+        self.catch_up: asyncio.Task[None] | None = None
+        self.closing = False
+
 
 class SSEBroadcaster:
     """
     Manages SSE subscriptions for variation event streams.
 
-    Each variation has a list of subscriber queues. When an event is
-    published, it's pushed to all subscriber queues.
+    Each variation has a list of subscribers. When an event is published,
+    it is recorded in the variation's history and offered to every
+    subscriber queue; subscribers that have fallen behind catch up from
+    history instead.
     """
 
-    def __init__(self) -> None:
-        # variation_id -> list of subscriber queues
-        self._subscribers: dict[str, list[asyncio.Queue[AnyEnvelope | None]]] = {}
-        # variation_id -> list of past envelopes (for replay)
-        self._history: dict[str, list[AnyEnvelope]] = {}
+    def __init__(
+        self,
+        transport: FanoutTransport | None = None,
+        *,
+        max_history_events: int = DEFAULT_HISTORY_EVENTS,
+        max_history_bytes: int = DEFAULT_HISTORY_BYTES,
+        max_history_seconds: float = DEFAULT_HISTORY_SECONDS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        # variation_id -> subscribers
+        self._subscribers: dict[str, list[_Subscriber]] = {}
+        # variation_id -> bounded replay buffer
+        self._history: dict[str, _StreamHistory] = {}
+        self._transport: FanoutTransport = transport or LocalFanout()
+        self._max_history_events = max_history_events
+        self._max_history_bytes = max_history_bytes
+        self._max_history_seconds = max_history_seconds
+        self._queue_size = queue_size
+        self._last_sweep = time.time()
+
+    async def start(self) -> None:
+        """Start receiving events published by other workers."""
+        await self._transport.start(self._on_fanout_message)
+
+    async def stop(self) -> None:
+        """Stop the fan-out transport."""
+        await self._transport.stop()
 
     async def publish(self, envelope: AnyEnvelope) -> int:
         """
         Publish an event to all subscribers of a variation.
 
-        Also stores the event for late-join replay.
-        Returns the number of subscribers that received the event.
+        Also stores the event for late-join replay and forwards it to
+        peer workers. Returns the number of local subscribers that will
+        receive the event.
         """
-        vid = envelope.variation_id
-
-        # Store for replay
-        if vid not in self._history:
-            self._history[vid] = []
-        self._history[vid].append(envelope)
-
-        # Broadcast to subscribers
-        subscribers = self._subscribers.get(vid, [])
-        delivered = 0
-        for queue in subscribers:
-            try:
-                queue.put_nowait(envelope)
-                delivered += 1
-            except asyncio.QueueFull:
-                logger.warning(
-                    f"SSE queue full for variation {vid[:8]}, dropping event"
-                )
+        raw = envelope.to_json().encode()
+        delivered = self._deliver(envelope, len(raw))
+        await self._transport.send(_OP_PUBLISH + raw)
 
         logger.debug(
             f"Published {envelope.type} seq={envelope.sequence} "
-            f"to {delivered}/{len(subscribers)} subscribers for {vid[:8]}"
+            f"to {delivered} subscribers for {envelope.variation_id[:8]}"
         )
         return delivered
 
@@ -79,29 +183,32 @@ class SSEBroadcaster:
         Returns a queue that will receive AnyEnvelope objects.
         A None sentinel signals end-of-stream.
 
-        If from_sequence > 0, queues replay events starting after that sequence.
+        Retained events after *from_sequence* are replayed first. If some
+        of them have already been evicted, replay starts from the oldest
+        retained event.
         """
-        queue: asyncio.Queue[AnyEnvelope | None] = asyncio.Queue(maxsize=256)
-
-        if variation_id not in self._subscribers:
-            self._subscribers[variation_id] = []
-        self._subscribers[variation_id].append(queue)
-
-        # Replay past events if requested
-        history = self._history.get(variation_id, [])
-        for envelope in history:
-            if envelope.sequence > from_sequence:
-                try:
-                    queue.put_nowait(envelope)
-                except asyncio.QueueFull:
-                    logger.warning(
-                        f"SSE replay queue full for {variation_id[:8]}"
-                    )
-                    break
+        queue: asyncio.Queue[AnyEnvelope | None] = asyncio.Queue(maxsize=self._queue_size)
+        subscriber = _Subscriber(queue, from_sequence)
+        self._subscribers.setdefault(variation_id, []).append(subscriber)
+
+        history = self._history.get(variation_id)
+        if history is None:
+            return queue
+        if history.evicted_through > from_sequence:
+            logger.info(
+                f"SSE resume for {variation_id[:8]} from seq={from_sequence} "
+                f"predates retained history (evicted through {history.evicted_through})"
+            )
+            subscriber.cursor = history.evicted_through
+
+        replay = history.since(subscriber.cursor)
+        for envelope in replay:
+            if not self._offer(variation_id, subscriber, envelope):
+                break
 
         logger.debug(
             f"New SSE subscriber for {variation_id[:8]} "
-            f"(from_seq={from_sequence}, replayed={len(history)})"
+            f"(from_seq={from_sequence}, replayed={len(replay)})"
         )
         return queue
 
@@ -112,8 +219,12 @@ class SSEBroadcaster:
     ) -> None:
         """Remove a subscriber queue."""
         subscribers = self._subscribers.get(variation_id, [])
-        if queue in subscribers:
-            subscribers.remove(queue)
+        for subscriber in subscribers:
+            if subscriber.queue is queue:
+                subscribers.remove(subscriber)
+                if subscriber.catch_up is not None:
+                    subscriber.catch_up.cancel()
+                break
 
         # Clean up empty subscriber lists
         if not subscribers and variation_id in self._subscribers:
@@ -123,17 +234,12 @@ class SSEBroadcaster:
         """
         Signal end-of-stream to all subscribers of a variation.
 
-        Sends None sentinel to each queue, then removes all subscribers.
+        Sends None sentinel to each queue (after any events a lagging
+        subscriber has yet to receive), then removes all subscribers.
+        Peer workers do the same for their subscribers.
         """
-        subscribers = self._subscribers.get(variation_id, [])
-        for queue in subscribers:
-            try:
-                queue.put_nowait(None)
-            except asyncio.QueueFull:
-                pass
-
-        if variation_id in self._subscribers:
-            del self._subscribers[variation_id]
+        self._close_local(variation_id)
+        await self._transport.send(_OP_CLOSE + variation_id.encode())
 
     def get_history(
         self,
@@ -141,19 +247,31 @@ class SSEBroadcaster:
         from_sequence: int = 0,
     ) -> list[AnyEnvelope]:
         """Get stored events for a variation, optionally from a sequence."""
-        history = self._history.get(variation_id, [])
-        if from_sequence > 0:
-            return [e for e in history if e.sequence > from_sequence]
-        return list(history)
+        history = self._history.get(variation_id)
+        if history is None:
+            return []
+        return history.since(from_sequence)
+
+    def has_stream(self, variation_id: str) -> bool:
+        """True if this worker holds history for the variation (local or from a peer)."""
+        return variation_id in self._history
+
+    def is_closed(self, variation_id: str) -> bool:
+        """True once ``close_stream`` has run for the variation on any worker."""
+        history = self._history.get(variation_id)
+        return history is not None and history.closed
 
     def cleanup(self, variation_id: str) -> None:
         """Remove all data for a variation (after terminal state)."""
-        self._subscribers.pop(variation_id, None)
+        for subscriber in self._subscribers.pop(variation_id, []):
+            if subscriber.catch_up is not None:
+                subscriber.catch_up.cancel()
         self._history.pop(variation_id, None)
 
     def clear(self) -> None:
         """Clear all state (for testing)."""
-        self._subscribers.clear()
+        for variation_id in list(self._subscribers):
+            self.cleanup(variation_id)
         self._history.clear()
 
     @property
@@ -161,6 +279,120 @@ class SSEBroadcaster:
         """Number of variations with active subscribers."""
         return sum(1 for subs in self._subscribers.values() if subs)
 
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _deliver(self, envelope: AnyEnvelope, size: int) -> int:
+        """Record *envelope* in history and offer it to local subscribers."""
+        vid = envelope.variation_id
+        history = self._history.get(vid)
+        if history is None:
+            history = self._history[vid] = _StreamHistory()
+        history.append(
+            envelope,
+            size,
+            self._max_history_events,
+            self._max_history_bytes,
+            self._max_history_seconds,
+        )
+
+        subscribers = self._subscribers.get(vid, [])
+        for subscriber in subscribers:
+            self._offer(vid, subscriber, envelope)
+        self._sweep()
+        return len(subscribers)
+
+    def _offer(self, variation_id: str, subscriber: _Subscriber, envelope: AnyEnvelope) -> bool:
+        """Queue *envelope* for *subscriber*; return False once it has fallen behind."""
+        if subscriber.catch_up is not None:
+            return False
+        if envelope.sequence <= subscriber.cursor:
+            return True
+        try:
+            subscriber.queue.put_nowait(envelope)
+        except asyncio.QueueFull:
+            logger.info(
+                f"SSE subscriber for {variation_id[:8]} is behind at "
+                f"seq={subscriber.cursor}; catching up from history"
+            )
+            subscriber.catch_up = asyncio.create_task(self._catch_up(variation_id, subscriber))
+            return False
+        subscriber.cursor = envelope.sequence
+        return True
+
+    async def _catch_up(self, variation_id: str, subscriber: _Subscriber) -> None:
+        """Refill a lagging subscriber's queue from history until it is current."""
+        try:
+            while True:
+                history = self._history.get(variation_id)
+                if history is None:
+                    break
+                if history.evicted_through > subscriber.cursor:
+                    logger.warning(
+                        f"SSE subscriber for {variation_id[:8]} fell behind retained "
+                        f"history at seq={subscriber.cursor}; ending its stream"
+                    )
+                    self._drop(variation_id, subscriber)
+                    break
+                pending = history.since(subscriber.cursor)
+                if not pending:
+                    break
+                for envelope in pending:
+                    await subscriber.queue.put(envelope)
+                    subscriber.cursor = envelope.sequence
+            if subscriber.closing:
+                await subscriber.queue.put(None)
+        finally:
+            subscriber.catch_up = None
+
+    def _drop(self, variation_id: str, subscriber: _Subscriber) -> None:
+        subscriber.closing = True
+        subscribers = self._subscribers.get(variation_id, [])
+        if subscriber in subscribers:
+            subscribers.remove(subscriber)
+        if not subscribers:
+            self._subscribers.pop(variation_id, None)
+
+    def _close_local(self, variation_id: str) -> None:
+        history = self._history.get(variation_id)
+        if history is None:
+            history = self._history[variation_id] = _StreamHistory()
+        history.closed = True
+
+        for subscriber in self._subscribers.pop(variation_id, []):
+            subscriber.closing = True
+            if subscriber.catch_up is not None:
+                continue
+            try:
+                subscriber.queue.put_nowait(None)
+            except asyncio.QueueFull:
+                subscriber.catch_up = asyncio.create_task(self._catch_up(variation_id, subscriber))
+
+    def _sweep(self) -> None:
+        """Drop streams without subscribers whose newest event is past the age limit."""
+        now = time.time()
+        if now - self._last_sweep < _SWEEP_INTERVAL_SECONDS:
+            return
+        self._last_sweep = now
+        horizon = now - self._max_history_seconds
+        stale = [
+            vid for vid, history in self._history.items()
+            if history.updated_at < horizon and not self._subscribers.get(vid)
+        ]
+        for vid in stale:
+            del self._history[vid]
+
+    async def _on_fanout_message(self, message: bytes) -> None:
+        op, body = message[:1], message[1:]
+        if op == _OP_PUBLISH:
+            envelope = envelope_from_dict(json.loads(body))
+            self._deliver(envelope, len(body))
+        elif op == _OP_CLOSE:
+            self._close_local(body.decode())
+        else:
+            logger.warning(f"Unknown variation fan-out message {op!r}")
+
 
 # Singleton instance
 _broadcaster: SSEBroadcaster | None = None
@@ -170,7 +402,14 @@ def get_sse_broadcaster() -> SSEBroadcaster:
     """Get the singleton SSEBroadcaster instance."""
     global _broadcaster
     if _broadcaster is None:
-        _broadcaster = SSEBroadcaster()
+        fanout_dir = settings.variation_stream_fanout_dir
+        _broadcaster = SSEBroadcaster(
+            UnixSocketFanout(fanout_dir) if fanout_dir else None,
+            max_history_events=settings.variation_stream_history_events,
+            max_history_bytes=settings.variation_stream_history_bytes,
+            max_history_seconds=settings.variation_stream_history_seconds,
+            queue_size=settings.variation_stream_queue_size,
+        )
     return _broadcaster
 
 
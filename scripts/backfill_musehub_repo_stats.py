@@ -0,0 +1,64 @@
+"""Rebuild the materialized Muse Hub repo stats table.
+
+Context
+-------
+Explore, topic, profile and sitemap pages read star, commit, fork and watcher
+counts from ``musehub_repo_stats`` (see ``maestro.db.musehub_stats_models``).
+A flush hook keeps those rows current, but repos created before the table
+existed have no row, and a Core statement that bypasses the ORM can leave a
+counter stale. This script recomputes the rows from the source tables.
+
+Behaviour
+---------
+- Without arguments, rebuilds a row for every repo.
+- With ``--repo-id`` (repeatable), rebuilds only those repos.
+- Idempotent: safe to run at any time, e.g. once after deploying the table.
+
+Usage
+-----
+Run inside the container (bind mount makes this file available):
+
+    docker compose exec maestro python3 /app/scripts/backfill_musehub_repo_stats.py [--repo-id ID ...]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from maestro.config import settings
+from maestro.db.musehub_stats_models import MusehubRepoStats, recompute_repo_stats
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+async def main(repo_ids: list[str] | None) -> None:
+    db_url: str = settings.database_url or ""
+    engine = create_async_engine(db_url, echo=False)
+    async_session: async_sessionmaker[AsyncSession] = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async with async_session() as db:
+        await db.run_sync(lambda session: recompute_repo_stats(session.connection(), repo_ids))
+        await db.commit()
+        rows: int = (await db.execute(select(func.count()).select_from(MusehubRepoStats))).scalar_one()
+
+    await engine.dispose()
+    logger.info("✅ Backfill complete — %d repo stats row(s) present.", rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repo-id",
+        action="append",
+        dest="repo_ids",
+        help="Rebuild only this repo (repeatable). Default: every repo.",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.repo_ids))
@@ -0,0 +1,68 @@
+"""Rebuild the Muse Hub full-text search index.
+
+Context
+-------
+Global search and the ``q`` filter on issue and PR lists query
+``musehub_search_documents`` (see ``maestro.db.musehub_search_models``).
+A flush hook keeps those documents current, but commits, repos, issues and
+pull requests written before the table existed have no document, and a Core
+statement that bypasses the ORM can leave one stale. This script rebuilds
+the documents from the source tables; the database's own indexes
+(``tsvector``/``pg_trgm`` on PostgreSQL, FTS5 on SQLite) follow along.
+
+Behaviour
+---------
+- Without arguments, rebuilds the documents of every repo.
+- With ``--repo-id`` (repeatable), rebuilds only those repos.
+- Idempotent: safe to run at any time, e.g. once after deploying the table.
+
+Usage
+-----
+Run inside the container (bind mount makes this file available):
+
+    docker compose exec maestro python3 /app/scripts/backfill_musehub_search_index.py [--repo-id ID ...]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from maestro.config import settings
+from maestro.db.musehub_search_models import MusehubSearchDocument, reindex_search_documents
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+async def main(repo_ids: list[str] | None) -> None:
+    db_url: str = settings.database_url or ""
+    engine = create_async_engine(db_url, echo=False)
+    async_session: async_sessionmaker[AsyncSession] = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async with async_session() as db:
+        await db.run_sync(lambda session: reindex_search_documents(session.connection(), repo_ids))
+        await db.commit()
+        rows: int = (
+            await db.execute(select(func.count()).select_from(MusehubSearchDocument))
+        ).scalar_one()
+
+    await engine.dispose()
+    logger.info("✅ Backfill complete — %d search document(s) present.", rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repo-id",
+        action="append",
+        dest="repo_ids",
+        help="Rebuild only this repo (repeatable). Default: every repo.",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.repo_ids))
@@ -0,0 +1,63 @@
+"""Garbage-collect the Muse Hub blob store.
+
+Context
+-------
+Object bytes live once per SHA-256 under ``<musehub_objects_dir>/blobs/`` and
+``musehub_objects`` rows reference them (see
+``maestro.services.musehub_blobs``). Deleting a repo cascades away its rows
+but leaves the blobs; this script is the sweep half of the mark-and-sweep
+collector that reclaims them.
+
+Behaviour
+---------
+- Marks every ``blob_sha256`` referenced by a ``musehub_objects`` row.
+- Deletes unreferenced blob files older than the grace period (default one
+  hour), so pushes still in flight keep their bytes.
+- Idempotent: safe to run at any time, e.g. from a nightly cron job.
+
+Usage
+-----
+Run inside the container (bind mount makes this file available):
+
+    docker compose exec maestro python3 /app/scripts/sweep_musehub_blobs.py [--grace-minutes N]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from maestro.config import settings
+from maestro.services.musehub_blobs import DEFAULT_SWEEP_GRACE, sweep_blobs
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+async def main(grace: timedelta) -> None:
+    db_url: str = settings.database_url or ""
+    engine = create_async_engine(db_url, echo=False)
+    async_session: async_sessionmaker[AsyncSession] = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async with async_session() as db:
+        removed = await sweep_blobs(db, settings.musehub_objects_dir, grace=grace)
+
+    await engine.dispose()
+    logger.info("✅ Sweep complete — %d unreferenced blob(s) removed.", removed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--grace-minutes",
+        type=int,
+        default=int(DEFAULT_SWEEP_GRACE.total_seconds() // 60),
+        help="Keep unreferenced blobs younger than this many minutes.",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(timedelta(minutes=args.grace_minutes)))
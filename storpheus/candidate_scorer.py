@@ -12,19 +12,29 @@ Scoring dimensions:
     - Instrument coverage (did we get notes on expected channels?)
 
 Each dimension returns a 0..1 score. The final score is a weighted sum.
+
+All dimensions are computed from ``CandidateFeatures`` — pitch-class
+histogram, pitch sum, register/velocity in-range counts, pitch bigram
+counts and per-bar note counts — aggregated from pitch/velocity/bar
+columns pulled out of the note dicts once.
+``score_candidates`` scores a whole batch against a ``ScoringParams``
+resolved once (target key, register bounds), and the detected key reuses
+the same histogram instead of re-walking the pitches.
 """
 
 from __future__ import annotations
 
 import logging
 import math
+from collections import Counter
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from storpheus_types import StorpheusNoteDict, ScoringParams
 from key_detection import (
     MAJOR_PROFILE,
     MINOR_PROFILE,
-    detect_key_from_pitches,
+    detect_key_from_histogram,
     parse_key_string,
     key_to_semitones,
 )
@@ -53,30 +63,90 @@ class CandidateScore:
     detected_key: str | None = None
 
 
-def _key_compliance(
-    pitches: list[int],
-    target_key: str | None,
-) -> float:
-    """Score how well the pitch distribution matches the target key.
+@dataclass(frozen=True)
+class _ScoringPlan:
+    """``ScoringParams`` resolved once per batch."""
+    params: ScoringParams
+    key: tuple[int, tuple[float, ...]] | None
+    register_center: int
+    register_spread: int
+    velocity_floor: int
+    velocity_ceiling: int
 
-    Returns 1.0 for perfect match, 0.0 for worst mismatch.
-    Falls back to 0.5 if no target key or too few pitches.
-    """
-    if not target_key or len(pitches) < 8:
-        return 0.5
 
+def _resolve_target_key(target_key: str | None) -> tuple[int, tuple[float, ...]] | None:
+    """Return ``(root_semitones, profile)`` for *target_key*, or None."""
+    if not target_key:
+        return None
     parsed = parse_key_string(target_key)
     if parsed is None:
-        return 0.5
-
+        return None
     target_tonic, target_mode = parsed
-    target_root = key_to_semitones(target_tonic, target_mode)
     profile = MAJOR_PROFILE if target_mode == "major" else MINOR_PROFILE
+    return key_to_semitones(target_tonic, target_mode), profile
 
-    pc_counts = [0.0] * 12
-    for p in pitches:
-        pc_counts[p % 12] += 1.0
 
+def _plan(params: ScoringParams) -> _ScoringPlan:
+    return _ScoringPlan(
+        params=params,
+        key=_resolve_target_key(params.target_key),
+        register_center=params.register_center or 60,
+        register_spread=params.register_spread or 24,
+        velocity_floor=params.velocity_floor or 0,
+        velocity_ceiling=params.velocity_ceiling or 127,
+    )
+
+
+@dataclass
+class CandidateFeatures:
+    """Aggregates of one candidate's notes, shared by every dimension."""
+    note_count: int
+    pc_counts: list[float]
+    pitch_sum: int
+    out_of_register: int
+    velocity_in_range: int
+    bigrams: dict[tuple[int, int], int]
+    bar_counts: list[int]
+
+
+def _extract_features(notes: list[StorpheusNoteDict], plan: _ScoringPlan) -> CandidateFeatures:
+    # Pull each field into its own column once, then aggregate column-wise
+    # with Counter/sum rather than re-walking the note dicts per metric.
+    pitches = [n["pitch"] for n in notes]
+    velocities = [n.get("velocity", 80) for n in notes]
+    bar_index = Counter([int(n.get("start_beat", 0.0) / 4) for n in notes])
+
+    pc_hist = Counter([p % 12 for p in pitches])
+    low = plan.register_center - plan.register_spread
+    high = plan.register_center + plan.register_spread
+    floor_v = plan.velocity_floor
+    ceil_v = plan.velocity_ceiling
+
+    return CandidateFeatures(
+        note_count=len(pitches),
+        pc_counts=[float(pc_hist.get(pc, 0)) for pc in range(12)],
+        pitch_sum=sum(pitches),
+        out_of_register=sum(1 for p in pitches if p < low or p > high),
+        velocity_in_range=sum(1 for v in velocities if floor_v <= v <= ceil_v),
+        bigrams=dict(Counter(zip(pitches, pitches[1:]))),
+        bar_counts=[bar_index.get(b, 0) for b in range(plan.params.bars)],
+    )
+
+
+def _key_fit(
+    pc_counts: list[float],
+    note_count: int,
+    key: tuple[int, tuple[float, ...]] | None,
+) -> float:
+    """Score how well the pitch distribution matches the target key.
+
+    Returns 1.0 for perfect match, 0.0 for worst mismatch.
+    Falls back to 0.5 if no target key or too few pitches.
+    """
+    if key is None or note_count < 8:
+        return 0.5
+
+    target_root, profile = key
     rotated = pc_counts[-target_root:] + pc_counts[:-target_root] if target_root > 0 else pc_counts
 
     n = 12
@@ -97,11 +167,7 @@ def _key_compliance(
 _ORPHEUS_TYPICAL_NOTES_PER_BAR = 50.0
 
 
-def _density_match(
-    notes: list[StorpheusNoteDict],
-    bars: int,
-    target_density: float | None,
-) -> float:
+def _density_fit(note_count: int, bars: int, target_density: float | None) -> float:
     """Score how well note density matches the target.
 
     target_density is notes_per_bar. Orpheus generates polyphonic MIDI
@@ -112,7 +178,7 @@ def _density_match(
     if bars <= 0:
         return 0.5
 
-    actual_npb = len(notes) / max(bars, 1)
+    actual_npb = note_count / max(bars, 1)
 
     if target_density is None or target_density <= 0:
         ideal = _ORPHEUS_TYPICAL_NOTES_PER_BAR
@@ -125,72 +191,45 @@ def _density_match(
     return max(0.0, 1.0 - abs(ratio - 1.0) * 0.3)
 
 
-def _register_compliance(
-    pitches: list[int],
-    register_center: int | None,
-    register_spread: int | None,
+def _register_fit(
+    pitch_sum: int,
+    out_of_range: int,
+    note_count: int,
+    center: int,
+    spread: int,
 ) -> float:
     """Score pitch distribution against register constraints."""
-    if not pitches:
+    if note_count == 0:
         return 0.0
 
-    center = register_center or 60
-    spread = register_spread or 24
-
-    mean_pitch = sum(pitches) / len(pitches)
+    mean_pitch = pitch_sum / note_count
     center_error = abs(mean_pitch - center) / max(spread, 1)
-
-    low = center - spread
-    high = center + spread
-    out_of_range = sum(1 for p in pitches if p < low or p > high)
-    range_score = 1.0 - (out_of_range / len(pitches))
+    range_score = 1.0 - (out_of_range / note_count)
 
     center_score = max(0.0, 1.0 - center_error * 0.5)
     return center_score * 0.5 + range_score * 0.5
 
 
-def _velocity_compliance(
-    notes: list[StorpheusNoteDict],
-    velocity_floor: int | None,
-    velocity_ceiling: int | None,
-) -> float:
-    """Score velocity range against constraints."""
-    if not notes:
-        return 0.0
-
-    velocities = [n.get("velocity", 80) for n in notes]
-    floor_v = velocity_floor or 0
-    ceil_v = velocity_ceiling or 127
-
-    in_range = sum(1 for v in velocities if floor_v <= v <= ceil_v)
-    return in_range / len(velocities)
-
-
-def _pattern_diversity(notes: list[StorpheusNoteDict]) -> float:
+def _diversity_fit(bigrams: dict[tuple[int, int], int], note_count: int) -> float:
     """Score melodic diversity using 2-note pattern entropy.
 
     Higher diversity → higher score. Penalizes both total randomness
     (too many unique patterns) and total repetition (single pattern).
     """
-    if len(notes) < 4:
+    if note_count < 4:
         return 0.5
 
-    patterns: dict[tuple[int, int], int] = {}
-    for i in range(len(notes) - 1):
-        p = (notes[i].get("pitch", 0), notes[i + 1].get("pitch", 0))
-        patterns[p] = patterns.get(p, 0) + 1
-
-    total = sum(patterns.values())
+    total = sum(bigrams.values())
     if total == 0:
         return 0.5
 
     entropy = 0.0
-    for count in patterns.values():
+    for count in bigrams.values():
         prob = count / total
         if prob > 0:
             entropy -= prob * math.log2(prob)
 
-    max_entropy = math.log2(max(len(patterns), 1)) if patterns else 1.0
+    max_entropy = math.log2(max(len(bigrams), 1)) if bigrams else 1.0
     if max_entropy == 0:
         return 0.5
 
@@ -216,51 +255,42 @@ def _coverage_score(
     return min(1.0, active / expected_channels)
 
 
-def _silence_score(notes: list[StorpheusNoteDict], bars: int) -> float:
+def _silence_fit(bar_counts: list[int], note_count: int, bars: int) -> float:
     """Score based on fraction of bars that contain at least one note."""
-    if bars <= 0 or not notes:
+    if bars <= 0 or note_count == 0:
         return 0.0
 
-    bar_counts = [0] * bars
-    for n in notes:
-        b = int(n.get("start_beat", 0.0) / 4)
-        if 0 <= b < bars:
-            bar_counts[b] += 1
-
     active = sum(1 for c in bar_counts if c > 0)
     return active / bars
 
 
-def score_candidate(
-    notes: list[StorpheusNoteDict],
+def _score_features(
+    features: CandidateFeatures,
     channel_notes: dict[int, list[StorpheusNoteDict]],
     batch_index: int,
-    params: ScoringParams,
-    weights: dict[str, float] | None = None,
+    plan: _ScoringPlan,
+    weights: dict[str, float],
 ) -> CandidateScore:
-    """Score a single generation candidate across all dimensions.
-
-    Returns a ``CandidateScore`` with per-dimension breakdowns and a
-    weighted total score in [0, 1].
-    """
-    w = weights or _DEFAULT_WEIGHTS
-    result = CandidateScore(batch_index=batch_index, note_count=len(notes))
-
-    pitches = [n["pitch"] for n in notes]
+    params = plan.params
+    n = features.note_count
+    result = CandidateScore(batch_index=batch_index, note_count=n)
 
     dims: dict[str, float] = {}
-    dims["key_compliance"] = _key_compliance(pitches, params.target_key)
-    dims["density"] = _density_match(notes, params.bars, params.target_density)
-    dims["register"] = _register_compliance(pitches, params.register_center, params.register_spread)
-    dims["velocity"] = _velocity_compliance(notes, params.velocity_floor, params.velocity_ceiling)
-    dims["diversity"] = _pattern_diversity(notes)
+    dims["key_compliance"] = _key_fit(features.pc_counts, n, plan.key)
+    dims["density"] = _density_fit(n, params.bars, params.target_density)
+    dims["register"] = _register_fit(
+        features.pitch_sum, features.out_of_register, n,
+        plan.register_center, plan.register_spread,
+    )
+    dims["velocity"] = features.velocity_in_range / n if n else 0.0
+    dims["diversity"] = _diversity_fit(features.bigrams, n)
     dims["coverage"] = _coverage_score(channel_notes, params.expected_channels)
-    dims["silence"] = _silence_score(notes, params.bars)
+    dims["silence"] = _silence_fit(features.bar_counts, n, params.bars)
 
     total = 0.0
     weight_sum = 0.0
     for dim_name, dim_score in dims.items():
-        w_val = w.get(dim_name, 0.0)
+        w_val = weights.get(dim_name, 0.0)
         total += dim_score * w_val
         weight_sum += w_val
 
@@ -268,14 +298,48 @@ def score_candidate(
     result.dimensions = {k: round(v, 4) for k, v in dims.items()}
 
     # Detect key for observability
-    if pitches:
-        key_result = detect_key_from_pitches(pitches)
+    if n >= 8:
+        key_result = detect_key_from_histogram(features.pc_counts)
         if key_result:
             result.detected_key = f"{key_result[0]} {key_result[1]}"
 
     return result
 
 
+def score_candidates(
+    batch: Sequence[tuple[int, list[StorpheusNoteDict], dict[int, list[StorpheusNoteDict]]]],
+    params: ScoringParams,
+    weights: dict[str, float] | None = None,
+) -> list[CandidateScore]:
+    """Score every ``(batch_index, notes, channel_notes)`` candidate of a batch.
+
+    ``params`` is resolved once for the whole batch and each candidate's
+    notes are walked exactly once. Results are identical to calling
+    ``score_candidate`` per candidate.
+    """
+    w = weights or _DEFAULT_WEIGHTS
+    plan = _plan(params)
+    return [
+        _score_features(_extract_features(notes, plan), channel_notes, batch_index, plan, w)
+        for batch_index, notes, channel_notes in batch
+    ]
+
+
+def score_candidate(
+    notes: list[StorpheusNoteDict],
+    channel_notes: dict[int, list[StorpheusNoteDict]],
+    batch_index: int,
+    params: ScoringParams,
+    weights: dict[str, float] | None = None,
+) -> CandidateScore:
+    """Score a single generation candidate across all dimensions.
+
+    Returns a ``CandidateScore`` with per-dimension breakdowns and a
+    weighted total score in [0, 1].
+    """
+    return score_candidates([(batch_index, notes, channel_notes)], params, weights)[0]
+
+
 def select_best_candidate(
     candidates: list[CandidateScore],
 ) -> CandidateScore:
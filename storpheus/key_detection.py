@@ -58,6 +58,18 @@ def _pearson(x: list[float], y: tuple[float, ...]) -> float:
     return num / (den_x * den_y)
 
 
+def _centered(values: tuple[float, ...]) -> tuple[tuple[float, ...], float]:
+    """Deviations from the mean and their L2 norm (Pearson building blocks)."""
+    mean = sum(values) / len(values)
+    dev = tuple(v - mean for v in values)
+    return dev, math.sqrt(sum(d * d for d in dev))
+
+
+# The profiles never change, so their Pearson terms are computed once.
+_MAJOR_DEV, _MAJOR_NORM = _centered(MAJOR_PROFILE)
+_MINOR_DEV, _MINOR_NORM = _centered(MINOR_PROFILE)
+
+
 def _rotate(distribution: list[float], n: int) -> list[float]:
     """Rotate a 12-element list by *n* positions to the left.
 
@@ -85,18 +97,42 @@ def detect_key_from_pitches(
     for p in pitches:
         pc_counts[p % 12] += 1.0
 
+    return detect_key_from_histogram(pc_counts)
+
+
+def detect_key_from_histogram(
+    pc_counts: list[float],
+) -> tuple[str, str, float] | None:
+    """Detect key from a 12-bin pitch-class histogram.
+
+    Lets callers that already hold a histogram (e.g. the candidate
+    scorer) skip a second pass over the notes. The ``min_notes`` check
+    is the caller's responsibility.
+    """
     total = sum(pc_counts)
     if total == 0:
         return None
 
+    # Rotation only permutes the histogram, so its mean and norm are
+    # shared by all 24 correlations; only the dot products differ.
+    dev, norm = _centered(tuple(pc_counts))
+    major_den = norm * _MAJOR_NORM
+    minor_den = norm * _MINOR_NORM
+
     best_key: str | None = None
     best_mode: str | None = None
     best_corr = -2.0
 
     for root in range(12):
-        rotated = _rotate(pc_counts, root)
-        corr_major = _pearson(rotated, MAJOR_PROFILE)
-        corr_minor = _pearson(rotated, MINOR_PROFILE)
+        rotated = dev[root:] + dev[:root]
+        corr_major = (
+            sum(a * b for a, b in zip(rotated, _MAJOR_DEV)) / major_den
+            if major_den else 0.0
+        )
+        corr_minor = (
+            sum(a * b for a, b in zip(rotated, _MINOR_DEV)) / minor_den
+            if minor_den else 0.0
+        )
 
         if corr_major > best_corr:
             best_corr = corr_major
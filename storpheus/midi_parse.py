@@ -0,0 +1,257 @@
+"""Single-pass columnar MIDI parser for Orpheus output.
+
+``parse_midi_to_notes`` sits on the hot path of every generation and every
+``filter_channels_for_instruments`` call. The original implementation built
+a mido ``Message`` object per event and closed each note by scanning the
+channel's note list backwards for a note still carrying the 0.5-beat
+placeholder duration — quadratic on dense tracks, and wrong whenever a
+note's real duration happened to be 0.5.
+
+``parse_midi_columns`` reads the Standard MIDI File bytes directly and
+pairs note-on/note-off events through per-(channel, pitch) stacks of open
+notes, so each event is O(1). Notes come back as per-channel columns
+(``array`` buffers for pitch, start, duration and velocity);
+``ParsedMidiColumns.to_result`` is the adapter that produces the
+dict-of-lists ``ParsedMidiResult`` shape the rest of the service consumes.
+
+Semantics match the mido-based parser it replaces:
+    - beats are ``round(ticks / ticks_per_beat, 3)``
+    - a note-off (or note-on with velocity 0) closes the most recent open
+      note of the same channel and pitch
+    - notes that are never closed keep a 0.5-beat duration
+    - meta events do not update running status; sysex events do
+    - a truncated final track chunk is read up to its last complete event,
+      and a file with fewer tracks than MThd declares keeps the tracks it
+      has (both logged as warnings rather than rejected)
+"""
+
+from __future__ import annotations
+
+import logging
+from array import array
+from dataclasses import dataclass, field
+
+from storpheus_types import (
+    ParsedMidiResult,
+    StorpheusAftertouch,
+    StorpheusCCEvent,
+    StorpheusNoteDict,
+    StorpheusPitchBend,
+)
+
+logger = logging.getLogger(__name__)
+
+UNCLOSED_NOTE_BEATS = 0.5
+
+# Data-byte count for each channel-voice status nibble.
+_CHANNEL_DATA_LEN = {0x8: 2, 0x9: 2, 0xA: 2, 0xB: 2, 0xC: 1, 0xD: 1, 0xE: 2}
+# Data-byte count for system common / realtime status bytes (0xF1–0xFE).
+_SYSTEM_DATA_LEN = {0xF1: 1, 0xF2: 2, 0xF3: 1}
+
+
+class MidiParseError(ValueError):
+    """The file is not a well-formed Standard MIDI File."""
+
+
+@dataclass
+class NoteColumns:
+    """Notes for one channel, stored column-wise in parse order."""
+
+    pitch: array[int] = field(default_factory=lambda: array("B"))
+    start_beat: array[float] = field(default_factory=lambda: array("d"))
+    duration_beats: array[float] = field(default_factory=lambda: array("d"))
+    velocity: array[int] = field(default_factory=lambda: array("B"))
+
+    def __len__(self) -> int:
+        return len(self.pitch)
+
+    def append(self, pitch: int, start_beat: float, velocity: int) -> int:
+        """Append an open note and return its row index."""
+        self.pitch.append(pitch)
+        self.start_beat.append(start_beat)
+        self.duration_beats.append(UNCLOSED_NOTE_BEATS)
+        self.velocity.append(velocity)
+        return len(self.pitch) - 1
+
+    def to_dicts(self) -> list[StorpheusNoteDict]:
+        return [
+            {"pitch": p, "start_beat": s, "duration_beats": d, "velocity": v}
+            for p, s, d, v in zip(
+                self.pitch, self.start_beat, self.duration_beats, self.velocity,
+            )
+        ]
+
+
+@dataclass
+class ParsedMidiColumns:
+    """Columnar parse result: notes as arrays, expressive events as dicts."""
+
+    ticks_per_beat: int
+    notes: dict[int, NoteColumns] = field(default_factory=dict)
+    cc_events: dict[int, list[StorpheusCCEvent]] = field(default_factory=dict)
+    pitch_bends: dict[int, list[StorpheusPitchBend]] = field(default_factory=dict)
+    aftertouch: dict[int, list[StorpheusAftertouch]] = field(default_factory=dict)
+    program_changes: dict[int, int] = field(default_factory=dict)
+
+    def to_result(self) -> ParsedMidiResult:
+        """Dict view consumed by filtering, post-processing and the API."""
+        return {
+            "notes": {ch: cols.to_dicts() for ch, cols in self.notes.items()},
+            "cc_events": self.cc_events,
+            "pitch_bends": self.pitch_bends,
+            "aftertouch": self.aftertouch,
+            "program_changes": self.program_changes,
+        }
+
+
+def _read_vlq(data: bytes, pos: int, end: int) -> tuple[int, int]:
+    value = 0
+    while pos < end:
+        byte = data[pos]
+        pos += 1
+        value = (value << 7) | (byte & 0x7F)
+        if byte < 0x80:
+            return value, pos
+    raise MidiParseError("truncated variable-length quantity")
+
+
+def parse_midi_bytes(data: bytes) -> ParsedMidiColumns:
+    """Parse a Standard MIDI File held in memory."""
+    if len(data) < 14 or data[:4] != b"MThd":
+        raise MidiParseError("missing MThd header")
+    header_len = int.from_bytes(data[4:8], "big")
+    n_tracks = int.from_bytes(data[10:12], "big")
+    division = int.from_bytes(data[12:14], "big")
+    if division & 0x8000:
+        raise MidiParseError("SMPTE time division is not supported")
+    ticks_per_beat = division
+
+    parsed = ParsedMidiColumns(ticks_per_beat=ticks_per_beat)
+    # (channel, pitch) → row indices of open notes, most recent last.
+    open_notes: dict[tuple[int, int], list[int]] = {}
+
+    pos = 8 + header_len
+    tracks_read = 0
+    while tracks_read < n_tracks and pos + 8 <= len(data):
+        chunk_id = data[pos:pos + 4]
+        chunk_len = int.from_bytes(data[pos + 4:pos + 8], "big")
+        pos += 8
+        end = pos + chunk_len
+        truncated = end > len(data)
+        if truncated:
+            logger.warning(
+                f"⚠️ MIDI track chunk declares {chunk_len} bytes, "
+                f"only {len(data) - pos} present — reading what is there"
+            )
+            end = len(data)
+        if chunk_id != b"MTrk":
+            pos = end
+            continue
+        try:
+            _parse_track(data, pos, end, ticks_per_beat, parsed, open_notes)
+        except MidiParseError:
+            if not truncated:
+                raise
+        tracks_read += 1
+        pos = end
+
+    if tracks_read < n_tracks:
+        logger.warning(f"⚠️ MIDI header declares {n_tracks} tracks, found {tracks_read}")
+
+    return parsed
+
+
+def _parse_track(
+    data: bytes,
+    pos: int,
+    end: int,
+    ticks_per_beat: int,
+    parsed: ParsedMidiColumns,
+    open_notes: dict[tuple[int, int], list[int]],
+) -> None:
+    notes = parsed.notes
+    ticks = 0
+    running: int | None = None
+
+    while pos < end:
+        delta, pos = _read_vlq(data, pos, end)
+        ticks += delta
+        if pos >= end:
+            raise MidiParseError("truncated event")
+        status = data[pos]
+
+        if status < 0x80:
+            if running is None:
+                raise MidiParseError("running status without a previous status byte")
+            status = running
+        else:
+            pos += 1
+            if status != 0xFF:
+                running = status
+
+        if status == 0xFF:
+            if pos >= end:
+                raise MidiParseError("truncated meta event")
+            length, pos = _read_vlq(data, pos + 1, end)
+            pos += length
+            continue
+        if status in (0xF0, 0xF7):
+            length, pos = _read_vlq(data, pos, end)
+            pos += length
+            continue
+        if status >= 0xF0:
+            pos += _SYSTEM_DATA_LEN.get(status, 0)
+            continue
+
+        kind = status >> 4
+        ch = status & 0x0F
+        n_data = _CHANNEL_DATA_LEN[kind]
+        if pos + n_data > end:
+            raise MidiParseError("truncated channel message")
+        d1 = data[pos]
+        d2 = data[pos + 1] if n_data == 2 else 0
+        pos += n_data
+        beat = round(ticks / ticks_per_beat, 3)
+
+        if kind == 0x9 and d2 > 0:
+            cols = notes.get(ch)
+            if cols is None:
+                cols = notes[ch] = NoteColumns()
+            row = cols.append(d1, beat, d2)
+            open_notes.setdefault((ch, d1), []).append(row)
+
+        elif kind == 0x8 or kind == 0x9:
+            stack = open_notes.get((ch, d1))
+            if stack:
+                row = stack.pop()
+                cols = notes[ch]
+                cols.duration_beats[row] = round(beat - cols.start_beat[row], 3)
+
+        elif kind == 0xB:
+            parsed.cc_events.setdefault(ch, []).append(
+                {"cc": d1, "beat": beat, "value": d2},
+            )
+
+        elif kind == 0xE:
+            parsed.pitch_bends.setdefault(ch, []).append(
+                {"beat": beat, "value": ((d2 << 7) | d1) - 8192},
+            )
+
+        elif kind == 0xD:
+            parsed.aftertouch.setdefault(ch, []).append(
+                {"beat": beat, "value": d1},
+            )
+
+        elif kind == 0xA:
+            parsed.aftertouch.setdefault(ch, []).append(
+                {"beat": beat, "value": d2, "pitch": d1},
+            )
+
+        elif kind == 0xC:
+            parsed.program_changes[ch] = d1
+
+
+def parse_midi_columns(midi_path: str) -> ParsedMidiColumns:
+    """Parse *midi_path* into columnar notes plus expressive events."""
+    with open(midi_path, "rb") as f:
+        return parse_midi_bytes(f.read())
@@ -11,22 +11,23 @@ This is where UX philosophy and musical taste live.
 """
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import Any, NamedTuple
 
-from fastapi import FastAPI, Query
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Header, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 from gradio_client import Client, handle_file
 from dataclasses import dataclass, field
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from enum import Enum
 from time import monotonic, time
 import uuid
 import asyncio
 import math
+import threading
 import mido
 import random
 import statistics
@@ -53,9 +54,12 @@ from generation_policy import (
 )
 from quality_metrics import analyze_quality, compare_generations, rejection_score
 from seed_selector import select_seed, select_seed_with_key, SeedSelection
-from midi_transforms import transpose_midi
+from seed_prep import SeedPrepCache
+from midi_parse import parse_midi_columns
 from candidate_scorer import score_candidate, select_best_candidate, CandidateScore
 from post_processing import build_post_processor
+from result_cache import CacheEntry as CacheEntry # re-exported for callers of the cache API
+from result_cache import IntentIndex, ResultCacheBackend, create_result_cache_backend
 from storpheus_types import (
     BestCandidate,
     CacheKeyData,
@@ -87,7 +91,7 @@ async def _lifespan(application: FastAPI) -> AsyncIterator[None]:
     _job_queue = JobQueue(max_queue=_MAX_QUEUE_DEPTH, max_workers=_MAX_CONCURRENT)
     await _job_queue.start()
 
-    loaded = _load_cache_from_disk()
+    loaded = await asyncio.to_thread(_load_cache_from_disk)
     if loaded:
         logger.info(f"✅ Startup: restored {loaded} cached results from disk")
     keepalive_task = asyncio.create_task(_keepalive_loop())
@@ -110,9 +114,22 @@ _MAX_CONCURRENT = int(os.environ.get("STORPHEUS_MAX_CONCURRENT", "1"))
 _MAX_QUEUE_DEPTH = int(os.environ.get("STORPHEUS_MAX_QUEUE_DEPTH", "20"))
 _JOB_TTL_SECONDS = int(os.environ.get("STORPHEUS_JOB_TTL", "300")) # 5 min
 _COOLDOWN_SECONDS = float(os.environ.get("STORPHEUS_COOLDOWN_SECONDS", "3"))
+# Queued jobs nobody has polled for this long are dropped before they run.
+_JOB_ABANDON_SECONDS = float(os.environ.get("STORPHEUS_JOB_ABANDON_SECONDS", "90"))
+# Interactive jobs dispatched per batch job while both classes are waiting.
+_INTERACTIVE_WEIGHT = int(os.environ.get("STORPHEUS_INTERACTIVE_WEIGHT", "4"))
+# Queued interactive jobs per tenant; further submits are scheduled as batch,
+# so a caller cannot claim the interactive class for an unbounded backlog.
+_INTERACTIVE_PER_TENANT = int(os.environ.get("STORPHEUS_INTERACTIVE_PER_TENANT", "8"))
+# Job updates buffered per /jobs/events stream before a slow stream is dropped
+# (its caller then falls back to polling /jobs/{id}/wait).
+_JOB_STREAM_BUFFER = int(os.environ.get("STORPHEUS_JOB_STREAM_BUFFER", "256"))
+_JOB_STREAM_KEEPALIVE_SECONDS = 15.0
 
 _CACHE_DIR = pathlib.Path(os.environ.get("STORPHEUS_CACHE_DIR", "/tmp/storpheus_cache"))
-_CACHE_FILE = _CACHE_DIR / "result_cache.json"
+# sqlite (default) — shared per-entry store, safe across worker processes on one host.
+# json — legacy whole-file snapshot. memory — no persistence.
+_CACHE_BACKEND = os.environ.get("STORPHEUS_CACHE_BACKEND", "sqlite")
 
 # ── Storpheus config flags ─────────────────────────────────────────────
 STORPHEUS_PRESERVE_ALL_CHANNELS = os.environ.get("STORPHEUS_PRESERVE_ALL_CHANNELS", "true").lower() in ("1", "true", "yes")
@@ -163,6 +180,17 @@ _CHUNKED_GEN_THRESHOLD_BARS: int = int(
 _CHUNK_BARS: int = int(os.environ.get("STORPHEUS_CHUNK_BARS", "8"))
 _CHUNK_FADE_BEATS: float = float(os.environ.get("STORPHEUS_CHUNK_FADE_BEATS", "4.0"))
 
+# STORPHEUS_CHUNK_PARALLELISM — chunks generated concurrently for multi-instrument
+# requests. Default 1: strictly sequential sliding window (no regression).
+# Above 1, every chunk starts from the seed library in its own session instead of
+# waiting for the previous chunk's MIDI, trading continuity for wall-clock time;
+# the boundary velocity fade smooths the seams. Each concurrent chunk gets its
+# own Gradio client slot, offset by _CHUNK_CLIENT_SLOT_BASE to stay clear of
+# JobQueue worker ids. Lanes beyond the first borrow idle JobQueue slots, so
+# they count against STORPHEUS_MAX_CONCURRENT.
+_CHUNK_PARALLELISM: int = int(os.environ.get("STORPHEUS_CHUNK_PARALLELISM", "1"))
+_CHUNK_CLIENT_SLOT_BASE = 1000
+
 
 @dataclass
 class GenerationTiming:
@@ -311,16 +339,83 @@ from time import time
 MAX_CACHE_SIZE = 1000 # Maximum number of cached results
 CACHE_TTL_SECONDS = 86400 # 24 hours
 
-@dataclass
-class CacheEntry:
-    """Cache entry with TTL support and key data for fuzzy matching."""
-    result: dict[str, object]
-    timestamp: float
-    hits: int = 0
-    key_data: CacheKeyData | None = None
-
-# Result cache: stores complete generation results (LRU with TTL)
+# Result cache: process-local LRU in front of the shared backend.
+# Inserts write through to the backend; misses read through from it.
 _result_cache: OrderedDict[str, CacheEntry] = OrderedDict()
+_cache_backend: ResultCacheBackend | None = None
+# Backend generation the local LRU was filled under; a /cache/clear on any
+# worker bumps the backend's, and the local LRU is dropped on the next lookup.
+_cache_generation: int | None = None
+# Fuzzy-lookup index over _result_cache entries that carry key_data.
+_intent_index = IntentIndex(step=_INTENT_QUANT_STEP)
+# The lookup/insert functions below run in worker threads (asyncio.to_thread)
+# so backend I/O stays off the event loop; this guards the local LRU state.
+_cache_lock = threading.RLock()
+
+
+def _get_cache_backend() -> ResultCacheBackend:
+    """Return the shared cache backend, opening it on first use."""
+    global _cache_backend
+    if _cache_backend is None:
+        _cache_backend = create_result_cache_backend(
+            _CACHE_BACKEND, _CACHE_DIR,
+            max_entries=MAX_CACHE_SIZE, ttl_seconds=CACHE_TTL_SECONDS,
+        )
+        logger.info(f"💾 Result cache backend: {_cache_backend.name}")
+    return _cache_backend
+
+
+def _remember_locally(cache_key: str, entry: CacheEntry) -> None:
+    """Insert into the process-local LRU, evicting its oldest entry if full."""
+    if cache_key not in _result_cache and len(_result_cache) >= MAX_CACHE_SIZE:
+        oldest_key, oldest_entry = _result_cache.popitem(last=False)
+        _intent_index.discard(oldest_key)
+        logger.info(f"🗑️ Evicted cache entry {oldest_key} (hits: {oldest_entry.hits})")
+    _result_cache[cache_key] = entry
+    _result_cache.move_to_end(cache_key)
+    if entry.key_data is not None:
+        _intent_index.add(cache_key, entry.key_data)
+    else:
+        _intent_index.discard(cache_key)
+
+
+def clear_result_cache() -> None:
+    """Drop every cached result, locally and in the shared backend."""
+    global _cache_generation
+    with _cache_lock:
+        _result_cache.clear()
+        _intent_index.clear()
+        backend = _get_cache_backend()
+        backend.clear()
+        _cache_generation = backend.generation()
+
+
+def _sync_cache_generation() -> bool:
+    """Drop the local LRU if another worker cleared the shared cache.
+
+    Returns False when the backend cannot be read; callers then treat the
+    lookup as a miss rather than serve possibly-cleared local entries.
+    """
+    global _cache_generation
+    try:
+        generation = _get_cache_backend().generation()
+    except Exception as e:
+        logger.warning(f"⚠️ Cache backend unavailable: {e}")
+        return False
+    if _cache_generation is not None and generation != _cache_generation:
+        logger.info(f"🗑️ Cache cleared by another worker — dropping {len(_result_cache)} local entries")
+        _result_cache.clear()
+        _intent_index.clear()
+    _cache_generation = generation
+    return True
+
+
+def _try_backend(op: str, action: Callable[[ResultCacheBackend], None]) -> None:
+    """Run a best-effort backend write; failures are logged, never raised."""
+    try:
+        action(_get_cache_backend())
+    except Exception as e:
+        logger.warning(f"⚠️ Cache backend {op} failed: {e}")
 
 
 def _quantize(value: float, step: float = _INTENT_QUANT_STEP) -> float:
@@ -379,47 +474,63 @@ def get_cached_result(cache_key: str) -> dict[str, object] | None:
     """
     Get cached generation result if available and not expired.
     
-    Implements LRU: moves accessed item to end of OrderedDict.
+    Implements LRU: moves accessed item to end of OrderedDict. Local misses
+    read through to the shared backend, so results generated by another
+    worker process are reused.
     """
-    if cache_key not in _result_cache:
-        logger.info(f"❌ Cache miss for {cache_key}")
-        return None
-    
-    entry = _result_cache[cache_key]
-    
-    # Check TTL
-    age = time() - entry.timestamp
-    if age > CACHE_TTL_SECONDS:
-        logger.info(f"⏰ Cache expired for {cache_key} (age: {age:.0f}s)")
-        del _result_cache[cache_key]
-        return None
-    
-    # LRU: move to end (most recently used)
-    _result_cache.move_to_end(cache_key)
-    entry.hits += 1
-    
-    logger.info(f"✅ Cache hit for {cache_key} (hits: {entry.hits}, age: {age:.0f}s)")
-    return copy.deepcopy(entry.result)
+    with _cache_lock:
+        if not _sync_cache_generation():
+            return None
+        entry = _result_cache.get(cache_key)
+        if entry is None:
+            try:
+                entry = _get_cache_backend().get(cache_key)
+            except Exception as e:
+                logger.warning(f"⚠️ Cache backend read failed for {cache_key}: {e}")
+                return None
+            if entry is None:
+                logger.info(f"❌ Cache miss for {cache_key}")
+                return None
+            _remember_locally(cache_key, entry)
+
+        # Check TTL
+        age = time() - entry.timestamp
+        if age > CACHE_TTL_SECONDS:
+            logger.info(f"⏰ Cache expired for {cache_key} (age: {age:.0f}s)")
+            del _result_cache[cache_key]
+            _intent_index.discard(cache_key)
+            _try_backend("delete", lambda b: b.delete(cache_key))
+            return None
+
+        # LRU: move to end (most recently used)
+        _result_cache.move_to_end(cache_key)
+        entry.hits += 1
+        _try_backend("hit update", lambda b: b.record_hit(cache_key))
+
+        logger.info(f"✅ Cache hit for {cache_key} (hits: {entry.hits}, age: {age:.0f}s)")
+        return copy.deepcopy(entry.result)
 
 
 def cache_result(cache_key: str, result: dict[str, object], key_data: CacheKeyData | None = None) -> None:
     """
-    Cache a generation result with LRU eviction + disk persistence.
+    Cache a generation result with LRU eviction + write-through persistence.
 
-    If cache is full, evicts least recently used item.
+    If the local cache is full, evicts its least recently used item. The
+    backend persists only this entry and applies its own TTL/LRU bounds.
     """
-    if len(_result_cache) >= MAX_CACHE_SIZE:
-        oldest_key, oldest_entry = _result_cache.popitem(last=False)
-        logger.info(f"🗑️ Evicted cache entry {oldest_key} (hits: {oldest_entry.hits})")
-
-    _result_cache[cache_key] = CacheEntry(
-        result=result,
-        timestamp=time(),
-        hits=0,
-        key_data=key_data,
-    )
-    logger.info(f"💾 Cached result {cache_key} (cache size: {len(_result_cache)})")
-    _save_cache_to_disk()
+    with _cache_lock:
+        entry = CacheEntry(
+            result=result,
+            timestamp=time(),
+            hits=0,
+            key_data=key_data,
+        )
+        _remember_locally(cache_key, entry)
+        logger.info(f"💾 Cached result {cache_key} (cache size: {len(_result_cache)})")
+        try:
+            _get_cache_backend().put(cache_key, entry)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to persist cache entry {cache_key}: {e}")
 
 
 def fuzzy_cache_lookup(request: GenerateRequest, epsilon: float = _FUZZY_EPSILON) -> dict[str, object] | None:
@@ -427,95 +538,64 @@ def fuzzy_cache_lookup(request: GenerateRequest, epsilon: float = _FUZZY_EPSILON
     Find the nearest cached result within ε distance on intent vector axes.
 
     Only considers entries with matching genre, instruments, bars, and preset.
+    Candidates come from ``_intent_index``, which probes only the bucket for
+    those fields and the grid cells within ε, so misses cost the same
+    regardless of cache size.
     Returns the result dict (with 'approximate': True in metadata) or None.
     """
-    if not _result_cache:
-        return None
+    with _cache_lock:
+        if not _result_cache or not _sync_cache_generation():
+            return None
 
-    now = time()
-    req_data = _cache_key_data(request)
-    best_dist = float("inf")
-    best_entry: CacheEntry | None = None
+        now = time()
+        req_data = _cache_key_data(request)
+        best_dist = float("inf")
+        best_entry: CacheEntry | None = None
 
-    for key, entry in _result_cache.items():
-        if now - entry.timestamp > CACHE_TTL_SECONDS:
-            continue
-        if not hasattr(entry, "key_data") or entry.key_data is None:
-            continue
-        kd = entry.key_data
-        if (kd.get("genre") != req_data["genre"]
-                or kd.get("instruments") != req_data["instruments"]
-                or kd.get("bars") != req_data["bars"]
-                or kd.get("quality_preset") != req_data["quality_preset"]):
-            continue
+        for key in _intent_index.candidates(req_data, epsilon):
+            entry = _result_cache.get(key)
+            if entry is None or entry.key_data is None:
+                continue
+            if now - entry.timestamp > CACHE_TTL_SECONDS:
+                continue
 
-        dist = _intent_distance(req_data, kd)
-        if dist < best_dist:
-            best_dist = dist
-            best_entry = entry
-
-    if best_entry is not None and best_dist <= epsilon:
-        best_entry.hits += 1
-        logger.info(f"🎯 Fuzzy cache hit (dist={best_dist:.3f}, ε={epsilon})")
-        result: dict[str, object] = {**best_entry.result}
-        raw_meta = result.get("metadata")
-        if isinstance(raw_meta, dict):
-            meta: dict[str, object] = {**raw_meta}
-            meta["cache_hit"] = True
-            meta["approximate"] = True
-            meta["fuzzy_distance"] = round(best_dist, 4)
-            result["metadata"] = meta
-        return result
+            dist = _intent_distance(req_data, entry.key_data)
+            if dist < best_dist:
+                best_dist = dist
+                best_entry = entry
+
+        if best_entry is not None and best_dist <= epsilon:
+            best_entry.hits += 1
+            logger.info(f"🎯 Fuzzy cache hit (dist={best_dist:.3f}, ε={epsilon})")
+            result: dict[str, object] = {**best_entry.result}
+            raw_meta = result.get("metadata")
+            if isinstance(raw_meta, dict):
+                meta: dict[str, object] = {**raw_meta}
+                meta["cache_hit"] = True
+                meta["approximate"] = True
+                meta["fuzzy_distance"] = round(best_dist, 4)
+                result["metadata"] = meta
+            return result
 
-    return None
+        return None
 
 
 # ── Disk persistence ─────────────────────────────────────────────────
 
-def _save_cache_to_disk() -> None:
-    """Persist the result cache to disk so it survives restarts."""
-    try:
-        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        serializable = {}
-        for key, entry in _result_cache.items():
-            serializable[key] = {
-                "result": entry.result,
-                "timestamp": entry.timestamp,
-                "hits": entry.hits,
-                "key_data": entry.key_data if hasattr(entry, "key_data") else None,
-            }
-        tmp = _CACHE_FILE.with_suffix(".tmp")
-        tmp.write_text(json.dumps(serializable, default=str))
-        tmp.rename(_CACHE_FILE)
-        logger.debug(f"💾 Cache persisted to disk ({len(serializable)} entries)")
-    except Exception as e:
-        logger.warning(f"⚠️ Failed to persist cache: {e}")
-
-
 def _load_cache_from_disk() -> int:
-    """Load cached results from disk on startup. Returns number of entries loaded."""
-    if not _CACHE_FILE.exists():
-        return 0
-    try:
-        data = json.loads(_CACHE_FILE.read_text())
-        now = time()
-        loaded = 0
-        for key, entry_data in data.items():
-            if now - entry_data["timestamp"] > CACHE_TTL_SECONDS:
-                continue
-            entry = CacheEntry(
-                result=entry_data["result"],
-                timestamp=entry_data["timestamp"],
-                hits=entry_data.get("hits", 0),
-            )
-            entry.key_data = entry_data.get("key_data")
-            _result_cache[key] = entry
-            loaded += 1
-        logger.info(f"📂 Loaded {loaded} cached results from disk (skipped {len(data) - loaded} expired)")
-        return loaded
-    except Exception as e:
-        logger.warning(f"⚠️ Failed to load cache from disk: {e}")
-        return 0
+    """Warm the local cache from the backend on startup. Returns number of entries loaded."""
+    with _cache_lock:
+        try:
+            _sync_cache_generation()
+            loaded = 0
+            for key, entry in _get_cache_backend().load(limit=MAX_CACHE_SIZE):
+                _remember_locally(key, entry)
+                loaded += 1
+            logger.info(f"📂 Loaded {loaded} cached results from {_get_cache_backend().name} backend")
+            return loaded
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to load cache from disk: {e}")
+            return 0
 
 
 class RoleProfileSummary(BaseModel):
@@ -577,6 +657,12 @@ class IntentGoal(BaseModel):
     constraint_type: str = "soft" # "hard" | "soft"
 
 
+class JobPriority(str, Enum):
+    """Scheduling class. Interactive jobs are dispatched ahead of batch jobs."""
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
 class GenerateRequest(BaseModel):
     """Music generation request.
 
@@ -614,6 +700,9 @@ class GenerateRequest(BaseModel):
     add_outro: bool = False
     unified_output: bool = False
 
+    # ── Scheduling ──
+    priority: JobPriority = JobPriority.INTERACTIVE
+
 
 class GenerateResponse(BaseModel):
     """Response from a generation request.
@@ -703,21 +792,242 @@ class Job:
     position: int = 0
     dedupe_key: str | None = None
     composition_id: str | None = None
+    waiter_tokens: set[str] = field(default_factory=set) # one per submit attached to this job
+    priority: JobPriority = JobPriority.INTERACTIVE
+    tenant: str = "anonymous"
+    last_polled_at: float = 0.0
+    active_polls: int = 0
+    abandon_after_s: float | None = None # None = never dropped for lack of polling
+    streams: set[str] = field(default_factory=set) # /jobs/events streams to push updates to
+    waiter_streams: dict[str, str] = field(default_factory=dict) # waiter token -> stream it waits on
+
+    @property
+    def waiters(self) -> int:
+        """Submitters attached to this job (>1 when coalesced)."""
+        return len(self.waiter_tokens)
+
+    def is_abandoned(self, now: float) -> bool:
+        """True when callers stopped polling long enough ago to have given up."""
+        if self.abandon_after_s is None or self.active_polls > 0:
+            return False
+        return now - max(self.last_polled_at, self.created_at) > self.abandon_after_s
+
+
+class JobTicket(NamedTuple):
+    """What ``JobQueue.submit`` hands one submitter: the (possibly shared)
+    job and the waiter token that submitter cancels with."""
+    job: Job
+    waiter: str
+
+
+# Upper bounds (seconds) of the queue wait-time histogram buckets.
+_WAIT_BUCKETS: tuple[float, ...] = (0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class _WaitHistogram:
+    """Cumulative wait-time histogram (Prometheus-style ``le`` buckets)."""
+
+    def __init__(self) -> None:
+        self._counts = [0] * (len(_WAIT_BUCKETS) + 1)
+        self._sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        for i, bound in enumerate(_WAIT_BUCKETS):
+            if seconds <= bound:
+                self._counts[i] += 1
+                break
+        else:
+            self._counts[-1] += 1
+        self._sum += seconds
+
+    def snapshot(self) -> dict[str, object]:
+        buckets: dict[str, int] = {}
+        running = 0
+        for bound, count in zip(_WAIT_BUCKETS, self._counts):
+            running += count
+            buckets[f"le_{bound:g}"] = running
+        total = running + self._counts[-1]
+        buckets["le_inf"] = total
+        return {"count": total, "sum_s": round(self._sum, 3), "buckets": buckets}
+
+
+class _FairScheduler:
+    """Priority classes with per-tenant round-robin inside each class.
+
+    Each class keeps one FIFO per tenant (composition_id); dispatch rotates
+    across tenants, so one composition flooding the queue only delays its
+    own jobs. Interactive jobs go first, but after ``interactive_weight``
+    consecutive interactive dispatches a waiting batch job gets a turn so
+    warm/sweep work cannot starve entirely.
+    """
+
+    def __init__(self, maxsize: int, interactive_weight: int) -> None:
+        self._maxsize = maxsize
+        self._interactive_weight = max(1, interactive_weight)
+        self._lanes: dict[JobPriority, OrderedDict[str, deque[Job]]] = {
+            p: OrderedDict() for p in JobPriority
+        }
+        self._size = 0
+        self._since_batch = 0
+        self._available = asyncio.Semaphore(0)
+
+    def qsize(self) -> int:
+        return self._size
+
+    def depth_of(self, priority: JobPriority) -> int:
+        return sum(len(q) for q in self._lanes[priority].values())
+
+    def tenant_depth(self, priority: JobPriority, tenant: str) -> int:
+        lane = self._lanes[priority].get(tenant)
+        return len(lane) if lane else 0
+
+    def put_nowait(self, job: Job) -> None:
+        if self._size >= self._maxsize:
+            raise asyncio.QueueFull
+        self._lanes[job.priority].setdefault(job.tenant, deque()).append(job)
+        self._size += 1
+        self._available.release()
+
+    def promote(self, job: Job, priority: JobPriority) -> None:
+        """Move a still-queued *job* to another class, keeping it queued."""
+        lane = self._lanes[job.priority].get(job.tenant)
+        if lane is None or job not in lane:
+            job.priority = priority
+            return
+        lane.remove(job)
+        if not lane:
+            del self._lanes[job.priority][job.tenant]
+        job.priority = priority
+        self._lanes[priority].setdefault(job.tenant, deque()).append(job)
+
+    def _pick_class(self) -> JobPriority:
+        interactive = self._lanes[JobPriority.INTERACTIVE]
+        batch = self._lanes[JobPriority.BATCH]
+        if batch and (not interactive or self._since_batch >= self._interactive_weight):
+            self._since_batch = 0
+            return JobPriority.BATCH
+        self._since_batch += 1
+        return JobPriority.INTERACTIVE
+
+    async def get(self) -> Job:
+        await self._available.acquire()
+        tenants = self._lanes[self._pick_class()]
+        tenant, lane = next(iter(tenants.items()))
+        job = lane.popleft()
+        del tenants[tenant]
+        if lane:
+            tenants[tenant] = lane # rotate tenant to the back
+        self._size -= 1
+        return job
+
+
+JobStreamEvent = dict[str, object] | None
+"""A ``_job_response`` payload, or ``None`` to end the stream."""
+
+
+class JobEventHub:
+    """Pushes job updates to long-lived ``/jobs/events`` streams.
+
+    Each Maestro worker holds one stream, named by an id it chooses, and
+    submits with ``X-Job-Stream: <id>``. Every status change of those jobs
+    (running, complete, failed, canceled) is pushed to the stream, so one
+    connection replaces a long-poll per in-flight job. Coalesced jobs push
+    to every stream attached to them.
+
+    A stream that falls ``_JOB_STREAM_BUFFER`` updates behind is closed
+    rather than allowed to miss an update; its caller polls instead.
+    """
+
+    def __init__(self, buffer: int = _JOB_STREAM_BUFFER) -> None:
+        self._buffer = buffer
+        self._streams: dict[str, asyncio.Queue[JobStreamEvent]] = {}
+
+    def open(self, stream_id: str) -> asyncio.Queue[JobStreamEvent]:
+        """Register a stream, replacing (and ending) any previous one with the same id."""
+        previous = self._streams.pop(stream_id, None)
+        if previous is not None:
+            self._end(previous)
+        queue: asyncio.Queue[JobStreamEvent] = asyncio.Queue(maxsize=self._buffer)
+        self._streams[stream_id] = queue
+        return queue
+
+    def close(self, stream_id: str, queue: asyncio.Queue[JobStreamEvent]) -> None:
+        if self._streams.get(stream_id) is queue:
+            del self._streams[stream_id]
+
+    def is_open(self, stream_id: str) -> bool:
+        return stream_id in self._streams
+
+    def watching(self, job: Job) -> bool:
+        """True while a submitter still attached to *job* waits on it over a connected stream.
+
+        Interest is per waiter, not per stream: a stream stays connected for
+        the life of a Maestro worker, so only waiters that have not detached
+        (``JobQueue.cancel`` with their token) keep an unpolled job alive.
+        """
+        return any(sid in self._streams for sid in job.waiter_streams.values())
+
+    @property
+    def stream_count(self) -> int:
+        return len(self._streams)
+
+    def publish(self, job: Job) -> None:
+        """Push the job's current wire state to every stream attached to it."""
+        if not job.streams:
+            return
+        event = _job_response(job)
+        for sid in job.streams:
+            queue = self._streams.get(sid)
+            if queue is None:
+                continue
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning(f"⚠️ Job stream {sid[:8]} is {self._buffer} updates behind — closing it")
+                del self._streams[sid]
+                self._end(queue)
+
+    @staticmethod
+    def _end(queue: asyncio.Queue[JobStreamEvent]) -> None:
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
 
 
 class JobQueue:
     """Bounded async job queue with a fixed-size worker pool.
 
     Replaces the semaphore model: callers submit jobs and poll for results
-    instead of blocking on a single long HTTP request.
+    instead of blocking on a single long HTTP request. Dispatch order comes
+    from ``_FairScheduler`` (priority class, then per-tenant round-robin).
+    Queued jobs whose callers stopped polling are dropped before they run,
+    unless a submitter that has not detached is still waiting on them over a
+    connected ``/jobs/events`` stream.
+    Status changes are pushed to those streams through ``events``.
+
+    ``max_workers`` bounds GPU calls, not just jobs: a worker takes one of
+    ``max_workers`` slots before running a job, and parallel chunk lanes
+    borrow idle slots through ``borrow_slots``.
     """
 
-    def __init__(self, max_queue: int = 20, max_workers: int = 2) -> None:
-        self._queue: asyncio.Queue[Job] = asyncio.Queue(maxsize=max_queue)
+    def __init__(
+        self,
+        max_queue: int = 20,
+        max_workers: int = 2,
+        events: JobEventHub | None = None,
+    ) -> None:
+        self.events = events or JobEventHub()
+        self._queue = _FairScheduler(max_queue, _INTERACTIVE_WEIGHT)
         self._jobs: dict[str, Job] = {}
         self._dedupe: dict[str, str] = {} # dedupe_key -> job_id
+        self._coalesced_total = 0
+        self._abandoned_total = 0
+        self._wait_histograms: dict[JobPriority, _WaitHistogram] = {
+            p: _WaitHistogram() for p in JobPriority
+        }
         self._max_workers = max_workers
         self._max_queue = max_queue
+        self._slots = asyncio.Semaphore(max_workers)
         self._workers: list[asyncio.Task[None]] = []
         self._cleanup_task: asyncio.Task[None] | None = None
 
@@ -743,23 +1053,59 @@ class JobQueue:
         self._workers.clear()
         logger.info("🛑 JobQueue shut down")
 
-    def submit(self, request: GenerateRequest, dedupe_key: str | None = None) -> Job:
+    def submit(
+        self,
+        request: GenerateRequest,
+        dedupe_key: str | None = None,
+        abandon_after_s: float | None = None,
+        stream: str | None = None,
+    ) -> JobTicket:
         """Enqueue a generation request. Raises QueueFullError when at capacity.
 
+        The job is scheduled in ``request.priority``'s class under the tenant
+        ``request.composition_id``; once the tenant already has
+        ``_INTERACTIVE_PER_TENANT`` interactive jobs queued, further ones are
+        clamped to batch. With *abandon_after_s*, the job is dropped
+        instead of run if nobody polls it for that long while it is queued.
+
         If *dedupe_key* is provided and an in-flight job with the same key
-        exists (queued or running), the existing job is returned instead of
-        creating a duplicate.
+        exists (queued or running), the caller is attached to the existing
+        job as another waiter instead of creating a duplicate — N identical
+        requests cost one generation. Every submit gets its own waiter token;
+        ``cancel`` with that token detaches only this submitter.
+
+        With *stream*, the job's status changes are pushed to that
+        ``/jobs/events`` stream.
         """
+        tenant = request.composition_id or "anonymous"
+        priority = request.priority
+        if (priority == JobPriority.INTERACTIVE
+                and self._queue.tenant_depth(priority, tenant) >= _INTERACTIVE_PER_TENANT):
+            priority = JobPriority.BATCH
         if dedupe_key:
             existing_id = self._dedupe.get(dedupe_key)
             if existing_id:
                 existing = self._jobs.get(existing_id)
                 if existing and existing.status in (JobStatus.QUEUED, JobStatus.RUNNING):
+                    waiter = uuid.uuid4().hex
+                    existing.waiter_tokens.add(waiter)
+                    self._coalesced_total += 1
+                    existing.last_polled_at = time()
+                    if (priority == JobPriority.INTERACTIVE
+                            and existing.priority == JobPriority.BATCH
+                            and self._queue.tenant_depth(priority, existing.tenant)
+                            < _INTERACTIVE_PER_TENANT):
+                        self._queue.promote(existing, JobPriority.INTERACTIVE)
+                    if abandon_after_s is None:
+                        existing.abandon_after_s = None
+                    if stream:
+                        existing.streams.add(stream)
+                        existing.waiter_streams[waiter] = stream
                     logger.info(
-                        f"📥 Job {existing.id[:8]} deduplicated "
-                        f"(key {dedupe_key[:8]})"
+                        f"📥 Job {existing.id[:8]} coalesced "
+                        f"(key {dedupe_key[:8]}, {existing.waiters} waiters)"
                     )
-                    return existing
+                    return JobTicket(existing, waiter)
 
         job = Job(
             id=str(uuid.uuid4()),
@@ -767,7 +1113,15 @@ class JobQueue:
             created_at=time(),
             dedupe_key=dedupe_key,
             composition_id=request.composition_id,
+            priority=priority,
+            tenant=tenant,
+            abandon_after_s=abandon_after_s,
         )
+        waiter = uuid.uuid4().hex
+        job.waiter_tokens.add(waiter)
+        if stream:
+            job.streams.add(stream)
+            job.waiter_streams[waiter] = stream
         try:
             self._queue.put_nowait(job)
         except asyncio.QueueFull:
@@ -779,12 +1133,19 @@ class JobQueue:
         if dedupe_key:
             self._dedupe[dedupe_key] = job.id
         _cid = f"[{job.composition_id[:8]}]" if job.composition_id else ""
-        logger.info(f"📥{_cid} Job {job.id[:8]} queued (position {job.position})")
-        return job
+        logger.info(
+            f"📥{_cid} Job {job.id[:8]} queued "
+            f"({job.priority.value}, position {job.position})"
+        )
+        return JobTicket(job, waiter)
 
     def get_job(self, job_id: str) -> Job | None:
         return self._jobs.get(job_id)
 
+    def touch(self, job: Job) -> None:
+        """Record that a caller is still interested in *job*."""
+        job.last_polled_at = time()
+
     @property
     def depth(self) -> int:
         return self._queue.qsize()
@@ -794,64 +1155,143 @@ class JobQueue:
         return sum(1 for j in self._jobs.values() if j.status == JobStatus.RUNNING)
 
     def status_snapshot(self) -> dict[str, object]:
+        in_flight = [
+            j for j in self._jobs.values()
+            if j.status in (JobStatus.QUEUED, JobStatus.RUNNING)
+        ]
         return {
             "depth": self.depth,
             "running": self.running_count,
             "max_concurrent": self._max_workers,
             "max_queue": self._max_queue,
             "total_tracked": len(self._jobs),
+            "coalesced_total": self._coalesced_total,
+            "coalesced_in_flight": sum(1 for j in in_flight if j.waiters > 1),
+            "waiters_in_flight": sum(j.waiters for j in in_flight),
+            "abandoned_total": self._abandoned_total,
+            "event_streams": self.events.stream_count,
+            "classes": {
+                p.value: {
+                    "depth": self._queue.depth_of(p),
+                    "running": sum(
+                        1 for j in in_flight
+                        if j.status == JobStatus.RUNNING and j.priority == p
+                    ),
+                    "wait_time": self._wait_histograms[p].snapshot(),
+                }
+                for p in JobPriority
+            },
         }
 
+    async def borrow_slots(self, wanted: int) -> int:
+        """Take up to *wanted* idle concurrency slots without waiting.
+
+        Returns how many were taken; hand them back with ``return_slots``.
+        Nothing is borrowed while a dequeued job is waiting for a slot, so
+        extra chunk lanes never delay another tenant's job.
+        """
+        taken = 0
+        while taken < wanted and not self._slots.locked():
+            await self._slots.acquire()
+            taken += 1
+        return taken
+
+    def return_slots(self, count: int) -> None:
+        for _ in range(count):
+            self._slots.release()
+
     # ── internal ────────────────────────────────────────────────────────
 
-    def cancel(self, job_id: str) -> Job | None:
+    def cancel(self, job_id: str, waiter: str | None = None) -> Job | None:
         """Cancel a job. Queued jobs are skipped by workers; running jobs are
-        marked canceled and their result is dropped."""
+        marked canceled and their result is dropped.
+
+        A coalesced job is shared by several submitters. With *waiter*, only
+        that submitter is detached (repeating it is a no-op), and the job is
+        canceled when its last waiter leaves. Without *waiter*, the job is
+        canceled for everyone.
+        """
         job = self._jobs.get(job_id)
         if job is None:
             return None
         if job.status in (JobStatus.COMPLETE, JobStatus.FAILED, JobStatus.CANCELED):
             return job
+        if waiter is not None:
+            if waiter not in job.waiter_tokens:
+                return job
+            job.waiter_tokens.discard(waiter)
+            job.waiter_streams.pop(waiter, None)
+            if job.waiter_tokens:
+                logger.info(f"🚪 Job {job.id[:8]} waiter detached ({job.waiters} remaining)")
+                return job
+        job.waiter_tokens.clear()
+        job.waiter_streams.clear()
         job.status = JobStatus.CANCELED
         job.completed_at = time()
         job.event.set()
+        self.events.publish(job)
         if job.dedupe_key:
             self._dedupe.pop(job.dedupe_key, None)
         logger.info(f"🚫 Job {job.id[:8]} canceled")
         return job
 
+    def _abandon(self, job: Job, now: float) -> None:
+        """Drop a queued job whose callers have stopped polling."""
+        job.status = JobStatus.CANCELED
+        job.error = "Abandoned: no caller polled the job before it started"
+        job.completed_at = now
+        job.event.set()
+        self.events.publish(job)
+        if job.dedupe_key and self._dedupe.get(job.dedupe_key) == job.id:
+            self._dedupe.pop(job.dedupe_key, None)
+        self._abandoned_total += 1
+        logger.info(
+            f"🗑️ Job {job.id[:8]} dropped — unpolled for "
+            f"{now - max(job.last_polled_at, job.created_at):.0f}s"
+        )
+
     async def _worker(self, worker_id: int) -> None:
         logger.info(f"🔧 Worker {worker_id} started")
         while True:
             job = await self._queue.get()
-            if job.status == JobStatus.CANCELED:
-                self._queue.task_done()
-                continue
-            job.status = JobStatus.RUNNING
-            job.started_at = time()
-            try:
-                job.result = await _do_generate(job.request, worker_id=worker_id)
-                job.status = JobStatus.COMPLETE
-            except Exception as exc:
-                logger.error(f"❌ Worker {worker_id} job {job.id[:8]} failed: {exc}")
-                job.status = JobStatus.FAILED
-                job.error = str(exc)
-                job.result = GenerateResponse(
-                    success=False, error=str(exc),
-                )
-            finally:
-                job.completed_at = time()
-                job.event.set()
-                self._queue.task_done()
-                elapsed = job.completed_at - (job.started_at or job.created_at)
-                icon = "✅" if job.status == JobStatus.COMPLETE else "❌"
-                _cid = f"[{job.composition_id[:8]}]" if job.composition_id else ""
-                logger.info(
-                    f"{icon}{_cid} Worker {worker_id} job {job.id[:8]} "
-                    f"{job.status.value} in {elapsed:.1f}s"
-                )
-                if _COOLDOWN_SECONDS > 0:
-                    await asyncio.sleep(_COOLDOWN_SECONDS)
+            async with self._slots:
+                await self._run_job(worker_id, job)
+
+    async def _run_job(self, worker_id: int, job: Job) -> None:
+        """Run one dequeued job while holding a concurrency slot."""
+        if job.status == JobStatus.CANCELED:
+            return
+        now = time()
+        if job.is_abandoned(now) and not self.events.watching(job):
+            self._abandon(job, now)
+            return
+        job.status = JobStatus.RUNNING
+        job.started_at = now
+        self._wait_histograms[job.priority].observe(now - job.created_at)
+        self.events.publish(job)
+        try:
+            job.result = await _do_generate(job.request, worker_id=worker_id)
+            job.status = JobStatus.COMPLETE
+        except Exception as exc:
+            logger.error(f"❌ Worker {worker_id} job {job.id[:8]} failed: {exc}")
+            job.status = JobStatus.FAILED
+            job.error = str(exc)
+            job.result = GenerateResponse(
+                success=False, error=str(exc),
+            )
+        finally:
+            job.completed_at = time()
+            job.event.set()
+            self.events.publish(job)
+            elapsed = job.completed_at - (job.started_at or job.created_at)
+            icon = "✅" if job.status == JobStatus.COMPLETE else "❌"
+            _cid = f"[{job.composition_id[:8]}]" if job.composition_id else ""
+            logger.info(
+                f"{icon}{_cid} Worker {worker_id} job {job.id[:8]} "
+                f"{job.status.value} in {elapsed:.1f}s"
+            )
+            if _COOLDOWN_SECONDS > 0:
+                await asyncio.sleep(_COOLDOWN_SECONDS)
 
     async def _cleanup_loop(self) -> None:
         while True:
@@ -1398,6 +1838,14 @@ def analyze_seed(path: str) -> dict[str, object]:
     }
 
 
+_SEED_PREP_CACHE_SIZE = int(os.environ.get("STORPHEUS_SEED_PREP_CACHE_SIZE", "512"))
+_seed_prep = SeedPrepCache(
+    analyze=analyze_seed,
+    max_entries=_SEED_PREP_CACHE_SIZE,
+    output_dir=_CACHE_DIR / "transposed_seeds",
+)
+
+
 @dataclass
 class ResolvedSeed:
     """Encapsulates a resolved seed with transposition metadata."""
@@ -1425,7 +1873,7 @@ def _resolve_seed(
         genre, target_key=target_key, randomize=True,
     )
     if selection is not None:
-        report = analyze_seed(selection.path)
+        report = _seed_prep.prepare(selection.path).report
         if report.get("quality_ok"):
             logger.info(
                 f"🌱 Using curated seed: {selection.path} "
@@ -1468,84 +1916,16 @@ def parse_midi_to_notes(midi_path: str, tempo: int) -> ParsedMidiResult:
     Returns ``{"notes": {ch: [...]}, "cc_events": {ch: [...]},
                "pitch_bends": {ch: [...]}, "aftertouch": {ch: [...]},
                "program_changes": {ch: program_number}}``.
-    """
-    mid = mido.MidiFile(midi_path)
-    ticks_per_beat = mid.ticks_per_beat
-
-    notes: dict[int, list[StorpheusNoteDict]] = {}
-    cc_events: dict[int, list[StorpheusCCEvent]] = {}
-    pitch_bends: dict[int, list[StorpheusPitchBend]] = {}
-    aftertouch: dict[int, list[StorpheusAftertouch]] = {}
-    program_changes: dict[int, int] = {}
-
-    for track in mid.tracks:
-        time = 0
-        for msg in track:
-            time += msg.time
-            beat = round(time / ticks_per_beat, 3)
-
-            if msg.type == 'program_change':
-                program_changes[msg.channel] = msg.program
-
-            elif msg.type == 'note_on' and msg.velocity > 0:
-                ch = msg.channel
-                notes.setdefault(ch, []).append({
-                    "pitch": msg.note,
-                    "start_beat": beat,
-                    "duration_beats": 0.5,
-                    "velocity": msg.velocity,
-                })
-
-            elif msg.type == 'note_off' or (msg.type == 'note_on' and msg.velocity == 0):
-                ch = msg.channel
-                if ch in notes:
-                    for note in reversed(notes[ch]):
-                        if note["pitch"] == msg.note and note.get("duration_beats") == 0.5:
-                            note["duration_beats"] = round(beat - note["start_beat"], 3)
-                            break
-
-            elif msg.type == 'control_change':
-                ch = msg.channel
-                cc_events.setdefault(ch, []).append({
-                    "cc": msg.control,
-                    "beat": beat,
-                    "value": msg.value,
-                })
-
-            elif msg.type == 'pitchwheel':
-                ch = msg.channel
-                pitch_bends.setdefault(ch, []).append({
-                    "beat": beat,
-                    "value": msg.pitch,
-                })
-
-            elif msg.type == 'aftertouch':
-                ch = msg.channel
-                aftertouch.setdefault(ch, []).append({
-                    "beat": beat,
-                    "value": msg.value,
-                })
-
-            elif msg.type == 'polytouch':
-                ch = msg.channel
-                aftertouch.setdefault(ch, []).append({
-                    "beat": beat,
-                    "value": msg.value,
-                    "pitch": msg.note,
-                })
 
-    if program_changes:
-        logger.debug(f"🎹 Parsed MIDI program changes: {program_changes}")
-
-    return {
-        "notes": notes,
-        "cc_events": cc_events,
-        "pitch_bends": pitch_bends,
-        "aftertouch": aftertouch,
-        "program_changes": program_changes,
-    }
+    Dict view over ``midi_parse.parse_midi_columns``; callers that only
+    need note columns should use that directly.
+    """
+    parsed = parse_midi_columns(midi_path)
 
+    if parsed.program_changes:
+        logger.debug(f"🎹 Parsed MIDI program changes: {parsed.program_changes}")
 
+    return parsed.to_result()
 
 
 def _channels_to_keep(channel_keys: set[int], instruments: list[str]) -> set[int]:
@@ -1700,8 +2080,9 @@ async def diagnostics() -> dict[str, object]:
             "max_size": MAX_CACHE_SIZE,
             "total_hits": total_hits,
             "ttl_s": CACHE_TTL_SECONDS,
-            "disk_persisted": _CACHE_FILE.exists(),
+            "backend": await asyncio.to_thread(_get_cache_backend().stats),
         },
+        "seed_prep_cache": _seed_prep.stats(),
     }
 
 
@@ -1738,12 +2119,50 @@ async def cache_stats() -> dict[str, object]:
         "total_hits": total_hits,
         "expired_entries": expired_count,
         "ttl_seconds": CACHE_TTL_SECONDS,
-
+        "backend": await asyncio.to_thread(_get_cache_backend().stats),
         "top_entries": entries_info,
         "policy_version": get_policy_version(),
     }
 
 
+async def _run_queued_job(
+    request: GenerateRequest,
+    priority: JobPriority,
+    dedupe_key: str | None = None,
+) -> GenerateResponse:
+    """Run *request* through the job queue in *priority*'s class and await it.
+
+    Every in-process generation goes through here so it shares the GPU
+    workers under the same priority and tenant fairness as ``/generate``.
+    Falls back to a direct ``_do_generate`` call when the queue is not
+    running. Raises QueueFullError when the queue is at capacity. If the
+    caller is cancelled while waiting, only its waiter is detached; the job
+    keeps running for any other submitters coalesced onto it.
+    """
+    if _job_queue is None:
+        return await _do_generate(request)
+    job, waiter = _job_queue.submit(
+        request.model_copy(update={"priority": priority}),
+        dedupe_key=dedupe_key,
+    )
+    try:
+        await job.event.wait()
+    except asyncio.CancelledError:
+        _job_queue.cancel(job.id, waiter)
+        raise
+    if job.result is not None:
+        return job.result
+    return GenerateResponse(success=False, error=job.error or f"Job {job.status.value}")
+
+
+async def _run_batch_job(
+    request: GenerateRequest,
+    dedupe_key: str | None = None,
+) -> GenerateResponse:
+    """Run *request* in the batch class: background work yields to live requests."""
+    return await _run_queued_job(request, JobPriority.BATCH, dedupe_key)
+
+
 @app.post("/cache/warm")
 async def warm_cache() -> dict[str, object]:
     """
@@ -1765,7 +2184,7 @@ async def warm_cache() -> dict[str, object]:
             genre=genre, tempo=tempo, instruments=["drums", "bass"],
             bars=4, quality_preset="fast",
         )
-        if get_cached_result(get_cache_key(req)) is not None:
+        if await asyncio.to_thread(get_cached_result, get_cache_key(req)) is not None:
             already_cached += 1
         else:
             to_generate.append(req)
@@ -1774,7 +2193,7 @@ async def warm_cache() -> dict[str, object]:
         ok, fail = 0, 0
         for req in to_generate:
             try:
-                resp = await _do_generate(req)
+                resp = await _run_batch_job(req, dedupe_key=get_cache_key(req))
                 if resp.success:
                     ok += 1
                 else:
@@ -1794,9 +2213,8 @@ async def warm_cache() -> dict[str, object]:
 @app.delete("/cache/clear")
 async def clear_cache() -> dict[str, object]:
     """Clear all caches."""
-    _result_cache.clear()
-    if _CACHE_FILE.exists():
-        _CACHE_FILE.unlink()
+    await asyncio.to_thread(clear_result_cache)
+    _seed_prep.clear()
     logger.info("🗑️ Caches cleared")
     return {
         "status": "ok",
@@ -1850,10 +2268,14 @@ async def ab_test(request: ABTestRequest) -> dict[str, object]:
     A/B test two generation configurations.
     
     Generates music with both configs and compares quality metrics.
-    Useful for testing policy changes before deploying.
+    Useful for testing policy changes before deploying. Both generations
+    run as batch jobs.
     """
-    result_a = await _do_generate(request.config_a)
-    result_b = await _do_generate(request.config_b)
+    try:
+        result_a = await _run_batch_job(request.config_a)
+        result_b = await _run_batch_job(request.config_b)
+    except QueueFullError:
+        return {"error": "Generation queue is full — try again shortly"}
     
     if not result_a.success or not result_b.success:
         return {
@@ -1945,7 +2367,12 @@ async def parameter_sweep(request: ParameterSweepRequest) -> SweepABTestResult:
             overridden = request.base_config.model_copy(
                 update={"temperature": round(temp, 3), "top_p": round(tp, 3)}
             )
-            result = await _do_generate(overridden)
+            try:
+                # No dedupe key: sampling overrides are not part of the cache key.
+                result = await _run_batch_job(overridden)
+            except QueueFullError:
+                logger.warning(f"⚠️ Sweep point temp={temp} top_p={tp} skipped — queue full")
+                continue
 
             if not result.success or not result.notes:
                 logger.warning(
@@ -2120,6 +2547,44 @@ def _apply_velocity_fade(
     return result
 
 
+async def _generate_chunks_parallel(
+    chunk_requests: list[GenerateRequest],
+    worker_id: int,
+) -> list[GenerateResponse]:
+    """Run chunk requests concurrently, at most ``_CHUNK_PARALLELISM`` at a time.
+
+    Each in-flight chunk holds a dedicated client slot (a Gradio session is
+    not safe to share between concurrent calls). The calling job already
+    holds one JobQueue slot; every extra lane borrows another idle one, so
+    chunk lanes count against ``max_workers`` and fall back to fewer lanes
+    (down to sequential) when other jobs are waiting. Exceptions are folded
+    into failed responses so the caller's in-order stitching sees every
+    chunk. Returns responses in the same order as *chunk_requests*.
+    """
+    queue = _job_queue
+    wanted = min(_CHUNK_PARALLELISM, len(chunk_requests)) - 1
+    borrowed = await queue.borrow_slots(wanted) if queue is not None else wanted
+    lanes = 1 + borrowed
+    free_slots: asyncio.Queue[int] = asyncio.Queue()
+    for lane in range(lanes):
+        free_slots.put_nowait(_CHUNK_CLIENT_SLOT_BASE + worker_id * _CHUNK_PARALLELISM + lane)
+
+    async def _run(chunk_request: GenerateRequest) -> GenerateResponse:
+        slot = await free_slots.get()
+        try:
+            return await _do_generate(chunk_request, worker_id=slot)
+        except Exception as exc:
+            return GenerateResponse(success=False, error=str(exc))
+        finally:
+            free_slots.put_nowait(slot)
+
+    try:
+        return list(await asyncio.gather(*(_run(r) for r in chunk_requests)))
+    finally:
+        if queue is not None:
+            queue.return_slots(borrowed)
+
+
 async def _generate_chunked(
     request: GenerateRequest,
     worker_id: int = 0,
@@ -2135,6 +2600,12 @@ async def _generate_chunked(
     spanning the full requested bar count. A linear velocity cross-fade is
     applied at each chunk boundary to smooth amplitude transitions.
 
+    With ``_CHUNK_PARALLELISM > 1`` multi-instrument requests switch to
+    parallel mode: every chunk is seeded from the seed library in its own
+    session and up to ``_CHUNK_PARALLELISM`` run at once, so wall-clock time
+    scales with the number of client slots rather than the chunk count.
+    Stitching (offsets, fades, partial-failure handling) is unchanged.
+
     Args:
         request: Original GenerateRequest with bars > _CHUNKED_GEN_THRESHOLD_BARS.
         worker_id: Worker slot passed through to each inner _do_generate call.
@@ -2156,25 +2627,15 @@ async def _generate_chunked(
         remaining -= c
 
     chunks_needed = len(chunk_bar_counts)
+    parallel = _CHUNK_PARALLELISM > 1 and len(request.instruments) > 1 and chunks_needed > 1
 
     # Isolated composition_id so chunked state does not bleed into caller's session
     chunked_comp_id = f"chunked-{request.composition_id or str(uuid.uuid4())}"
 
-    all_notes: list[WireNoteDict] = []
-    chunk_metadata: list[ChunkMetadata] = []
-    beat_offset = 0.0
-
-    _run_start = monotonic()
-    logger.info(
-        f"🧩 Chunked generation: {total_bars} bars → {chunks_needed} chunk(s) of "
-        f"≤{_CHUNK_BARS} bars | composition={chunked_comp_id[:16]}"
-    )
-
+    chunk_requests: list[GenerateRequest] = []
     for chunk_idx, c_bars in enumerate(chunk_bar_counts):
-        is_first = chunk_idx == 0
         is_last = chunk_idx == chunks_needed - 1
-
-        chunk_request = GenerateRequest(
+        chunk_requests.append(GenerateRequest(
             genre=request.genre,
             tempo=request.tempo,
             instruments=request.instruments,
@@ -2184,23 +2645,53 @@ async def _generate_chunked(
             role_profile_summary=request.role_profile_summary,
             generation_constraints=request.generation_constraints,
             intent_goals=request.intent_goals,
-            seed=request.seed,
+            # Parallel chunks run in independent sessions from the same seed MIDI;
+            # distinct RNG seeds keep them from producing identical material.
+            seed=(
+                request.seed + chunk_idx
+                if parallel and request.seed is not None
+                else request.seed
+            ),
             trace_id=request.trace_id,
             intent_hash=request.intent_hash,
             quality_preset=request.quality_preset,
             temperature=request.temperature,
             top_p=request.top_p,
-            composition_id=chunked_comp_id,
+            # Sequential chunks share one session (sliding window); parallel
+            # chunks each get their own so none waits on another's MIDI.
+            composition_id=f"{chunked_comp_id}-{chunk_idx}" if parallel else chunked_comp_id,
             # Only attach outro token on the final chunk
             add_outro=request.add_outro and is_last,
             unified_output=False, # chunked always returns flat notes; caller re-wraps
-        )
+        ))
+
+    all_notes: list[WireNoteDict] = []
+    chunk_metadata: list[ChunkMetadata] = []
+    beat_offset = 0.0
+
+    _run_start = monotonic()
+    logger.info(
+        f"🧩 Chunked generation: {total_bars} bars → {chunks_needed} chunk(s) of "
+        f"≤{_CHUNK_BARS} bars | composition={chunked_comp_id[:16]}"
+        + (f" | parallel×{min(_CHUNK_PARALLELISM, chunks_needed)}" if parallel else "")
+    )
+
+    parallel_responses: list[GenerateResponse] = []
+    if parallel:
+        parallel_responses = await _generate_chunks_parallel(chunk_requests, worker_id)
+
+    for chunk_idx, c_bars in enumerate(chunk_bar_counts):
+        is_first = chunk_idx == 0
+        is_last = chunk_idx == chunks_needed - 1
 
         logger.info(
             f"🧩 Chunk {chunk_idx + 1}/{chunks_needed}: "
             f"{c_bars} bars, beat_offset={beat_offset:.0f}"
         )
-        chunk_response = await _do_generate(chunk_request, worker_id=worker_id)
+        if parallel:
+            chunk_response = parallel_responses[chunk_idx]
+        else:
+            chunk_response = await _do_generate(chunk_requests[chunk_idx], worker_id=worker_id)
 
         if not chunk_response.success:
             logger.error(
@@ -2304,6 +2795,7 @@ async def _generate_chunked(
             "chunked": True,
             "chunk_count": chunks_needed,
             "chunk_bars": _CHUNK_BARS,
+            "chunk_parallelism": min(_CHUNK_PARALLELISM, chunks_needed) if parallel else 1,
             "total_bars": total_bars,
             "chunk_metadata": list(chunk_metadata),
             "total_elapsed_seconds": chunked_result["total_elapsed_seconds"],
@@ -2360,17 +2852,18 @@ async def _do_generate(request: GenerateRequest, worker_id: int = 0) -> Generate
         seed_source_type = resolved.source_type
         seed_uri = resolved.source_uri
 
-        # Apply key transposition if needed
+        # Key transposition, analysis and hashing are memoised per (seed, semitones)
+        prepared_seed = _seed_prep.prepare(seed_path, resolved.transpose_semitones)
+        seed_path = prepared_seed.path
         if resolved.transpose_semitones != 0:
-            seed_path = str(transpose_midi(seed_path, resolved.transpose_semitones))
             logger.info(
                 f"{_log_prefix} 🎹 Transposed seed by {resolved.transpose_semitones:+d} semitones "
                 f"({resolved.detected_key} → {request.key})"
             )
         _timing.seed_elapsed_s = time() - _seed_t0
 
-        seed_report = analyze_seed(seed_path)
-        seed_hash = hashlib.sha256(open(seed_path, "rb").read()).hexdigest()[:16]
+        seed_report = prepared_seed.report
+        seed_hash = prepared_seed.seed_hash
 
         if not seed_report.get("quality_ok"):
             logger.warning(
@@ -2549,6 +3042,8 @@ async def _do_generate(request: GenerateRequest, worker_id: int = 0) -> Generate
         # is still below STORPHEUS_REGEN_THRESHOLD do we pay the cost of a full
         # re-generate (25-65s). For a "quality" preset (4 candidates) this can
         # reduce total latency from 4×(25-65s) → 1×(25-65s) + 3×(~2s).
+        # Each candidate is scored as soon as it is fetched, so one that clears
+        # the acceptance threshold skips the remaining /add_batch calls.
         _num_candidates = quality_preset_to_batch_count(request.quality_preset)
         _rejection_threshold = float(os.environ.get("STORPHEUS_REJECTION_THRESHOLD", "0.3"))
         _multi_batch_tries = min(STORPHEUS_MULTI_BATCH_TRIES, 10)
@@ -2624,7 +3119,8 @@ async def _do_generate(request: GenerateRequest, worker_id: int = 0) -> Generate
         _used_batch_indices: set[int] = set()
 
         while not _done:
-            # ── Inner loop: try multiple batch indices from the current generate ──
+            # ── Inner loop: fetch and score batch indices from the current generate
+            # one at a time, stopping as soon as one clears the acceptance bar ──
             _batches_this_gen = 0
             while _batches_this_gen < _multi_batch_tries and _total_candidates < _num_candidates:
                 _available = [i for i in range(10) if i not in _used_batch_indices]
@@ -2709,13 +3205,16 @@ async def _do_generate(request: GenerateRequest, worker_id: int = 0) -> Generate
                     all_candidate_scores.append({"batch": batch_idx, "score": 0.0, "notes": 0})
                     continue
 
+                candidate = BestCandidate(
+                    midi_result=midi_result,
+                    midi_path=_attempt_midi_path,
+                    parsed=_attempt_parsed,
+                    flat_notes=_attempt_flat,
+                    batch_idx=batch_idx,
+                )
                 candidate_score = score_candidate(
-                    _attempt_flat,
-                    _attempt_parsed["notes"],
-                    batch_index=batch_idx,
-                    params=_scoring,
+                    _attempt_flat, _attempt_parsed["notes"], batch_idx, _scoring,
                 )
-
                 all_candidate_scores.append({
                     "batch": batch_idx,
                     "score": candidate_score.total_score,
@@ -2733,17 +3232,11 @@ async def _do_generate(request: GenerateRequest, worker_id: int = 0) -> Generate
 
                 if best_score is None or candidate_score.total_score > best_score.total_score:
                     best_score = candidate_score
-                    best_candidate = BestCandidate(
-                        midi_result=midi_result,
-                        midi_path=_attempt_midi_path,
-                        parsed=_attempt_parsed,
-                        flat_notes=_attempt_flat,
-                        batch_idx=batch_idx,
-                    )
+                    best_candidate = candidate
 
-                if candidate_score.total_score >= (1.0 - _rejection_threshold):
+                if best_score.total_score >= (1.0 - _rejection_threshold):
                     logger.info(
-                        f"✅ Score {candidate_score.total_score:.3f} above acceptance threshold, "
+                        f"✅ Score {best_score.total_score:.3f} above acceptance threshold, "
                         f"skipping remaining candidates"
                     )
                     _done = True
@@ -3015,7 +3508,8 @@ async def _do_generate(request: GenerateRequest, worker_id: int = 0) -> Generate
             metadata=metadata,
             channel_notes=response_notes_unified,
         )
-        cache_result(
+        await asyncio.to_thread(
+            cache_result,
             cache_key,
             _response.model_dump(),
             key_data=_cache_key_data(request),
@@ -3108,7 +3602,10 @@ async def _do_progressive_generate(
             unified_output=True, # always get per-channel notes for seeding
         )
 
-        response = await _do_generate(tier_request)
+        try:
+            response = await _run_queued_job(tier_request, JobPriority.INTERACTIVE)
+        except QueueFullError as exc:
+            response = GenerateResponse(success=False, error=str(exc))
         elapsed = monotonic() - _tier_start
 
         if not response.success:
@@ -3168,6 +3665,8 @@ def _job_response(job: Job) -> dict[str, object]:
     }
     if job.status == JobStatus.QUEUED:
         resp["position"] = job.position
+    if job.status in (JobStatus.QUEUED, JobStatus.RUNNING):
+        resp["waiters"] = job.waiters
     if job.status in (JobStatus.COMPLETE, JobStatus.FAILED) and job.result:
         resp["result"] = job.result.model_dump()
     if job.error:
@@ -3178,12 +3677,19 @@ def _job_response(job: Job) -> dict[str, object]:
 
 
 @app.post("/generate", response_model=None)
-async def generate(request: GenerateRequest) -> dict[str, object] | JSONResponse:
-    """Submit a generation job. Cache hits return immediately; misses enqueue."""
+async def generate(
+    request: GenerateRequest,
+    x_job_stream: str | None = Header(default=None),
+) -> dict[str, object] | JSONResponse:
+    """Submit a generation job. Cache hits return immediately; misses enqueue.
+
+    With an ``X-Job-Stream`` header, the job's updates are also pushed to
+    that ``/jobs/events`` stream.
+    """
     assert _job_queue is not None, "JobQueue not initialized"
 
     cache_key = get_cache_key(request)
-    cached = get_cached_result(cache_key)
+    cached = await asyncio.to_thread(get_cached_result, cache_key)
     if cached:
         _cached_meta = cached.get("metadata")
         if isinstance(_cached_meta, dict):
@@ -3194,7 +3700,7 @@ async def generate(request: GenerateRequest) -> dict[str, object] | JSONResponse
             "result": cached,
         }
 
-    fuzzy = fuzzy_cache_lookup(request)
+    fuzzy = await asyncio.to_thread(fuzzy_cache_lookup, request)
     if fuzzy:
         return {
             "jobId": str(uuid.uuid4()),
@@ -3203,14 +3709,21 @@ async def generate(request: GenerateRequest) -> dict[str, object] | JSONResponse
         }
 
     try:
-        job = _job_queue.submit(request, dedupe_key=cache_key)
+        job, waiter = _job_queue.submit(
+            request,
+            dedupe_key=cache_key,
+            abandon_after_s=_JOB_ABANDON_SECONDS,
+            stream=x_job_stream,
+        )
     except QueueFullError:
         return JSONResponse(
             status_code=503,
             content={"error": "Generation queue is full — try again shortly"},
             headers={"Retry-After": "30"},
         )
-    return _job_response(job)
+    resp = _job_response(job)
+    resp["waiter"] = waiter
+    return resp
 
 
 @app.post("/generate/progressive", response_model=None)
@@ -3228,14 +3741,57 @@ async def generate_progressive(
     all tiers complete. For large arrangements (many instruments, high
     quality preset) this may take 60–120 s.
 
-    Unlike ``POST /generate``, this endpoint bypasses the job queue and runs
-    the entire pipeline in-request so per-tier timing is accurate.
+    Each tier runs as an interactive job on the shared queue under the
+    composition's tenant, awaited in-request; per-tier timing includes any
+    queue wait.
     """
     result = await _do_progressive_generate(request)
     status_code = 200 if result["success"] else 500
     return JSONResponse(status_code=status_code, content=result)
 
 
+@app.get("/jobs/events", response_model=None)
+async def job_events(
+    stream: str = Query(min_length=8, max_length=64),
+) -> StreamingResponse:
+    """SSE stream of updates for every job submitted with ``X-Job-Stream: <stream>``.
+
+    Emits ``event: ready`` once the stream is registered, then one
+    ``event: job`` per status change carrying the ``/jobs/{id}`` payload
+    (including ``result`` when complete), plus keepalive comments. The
+    stream ends if the caller falls too far behind; callers poll
+    ``/jobs/{id}/wait`` for any job whose update they did not receive.
+    """
+    assert _job_queue is not None
+    hub = _job_queue.events
+    queue = hub.open(stream)
+    logger.info(f"📡 Job stream {stream[:8]} connected ({hub.stream_count} open)")
+
+    async def _events() -> AsyncIterator[str]:
+        try:
+            yield f"event: ready\ndata: {json.dumps({'stream': stream})}\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=_JOB_STREAM_KEEPALIVE_SECONDS,
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if event is None:
+                    return
+                yield f"event: job\ndata: {json.dumps(event)}\n\n"
+        finally:
+            hub.close(stream, queue)
+            logger.info(f"📡 Job stream {stream[:8]} disconnected")
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/jobs/{job_id}", response_model=None)
 async def get_job(job_id: str) -> dict[str, object] | JSONResponse:
     """Return current status of a submitted job."""
@@ -3243,6 +3799,7 @@ async def get_job(job_id: str) -> dict[str, object] | JSONResponse:
     job = _job_queue.get_job(job_id)
     if job is None:
         return JSONResponse(status_code=404, content={"error": "Job not found"})
+    _job_queue.touch(job)
     return _job_response(job)
 
 
@@ -3257,28 +3814,47 @@ async def wait_for_job(
     if job is None:
         return JSONResponse(status_code=404, content={"error": "Job not found"})
 
+    _job_queue.touch(job)
     if not job.event.is_set():
+        job.active_polls += 1
         try:
             await asyncio.wait_for(job.event.wait(), timeout=timeout)
         except asyncio.TimeoutError:
             pass
+        finally:
+            job.active_polls -= 1
+            _job_queue.touch(job)
 
     return _job_response(job)
 
 
 @app.post("/jobs/{job_id}/cancel", response_model=None)
-async def cancel_job(job_id: str) -> dict[str, object] | JSONResponse:
-    """Cancel a queued or running job."""
+async def cancel_job(
+    job_id: str,
+    waiter: str | None = Query(default=None),
+) -> dict[str, object] | JSONResponse:
+    """Detach the submitter holding *waiter* (from ``POST /generate``) from a job.
+
+    The job is canceled once its last waiter detaches. Without *waiter*,
+    only a job with a single waiter can be canceled; a shared job returns 409.
+    """
     assert _job_queue is not None
-    job = _job_queue.cancel(job_id)
+    job = _job_queue.get_job(job_id)
     if job is None:
         return JSONResponse(status_code=404, content={"error": "Job not found"})
+    if waiter is None and job.waiters > 1:
+        return JSONResponse(
+            status_code=409,
+            content={"error": "Job is shared by several submitters — cancel with your waiter token"},
+        )
+    _job_queue.cancel(job_id, waiter)
     return _job_response(job)
 
 
 @app.get("/queue/status")
 async def queue_status() -> dict[str, object]:
-    """Diagnostics: current queue depth, running workers, limits."""
+    """Diagnostics: queue depth, running workers, limits, coalescing, and
+    per-class depth / wait-time histograms."""
     if _job_queue is None:
         return {"error": "JobQueue not initialized"}
     return _job_queue.status_snapshot()
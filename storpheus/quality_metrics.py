@@ -153,14 +153,29 @@ def rejection_score(notes: list[StorpheusNoteDict], bars: int) -> float:
     if not notes:
         return 0.0
 
-    total_beats = max(bars * 4, 1)
-
-    # ── Density variance: how evenly distributed are notes across bars? ──
+    # Single pass: per-bar counts, pitch extremes and 2-note repetition.
     bar_counts = [0] * max(bars, 1)
+    pitch_min = pitch_max = notes[0].get("pitch", 60)
+    pattern_set: set[tuple[int, int]] = set()
+    repeated = 0
+    prev: int | None = None
     for n in notes:
         b = int(n.get("start_beat", 0.0) / 4)
         if 0 <= b < bars:
             bar_counts[b] += 1
+        p = n.get("pitch", 60)
+        if p < pitch_min:
+            pitch_min = p
+        elif p > pitch_max:
+            pitch_max = p
+        if prev is not None:
+            pattern = (prev, p)
+            if pattern in pattern_set:
+                repeated += 1
+            pattern_set.add(pattern)
+        prev = p
+
+    # ── Density variance: how evenly distributed are notes across bars? ──
     mean_density = len(notes) / max(bars, 1)
     if mean_density > 0 and len(bar_counts) > 1:
         variance = sum((c - mean_density) ** 2 for c in bar_counts) / len(bar_counts)
@@ -170,8 +185,7 @@ def rejection_score(notes: list[StorpheusNoteDict], bars: int) -> float:
         density_score = 0.5
 
     # ── Pitch range sanity ──
-    pitches = [n.get("pitch", 60) for n in notes]
-    pitch_range = max(pitches) - min(pitches) if pitches else 0
+    pitch_range = pitch_max - pitch_min
     if 12 <= pitch_range <= 36:
         range_score = 1.0
     elif pitch_range < 12:
@@ -181,13 +195,6 @@ def rejection_score(notes: list[StorpheusNoteDict], bars: int) -> float:
 
     # ── Repetition penalty ──
     if len(notes) >= 4:
-        pattern_set: set[tuple[int, int]] = set()
-        repeated = 0
-        for i in range(len(notes) - 1):
-            p = (notes[i].get("pitch", 0), notes[i + 1].get("pitch", 0))
-            if p in pattern_set:
-                repeated += 1
-            pattern_set.add(p)
         rep_rate = repeated / max(len(notes) - 1, 1)
         rep_score = max(0.0, 1.0 - max(0.0, rep_rate - 0.4) / 0.6)
     else:
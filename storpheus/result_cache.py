@@ -0,0 +1,597 @@
+"""Pluggable persistence backends for the Storpheus result cache.
+
+``music_service`` keeps a small process-local LRU (``_result_cache``) in
+front of one of these backends. The backend is the shared, durable tier:
+every insert is written through as a single entry, misses in the local
+LRU read through to it, and it enforces its own TTL + LRU bounds.
+Each backend also keeps a generation counter that ``clear()`` bumps, so
+workers sharing the store can tell their local LRU is stale.
+
+Backends:
+    sqlite — one row per entry in a WAL-mode SQLite file. Writes are
+             per-entry (O(1) per insert, not O(cache size)) and several
+             worker processes on the same host can share one file safely.
+    json   — legacy single-file snapshot. Rewrites the whole file on every
+             insert; kept for single-process deployments and debugging.
+    memory — no persistence (tests, ephemeral containers).
+
+``IntentIndex`` is the in-process fuzzy-lookup index over the local LRU:
+entries are bucketed by their exact-match fields and gridded by their
+quantized intent vector, so a fuzzy lookup probes only nearby cells.
+
+Usage in music_service.py:
+    from result_cache import CacheEntry, create_result_cache_backend
+    backend = create_result_cache_backend("sqlite", cache_dir, max_entries=1000, ttl_seconds=86400)
+    backend.put(key, CacheEntry(result=..., timestamp=time()))
+"""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+import json
+import logging
+import math
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from time import time
+from typing import Protocol
+
+from storpheus_types import CacheKeyData
+
+logger = logging.getLogger(__name__)
+
+SQLITE_CACHE_FILENAME = "result_cache.sqlite3"
+JSON_CACHE_FILENAME = "result_cache.json"
+
+
+@dataclass
+class CacheEntry:
+    """Cache entry with TTL support and key data for fuzzy matching."""
+    result: dict[str, object]
+    timestamp: float
+    hits: int = 0
+    key_data: CacheKeyData | None = None
+
+
+class ResultCacheBackend(Protocol):
+    """Durable, shareable store behind the in-process result cache."""
+
+    name: str
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for *key*, or ``None`` if absent or expired."""
+        ...
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        """Insert or replace one entry, evicting expired/LRU entries as needed."""
+        ...
+
+    def record_hit(self, key: str) -> None:
+        """Bump the hit counter and LRU position of *key*."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Remove *key* if present."""
+        ...
+
+    def clear(self) -> None:
+        """Remove every entry and bump the generation."""
+        ...
+
+    def generation(self) -> int:
+        """Counter bumped by every ``clear()``, visible to every process sharing the store."""
+        ...
+
+    def load(self, limit: int) -> list[tuple[str, CacheEntry]]:
+        """Return up to *limit* live entries, least recently used first."""
+        ...
+
+    def size(self) -> int:
+        """Number of stored entries (including not-yet-purged expired ones)."""
+        ...
+
+    def stats(self) -> dict[str, object]:
+        """Backend-specific statistics for ``/cache/stats`` and ``/diagnostics``."""
+        ...
+
+
+# ── memory ───────────────────────────────────────────────────────────
+
+
+class MemoryResultCacheBackend:
+    """Process-local backend with no persistence."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._generation = 0
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time() - entry.timestamp > self._ttl_seconds:
+            del self._entries[key]
+            return None
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def record_hit(self, key: str) -> None:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._generation += 1
+
+    def generation(self) -> int:
+        return self._generation
+
+    def load(self, limit: int) -> list[tuple[str, CacheEntry]]:
+        now = time()
+        live = [
+            (k, e) for k, e in self._entries.items()
+            if now - e.timestamp <= self._ttl_seconds
+        ]
+        return live[-limit:] if limit > 0 else []
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, object]:
+        return {"backend": self.name, "entries": len(self._entries), "persistent": False}
+
+
+# ── json (legacy) ────────────────────────────────────────────────────
+
+
+class JsonFileResultCacheBackend(MemoryResultCacheBackend):
+    """Whole-file JSON snapshot; every mutation rewrites the file.
+
+    Not safe for several processes writing the same file — last writer wins.
+    """
+
+    name = "json"
+
+    def __init__(self, path: Path, max_entries: int, ttl_seconds: float) -> None:
+        super().__init__(max_entries, ttl_seconds)
+        self._path = path
+        self._read_file()
+
+    def _read_file(self) -> None:
+        if not self._path.exists():
+            return
+        try:
+            data = json.loads(self._path.read_text())
+            for key, entry_data in data.items():
+                self._entries[key] = CacheEntry(
+                    result=entry_data["result"],
+                    timestamp=entry_data["timestamp"],
+                    hits=entry_data.get("hits", 0),
+                    key_data=entry_data.get("key_data"),
+                )
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to read cache file {self._path}: {e}")
+
+    def _write_file(self) -> None:
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            serializable = {
+                key: {
+                    "result": entry.result,
+                    "timestamp": entry.timestamp,
+                    "hits": entry.hits,
+                    "key_data": entry.key_data,
+                }
+                for key, entry in self._entries.items()
+            }
+            tmp = self._path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(serializable, default=str))
+            tmp.rename(self._path)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to persist cache: {e}")
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        super().put(key, entry)
+        self._write_file()
+
+    def delete(self, key: str) -> None:
+        if key in self._entries:
+            super().delete(key)
+            self._write_file()
+
+    def clear(self) -> None:
+        super().clear()
+        if self._path.exists():
+            self._path.unlink()
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "backend": self.name,
+            "entries": len(self._entries),
+            "persistent": self._path.exists(),
+            "path": str(self._path),
+        }
+
+
+# ── sqlite ───────────────────────────────────────────────────────────
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS result_cache (
+    key         TEXT PRIMARY KEY,
+    result      TEXT NOT NULL,
+    key_data    TEXT,
+    timestamp   REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits        INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ix_result_cache_last_access ON result_cache (last_access);
+CREATE INDEX IF NOT EXISTS ix_result_cache_timestamp ON result_cache (timestamp);
+CREATE TABLE IF NOT EXISTS result_cache_meta (
+    name  TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO result_cache_meta (name, value) VALUES ('generation', 0);
+BEGIN IMMEDIATE;
+CREATE TRIGGER IF NOT EXISTS tr_result_cache_count_insert AFTER INSERT ON result_cache
+BEGIN
+    UPDATE result_cache_meta SET value = value + 1 WHERE name = 'entries';
+END;
+CREATE TRIGGER IF NOT EXISTS tr_result_cache_count_delete AFTER DELETE ON result_cache
+BEGIN
+    UPDATE result_cache_meta SET value = value - 1 WHERE name = 'entries';
+END;
+INSERT OR IGNORE INTO result_cache_meta (name, value)
+    SELECT 'entries', COUNT(*) FROM result_cache;
+COMMIT;
+"""
+
+# Upsert rather than INSERT OR REPLACE: REPLACE deletes the old row without
+# firing the delete trigger, which would drift the 'entries' counter.
+_UPSERT = (
+    "INSERT INTO result_cache (key, result, key_data, timestamp, last_access, hits) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (key) DO UPDATE SET result = excluded.result, "
+    "key_data = excluded.key_data, timestamp = excluded.timestamp, "
+    "last_access = excluded.last_access, hits = excluded.hits"
+)
+
+# Busy timeout for best-effort writes (hit counts, expired-row deletes). These
+# run on the request path, so they give up quickly instead of waiting out a
+# long write by another process; the row is fixed up by the next ``put``.
+_BEST_EFFORT_BUSY_MS = 50
+
+
+class SqliteResultCacheBackend:
+    """One row per entry in a WAL-mode SQLite database.
+
+    WAL lets readers proceed while another process writes; writers
+    serialise on SQLite's file lock, retried for up to ``busy_timeout_s``.
+    Each ``put`` is a single short ``BEGIN IMMEDIATE`` transaction that
+    upserts the row, purges expired rows, and trims the LRU tail. The row
+    count is kept in ``result_cache_meta`` by triggers, so the trim never
+    scans the table.
+    ``record_hit`` and ``delete`` only wait ``_BEST_EFFORT_BUSY_MS`` for
+    the lock, so a long write elsewhere does not stall a cache read.
+    """
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int,
+        ttl_seconds: float,
+        busy_timeout_s: float = 5.0,
+    ) -> None:
+        self._path = path
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._busy_ms = int(busy_timeout_s * 1000)
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(path),
+            timeout=busy_timeout_s,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def _row_to_entry(row: tuple[str, str | None, float, int]) -> CacheEntry:
+        result_json, key_data_json, timestamp, hits = row
+        return CacheEntry(
+            result=json.loads(result_json),
+            timestamp=timestamp,
+            hits=hits,
+            key_data=json.loads(key_data_json) if key_data_json else None,
+        )
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, key_data, timestamp, hits FROM result_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        entry = self._row_to_entry(row)
+        if time() - entry.timestamp > self._ttl_seconds:
+            with contextlib.suppress(sqlite3.OperationalError):
+                self.delete(key)
+            return None
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        result_json = json.dumps(entry.result, default=str)
+        key_data_json = json.dumps(entry.key_data) if entry.key_data is not None else None
+        now = time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    _UPSERT,
+                    (key, result_json, key_data_json, entry.timestamp, now, entry.hits),
+                )
+                self._conn.execute(
+                    "DELETE FROM result_cache WHERE timestamp < ?",
+                    (now - self._ttl_seconds,),
+                )
+                overflow = self._entry_count() - self._max_entries
+                if overflow > 0:
+                    self._conn.execute(
+                        "DELETE FROM result_cache WHERE key IN ("
+                        "SELECT key FROM result_cache ORDER BY last_access ASC LIMIT ?)",
+                        (overflow,),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _best_effort_write(self, sql: str, params: tuple[object, ...]) -> None:
+        with self._lock:
+            self._conn.execute(f"PRAGMA busy_timeout = {_BEST_EFFORT_BUSY_MS}")
+            try:
+                self._conn.execute(sql, params)
+            finally:
+                self._conn.execute(f"PRAGMA busy_timeout = {self._busy_ms}")
+
+    def record_hit(self, key: str) -> None:
+        self._best_effort_write(
+            "UPDATE result_cache SET hits = hits + 1, last_access = ? WHERE key = ?",
+            (time(), key),
+        )
+
+    def delete(self, key: str) -> None:
+        self._best_effort_write("DELETE FROM result_cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM result_cache")
+                self._conn.execute(
+                    "UPDATE result_cache_meta SET value = value + 1 WHERE name = 'generation'"
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def generation(self) -> int:
+        with self._lock:
+            (value,) = self._conn.execute(
+                "SELECT value FROM result_cache_meta WHERE name = 'generation'"
+            ).fetchone()
+        return int(value)
+
+    def load(self, limit: int) -> list[tuple[str, CacheEntry]]:
+        if limit <= 0:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, result, key_data, timestamp, hits FROM result_cache "
+                "WHERE timestamp >= ? ORDER BY last_access DESC LIMIT ?",
+                (time() - self._ttl_seconds, limit),
+            ).fetchall()
+        return [(row[0], self._row_to_entry(row[1:])) for row in reversed(rows)]
+
+    def _entry_count(self) -> int:
+        (count,) = self._conn.execute(
+            "SELECT value FROM result_cache_meta WHERE name = 'entries'"
+        ).fetchone()
+        return int(count)
+
+    def size(self) -> int:
+        with self._lock:
+            return self._entry_count()
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            count, total_hits = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM result_cache"
+            ).fetchone()
+        return {
+            "backend": self.name,
+            "entries": int(count),
+            "total_hits": int(total_hits),
+            "persistent": True,
+            "path": str(self._path),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_result_cache_backend(
+    kind: str,
+    cache_dir: Path,
+    max_entries: int,
+    ttl_seconds: float,
+) -> ResultCacheBackend:
+    """Build the backend named by *kind* (``sqlite`` | ``json`` | ``memory``).
+
+    Falls back to the in-memory backend if the on-disk store cannot be
+    opened, so a bad volume mount degrades to a process-local cache rather
+    than taking the service down.
+    """
+    kind = kind.lower().strip()
+    try:
+        if kind == "sqlite":
+            return SqliteResultCacheBackend(cache_dir / SQLITE_CACHE_FILENAME, max_entries, ttl_seconds)
+        if kind == "json":
+            return JsonFileResultCacheBackend(cache_dir / JSON_CACHE_FILENAME, max_entries, ttl_seconds)
+        if kind != "memory":
+            logger.warning(f"⚠️ Unknown cache backend {kind!r} — using memory")
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"⚠️ Cache backend {kind!r} unavailable ({e}) — using memory")
+    return MemoryResultCacheBackend(max_entries, ttl_seconds)
+
+
+# ── fuzzy lookup index ───────────────────────────────────────────────
+
+_INTENT_DIMS = 5
+# Above this many probe cells a bucket scan is always cheaper.
+_MAX_PROBE_CELLS = 4096
+
+_Bucket = tuple[str, tuple[str, ...], int, str]
+_Cell = tuple[int, ...]
+
+
+def _bucket_of(kd: CacheKeyData) -> _Bucket:
+    """Fields that must match exactly for a fuzzy hit."""
+    return (kd["genre"], tuple(kd["instruments"]), kd["bars"], kd["quality_preset"])
+
+
+def _intent_vector(kd: CacheKeyData) -> tuple[float, ...]:
+    return (kd["energy"], kd["valence"], kd["tension"], kd["intimacy"], kd["motion"])
+
+
+class IntentIndex:
+    """Bucketed grid index over quantized intent vectors.
+
+    Cache keys quantize every intent axis to multiples of ``step``, so each
+    entry sits exactly on an integer grid cell. A lookup with radius ε only
+    has to probe the cells whose grid offset is within ε — a fixed set that
+    does not grow with the cache. When a bucket holds fewer entries than
+    there are cells to probe, its entries are returned directly instead.
+    Entries whose vectors are off-grid (e.g. loaded from a cache written
+    with a different step) are kept in a per-bucket side list and always
+    returned as candidates.
+    """
+
+    def __init__(self, step: float) -> None:
+        self._step = step
+        self._cells: dict[_Bucket, dict[_Cell, set[str]]] = {}
+        self._off_grid: dict[_Bucket, set[str]] = {}
+        self._sizes: dict[_Bucket, int] = {}
+        self._located: dict[str, tuple[_Bucket, _Cell | None]] = {}
+        self._offsets: dict[float, list[_Cell] | None] = {}
+
+    def __len__(self) -> int:
+        return len(self._located)
+
+    def _cell_of(self, kd: CacheKeyData) -> _Cell | None:
+        cell: list[int] = []
+        for value in _intent_vector(kd):
+            idx = round(value / self._step)
+            if abs(idx * self._step - value) > 1e-6:
+                return None
+            cell.append(idx)
+        return tuple(cell)
+
+    def _offsets_within(self, epsilon: float) -> list[_Cell] | None:
+        """Grid offsets within *epsilon*, or ``None`` if there are too many to probe."""
+        if epsilon in self._offsets:
+            return self._offsets[epsilon]
+        reach = int(math.floor(epsilon / self._step + 1e-9))
+        offsets: list[_Cell] | None = None
+        if (2 * reach + 1) ** _INTENT_DIMS <= _MAX_PROBE_CELLS:
+            limit = (epsilon / self._step) ** 2 + 1e-9
+            offsets = [
+                o for o in itertools.product(range(-reach, reach + 1), repeat=_INTENT_DIMS)
+                if sum(d * d for d in o) <= limit
+            ]
+        self._offsets[epsilon] = offsets
+        return offsets
+
+    def add(self, key: str, kd: CacheKeyData) -> None:
+        self.discard(key)
+        bucket = _bucket_of(kd)
+        cell = self._cell_of(kd)
+        if cell is None:
+            self._off_grid.setdefault(bucket, set()).add(key)
+        else:
+            self._cells.setdefault(bucket, {}).setdefault(cell, set()).add(key)
+        self._sizes[bucket] = self._sizes.get(bucket, 0) + 1
+        self._located[key] = (bucket, cell)
+
+    def discard(self, key: str) -> None:
+        located = self._located.pop(key, None)
+        if located is None:
+            return
+        bucket, cell = located
+        if cell is None:
+            off_grid = self._off_grid[bucket]
+            off_grid.discard(key)
+            if not off_grid:
+                del self._off_grid[bucket]
+        else:
+            cells = self._cells[bucket]
+            keys = cells[cell]
+            keys.discard(key)
+            if not keys:
+                del cells[cell]
+                if not cells:
+                    del self._cells[bucket]
+        self._sizes[bucket] -= 1
+        if not self._sizes[bucket]:
+            del self._sizes[bucket]
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._off_grid.clear()
+        self._sizes.clear()
+        self._located.clear()
+
+    def candidates(self, kd: CacheKeyData, epsilon: float) -> Iterable[str]:
+        """Keys that may lie within *epsilon* of *kd*; callers check exact distance."""
+        bucket = _bucket_of(kd)
+        cells = self._cells.get(bucket)
+        off_grid = self._off_grid.get(bucket, set())
+        if not cells:
+            return list(off_grid)
+        offsets = self._offsets_within(epsilon)
+        query = self._cell_of(kd)
+        if query is None or offsets is None or len(offsets) >= self._sizes.get(bucket, 0):
+            found = [k for keys in cells.values() for k in keys]
+        else:
+            found = []
+            for offset in offsets:
+                keys = cells.get(tuple(q + d for q, d in zip(query, offset)))
+                if keys:
+                    found.extend(keys)
+        found.extend(off_grid)
+        return found
@@ -0,0 +1,128 @@
+"""Seed preparation cache for the Orpheus generation path.
+
+Preparing a seed — transposing it into the target key, analyzing it, and
+hashing its bytes — is deterministic for a given (seed file, semitones)
+pair, yet ``_do_generate`` used to redo all of it on every call: a fresh
+transposed file written to ``/tmp``, a full MIDI reparse for the analysis
+report, and a second full read for the hash.
+
+``SeedPrepCache`` memoises the prepared result in a bounded LRU keyed by
+(path, size, mtime_ns, semitones), so a library seed is transposed and
+analyzed at most once per key per process and later calls are a
+dictionary lookup. Transposed files are written once per key to a
+stable directory instead of to ``/tmp`` on every call.
+
+Usage in music_service.py:
+    from seed_prep import SeedPrepCache
+    _seed_prep = SeedPrepCache(analyze=analyze_seed, max_entries=512, output_dir=...)
+    prepared = _seed_prep.prepare(selection.path, semitones=3)
+    # prepared.path, prepared.report, prepared.seed_hash
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from midi_transforms import transpose_midi
+
+logger = logging.getLogger(__name__)
+
+_SeedKey = tuple[str, int, int, int]
+
+
+@dataclass(frozen=True)
+class PreparedSeed:
+    """A seed ready for generation: on-disk path, analysis report, content hash."""
+    path: str
+    report: dict[str, object]
+    seed_hash: str
+    transpose_semitones: int = 0
+
+
+def seed_file_hash(path: str) -> str:
+    """Short SHA-256 of the file contents (the ``seed_hash`` used in telemetry)."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+class SeedPrepCache:
+    """Bounded LRU of prepared seeds.
+
+    Entries are keyed by the source file's identity (path, size, mtime_ns),
+    so rebuilding the seed library invalidates them naturally. Thread-safe;
+    preparation itself runs outside the lock, so two concurrent misses on
+    the same key may both do the work, and the last one wins.
+    """
+
+    def __init__(
+        self,
+        analyze: Callable[[str], dict[str, object]],
+        max_entries: int,
+        output_dir: Path,
+    ) -> None:
+        self._analyze = analyze
+        self._max_entries = max_entries
+        self._output_dir = output_dir
+        self._entries: OrderedDict[_SeedKey, PreparedSeed] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def prepare(self, path: str, semitones: int = 0) -> PreparedSeed:
+        """Return the prepared seed for *path* shifted by *semitones*.
+
+        Raises OSError if *path* does not exist.
+        """
+        st = os.stat(path)
+        key: _SeedKey = (path, st.st_size, st.st_mtime_ns, semitones)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and os.path.exists(cached.path):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        prepared = self._build(path, semitones)
+        with self._lock:
+            self._entries[key] = prepared
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return prepared
+
+    def _build(self, path: str, semitones: int) -> PreparedSeed:
+        seed_path = path
+        if semitones != 0:
+            # Seed stems repeat across genres (e.g. ``seed_00``), so keep one
+            # subdirectory per source directory.
+            out_dir = self._output_dir / Path(path).parent.name
+            seed_path = str(transpose_midi(path, semitones, output_dir=out_dir))
+        return PreparedSeed(
+            path=seed_path,
+            report=self._analyze(seed_path),
+            seed_hash=seed_file_hash(seed_path),
+            transpose_semitones=semitones,
+        )
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -7,12 +7,14 @@ to prevent memory issues in production.
 from __future__ import annotations
 
 import pytest
+from pathlib import Path
 from time import time, sleep
 from music_service import (
     get_cache_key,
     get_cached_result,
     cache_result,
     _result_cache,
+    clear_result_cache,
     MAX_CACHE_SIZE,
     CACHE_TTL_SECONDS,
     GenerateRequest,
@@ -22,7 +24,7 @@ from music_service import (
 
 def setup_function() -> None:
     """Clear cache before each test."""
-    _result_cache.clear()
+    clear_result_cache()
 
 
 def test_cache_key_generation() -> None:
@@ -210,3 +212,142 @@ def test_cache_preserves_data() -> None:
     cached_again = get_cached_result(key)
     assert cached_again is not None
     assert cached_again["success"] is True # Not modified
+
+
+def test_sqlite_backend_evicts_least_recently_used(tmp_path: Path) -> None:
+    """The shared backend enforces its own LRU bound, one entry per write."""
+    from result_cache import SqliteResultCacheBackend
+
+    backend = SqliteResultCacheBackend(tmp_path / "cache.sqlite3", max_entries=2, ttl_seconds=3600)
+    backend.put("a", CacheEntry(result={"data": "a"}, timestamp=time()))
+    backend.put("b", CacheEntry(result={"data": "b"}, timestamp=time()))
+    sleep(0.01)
+    backend.record_hit("a")
+    backend.put("c", CacheEntry(result={"data": "c"}, timestamp=time()))
+
+    assert backend.size() == 2
+    assert backend.get("b") is None
+    entry = backend.get("a")
+    assert entry is not None and entry.hits == 1
+    assert backend.get("c") is not None
+
+
+def test_sqlite_backend_drops_expired_entries(tmp_path: Path) -> None:
+    """Expired rows are never returned and are purged on the next write."""
+    from result_cache import SqliteResultCacheBackend
+
+    backend = SqliteResultCacheBackend(tmp_path / "cache.sqlite3", max_entries=10, ttl_seconds=60)
+    backend.put("old", CacheEntry(result={"data": 1}, timestamp=time() - 120))
+    assert backend.get("old") is None
+    backend.put("new", CacheEntry(result={"data": 2}, timestamp=time()))
+    assert backend.size() == 1
+
+
+def test_sqlite_backend_counts_entries_without_scanning(tmp_path: Path) -> None:
+    """The LRU trim reads a trigger-maintained counter that survives re-puts and reopen."""
+    from result_cache import SqliteResultCacheBackend
+
+    path = tmp_path / "cache.sqlite3"
+    backend = SqliteResultCacheBackend(path, max_entries=3, ttl_seconds=3600)
+    for key in ("a", "b", "a", "c", "b"):
+        backend.put(key, CacheEntry(result={"data": key}, timestamp=time()))
+    assert backend.size() == 3
+    backend.delete("c")
+    backend.put("d", CacheEntry(result={"data": "d"}, timestamp=time()))
+    backend.put("e", CacheEntry(result={"data": "e"}, timestamp=time()))
+    assert backend.size() == 3
+    backend.close()
+
+    reopened = SqliteResultCacheBackend(path, max_entries=3, ttl_seconds=3600)
+    assert reopened.size() == 3
+    reopened.clear()
+    assert reopened.size() == 0
+
+
+def test_intent_index_probes_only_nearby_cells() -> None:
+    """Far-away entries in the same bucket are never returned as candidates."""
+    from music_service import _cache_key_data, EmotionVectorPayload
+    from result_cache import IntentIndex
+
+    index = IntentIndex(step=0.2)
+    for i in range(200):
+        energy = (i % 6) * 0.2
+        valence = -1.0 + (i // 6 % 11) * 0.2
+        req = GenerateRequest(emotion_vector=EmotionVectorPayload(energy=energy, valence=valence))
+        index.add(f"key_{i}", _cache_key_data(req))
+
+    query = _cache_key_data(GenerateRequest(emotion_vector=EmotionVectorPayload(energy=0.0, valence=-1.0)))
+    found = set(index.candidates(query, epsilon=0.35))
+    assert "key_0" in found
+    assert len(found) < 200
+
+    other_genre = _cache_key_data(GenerateRequest(genre="jazz"))
+    assert list(index.candidates(other_genre, epsilon=0.35)) == []
+
+
+def test_intent_index_returns_off_grid_entries() -> None:
+    """Entries quantized with a different step are still found (by scan)."""
+    from music_service import _cache_key_data
+    from result_cache import IntentIndex
+
+    index = IntentIndex(step=0.2)
+    kd = _cache_key_data(GenerateRequest())
+    kd["energy"] = 0.55
+    index.add("odd", kd)
+    assert list(index.candidates(_cache_key_data(GenerateRequest()), epsilon=0.35)) == ["odd"]
+    index.discard("odd")
+    assert len(index) == 0
+
+
+def test_clear_on_another_worker_drops_local_hits(tmp_path: Path) -> None:
+    """A /cache/clear on one worker invalidates every worker's local LRU."""
+    from unittest.mock import patch
+    from result_cache import SqliteResultCacheBackend
+
+    path = tmp_path / "cache.sqlite3"
+    ours = SqliteResultCacheBackend(path, max_entries=10, ttl_seconds=3600)
+    theirs = SqliteResultCacheBackend(path, max_entries=10, ttl_seconds=3600)
+    with patch("music_service._cache_backend", ours):
+        clear_result_cache()
+        cache_result("shared", {"success": True})
+        assert get_cached_result("shared") is not None
+
+        theirs.clear()
+        assert get_cached_result("shared") is None
+        assert "shared" not in _result_cache
+
+
+def test_backend_failure_degrades_to_miss() -> None:
+    """A locked or corrupt backend turns lookups into misses instead of errors."""
+    import sqlite3
+    from unittest.mock import MagicMock, patch
+
+    backend = MagicMock()
+    backend.generation.return_value = 0
+    backend.get.side_effect = sqlite3.OperationalError("database is locked")
+    with patch("music_service._cache_backend", backend):
+        assert get_cached_result("missing") is None
+
+        backend.generation.side_effect = sqlite3.DatabaseError("file is not a database")
+        assert get_cached_result("missing") is None
+
+
+def test_sqlite_hit_update_does_not_wait_out_a_writer(tmp_path: Path) -> None:
+    """Hit counting gives up quickly while another process holds the write lock."""
+    import sqlite3
+    from result_cache import SqliteResultCacheBackend
+
+    path = tmp_path / "cache.sqlite3"
+    backend = SqliteResultCacheBackend(path, max_entries=10, ttl_seconds=3600)
+    backend.put("a", CacheEntry(result={"data": "a"}, timestamp=time()))
+    writer = sqlite3.connect(str(path), isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        start = time()
+        with pytest.raises(sqlite3.OperationalError):
+            backend.record_hit("a")
+        assert time() - start < 2.0
+        assert backend.get("a") is not None
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
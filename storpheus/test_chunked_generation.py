@@ -6,6 +6,7 @@ Validates:
 - Threshold routing — requests above threshold go through chunked path
 - No regression for short requests — standard path unchanged below threshold
 - Partial-failure behaviour — incomplete chunked results are surfaced correctly
+- Parallel mode — concurrent chunks on separate client slots, same stitching
 
 All tests are unit-level and mock _do_generate to avoid live Gradio/GPU calls.
 """
@@ -21,6 +22,7 @@ import pytest
 from music_service import (
     GenerateRequest,
     GenerateResponse,
+    JobQueue,
     _CHUNK_BARS,
     _CHUNK_FADE_BEATS,
     _CHUNKED_GEN_THRESHOLD_BARS,
@@ -366,6 +368,117 @@ class TestGenerateChunked:
         assert len(meta["chunk_metadata"]) == 2
 
 
+# ── Parallel chunk mode ─────────────────────────────────────────────────────
+
+@pytest.mark.anyio
+class TestParallelChunks:
+    """_generate_chunked with _CHUNK_PARALLELISM > 1."""
+
+    async def test_chunks_run_concurrently_on_distinct_slots(self) -> None:
+        in_flight = 0
+        peak = 0
+        slots_in_use: set[int] = set()
+        seen: list[GenerateRequest] = []
+
+        async def fake_do_generate(req: GenerateRequest, worker_id: int = 0) -> GenerateResponse:
+            nonlocal in_flight, peak
+            assert worker_id not in slots_in_use
+            slots_in_use.add(worker_id)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            seen.append(req)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            slots_in_use.discard(worker_id)
+            return _make_response([_note(start=0.0)], bars=req.bars)
+
+        request = GenerateRequest(
+            genre="boom_bap", tempo=90, instruments=["drums", "bass"],
+            bars=_CHUNK_BARS * 4, seed=7,
+        )
+        with (
+            patch("music_service._CHUNK_PARALLELISM", 2),
+            patch("music_service._do_generate", side_effect=fake_do_generate),
+        ):
+            result = await _generate_chunked(request)
+
+        assert peak == 2
+        assert result.success
+        assert result.notes is not None
+        assert [n["startBeat"] for n in result.notes] == [
+            pytest.approx(i * _CHUNK_BARS * 4.0) for i in range(4)
+        ]
+        assert result.metadata is not None
+        assert result.metadata["chunk_parallelism"] == 2
+        assert len({r.composition_id for r in seen}) == 4
+        assert sorted(r.seed for r in seen if r.seed is not None) == [7, 8, 9, 10]
+
+    async def test_chunk_lanes_count_against_queue_workers(self) -> None:
+        queue = JobQueue(max_queue=4, max_workers=2)
+        own_slot = await queue.borrow_slots(1)  # the slot the calling job's worker holds
+        in_flight = 0
+        peak = 0
+
+        async def fake_do_generate(req: GenerateRequest, worker_id: int = 0) -> GenerateResponse:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _make_response([_note(start=0.0)], bars=req.bars)
+
+        request = GenerateRequest(
+            genre="boom_bap", tempo=90, instruments=["drums", "bass"], bars=_CHUNK_BARS * 4,
+        )
+        with (
+            patch("music_service._job_queue", queue),
+            patch("music_service._CHUNK_PARALLELISM", 4),
+            patch("music_service._do_generate", side_effect=fake_do_generate),
+        ):
+            result = await _generate_chunked(request)
+
+        assert result.success
+        assert peak == 2
+        queue.return_slots(own_slot)
+        assert await queue.borrow_slots(4) == 2
+
+    async def test_parallel_failure_keeps_prior_chunks_only(self) -> None:
+        async def fake_do_generate(req: GenerateRequest, worker_id: int = 0) -> GenerateResponse:
+            if req.composition_id and req.composition_id.endswith("-1"):
+                raise RuntimeError("GPU OOM")
+            return _make_response([_note(start=0.0)], bars=req.bars)
+
+        request = GenerateRequest(
+            genre="boom_bap", tempo=90, instruments=["drums", "bass"], bars=_CHUNK_BARS * 3,
+        )
+        with (
+            patch("music_service._CHUNK_PARALLELISM", 3),
+            patch("music_service._do_generate", side_effect=fake_do_generate),
+        ):
+            result = await _generate_chunked(request)
+
+        assert not result.success
+        assert result.error is not None and "GPU OOM" in result.error
+        assert result.notes is not None and len(result.notes) == 1
+
+    async def test_single_instrument_stays_sequential(self) -> None:
+        seen_ids: set[str | None] = set()
+
+        async def fake_do_generate(req: GenerateRequest, worker_id: int = 0) -> GenerateResponse:
+            seen_ids.add(req.composition_id)
+            return _make_response([_note()], bars=req.bars)
+
+        request = GenerateRequest(genre="jazz", tempo=120, instruments=["piano"], bars=_CHUNK_BARS * 2)
+        with (
+            patch("music_service._CHUNK_PARALLELISM", 4),
+            patch("music_service._do_generate", side_effect=fake_do_generate),
+        ):
+            result = await _generate_chunked(request)
+
+        assert result.success
+        assert len(seen_ids) == 1
+
+
 # ── Threshold routing (via _do_generate) ─────────────────────────────────────
 
 @pytest.mark.anyio
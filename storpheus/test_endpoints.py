@@ -18,6 +18,7 @@ import music_service
 from music_service import (
     app,
     _result_cache,
+    clear_result_cache,
     JobQueue,
     GenerateRequest,
     GenerateResponse,
@@ -48,7 +49,7 @@ async def client() -> AsyncGenerator[AsyncClient, None]:
 @pytest.fixture(autouse=True)
 def _clear_caches() -> None:
     """Clear caches before each test."""
-    _result_cache.clear()
+    clear_result_cache()
 
 
 # =============================================================================
@@ -18,6 +18,7 @@ from unittest.mock import patch, MagicMock
 from pathlib import Path
 
 from key_detection import (
+    detect_key_from_histogram,
     detect_key_from_pitches,
     key_to_semitones,
     transpose_distance,
@@ -28,14 +29,15 @@ from key_detection import (
 from midi_transforms import transpose_notes
 from candidate_scorer import (
     score_candidate,
+    score_candidates,
     select_best_candidate,
     CandidateScore,
-    _key_compliance,
-    _density_match,
-    _register_compliance,
-    _velocity_compliance,
-    _pattern_diversity,
-    _silence_score,
+    _density_fit,
+    _diversity_fit,
+    _key_fit,
+    _register_fit,
+    _resolve_target_key,
+    _silence_fit,
 )
 from storpheus_types import StorpheusNoteDict, ScoringParams
 from post_processing import PostProcessor, PostProcessorConfig, build_post_processor
@@ -105,6 +107,15 @@ class TestKeyDetection:
         assert result is not None
         assert result[0] in ("G", "D", "C") # G or close relatives
 
+    def test_histogram_matches_pitch_list(self) -> None:
+        """Histogram entry point agrees with the pitch-list entry point."""
+        pitches = [57, 60, 64, 69, 72, 76, 59, 62, 65, 71, 45, 52]
+        pc_counts = [0.0] * 12
+        for p in pitches:
+            pc_counts[p % 12] += 1.0
+        assert detect_key_from_histogram(pc_counts) == detect_key_from_pitches(pitches)
+        assert detect_key_from_histogram([0.0] * 12) is None
+
 
 class TestKeyUtilities:
     """Test key utility functions."""
@@ -253,6 +264,47 @@ class TestCandidateScoring:
         assert result.total_score >= 0.0
         assert result.note_count == 0
 
+    def test_batch_scoring_matches_single(self) -> None:
+        """score_candidates returns exactly what per-candidate scoring does."""
+        params = ScoringParams(
+            bars=4, target_key="A minor", expected_channels=2,
+            register_center=62, register_spread=10,
+            velocity_floor=70, velocity_ceiling=95,
+        )
+        batch = [
+            (idx, notes, {0: notes})
+            for idx, notes in enumerate([
+                self._make_notes(),
+                self._make_notes(n=64, pitch_center=48, pitch_range=30),
+                self._make_notes(n=3),
+                [],
+            ])
+        ]
+        batched = score_candidates(batch, params)
+        singles = [
+            score_candidate(notes, ch, batch_index=idx, params=params)
+            for idx, notes, ch in batch
+        ]
+        assert batched == singles
+        assert [s.batch_index for s in batched] == [0, 1, 2, 3]
+
+    def test_dimensions_from_full_score(self) -> None:
+        """Velocity, register and silence dimensions come out of score_candidate."""
+        notes: list[StorpheusNoteDict] = [
+            StorpheusNoteDict(pitch=60, start_beat=float(i) / 2, duration_beats=0.5, velocity=v)
+            for i, v in enumerate([50, 80] * 8)
+        ]
+        params = ScoringParams(
+            bars=4, target_key=None, expected_channels=1,
+            register_center=60, register_spread=4,
+            velocity_floor=60, velocity_ceiling=100,
+        )
+        dims = score_candidate(notes, {0: notes}, batch_index=0, params=params).dimensions
+        assert dims["key_compliance"] == 0.5
+        assert dims["register"] == 1.0
+        assert dims["velocity"] == 0.5
+        assert dims["silence"] == 0.5
+
     def test_select_best(self) -> None:
         scores = [
             CandidateScore(batch_index=0, total_score=0.5, note_count=20),
@@ -264,45 +316,41 @@ class TestCandidateScoring:
         assert best.total_score == 0.8
 
     def test_key_compliance_no_target(self) -> None:
-        assert _key_compliance([60, 62, 64], None) == 0.5
+        pc_counts = [0.0] * 12
+        for p in (60, 62, 64):
+            pc_counts[p % 12] += 1.0
+        assert _key_fit(pc_counts, 3, _resolve_target_key(None)) == 0.5
 
     def test_density_match_ideal(self) -> None:
-        notes: list[StorpheusNoteDict] = [
-            StorpheusNoteDict(pitch=60, start_beat=i * 0.5, duration_beats=0.5, velocity=80)
-            for i in range(32)
-        ]
-        score = _density_match(notes, 4, 8.0)
-        assert score > 0.9
+        assert _density_fit(32, 4, 8.0) > 0.9
 
     def test_density_match_default_orpheus_output(self) -> None:
         """Typical Orpheus output (~111 notes/bar) scores reasonably with no target."""
-        notes: list[StorpheusNoteDict] = [
-            StorpheusNoteDict(pitch=60, start_beat=i * 0.036, duration_beats=0.1, velocity=80)
-            for i in range(444)
-        ]
-        score = _density_match(notes, 4, None)
+        score = _density_fit(444, 4, None)
         assert score > 0.3, f"Default density should handle typical Orpheus output, got {score}"
 
     def test_register_compliance(self) -> None:
         pitches = list(range(55, 66)) # centered around 60
-        score = _register_compliance(pitches, 60, 12)
+        score = _register_fit(sum(pitches), 0, len(pitches), 60, 12)
         assert score > 0.7
 
     def test_velocity_compliance_all_in_range(self) -> None:
         notes: list[StorpheusNoteDict] = [
-            StorpheusNoteDict(pitch=60, start_beat=float(i), duration_beats=0.5, velocity=v)
+            StorpheusNoteDict(pitch=60, start_beat=float(i) / 10, duration_beats=0.5, velocity=v)
             for i, v in enumerate(range(60, 100))
         ]
-        score = _velocity_compliance(notes, 60, 100)
-        assert score == 1.0
+        params = ScoringParams(
+            bars=4, target_key=None, expected_channels=1,
+            velocity_floor=60, velocity_ceiling=100,
+        )
+        dims = score_candidate(notes, {0: notes}, batch_index=0, params=params).dimensions
+        assert dims["velocity"] == 1.0
 
     def test_silence_score_full(self) -> None:
-        notes: list[StorpheusNoteDict] = [
-            StorpheusNoteDict(pitch=60, start_beat=float(i), duration_beats=0.5, velocity=80)
-            for i in range(16)
-        ]
-        score = _silence_score(notes, 4)
-        assert score == 1.0
+        assert _silence_fit([4, 4, 4, 4], 16, 4) == 1.0
+
+    def test_diversity_repetition_penalised(self) -> None:
+        assert _diversity_fit({(60, 60): 15}, 16) == 0.5
 
 
 # ============================================================================
@@ -15,12 +15,15 @@ import music_service
 from music_service import (
     app,
     Job,
+    JobEventHub,
+    JobPriority,
     JobQueue,
     JobStatus,
     QueueFullError,
     GenerateRequest,
     GenerateResponse,
     _do_generate,
+    job_events,
 )
 
 
@@ -37,7 +40,7 @@ class TestJobQueue:
         q = JobQueue(max_queue=5, max_workers=1)
         # Don't start workers — we just test submit mechanics
         req = GenerateRequest(genre="lofi", tempo=85)
-        job = q.submit(req)
+        job, _ = q.submit(req)
         assert job.status == JobStatus.QUEUED
         assert job.id
         assert job.position == 1
@@ -57,7 +60,7 @@ class TestJobQueue:
     @pytest.mark.asyncio
     async def test_get_job_returns_submitted(self) -> None:
         q = JobQueue(max_queue=5, max_workers=1)
-        job = q.submit(GenerateRequest(genre="x", tempo=90))
+        job, _ = q.submit(GenerateRequest(genre="x", tempo=90))
         assert q.get_job(job.id) is job
 
     @pytest.mark.asyncio
@@ -82,7 +85,7 @@ class TestJobQueue:
             mock_gen.return_value = mock_result
             await q.start()
             try:
-                job = q.submit(GenerateRequest(genre="house", tempo=128))
+                job, _ = q.submit(GenerateRequest(genre="house", tempo=128))
                 await asyncio.wait_for(job.event.wait(), timeout=5)
             finally:
                 await q.shutdown()
@@ -101,7 +104,7 @@ class TestJobQueue:
             mock_gen.side_effect = RuntimeError("GPU exploded")
             await q.start()
             try:
-                job = q.submit(GenerateRequest(genre="trap", tempo=140))
+                job, _ = q.submit(GenerateRequest(genre="trap", tempo=140))
                 await asyncio.wait_for(job.event.wait(), timeout=5)
             finally:
                 await q.shutdown()
@@ -125,8 +128,8 @@ class TestJobQueue:
         with patch("music_service._do_generate", side_effect=_track_gen):
             await q.start()
             try:
-                j1 = q.submit(GenerateRequest(genre="first", tempo=90))
-                j2 = q.submit(GenerateRequest(genre="second", tempo=90))
+                j1, _ = q.submit(GenerateRequest(genre="first", tempo=90))
+                j2, _ = q.submit(GenerateRequest(genre="second", tempo=90))
                 await asyncio.wait_for(j2.event.wait(), timeout=5)
             finally:
                 await q.shutdown()
@@ -139,17 +142,84 @@ class TestJobQueue:
     async def test_dedupe_returns_existing_queued_job(self) -> None:
         """Submitting with the same dedupe key returns the existing job."""
         q = JobQueue(max_queue=5, max_workers=1)
-        j1 = q.submit(GenerateRequest(genre="lofi", tempo=85), dedupe_key="abc123")
-        j2 = q.submit(GenerateRequest(genre="lofi", tempo=85), dedupe_key="abc123")
+        j1, _ = q.submit(GenerateRequest(genre="lofi", tempo=85), dedupe_key="abc123")
+        j2, _ = q.submit(GenerateRequest(genre="lofi", tempo=85), dedupe_key="abc123")
         assert j1 is j2
         assert q.depth == 1 # only one job in the queue
 
+    @pytest.mark.asyncio
+    async def test_dedupe_counts_coalesced_waiters(self) -> None:
+        """Each coalesced submit adds a waiter and shows up in the snapshot."""
+        q = JobQueue(max_queue=5, max_workers=1)
+        job, _ = q.submit(GenerateRequest(genre="lofi", tempo=85), dedupe_key="abc123")
+        for _ in range(3):
+            assert q.submit(GenerateRequest(genre="lofi", tempo=85), dedupe_key="abc123").job is job
+        assert job.waiters == 4
+        snap = q.status_snapshot()
+        assert snap["coalesced_total"] == 3
+        assert snap["coalesced_in_flight"] == 1
+        assert snap["waiters_in_flight"] == 4
+
+    @pytest.mark.asyncio
+    async def test_coalesced_job_canceled_only_when_last_waiter_leaves(self) -> None:
+        """Cancel detaches one waiter; the job survives until none remain."""
+        q = JobQueue(max_queue=5, max_workers=1)
+        job, first = q.submit(GenerateRequest(genre="lofi", tempo=85), dedupe_key="abc123")
+        _, second = q.submit(GenerateRequest(genre="lofi", tempo=85), dedupe_key="abc123")
+        assert first != second
+
+        q.cancel(job.id, first)
+        assert job.status == JobStatus.QUEUED
+        assert job.waiters == 1
+        assert not job.event.is_set()
+
+        last = q.cancel(job.id, second)
+        assert last is not None and last.status == JobStatus.CANCELED
+        assert job.event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_repeated_cancel_detaches_only_own_waiter(self) -> None:
+        """One submitter canceling over and over cannot cancel a shared job."""
+        q = JobQueue(max_queue=5, max_workers=1)
+        job, mine = q.submit(GenerateRequest(genre="lofi", tempo=85), dedupe_key="abc123")
+        q.submit(GenerateRequest(genre="lofi", tempo=85), dedupe_key="abc123")
+        q.submit(GenerateRequest(genre="lofi", tempo=85), dedupe_key="abc123")
+
+        for _ in range(5):
+            q.cancel(job.id, mine)
+        assert job.status == JobStatus.QUEUED
+        assert job.waiters == 2
+        assert q.cancel(job.id, "not-a-waiter") is job
+        assert job.waiters == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_in_process_caller_detaches_its_waiter(self) -> None:
+        """An in-process caller that is cancelled releases only its own waiter."""
+        q = JobQueue(max_queue=5, max_workers=1)
+        req = GenerateRequest(genre="lofi", tempo=85)
+        with patch.object(music_service, "_job_queue", q):
+            first = asyncio.create_task(music_service._run_batch_job(req, dedupe_key="abc123"))
+            second = asyncio.create_task(music_service._run_batch_job(req, dedupe_key="abc123"))
+            await asyncio.sleep(0)
+            job = q.get_job(q._dedupe["abc123"])
+            assert job is not None and job.waiters == 2
+
+            first.cancel()
+            await asyncio.gather(first, return_exceptions=True)
+            assert job.status == JobStatus.QUEUED
+            assert job.waiters == 1
+
+            second.cancel()
+            await asyncio.gather(second, return_exceptions=True)
+        final = q.get_job(job.id)
+        assert final is not None and final.status == JobStatus.CANCELED
+
     @pytest.mark.asyncio
     async def test_dedupe_allows_different_keys(self) -> None:
         """Different dedupe keys create separate jobs."""
         q = JobQueue(max_queue=5, max_workers=1)
-        j1 = q.submit(GenerateRequest(genre="lofi", tempo=85), dedupe_key="aaa")
-        j2 = q.submit(GenerateRequest(genre="trap", tempo=140), dedupe_key="bbb")
+        j1, _ = q.submit(GenerateRequest(genre="lofi", tempo=85), dedupe_key="aaa")
+        j2, _ = q.submit(GenerateRequest(genre="trap", tempo=140), dedupe_key="bbb")
         assert j1 is not j2
         assert q.depth == 2
 
@@ -162,11 +232,11 @@ class TestJobQueue:
             mock_gen.return_value = GenerateResponse(success=True, tool_calls=[])
             await q.start()
             try:
-                j1 = q.submit(GenerateRequest(genre="x", tempo=90), dedupe_key="dup")
+                j1, _ = q.submit(GenerateRequest(genre="x", tempo=90), dedupe_key="dup")
                 await asyncio.wait_for(j1.event.wait(), timeout=5)
                 assert j1.status == JobStatus.COMPLETE
 
-                j2 = q.submit(GenerateRequest(genre="x", tempo=90), dedupe_key="dup")
+                j2, _ = q.submit(GenerateRequest(genre="x", tempo=90), dedupe_key="dup")
                 assert j2 is not j1 # new job created
                 assert j2.status == JobStatus.QUEUED
             finally:
@@ -176,8 +246,8 @@ class TestJobQueue:
     async def test_dedupe_no_key_always_creates_new(self) -> None:
         """Without a dedupe key, every submit creates a new job."""
         q = JobQueue(max_queue=5, max_workers=1)
-        j1 = q.submit(GenerateRequest(genre="lofi", tempo=85))
-        j2 = q.submit(GenerateRequest(genre="lofi", tempo=85))
+        j1, _ = q.submit(GenerateRequest(genre="lofi", tempo=85))
+        j2, _ = q.submit(GenerateRequest(genre="lofi", tempo=85))
         assert j1 is not j2
         assert q.depth == 2
 
@@ -185,7 +255,7 @@ class TestJobQueue:
     async def test_cancel_queued_job(self) -> None:
         """Canceling a queued job marks it canceled and sets the event."""
         q = JobQueue(max_queue=5, max_workers=1)
-        job = q.submit(GenerateRequest(genre="lofi", tempo=85))
+        job, _ = q.submit(GenerateRequest(genre="lofi", tempo=85))
         assert job.status == JobStatus.QUEUED
 
         result = q.cancel(job.id)
@@ -213,10 +283,10 @@ class TestJobQueue:
         with patch("music_service._do_generate", side_effect=_counting_gen):
             await q.start()
             try:
-                j1 = q.submit(GenerateRequest(genre="first", tempo=90))
+                j1, _ = q.submit(GenerateRequest(genre="first", tempo=90))
                 q.cancel(j1.id) # cancel before worker picks it up
 
-                j2 = q.submit(GenerateRequest(genre="second", tempo=90))
+                j2, _ = q.submit(GenerateRequest(genre="second", tempo=90))
                 await asyncio.wait_for(j2.event.wait(), timeout=5)
             finally:
                 await q.shutdown()
@@ -234,7 +304,7 @@ class TestJobQueue:
             mock_gen.return_value = GenerateResponse(success=True, tool_calls=[])
             await q.start()
             try:
-                job = q.submit(GenerateRequest(genre="x", tempo=90))
+                job, _ = q.submit(GenerateRequest(genre="x", tempo=90))
                 await asyncio.wait_for(job.event.wait(), timeout=5)
                 assert job.status == JobStatus.COMPLETE
 
@@ -252,7 +322,7 @@ class TestJobQueue:
             mock_gen.return_value = GenerateResponse(success=True, tool_calls=[])
             await q.start()
             try:
-                job = q.submit(GenerateRequest(genre="x", tempo=90))
+                job, _ = q.submit(GenerateRequest(genre="x", tempo=90))
                 await asyncio.wait_for(job.event.wait(), timeout=5)
 
                 assert q.get_job(job.id) is not None
@@ -265,6 +335,257 @@ class TestJobQueue:
                 await q.shutdown()
 
 
+# ============================================================================
+# Scheduling: priority classes, tenant fairness, abandoned jobs
+# ============================================================================
+
+
+class TestScheduling:
+    """Dispatch order and deadline handling of the fair scheduler."""
+
+    async def _run_order(self, q: JobQueue, jobs: list[Job]) -> list[str]:
+        order: list[str] = []
+
+        async def _track_gen(req: GenerateRequest, **kwargs: object) -> GenerateResponse:
+            order.append(req.genre)
+            return GenerateResponse(success=True, tool_calls=[])
+
+        with (
+            patch("music_service._do_generate", side_effect=_track_gen),
+            patch("music_service._COOLDOWN_SECONDS", 0),
+        ):
+            await q.start()
+            try:
+                for job in jobs:
+                    await asyncio.wait_for(job.event.wait(), timeout=5)
+            finally:
+                await q.shutdown()
+        return order
+
+    @pytest.mark.asyncio
+    async def test_tenants_are_served_round_robin(self) -> None:
+        """A tenant that floods the queue does not delay another tenant's job."""
+        q = JobQueue(max_queue=10, max_workers=1)
+        jobs = [
+            q.submit(GenerateRequest(genre=f"flood{i}", composition_id="A")).job
+            for i in range(4)
+        ]
+        jobs.append(q.submit(GenerateRequest(genre="other", composition_id="B")).job)
+        order = await self._run_order(q, jobs)
+        assert order.index("other") == 1
+
+    @pytest.mark.asyncio
+    async def test_interactive_jobs_run_before_batch(self) -> None:
+        q = JobQueue(max_queue=10, max_workers=1)
+        batch, _ = q.submit(GenerateRequest(genre="warm", priority=JobPriority.BATCH))
+        live, _ = q.submit(GenerateRequest(genre="live"))
+        order = await self._run_order(q, [batch, live])
+        assert order == ["live", "warm"]
+
+    @pytest.mark.asyncio
+    async def test_batch_is_not_starved(self) -> None:
+        q = JobQueue(max_queue=20, max_workers=1)
+        jobs = [q.submit(GenerateRequest(genre="warm", priority=JobPriority.BATCH)).job]
+        jobs += [
+            q.submit(GenerateRequest(genre=f"live{i}", composition_id=f"c{i}")).job
+            for i in range(10)
+        ]
+        with patch("music_service._INTERACTIVE_WEIGHT", 4):
+            order = await self._run_order(q, jobs)
+        assert order.index("warm") <= 4
+
+    @pytest.mark.asyncio
+    async def test_interactive_coalesce_promotes_batch_job(self) -> None:
+        q = JobQueue(max_queue=10, max_workers=1)
+        warm, _ = q.submit(GenerateRequest(genre="warm", priority=JobPriority.BATCH), dedupe_key="k")
+        other, _ = q.submit(GenerateRequest(genre="other", priority=JobPriority.BATCH))
+        assert q.submit(GenerateRequest(genre="warm"), dedupe_key="k").job is warm
+        assert warm.priority == JobPriority.INTERACTIVE
+        snap = q.status_snapshot()
+        classes = snap["classes"]
+        assert isinstance(classes, dict)
+        assert classes["interactive"]["depth"] == 1
+        assert classes["batch"]["depth"] == 1
+        order = await self._run_order(q, [warm, other])
+        assert order == ["warm", "other"]
+
+    def test_interactive_backlog_is_clamped_per_tenant(self) -> None:
+        """A tenant's interactive jobs beyond the cap are scheduled as batch."""
+        q = JobQueue(max_queue=10, max_workers=1)
+        with patch("music_service._INTERACTIVE_PER_TENANT", 2):
+            jobs = [
+                q.submit(GenerateRequest(genre=f"flood{i}", composition_id="A")).job
+                for i in range(3)
+            ]
+            other, _ = q.submit(GenerateRequest(genre="other", composition_id="B"))
+        assert [j.priority for j in jobs] == [
+            JobPriority.INTERACTIVE, JobPriority.INTERACTIVE, JobPriority.BATCH,
+        ]
+        assert other.priority == JobPriority.INTERACTIVE
+
+    @pytest.mark.asyncio
+    async def test_ab_test_runs_as_batch_jobs(self) -> None:
+        """/quality/ab-test generations go through the queue in the batch class."""
+        import music_service
+
+        q = JobQueue(max_queue=10, max_workers=1)
+        seen: list[JobPriority] = []
+
+        async def _gen(req: GenerateRequest, **kwargs: object) -> GenerateResponse:
+            seen.append(req.priority)
+            return GenerateResponse(success=False, error="boom")
+
+        with (
+            patch("music_service._do_generate", side_effect=_gen),
+            patch("music_service._COOLDOWN_SECONDS", 0),
+            patch.object(music_service, "_job_queue", q),
+        ):
+            await q.start()
+            try:
+                result = await music_service.ab_test(music_service.ABTestRequest(
+                    config_a=GenerateRequest(genre="a"),
+                    config_b=GenerateRequest(genre="b"),
+                ))
+            finally:
+                await q.shutdown()
+        assert seen == [JobPriority.BATCH, JobPriority.BATCH]
+        assert result["result_a_success"] is False
+
+    @pytest.mark.asyncio
+    async def test_unpolled_job_is_dropped_before_running(self) -> None:
+        q = JobQueue(max_queue=10, max_workers=1)
+        stale, _ = q.submit(GenerateRequest(genre="stale"), abandon_after_s=30)
+        stale.created_at -= 60
+        fresh, _ = q.submit(GenerateRequest(genre="fresh"), abandon_after_s=30)
+        order = await self._run_order(q, [stale, fresh])
+        assert order == ["fresh"]
+        assert stale.status == JobStatus.CANCELED
+        assert stale.error is not None and "Abandoned" in stale.error
+        assert q.status_snapshot()["abandoned_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_streamed_job_is_not_abandoned(self) -> None:
+        """A job a connected /jobs/events stream waits on runs even when unpolled."""
+        q = JobQueue(max_queue=10, max_workers=1)
+        q.events.open("stream-a")
+        job, _ = q.submit(GenerateRequest(genre="pushed"), abandon_after_s=30, stream="stream-a")
+        job.created_at -= 60
+        order = await self._run_order(q, [job])
+        assert order == ["pushed"]
+        assert job.status == JobStatus.COMPLETE
+
+    @pytest.mark.asyncio
+    async def test_detached_stream_waiter_no_longer_keeps_job(self) -> None:
+        """A stream stays connected, but a waiter that canceled stops counting as interest."""
+        q = JobQueue(max_queue=10, max_workers=1)
+        q.events.open("stream-a")
+        job, pushed = q.submit(
+            GenerateRequest(genre="x"), dedupe_key="k", abandon_after_s=30, stream="stream-a",
+        )
+        q.submit(GenerateRequest(genre="x"), dedupe_key="k", abandon_after_s=30)
+        job.created_at -= 60
+        job.last_polled_at -= 60
+        assert q.events.watching(job)
+        q.cancel(job.id, pushed)
+        assert q.events.is_open("stream-a")
+        assert not q.events.watching(job)
+        order = await self._run_order(q, [job])
+        assert order == []
+        assert job.error is not None and "Abandoned" in job.error
+
+    @pytest.mark.asyncio
+    async def test_wait_time_histogram_per_class(self) -> None:
+        q = JobQueue(max_queue=10, max_workers=1)
+        job, _ = q.submit(GenerateRequest(genre="x", priority=JobPriority.BATCH))
+        await self._run_order(q, [job])
+        classes = q.status_snapshot()["classes"]
+        assert isinstance(classes, dict)
+        assert classes["batch"]["wait_time"]["count"] == 1
+        assert classes["interactive"]["wait_time"]["count"] == 0
+
+
+class TestJobEvents:
+    """Job updates pushed to /jobs/events streams through JobEventHub."""
+
+    @staticmethod
+    def _drain(queue: asyncio.Queue[dict[str, object] | None]) -> list[object]:
+        items: list[object] = []
+        while not queue.empty():
+            item = queue.get_nowait()
+            items.append(None if item is None else item["status"])
+        return items
+
+    @pytest.mark.asyncio
+    async def test_worker_pushes_running_and_complete(self) -> None:
+        q = JobQueue(max_queue=10, max_workers=1)
+        stream = q.events.open("stream-a")
+        job, _ = q.submit(GenerateRequest(genre="x"), stream="stream-a")
+        with (
+            patch("music_service._do_generate", new_callable=AsyncMock,
+                  return_value=GenerateResponse(success=True, tool_calls=[])),
+            patch("music_service._COOLDOWN_SECONDS", 0),
+        ):
+            await q.start()
+            try:
+                await asyncio.wait_for(job.event.wait(), timeout=5)
+            finally:
+                await q.shutdown()
+        assert self._drain(stream) == ["running", "complete"]
+
+    @pytest.mark.asyncio
+    async def test_coalesced_job_pushes_to_every_stream(self) -> None:
+        q = JobQueue(max_queue=10, max_workers=1)
+        first = q.events.open("stream-a")
+        second = q.events.open("stream-b")
+        job, a = q.submit(GenerateRequest(genre="x"), dedupe_key="k", stream="stream-a")
+        shared, b = q.submit(GenerateRequest(genre="x"), dedupe_key="k", stream="stream-b")
+        assert shared is job
+        q.cancel(job.id, a)
+        q.cancel(job.id, b)
+        assert self._drain(first) == ["canceled"]
+        assert self._drain(second) == ["canceled"]
+
+    def test_stream_that_falls_behind_is_closed(self) -> None:
+        hub = JobEventHub(buffer=2)
+        stream = hub.open("stream-a")
+        job = Job(id="j1", request=GenerateRequest(genre="x"), streams={"stream-a"})
+        for _ in range(3):
+            hub.publish(job)
+        assert not hub.is_open("stream-a")
+        assert self._drain(stream) == [None]
+
+    def test_reopening_stream_ends_previous_connection(self) -> None:
+        hub = JobEventHub()
+        old = hub.open("stream-a")
+        new = hub.open("stream-a")
+        hub.close("stream-a", old)
+        assert hub.is_open("stream-a")
+        assert self._drain(old) == [None]
+        assert self._drain(new) == []
+
+    @pytest.mark.asyncio
+    async def test_events_endpoint_streams_job_updates(self) -> None:
+        q = JobQueue(max_queue=10, max_workers=1)
+        music_service._job_queue = q
+        try:
+            response = await job_events(stream="stream-a")
+            body = response.body_iterator
+            assert isinstance(body, AsyncGenerator)
+            ready = await body.__anext__()
+            assert ready == 'event: ready\ndata: {"stream": "stream-a"}\n\n'
+
+            job, _ = q.submit(GenerateRequest(genre="x"), stream="stream-a")
+            q.cancel(job.id)
+            update = await body.__anext__()
+            assert isinstance(update, str) and update.startswith("event: job\ndata: ")
+            assert f'"jobId": "{job.id}"' in update and '"status": "canceled"' in update
+
+            await body.aclose()
+            assert not q.events.is_open("stream-a")
+        finally:
+            music_service._job_queue = None
+
+
 # ============================================================================
 # Endpoint integration tests (via ASGI transport)
 # ============================================================================
@@ -324,6 +645,49 @@ class TestEndpoints:
         assert data["status"] == "queued"
         assert "jobId" in data
 
+    @pytest.mark.asyncio
+    async def test_generate_attaches_job_stream_header(self, async_client: AsyncClient) -> None:
+        with (
+            patch("music_service.get_cached_result", return_value=None),
+            patch("music_service.fuzzy_cache_lookup", return_value=None),
+        ):
+            resp = await async_client.post(
+                "/generate",
+                json={"genre": "trap", "tempo": 140, "instruments": ["drums"]},
+                headers={"X-Job-Stream": "stream-a"},
+            )
+        assert music_service._job_queue is not None
+        job = music_service._job_queue.get_job(resp.json()["jobId"])
+        assert job is not None and job.streams == {"stream-a"}
+
+    @pytest.mark.asyncio
+    async def test_cancel_shared_job_requires_waiter_token(self, async_client: AsyncClient) -> None:
+        body = {"genre": "trap", "tempo": 140, "instruments": ["drums"]}
+        release = asyncio.Event()
+
+        async def _held_generate(*args: object, **kwargs: object) -> dict[str, object]:
+            await release.wait()
+            return {"success": True}
+
+        with (
+            patch("music_service.get_cached_result", return_value=None),
+            patch("music_service.fuzzy_cache_lookup", return_value=None),
+            patch("music_service._do_generate", side_effect=_held_generate),
+        ):
+            first = (await async_client.post("/generate", json=body)).json()
+            second = (await async_client.post("/generate", json=body)).json()
+        assert first["jobId"] == second["jobId"]
+        assert first["waiter"] != second["waiter"]
+        url = f"/jobs/{first['jobId']}/cancel"
+
+        assert (await async_client.post(url)).status_code == 409
+        for _ in range(3):
+            resp = await async_client.post(url, params={"waiter": first["waiter"]})
+            assert resp.json()["status"] in ("queued", "running")
+        resp = await async_client.post(url, params={"waiter": second["waiter"]})
+        assert resp.json()["status"] == "canceled"
+        release.set()
+
     @pytest.mark.asyncio
     async def test_get_job_returns_404_for_unknown(self, async_client: AsyncClient) -> None:
         resp = await async_client.get("/jobs/nonexistent-id")
@@ -342,3 +706,4 @@ class TestEndpoints:
         assert "depth" in data
         assert "running" in data
         assert "max_concurrent" in data
+        assert data["coalesced_total"] == 0
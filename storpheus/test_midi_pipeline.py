@@ -1,6 +1,6 @@
 """Tests for the MIDI parsing pipeline.
 
-Covers: parse_midi_to_notes, filter_channels_for_instruments,
+Covers: parse_midi_to_notes (and the midi_parse columnar parser), filter_channels_for_instruments,
 _channels_to_keep, rejection_score.
 
 These functions are the critical path between Orpheus output and Maestro input.
@@ -10,7 +10,9 @@ from __future__ import annotations
 
 import os
 import tempfile
+from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from midiutil import MIDIFile
@@ -20,6 +22,7 @@ from music_service import (
     filter_channels_for_instruments,
     _channels_to_keep,
 )
+from midi_parse import parse_midi_columns
 from quality_metrics import rejection_score
 
 
@@ -68,6 +71,37 @@ def _make_midi(
     return path
 
 
+def _write_raw_midi(
+    ticks_per_beat: int,
+    events: list[tuple[int, int | None, int, int]],
+) -> str:
+    """Write a single-track SMF from (delta_ticks, status, data1, data2).
+
+    ``status=None`` emits the event with running status.
+    """
+    body = bytearray()
+    for delta, status, d1, d2 in events:
+        vlq = [delta & 0x7F]
+        delta >>= 7
+        while delta:
+            vlq.insert(0, (delta & 0x7F) | 0x80)
+            delta >>= 7
+        body += bytes(vlq)
+        if status is not None:
+            body.append(status)
+        body += bytes([d1, d2])
+    body += b"\x00\xff\x2f\x00"
+    data = (
+        b"MThd" + (6).to_bytes(4, "big") + (0).to_bytes(2, "big")
+        + (1).to_bytes(2, "big") + ticks_per_beat.to_bytes(2, "big")
+        + b"MTrk" + len(body).to_bytes(4, "big") + bytes(body)
+    )
+    fd, path = tempfile.mkstemp(suffix=".mid")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    return path
+
+
 # =============================================================================
 # parse_midi_to_notes
 # =============================================================================
@@ -153,6 +187,79 @@ class TestParseMidiToNotes:
         note = result["notes"][0][0]
         assert note["duration_beats"] > 0
 
+    def test_half_beat_note_does_not_capture_later_note_off(self) -> None:
+        """A closed 0.5-beat note is not mistaken for an open one."""
+        # Pitch 60 held 0–4; a second pitch-60 note 1–1.5 nested inside it.
+        path = _write_raw_midi(96, [
+            (0, 0x90, 60, 100),
+            (96, 0x90, 60, 90),
+            (48, 0x80, 60, 0),
+            (240, 0x80, 60, 0),
+        ])
+        result = parse_midi_to_notes(path, tempo=120)
+        os.unlink(path)
+
+        durations = [n["duration_beats"] for n in result["notes"][0]]
+        assert durations == [4.0, 0.5]
+
+    def test_running_status_and_pitch_bend(self) -> None:
+        """Running-status events and signed pitch-bend values are decoded."""
+        path = _write_raw_midi(480, [
+            (0, 0x91, 64, 80),
+            (240, None, 64, 0),  # running status note_on vel 0 == note_off
+            (0, 0xE1, 0x00, 0x40),
+            (0, None, 0x00, 0x00),
+        ])
+        result = parse_midi_to_notes(path, tempo=120)
+        os.unlink(path)
+
+        assert result["notes"][1] == [
+            {"pitch": 64, "start_beat": 0.0, "duration_beats": 0.5, "velocity": 80},
+        ]
+        assert [b["value"] for b in result["pitch_bends"][1]] == [0, -8192]
+
+    def test_truncated_trailing_chunk_keeps_complete_events(self) -> None:
+        """A final track chunk cut short is parsed up to its last whole event."""
+        path = _write_raw_midi(96, [
+            (0, 0x90, 60, 100),
+            (96, 0x80, 60, 0),
+            (0, 0x90, 64, 100),
+            (96, 0x80, 64, 0),
+        ])
+        with open(path, "rb") as f:
+            data = f.read()
+        # Drop the end-of-track meta and half of the last note-off.
+        with open(path, "wb") as f:
+            f.write(data[:-6])
+        result = parse_midi_to_notes(path, tempo=120)
+        os.unlink(path)
+
+        assert [(n["pitch"], n["duration_beats"]) for n in result["notes"][0]] == [
+            (60, 1.0), (64, 0.5),
+        ]
+
+    def test_missing_tracks_are_tolerated(self) -> None:
+        """A header declaring more tracks than present keeps the ones found."""
+        path = _write_raw_midi(96, [(0, 0x90, 60, 100), (96, 0x80, 60, 0)])
+        with open(path, "r+b") as f:
+            f.seek(10)
+            f.write((3).to_bytes(2, "big"))
+        result = parse_midi_to_notes(path, tempo=120)
+        os.unlink(path)
+
+        assert len(result["notes"][0]) == 1
+
+    def test_columns_match_dict_view(self) -> None:
+        """The columnar parse and the dict adapter agree."""
+        path = _make_midi([(0, 60, 0.0, 1.0, 80), (0, 67, 0.5, 0.25, 70)])
+        columns = parse_midi_columns(path)
+        result = parse_midi_to_notes(path, tempo=120)
+        os.unlink(path)
+
+        cols = columns.notes[0]
+        assert list(cols.pitch) == [n["pitch"] for n in result["notes"][0]]
+        assert list(cols.duration_beats) == [1.0, 0.25]
+
 
 # =============================================================================
 # _channels_to_keep
@@ -319,8 +426,8 @@ class TestFuzzyCache:
     """Tests for fuzzy (epsilon) cache matching."""
 
     def setup_method(self) -> None:
-        from music_service import _result_cache
-        _result_cache.clear()
+        from music_service import clear_result_cache
+        clear_result_cache()
 
     def test_exact_match_returns_result(self) -> None:
         from music_service import (
@@ -383,6 +490,47 @@ class TestFuzzyCache:
         req = GenerateRequest(genre="trap", tempo=140)
         assert fuzzy_cache_lookup(req) is None
 
+    def test_nearest_of_many_entries_wins(self) -> None:
+        from music_service import (
+            cache_result, fuzzy_cache_lookup, get_cache_key,
+            GenerateRequest, _cache_key_data, EmotionVectorPayload,
+        )
+        for energy in (0.0, 0.2, 0.4, 0.6, 0.8, 1.0):
+            for genre in ("trap", "house"):
+                req = GenerateRequest(
+                    genre=genre, tempo=140, instruments=["drums"],
+                    emotion_vector=EmotionVectorPayload(energy=energy),
+                )
+                cache_result(
+                    get_cache_key(req),
+                    {"success": True, "tool_calls": [], "metadata": {"energy": energy, "genre": genre}},
+                    key_data=_cache_key_data(req),
+                )
+        query = GenerateRequest(
+            genre="trap", tempo=120, instruments=["drums"],
+            emotion_vector=EmotionVectorPayload(energy=0.6, valence=0.2),
+        )
+        result = fuzzy_cache_lookup(query)
+        assert result is not None
+        meta = result["metadata"]
+        assert isinstance(meta, dict)
+        assert meta["genre"] == "trap" and meta["energy"] == 0.6
+        assert meta["fuzzy_distance"] == pytest.approx(0.2)
+
+    def test_evicted_entry_leaves_index(self) -> None:
+        from music_service import (
+            _intent_index, _result_cache, cache_result, get_cache_key,
+            GenerateRequest, _cache_key_data,
+        )
+        import music_service
+        req = GenerateRequest(genre="trap", tempo=140, instruments=["drums"])
+        cache_result(get_cache_key(req), {"success": True}, key_data=_cache_key_data(req))
+        assert len(_intent_index) == 1
+        with patch.object(music_service, "MAX_CACHE_SIZE", 1):
+            cache_result("other", {"success": True})
+        assert get_cache_key(req) not in _result_cache
+        assert len(_intent_index) == 0
+
 
 # =============================================================================
 # Cache disk persistence
@@ -393,21 +541,20 @@ class TestCachePersistence:
     """Tests for save/load cache to disk."""
 
     def setup_method(self) -> None:
-        from music_service import _result_cache
-        _result_cache.clear()
+        from music_service import clear_result_cache
+        clear_result_cache()
 
     def test_save_and_load_roundtrip(self, tmp_path: Any) -> None:
-        from music_service import (
-            _result_cache, _save_cache_to_disk, _load_cache_from_disk,
-            cache_result, _CACHE_FILE, CacheEntry,
-        )
+        from music_service import _result_cache, _load_cache_from_disk, cache_result
+        from result_cache import SqliteResultCacheBackend
         import music_service
 
-        original_cache_file = music_service._CACHE_FILE
-        music_service._CACHE_FILE = tmp_path / "cache.json"
+        original_backend = music_service._cache_backend
+        music_service._cache_backend = SqliteResultCacheBackend(
+            tmp_path / "cache.sqlite3", max_entries=10, ttl_seconds=3600,
+        )
         try:
             cache_result("test_key", {"success": True, "tool_calls": []})
-            _save_cache_to_disk()
 
             _result_cache.clear()
             assert len(_result_cache) == 0
@@ -416,28 +563,50 @@ class TestCachePersistence:
             assert loaded == 1
             assert "test_key" in _result_cache
         finally:
-            music_service._CACHE_FILE = original_cache_file
+            music_service._cache_backend = original_backend
 
     def test_load_skips_expired_entries(self, tmp_path: Any) -> None:
-        from music_service import (
-            _result_cache, _save_cache_to_disk, _load_cache_from_disk,
-            CacheEntry, CACHE_TTL_SECONDS,
-        )
+        from music_service import _result_cache, _load_cache_from_disk, CacheEntry, CACHE_TTL_SECONDS
+        from result_cache import SqliteResultCacheBackend
         import music_service
         from time import time
 
-        original_cache_file = music_service._CACHE_FILE
-        music_service._CACHE_FILE = tmp_path / "cache.json"
+        original_backend = music_service._cache_backend
+        backend = SqliteResultCacheBackend(
+            tmp_path / "cache.sqlite3", max_entries=10, ttl_seconds=CACHE_TTL_SECONDS,
+        )
+        music_service._cache_backend = backend
         try:
-            _result_cache["expired_key"] = CacheEntry(
+            backend.put("expired_key", CacheEntry(
                 result={"data": 1},
                 timestamp=time() - CACHE_TTL_SECONDS - 100,
                 hits=0,
-            )
-            _save_cache_to_disk()
+            ))
 
             _result_cache.clear()
             loaded = _load_cache_from_disk()
             assert loaded == 0
         finally:
-            music_service._CACHE_FILE = original_cache_file
+            music_service._cache_backend = original_backend
+
+    def test_local_miss_reads_through_shared_backend(self, tmp_path: Path) -> None:
+        """An entry written by another worker process is served on a local miss."""
+        from music_service import _result_cache, get_cached_result, CacheEntry
+        from result_cache import SqliteResultCacheBackend
+        import music_service
+        from time import time
+
+        path = tmp_path / "cache.sqlite3"
+        original_backend = music_service._cache_backend
+        music_service._cache_backend = SqliteResultCacheBackend(path, max_entries=10, ttl_seconds=3600)
+        try:
+            other_worker = SqliteResultCacheBackend(path, max_entries=10, ttl_seconds=3600)
+            other_worker.put("shared_key", CacheEntry(result={"success": True}, timestamp=time()))
+            other_worker.close()
+
+            _result_cache.clear()
+            result = get_cached_result("shared_key")
+            assert result is not None and result["success"] is True
+            assert "shared_key" in _result_cache
+        finally:
+            music_service._cache_backend = original_backend
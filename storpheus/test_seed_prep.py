@@ -0,0 +1,72 @@
+"""Tests for the seed preparation cache (transpose + analyze + hash memoisation)."""
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import mido
+from midiutil import MIDIFile
+
+from seed_prep import SeedPrepCache, seed_file_hash
+
+
+def _write_seed(path: Path, pitch: int = 60) -> str:
+    midi = MIDIFile(1)
+    midi.addTempo(0, 0, 120)
+    for i in range(8):
+        midi.addNote(0, 0, pitch + i, float(i), 1.0, 90)
+    with open(path, "wb") as f:
+        midi.writeFile(f)
+    return str(path)
+
+
+def _pitches(path: str) -> list[int]:
+    return [
+        msg.note for track in mido.MidiFile(path).tracks for msg in track
+        if msg.type == "note_on" and msg.velocity > 0
+    ]
+
+
+def _analyze(path: str) -> dict[str, object]:
+    return {"seed_notes": len(_pitches(path)), "quality_ok": True}
+
+
+def test_repeat_prepare_is_a_lookup(tmp_path: Path) -> None:
+    seed = _write_seed(tmp_path / "seed_00.mid")
+    analyze = MagicMock(side_effect=_analyze)
+    cache = SeedPrepCache(analyze=analyze, max_entries=8, output_dir=tmp_path / "out")
+
+    first = cache.prepare(seed, 0)
+    second = cache.prepare(seed, 0)
+
+    assert first is second
+    assert analyze.call_count == 1
+    assert first.seed_hash == seed_file_hash(seed)
+    assert cache.stats()["hits"] == 1
+
+
+def test_transposition_written_once_and_shifted(tmp_path: Path) -> None:
+    seed = _write_seed(tmp_path / "seed_00.mid")
+    cache = SeedPrepCache(analyze=_analyze, max_entries=8, output_dir=tmp_path / "out")
+
+    up = cache.prepare(seed, 3)
+    assert up.path != seed
+    assert Path(up.path).is_relative_to(tmp_path / "out")
+    assert _pitches(up.path) == [p + 3 for p in _pitches(seed)]
+    assert up.seed_hash == seed_file_hash(up.path)
+    assert cache.prepare(seed, 3) is up
+    assert cache.prepare(seed, -2) is not up
+
+
+def test_lru_bound_and_source_change_invalidate(tmp_path: Path) -> None:
+    seed = _write_seed(tmp_path / "seed_00.mid")
+    cache = SeedPrepCache(analyze=_analyze, max_entries=2, output_dir=tmp_path / "out")
+    for semitones in (1, 2, 3):
+        cache.prepare(seed, semitones)
+    assert len(cache) == 2
+
+    before = cache.prepare(seed, 0)
+    _write_seed(tmp_path / "seed_00.mid", pitch=40)
+    after = cache.prepare(seed, 0)
+    assert after is not before
+    assert after.seed_hash != before.seed_hash
@@ -0,0 +1,174 @@
+"""Tests for changed-path Bloom filters — ``maestro.muse_cli.changed_paths``.
+
+Coverage:
+- Filters never give false negatives, for files and parent directories
+- Oversized change sets and missing filters answer "maybe"
+- path_changed compares files and directory prefixes between manifests
+- muse commit stores a filter computed against the parent snapshot
+- backfill_changed_path_blooms fills in filters for commits without one
+- CommitGraph.may_have_changed and the generation-ordered merge-base
+"""
+from __future__ import annotations
+
+import json
+import pathlib
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from maestro.muse_cli.changed_paths import (
+    MAX_CHANGED_PATHS,
+    backfill_changed_path_blooms,
+    bloom_may_contain,
+    build_changed_path_bloom,
+    changed_paths,
+    path_changed,
+)
+from maestro.muse_cli.commands.commit import _commit_async
+from maestro.muse_cli.commit_graph import CommitGraph, commit_graph_for
+from maestro.muse_cli.models import MuseCliCommit
+
+
+def _cid(label: str) -> str:
+    return label.ljust(64, "0")
+
+
+def _init_muse_repo(root: pathlib.Path) -> None:
+    muse = root / ".muse"
+    (muse / "refs" / "heads").mkdir(parents=True)
+    (muse / "repo.json").write_text(
+        json.dumps({"repo_id": str(uuid.uuid4()), "schema_version": "1"})
+    )
+    (muse / "HEAD").write_text("refs/heads/main")
+    (muse / "refs" / "heads" / "main").write_text("")
+
+
+def _write_file(root: pathlib.Path, rel_path: str, content: bytes) -> None:
+    target = root / "muse-work" / rel_path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(content)
+
+
+# ---------------------------------------------------------------------------
+# Pure filter functions
+# ---------------------------------------------------------------------------
+
+
+def test_bloom_has_no_false_negatives() -> None:
+    paths = [f"tracks/part_{i}/take_{i}.mid" for i in range(200)]
+    bloom = build_changed_path_bloom(paths)
+
+    for path in paths:
+        assert bloom_may_contain(bloom, path)
+        assert bloom_may_contain(bloom, f"muse-work/{path}")
+        assert bloom_may_contain(bloom, path.rsplit("/", 1)[0])
+    assert bloom_may_contain(bloom, "tracks")
+
+
+def test_bloom_rejects_most_unrelated_paths() -> None:
+    bloom = build_changed_path_bloom([f"drums/kick_{i}.mid" for i in range(50)])
+    hits = sum(bloom_may_contain(bloom, f"bass/line_{i}.mid") for i in range(1000))
+    assert hits < 50
+
+
+def test_bloom_empty_oversized_and_missing() -> None:
+    assert not bloom_may_contain(build_changed_path_bloom([]), "any.mid")
+    oversized = build_changed_path_bloom(f"f{i}.mid" for i in range(MAX_CHANGED_PATHS + 1))
+    assert oversized == bytes([0])
+    assert bloom_may_contain(oversized, "unrelated.mid")
+    assert bloom_may_contain(None, "unrelated.mid")
+
+
+def test_changed_paths_and_path_changed() -> None:
+    old = {"drums/kick.mid": "a", "bass.mid": "b", "keys.mid": "c"}
+    new = {"drums/kick.mid": "a2", "bass.mid": "b", "lead.mid": "d"}
+
+    assert changed_paths(old, new) == {"drums/kick.mid", "keys.mid", "lead.mid"}
+    assert path_changed(old, new, "muse-work/drums/kick.mid")
+    assert path_changed(old, new, "drums/")
+    assert not path_changed(old, new, "bass.mid")
+    assert not path_changed(old, new, "dru")
+
+
+# ---------------------------------------------------------------------------
+# Commit-time filters and backfill
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.anyio
+async def test_commit_stores_filter_against_parent(
+    tmp_path: pathlib.Path, muse_cli_db_session: AsyncSession
+) -> None:
+    _init_muse_repo(tmp_path)
+    _write_file(tmp_path, "drums/kick.mid", b"kick-v1")
+    _write_file(tmp_path, "bass.mid", b"bass-v1")
+    await _commit_async(message="init", root=tmp_path, session=muse_cli_db_session)
+    _write_file(tmp_path, "drums/kick.mid", b"kick-v2")
+    second = await _commit_async(message="kick", root=tmp_path, session=muse_cli_db_session)
+
+    commit = await muse_cli_db_session.get(MuseCliCommit, second)
+    assert commit is not None and commit.changed_paths_bloom is not None
+    assert bloom_may_contain(commit.changed_paths_bloom, "drums/kick.mid")
+    assert bloom_may_contain(commit.changed_paths_bloom, "drums")
+
+    graph = await commit_graph_for(muse_cli_db_session, second, repo_root=tmp_path)
+    assert graph.may_have_changed(second, "drums/kick.mid")
+    assert graph.may_have_changed(_cid("unknown"), "bass.mid")
+
+
+@pytest.mark.anyio
+async def test_backfill_fills_missing_filters(
+    tmp_path: pathlib.Path, muse_cli_db_session: AsyncSession
+) -> None:
+    _init_muse_repo(tmp_path)
+    _write_file(tmp_path, "bass.mid", b"bass-v1")
+    first = await _commit_async(message="init", root=tmp_path, session=muse_cli_db_session)
+    _write_file(tmp_path, "keys.mid", b"keys-v1")
+    second = await _commit_async(message="keys", root=tmp_path, session=muse_cli_db_session)
+
+    commits = [await muse_cli_db_session.get(MuseCliCommit, cid) for cid in (first, second)]
+    assert all(c is not None for c in commits)
+    rows = [c for c in commits if c is not None]
+    for row in rows:
+        row.changed_paths_bloom = None
+
+    assert await backfill_changed_path_blooms(muse_cli_db_session, rows) == 2
+    assert await backfill_changed_path_blooms(muse_cli_db_session, rows) == 0
+    assert bloom_may_contain(rows[0].changed_paths_bloom, "bass.mid")
+    assert bloom_may_contain(rows[1].changed_paths_bloom, "keys.mid")
+
+
+# ---------------------------------------------------------------------------
+# Generation-ordered merge-base
+# ---------------------------------------------------------------------------
+
+
+def test_merge_base_criss_cross_prefers_newest() -> None:
+    """x and y both merge a and b; either is a best base, the newer one wins."""
+    graph = CommitGraph.from_rows([
+        (_cid("root"), None, None, 1.0, None),
+        (_cid("a"), _cid("root"), None, 2.0, None),
+        (_cid("b"), _cid("root"), None, 3.0, None),
+        (_cid("x"), _cid("a"), _cid("b"), 4.0, None),
+        (_cid("y"), _cid("b"), _cid("a"), 5.0, None),
+    ])
+    assert graph.merge_base(_cid("x"), _cid("y")) == _cid("b")
+    assert graph.merge_base(_cid("y"), _cid("x")) == _cid("b")
+
+
+def test_merge_base_long_history_below_base() -> None:
+    """The base is found without depending on how deep history goes."""
+    rows: list[tuple[str, str | None, str | None, float, bytes | None]] = []
+    parent: str | None = None
+    for i in range(500):
+        rows.append((_cid(f"c{i}"), parent, None, float(i), None))
+        parent = _cid(f"c{i}")
+    rows.append((_cid("left"), _cid("c499"), None, 600.0, None))
+    rows.append((_cid("right"), _cid("c499"), None, 601.0, None))
+    graph = CommitGraph.from_rows(rows)
+
+    assert graph.merge_base(_cid("left"), _cid("right")) == _cid("c499")
+    assert graph.merge_base(_cid("left"), _cid("c10")) == _cid("c10")
+    assert graph.merge_base(_cid("left"), _cid("left")) == _cid("left")
+    assert graph.merge_base(_cid("left"), _cid("nowhere")) is None
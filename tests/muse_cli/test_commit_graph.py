@@ -0,0 +1,252 @@
+"""Tests for the in-memory commit graph — ``maestro.muse_cli.commit_graph``.
+
+Pure graph tests build a :class:`CommitGraph` from rows directly; loader
+tests use the in-memory SQLite session from ``conftest.py``.
+
+Coverage:
+- Generation numbers (roots = 1, merges = 1 + max parent)
+- First-parent chain, ancestors, range and merge-base queries
+- Missing parents are kept as nodes but end the first-parent chain
+- load_commit_graph loads a repo in one query and resolves foreign parents
+- .muse/commit-graph.json is written, reused while the commit count matches
+  and HEAD is in it, appended to line-by-line by muse commit, and rebuilt
+  when stale
+- load_commit_rows preserves the requested order
+"""
+from __future__ import annotations
+
+import datetime
+import json
+import pathlib
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from maestro.muse_cli.commit_graph import (
+    CommitGraph,
+    append_commit_to_graph_file,
+    commit_graph_for,
+    load_commit_graph,
+    load_commit_rows,
+    read_commit_graph_file,
+)
+from maestro.muse_cli.models import MuseCliCommit, MuseCliSnapshot
+from maestro.muse_cli.snapshot import compute_snapshot_id
+
+
+def _cid(label: str) -> str:
+    return label.ljust(64, "0")
+
+
+# ---------------------------------------------------------------------------
+# Pure graph
+# ---------------------------------------------------------------------------
+
+
+def _diamond() -> CommitGraph:
+    """root ← a ← merge, root ← b ← merge (merge has parents a, b); tip ← merge."""
+    return CommitGraph.from_rows([
+        (_cid("tip"), _cid("merge"), None, 5.0, None),
+        (_cid("merge"), _cid("a"), _cid("b"), 4.0, None),
+        (_cid("a"), _cid("root"), None, 2.0, None),
+        (_cid("b"), _cid("root"), None, 3.0, None),
+        (_cid("root"), None, None, 1.0, None),
+    ])
+
+
+def test_generation_numbers() -> None:
+    graph = _diamond()
+    gen = {cid: graph.generation[graph.node(cid) or 0] for cid in graph.ids}
+    assert gen[_cid("root")] == 1
+    assert gen[_cid("a")] == gen[_cid("b")] == 2
+    assert gen[_cid("merge")] == 3
+    assert gen[_cid("tip")] == 4
+
+
+def test_first_parent_chain_and_limit() -> None:
+    graph = _diamond()
+    assert graph.first_parent_chain(_cid("tip")) == [
+        _cid("tip"), _cid("merge"), _cid("a"), _cid("root"),
+    ]
+    assert graph.first_parent_chain(_cid("tip"), limit=2) == [_cid("tip"), _cid("merge")]
+    assert graph.first_parent_chain(_cid("unknown")) == []
+
+
+def test_ancestors_range_and_merge_base() -> None:
+    graph = _diamond()
+    assert graph.ancestors(_cid("merge")) == {
+        _cid("merge"), _cid("a"), _cid("b"), _cid("root"),
+    }
+    assert graph.range(_cid("a"), _cid("tip")) == {_cid("tip"), _cid("merge"), _cid("b")}
+    assert graph.merge_base(_cid("a"), _cid("b")) == _cid("root")
+    assert graph.merge_base(_cid("tip"), _cid("b")) == _cid("b")
+    assert graph.is_ancestor(_cid("root"), _cid("tip"))
+    assert not graph.is_ancestor(_cid("tip"), _cid("root"))
+
+
+def test_missing_parent_ends_chain() -> None:
+    graph = CommitGraph.from_rows([(_cid("child"), _cid("gone"), None, 1.0, None)])
+    assert _cid("gone") not in graph
+    assert graph.first_parent_chain(_cid("child")) == [_cid("child")]
+    assert graph.ancestors(_cid("child")) == {_cid("child"), _cid("gone")}
+
+
+def test_json_round_trip() -> None:
+    graph = _diamond()
+    graph.repo_commits = 5
+    restored = CommitGraph.from_json(graph.to_json("repo"), "repo")
+    assert restored is not None
+    assert restored.ids == graph.ids
+    assert list(restored.generation) == list(graph.generation)
+    assert CommitGraph.from_json(graph.to_json("repo"), "other-repo") is None
+
+
+# ---------------------------------------------------------------------------
+# Loading from the database
+# ---------------------------------------------------------------------------
+
+
+async def _seed_linear(
+    session: AsyncSession, repo_id: str, labels: list[str]
+) -> list[MuseCliCommit]:
+    """Insert a linear chain of commits, oldest first."""
+    snapshot_id = compute_snapshot_id({})
+    if await session.get(MuseCliSnapshot, snapshot_id) is None:
+        session.add(MuseCliSnapshot(snapshot_id=snapshot_id, manifest={}))
+        await session.flush()
+    base = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    commits: list[MuseCliCommit] = []
+    parent: str | None = None
+    for i, label in enumerate(labels):
+        commit = MuseCliCommit(
+            commit_id=_cid(label),
+            repo_id=repo_id,
+            branch="main",
+            parent_commit_id=parent,
+            snapshot_id=snapshot_id,
+            message=label,
+            author="",
+            committed_at=base + datetime.timedelta(minutes=i),
+        )
+        session.add(commit)
+        commits.append(commit)
+        parent = commit.commit_id
+    await session.flush()
+    return commits
+
+
+def _init_muse_dir(root: pathlib.Path) -> None:
+    (root / ".muse").mkdir()
+
+
+@pytest.mark.anyio
+async def test_load_commit_graph_single_repo(muse_cli_db_session: AsyncSession) -> None:
+    await _seed_linear(muse_cli_db_session, "repo-a", ["c1", "c2", "c3"])
+    await _seed_linear(muse_cli_db_session, "repo-b", ["x1"])
+
+    graph = await load_commit_graph(muse_cli_db_session, "repo-a")
+
+    assert len(graph) == 3
+    assert graph.repo_commits == 3
+    assert graph.first_parent_chain(_cid("c3")) == [_cid("c3"), _cid("c2"), _cid("c1")]
+    assert _cid("x1") not in graph
+
+
+@pytest.mark.anyio
+async def test_commit_graph_for_resolves_foreign_ids(muse_cli_db_session: AsyncSession) -> None:
+    await _seed_linear(muse_cli_db_session, "repo-a", ["c1", "c2"])
+    await _seed_linear(muse_cli_db_session, "repo-b", ["x1"])
+
+    graph = await commit_graph_for(muse_cli_db_session, _cid("c2"), _cid("x1"))
+
+    assert _cid("c2") in graph
+    assert _cid("x1") in graph
+    assert graph.merge_base(_cid("c2"), _cid("x1")) is None
+
+
+@pytest.mark.anyio
+async def test_graph_file_written_and_reused(
+    muse_cli_db_session: AsyncSession, tmp_path: pathlib.Path
+) -> None:
+    _init_muse_dir(tmp_path)
+    await _seed_linear(muse_cli_db_session, "repo-a", ["c1", "c2"])
+
+    await load_commit_graph(muse_cli_db_session, "repo-a", repo_root=tmp_path)
+    cached = read_commit_graph_file(tmp_path, "repo-a")
+    assert cached is not None and len(cached) == 2
+
+    # Tamper with the file without changing the commit count: the cache is
+    # trusted, proving no full reload happened.
+    path = tmp_path / ".muse" / "commit-graph.json"
+    lines = path.read_text().splitlines()
+    record = json.loads(lines[1])
+    record[4] = 123.0
+    lines[1] = json.dumps(record)
+    path.write_text("\n".join(lines) + "\n")
+    graph = await load_commit_graph(muse_cli_db_session, "repo-a", repo_root=tmp_path)
+    assert graph.committed_at[0] == 123.0
+
+
+@pytest.mark.anyio
+async def test_graph_file_append_and_stale_rebuild(
+    muse_cli_db_session: AsyncSession, tmp_path: pathlib.Path
+) -> None:
+    _init_muse_dir(tmp_path)
+    commits = await _seed_linear(muse_cli_db_session, "repo-a", ["c1", "c2"])
+    await load_commit_graph(muse_cli_db_session, "repo-a", repo_root=tmp_path)
+
+    path = tmp_path / ".muse" / "commit-graph.json"
+    before = path.read_text()
+    append_commit_to_graph_file(
+        tmp_path, "repo-a", _cid("c3"), [commits[-1].commit_id],
+        datetime.datetime.now(datetime.timezone.utc),
+    )
+    after = path.read_text()
+    assert after.startswith(before)
+    assert after.count("\n") == before.count("\n") + 1
+    appended = read_commit_graph_file(tmp_path, "repo-a")
+    assert appended is not None
+    assert appended.repo_commits == 3
+    assert appended.generation[appended.node(_cid("c3")) or 0] == 3
+
+    # c3 was never inserted: the count mismatch forces a rebuild.
+    graph = await load_commit_graph(muse_cli_db_session, "repo-a", repo_root=tmp_path)
+    assert _cid("c3") not in graph
+    assert len(graph) == 2
+
+
+@pytest.mark.anyio
+async def test_graph_file_rebuilt_when_head_not_cached(
+    muse_cli_db_session: AsyncSession, tmp_path: pathlib.Path
+) -> None:
+    """Same commit count but HEAD on an unknown commit: the cache is not trusted."""
+    _init_muse_dir(tmp_path)
+    (tmp_path / ".muse" / "refs" / "heads").mkdir(parents=True)
+    (tmp_path / ".muse" / "HEAD").write_text("refs/heads/main")
+    await _seed_linear(muse_cli_db_session, "repo-a", ["c1", "c2"])
+    await load_commit_graph(muse_cli_db_session, "repo-a", repo_root=tmp_path)
+
+    path = tmp_path / ".muse" / "commit-graph.json"
+    lines = path.read_text().splitlines()
+    record = json.loads(lines[1])
+    record[4] = 123.0
+    lines[1] = json.dumps(record)
+    path.write_text("\n".join(lines) + "\n")
+    (tmp_path / ".muse" / "refs" / "heads" / "main").write_text(_cid("c2"))
+    graph = await load_commit_graph(muse_cli_db_session, "repo-a", repo_root=tmp_path)
+    assert graph.committed_at[0] == 123.0
+
+    (tmp_path / ".muse" / "refs" / "heads" / "main").write_text(_cid("elsewhere"))
+    graph = await load_commit_graph(muse_cli_db_session, "repo-a", repo_root=tmp_path)
+    assert graph.committed_at[0] != 123.0
+
+
+@pytest.mark.anyio
+async def test_load_commit_rows_preserves_order(muse_cli_db_session: AsyncSession) -> None:
+    await _seed_linear(muse_cli_db_session, "repo-a", ["c1", "c2", "c3"])
+
+    rows = await load_commit_rows(
+        muse_cli_db_session, [_cid("c2"), _cid("missing"), _cid("c3"), _cid("c1")]
+    )
+
+    assert [r.commit_id for r in rows] == [_cid("c2"), _cid("c3"), _cid("c1")]
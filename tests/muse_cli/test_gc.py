@@ -0,0 +1,285 @@
+"""Tests for packed object storage and ``muse gc``.
+
+Pure filesystem tests — no DB session needed.
+
+Coverage:
+- Binary delta encode/decode round-trips
+- repack folds loose objects into one pack and removes them
+- has_object / read_object / restore_object read transparently through packs
+- Near-identical objects are stored as deltas
+- write_object is a no-op for objects that already live in a pack
+- A second repack merges new loose objects with the existing pack
+- CLI surface: summary output and nothing-to-pack
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import pathlib
+import random
+import uuid
+
+import pytest
+
+from maestro.muse_cli.object_store import (
+    has_object,
+    object_path,
+    read_object,
+    restore_object,
+    write_object,
+)
+from maestro.muse_cli import pack as pack_module
+from maestro.muse_cli.pack import (
+    PackIndex,
+    apply_delta,
+    load_packs,
+    make_delta,
+    pack_dir,
+    repack,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _init_muse_repo(root: pathlib.Path) -> None:
+    muse = root / ".muse"
+    (muse / "refs" / "heads").mkdir(parents=True)
+    (muse / "repo.json").write_text(
+        json.dumps({"repo_id": str(uuid.uuid4()), "schema_version": "1"})
+    )
+    (muse / "HEAD").write_text("refs/heads/main")
+    (muse / "refs" / "heads" / "main").write_text("")
+
+
+def _store(root: pathlib.Path, content: bytes) -> str:
+    oid = hashlib.sha256(content).hexdigest()
+    write_object(root, oid, content)
+    return oid
+
+
+def _random_bytes(seed: int, n: int) -> bytes:
+    return random.Random(seed).randbytes(n)
+
+
+# ---------------------------------------------------------------------------
+# Delta encoding
+# ---------------------------------------------------------------------------
+
+
+def test_delta_round_trip_with_edits() -> None:
+    base = _random_bytes(1, 20_000)
+    target = base[:5000] + b"inserted-bars" + base[5100:15000] + base[:300]
+    delta = make_delta(base, target)
+    assert apply_delta(base, delta) == target
+    assert len(delta) < len(target) // 4
+
+
+def test_delta_round_trip_unrelated_and_empty() -> None:
+    base = _random_bytes(2, 1000)
+    target = _random_bytes(3, 1000)
+    assert apply_delta(base, make_delta(base, target)) == target
+    assert apply_delta(base, make_delta(base, b"")) == b""
+    assert apply_delta(b"", make_delta(b"", target)) == target
+
+
+# ---------------------------------------------------------------------------
+# repack + transparent reads
+# ---------------------------------------------------------------------------
+
+
+def test_repack_moves_loose_objects_into_pack(tmp_path: pathlib.Path) -> None:
+    _init_muse_repo(tmp_path)
+    contents = [_random_bytes(i, 512 + i) for i in range(5)]
+    ids = [_store(tmp_path, c) for c in contents]
+
+    result = repack(tmp_path)
+
+    assert result.objects == 5
+    assert result.loose_removed == 5
+    assert result.pack_name is not None
+    assert (pack_dir(tmp_path) / f"{result.pack_name}.pack").is_file()
+    assert (pack_dir(tmp_path) / f"{result.pack_name}.idx").is_file()
+    for oid, content in zip(ids, contents):
+        assert not object_path(tmp_path, oid).exists()
+        assert has_object(tmp_path, oid)
+        assert read_object(tmp_path, oid) == content
+
+
+def test_repack_skips_corrupt_loose_object(tmp_path: pathlib.Path) -> None:
+    _init_muse_repo(tmp_path)
+    good = _store(tmp_path, _random_bytes(1, 800))
+    bad = _store(tmp_path, _random_bytes(2, 800))
+    object_path(tmp_path, bad).write_bytes(b"bit rot")
+
+    result = repack(tmp_path)
+
+    assert result.corrupt == [bad]
+    assert result.objects == 1
+    assert object_path(tmp_path, bad).read_bytes() == b"bit rot"
+    assert not object_path(tmp_path, good).exists()
+    assert read_object(tmp_path, good) == _random_bytes(1, 800)
+    assert not list(pack_dir(tmp_path).glob("tmp-*"))
+    assert result.pack_name is not None
+    body = (pack_dir(tmp_path) / f"{result.pack_name}.pack").read_bytes()
+    assert hashlib.sha256(body[:-32]).hexdigest() == result.pack_name.removeprefix("pack-")
+
+
+def test_restore_object_reads_from_pack(tmp_path: pathlib.Path) -> None:
+    _init_muse_repo(tmp_path)
+    content = b"MIDI-" * 200
+    oid = _store(tmp_path, content)
+    repack(tmp_path)
+
+    dest = tmp_path / "muse-work" / "tracks" / "bass.mid"
+    assert restore_object(tmp_path, oid, dest) is True
+    assert dest.read_bytes() == content
+
+
+def test_similar_objects_are_stored_as_deltas(tmp_path: pathlib.Path) -> None:
+    _init_muse_repo(tmp_path)
+    base = _random_bytes(7, 50_000)
+    revisions = [base[: 1000 * i] + b"edit" + base[1000 * i :] for i in range(1, 6)]
+    ids = [_store(tmp_path, r) for r in revisions]
+
+    result = repack(tmp_path)
+
+    assert result.deltas == len(revisions) - 1
+    assert result.pack_bytes < result.input_bytes // 3
+    for oid, content in zip(ids, revisions):
+        assert read_object(tmp_path, oid) == content
+
+
+def test_delta_search_skips_oversized_and_mismatched_objects(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Objects over the size cap and bases far larger than the target are never diffed."""
+    _init_muse_repo(tmp_path)
+    big = _random_bytes(9, 300_000)
+    _store(tmp_path, big)
+    _store(tmp_path, big + b"tail")
+    _store(tmp_path, big[:100_000])
+    calls: list[tuple[int, int]] = []
+    real_make_delta = pack_module.make_delta
+
+    def _counting(base: bytes, target: bytes) -> bytes:
+        calls.append((len(base), len(target)))
+        return real_make_delta(base, target)
+
+    monkeypatch.setattr(pack_module, "make_delta", _counting)
+
+    result = repack(tmp_path)
+
+    assert calls == []
+    assert result.deltas == 0
+
+
+def test_depth_zero_disables_deltas(tmp_path: pathlib.Path) -> None:
+    _init_muse_repo(tmp_path)
+    base = _random_bytes(8, 10_000)
+    _store(tmp_path, base)
+    _store(tmp_path, base + b"tail")
+
+    result = repack(tmp_path, max_depth=0)
+
+    assert result.deltas == 0
+
+
+def test_write_object_skips_packed_ids(tmp_path: pathlib.Path) -> None:
+    _init_muse_repo(tmp_path)
+    content = b"already-packed"
+    oid = _store(tmp_path, content)
+    repack(tmp_path)
+
+    assert write_object(tmp_path, oid, content) is False
+    assert not object_path(tmp_path, oid).exists()
+
+
+def test_index_lookup_present_and_absent(tmp_path: pathlib.Path) -> None:
+    _init_muse_repo(tmp_path)
+    ids = {_store(tmp_path, f"obj-{i}".encode()) for i in range(40)}
+    result = repack(tmp_path)
+
+    index = PackIndex((pack_dir(tmp_path) / f"{result.pack_name}.idx").read_bytes())
+    assert set(index.object_ids()) == ids
+    for oid in ids:
+        assert index.find(bytes.fromhex(oid)) is not None
+    assert index.find(bytes.fromhex("00" * 32)) is None
+    assert index.find(bytes.fromhex("ff" * 32)) is None
+
+
+def test_second_repack_merges_existing_pack(tmp_path: pathlib.Path) -> None:
+    _init_muse_repo(tmp_path)
+    first = _store(tmp_path, b"first-object" * 10)
+    repack(tmp_path)
+    second = _store(tmp_path, b"second-object" * 10)
+
+    result = repack(tmp_path)
+
+    assert result.objects == 2
+    assert result.loose_removed == 1
+    assert result.packs_removed == 1
+    assert len(load_packs(tmp_path)) == 1
+    assert read_object(tmp_path, first) == b"first-object" * 10
+    assert read_object(tmp_path, second) == b"second-object" * 10
+
+
+def test_repack_already_packed_is_noop(tmp_path: pathlib.Path) -> None:
+    _init_muse_repo(tmp_path)
+    _store(tmp_path, b"solo")
+    repack(tmp_path)
+
+    result = repack(tmp_path)
+
+    assert result.objects == 1
+    assert result.pack_name is None
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def test_gc_cli_reports_summary(tmp_path: pathlib.Path) -> None:
+    import os
+    from typer.testing import CliRunner
+    from maestro.muse_cli.app import cli
+
+    _init_muse_repo(tmp_path)
+    _store(tmp_path, b"beat" * 100)
+    _store(tmp_path, b"lead" * 100)
+
+    runner = CliRunner()
+    prev = os.getcwd()
+    try:
+        os.chdir(tmp_path)
+        result = runner.invoke(cli, ["gc"], catch_exceptions=False)
+        again = runner.invoke(cli, ["gc"], catch_exceptions=False)
+    finally:
+        os.chdir(prev)
+
+    assert result.exit_code == 0
+    assert "Packed 2 object(s)" in result.output
+    assert again.exit_code == 0
+    assert "Already packed" in again.output
+
+
+def test_gc_cli_nothing_to_pack(tmp_path: pathlib.Path) -> None:
+    import os
+    from typer.testing import CliRunner
+    from maestro.muse_cli.app import cli
+
+    _init_muse_repo(tmp_path)
+
+    runner = CliRunner()
+    prev = os.getcwd()
+    try:
+        os.chdir(tmp_path)
+        result = runner.invoke(cli, ["gc"], catch_exceptions=False)
+    finally:
+        os.chdir(prev)
+
+    assert result.exit_code == 0
+    assert "Nothing to pack" in result.output
@@ -314,3 +314,59 @@ async def test_log_limit_one_shows_only_head(
     assert cids[2] in out
     assert cids[1] not in out
     assert cids[0] not in out
+
+
+# ---------------------------------------------------------------------------
+# --path
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.anyio
+async def test_log_path_shows_only_commits_touching_path(
+    tmp_path: pathlib.Path,
+    muse_cli_db_session: AsyncSession,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """``--path`` keeps only commits whose snapshot changed that file."""
+    _init_muse_repo(tmp_path)
+    cids = await _make_commits(tmp_path, muse_cli_db_session, ["a", "b", "c"])
+    _write_workdir(tmp_path, {"track_1.mid": b"MIDI-1-edited"})
+    cids.append(
+        await _commit_async(message="edit 1", root=tmp_path, session=muse_cli_db_session)
+    )
+    capsys.readouterr()
+
+    await _log_async(
+        root=tmp_path, session=muse_cli_db_session, limit=1000, graph=False,
+        path="muse-work/track_1.mid",
+    )
+    out = capsys.readouterr().out
+
+    assert out.count("commit ") == 2
+    assert cids[3] in out
+    assert cids[1] in out
+    assert cids[0] not in out
+    assert cids[2] not in out
+
+
+@pytest.mark.anyio
+async def test_log_path_unknown_path_shows_nothing(
+    tmp_path: pathlib.Path,
+    muse_cli_db_session: AsyncSession,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A path no commit touched produces the empty-history message."""
+    import typer
+
+    _init_muse_repo(tmp_path)
+    await _make_commits(tmp_path, muse_cli_db_session, ["a", "b"])
+    capsys.readouterr()
+
+    with pytest.raises(typer.Exit) as exc_info:
+        await _log_async(
+            root=tmp_path, session=muse_cli_db_session, limit=1000, graph=False,
+            path="drums",
+        )
+
+    assert exc_info.value.exit_code == ExitCode.SUCCESS
+    assert "No commits yet" in capsys.readouterr().out
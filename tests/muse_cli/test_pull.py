@@ -15,6 +15,8 @@ Covers acceptance criteria (new remote sync flags):
 
 All HTTP calls are mocked — no live network required.
 DB calls use the in-memory SQLite fixture from conftest.py where needed.
+These tests exercise the JSON ``/pull`` protocol; the negotiated pack
+protocol is covered in ``test_pull_pack.py``.
 """
 from __future__ import annotations
 
@@ -22,6 +24,7 @@ import asyncio
 import datetime
 import json
 import pathlib
+from collections.abc import Iterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -39,6 +42,16 @@ from maestro.muse_cli.models import MuseCliCommit
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _json_pull_protocol() -> Iterator[None]:
+    """Make pack negotiation decline so every pull takes the JSON path."""
+    with patch(
+        "maestro.muse_cli.commands.pull._pull_pack", new=AsyncMock(return_value=None)
+    ):
+        yield
+
+
+
 def _init_repo(tmp_path: pathlib.Path, branch: str = "main") -> pathlib.Path:
     """Create a minimal .muse/ structure."""
     import json as _json
@@ -481,7 +494,7 @@ async def test_push_pull_roundtrip(tmp_path: pathlib.Path) -> None:
     mock_hub_push = MagicMock()
     mock_hub_push.__aenter__ = AsyncMock(return_value=mock_hub_push)
     mock_hub_push.__aexit__ = AsyncMock(return_value=None)
-    mock_hub_push.post = AsyncMock(return_value=mock_push_resp)
+    mock_hub_push.push_pack = AsyncMock(return_value=mock_push_resp)
 
     with (
         patch(
@@ -489,6 +502,10 @@ async def test_push_pull_roundtrip(tmp_path: pathlib.Path) -> None:
             new=AsyncMock(return_value=[commit_a]),
         ),
         patch("maestro.muse_cli.commands.push.get_all_object_ids", new=AsyncMock(return_value=[])),
+        patch(
+            "maestro.muse_cli.commands.push.load_snapshot_manifests",
+            new=AsyncMock(return_value={}),
+        ),
         patch("maestro.muse_cli.commands.push.open_session") as mock_push_session,
         patch("maestro.muse_cli.commands.push.MuseHubClient", return_value=mock_hub_push),
     ):
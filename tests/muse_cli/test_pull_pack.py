@@ -0,0 +1,278 @@
+"""Tests for ``muse pull`` over the negotiated pack protocol.
+
+The Hub side is replaced by an ``httpx.MockTransport`` handler that answers
+``/pull/pack`` with a stream built by ``encode_pack``; the local DB is the
+in-memory SQLite fixture from conftest.py.
+
+Covers:
+- have_tips collects local branch heads and remote-tracking heads
+- MuseHubClient.open_pack yields frames for a pack and None for anything else
+- _store_pack stores commits and writes verified objects to the object store
+- A hash mismatch aborts the pull and leaves no temp files behind
+- _pull_async uses the pack when offered and falls back to JSON /pull otherwise
+"""
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import pathlib
+from collections.abc import AsyncIterator, Callable
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from maestro.muse_cli.commands.pull import (
+    _collect_have_tips,
+    _pull_async,
+    _store_pack,
+)
+from maestro.muse_cli.hub_client import MuseHubClient
+from maestro.muse_cli.models import MuseCliCommit, MuseCliObject
+from maestro.muse_cli.object_store import read_object
+from maestro.services.musehub_pack import (
+    PACK_MEDIA_TYPE,
+    PackFormatError,
+    PackObject,
+    encode_pack,
+    iter_pack_frames,
+)
+
+_Handler = Callable[[httpx.Request], httpx.Response]
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _init_repo(root: pathlib.Path) -> pathlib.Path:
+    muse = root / ".muse"
+    (muse / "refs" / "heads").mkdir(parents=True)
+    (muse / "repo.json").write_text(json.dumps({"repo_id": "test-repo-id"}))
+    (muse / "HEAD").write_text("refs/heads/main")
+    (muse / "config.toml").write_text(
+        '[auth]\ntoken = "test-token"\n\n[remotes.origin]\nurl = "https://hub.test/r"\n'
+    )
+    return root
+
+
+def _commit_payload(cid: str, parent: str | None) -> dict[str, object]:
+    return {
+        "commit_id": cid,
+        "parent_commit_id": parent,
+        "snapshot_id": f"snap-{cid}",
+        "branch": "main",
+        "message": cid,
+        "author": "hub",
+        "committed_at": "2025-01-01T00:00:00+00:00",
+        "metadata": None,
+    }
+
+
+def _hub_object(hub_dir: pathlib.Path, content: bytes) -> tuple[str, PackObject]:
+    oid = hashlib.sha256(content).hexdigest()
+    path = hub_dir / oid
+    path.write_bytes(content)
+    return oid, PackObject(f"sha256:{oid}", "tracks/x.mid", str(path))
+
+
+async def _pack_bytes(commits: list[dict[str, object]], objects: list[PackObject]) -> bytes:
+    header: dict[str, object] = {"branch": "main", "remote_head": "c2"}
+    return b"".join([chunk async for chunk in encode_pack(header, commits, objects)])
+
+
+async def _chunks(data: bytes, step: int = 5) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), step):
+        yield data[start:start + step]
+
+
+class _MockHub(MuseHubClient):
+    """MuseHubClient wired to an in-process handler instead of the network."""
+
+    def __init__(self, handler: _Handler) -> None:
+        super().__init__(base_url="https://hub.test/r")
+        self._handler = handler
+
+    async def __aenter__(self) -> MuseHubClient:
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url, transport=httpx.MockTransport(self._handler)
+        )
+        return self
+
+
+def _session_ctx(session: AsyncSession) -> Callable[[], contextlib.AbstractAsyncContextManager[AsyncSession]]:
+    @contextlib.asynccontextmanager
+    async def _open() -> AsyncIterator[AsyncSession]:
+        yield session
+
+    return _open
+
+
+# ---------------------------------------------------------------------------
+# Negotiation
+# ---------------------------------------------------------------------------
+
+
+def test_collect_have_tips(tmp_path: pathlib.Path) -> None:
+    root = _init_repo(tmp_path)
+    (root / ".muse" / "refs" / "heads" / "main").write_text("c-main")
+    (root / ".muse" / "refs" / "heads" / "feat").mkdir()
+    (root / ".muse" / "refs" / "heads" / "feat" / "bass").write_text("c-feat")
+    (root / ".muse" / "refs" / "heads" / "empty").write_text("")
+    (root / ".muse" / "remotes" / "origin").mkdir(parents=True)
+    (root / ".muse" / "remotes" / "origin" / "main").write_text("c-remote")
+
+    assert _collect_have_tips(root, "origin") == ["c-feat", "c-main", "c-remote"]
+
+
+@pytest.mark.anyio
+async def test_open_pack_yields_none_without_pack(tmp_path: pathlib.Path) -> None:
+    root = _init_repo(tmp_path)
+    seen: list[dict[str, object]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(json.loads(request.content))
+        assert request.headers["accept"] == PACK_MEDIA_TYPE
+        return httpx.Response(404, json={"detail": "Not Found"})
+
+    async with _MockHub(handler) as hub:
+        hub._repo_root = root
+        async with hub.open_pack("/pull/pack", json={"branch": "main", "have_tips": ["c1"]}) as frames:
+            assert frames is None
+
+    assert seen == [{"branch": "main", "have_tips": ["c1"]}]
+
+
+# ---------------------------------------------------------------------------
+# Receiving
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.anyio
+async def test_store_pack_stores_commits_and_objects(
+    tmp_path: pathlib.Path, muse_cli_db_session: AsyncSession
+) -> None:
+    root = _init_repo(tmp_path / "repo")
+    hub_dir = tmp_path / "hub"
+    hub_dir.mkdir()
+    oid, obj = _hub_object(hub_dir, b"MIDI" * 50_000)
+    data = await _pack_bytes(
+        [_commit_payload("c1", None), _commit_payload("c2", "c1")], [obj]
+    )
+
+    result = await _store_pack(
+        muse_cli_db_session, root, "test-repo-id", iter_pack_frames(_chunks(data, 4096))
+    )
+
+    assert result.remote_head == "c2"
+    assert (result.new_commits, result.new_objects) == (2, 1)
+    c2 = await muse_cli_db_session.get(MuseCliCommit, "c2")
+    assert c2 is not None and c2.parent_commit_id == "c1"
+    assert await muse_cli_db_session.get(MuseCliObject, oid) is not None
+    assert read_object(root, oid) == b"MIDI" * 50_000
+    assert not list((root / ".muse").glob("pack-incoming-*"))
+
+
+@pytest.mark.anyio
+async def test_store_pack_rejects_hash_mismatch(
+    tmp_path: pathlib.Path, muse_cli_db_session: AsyncSession
+) -> None:
+    root = _init_repo(tmp_path / "repo")
+    hub_dir = tmp_path / "hub"
+    hub_dir.mkdir()
+    oid, obj = _hub_object(hub_dir, b"original")
+    (hub_dir / oid).write_bytes(b"tampered")
+    data = await _pack_bytes([], [obj])
+
+    with pytest.raises(PackFormatError):
+        await _store_pack(muse_cli_db_session, root, "test-repo-id", iter_pack_frames(_chunks(data)))
+
+    assert read_object(root, oid) is None
+    assert not list((root / ".muse").glob("pack-incoming-*"))
+
+
+@pytest.mark.anyio
+async def test_store_pack_rejects_truncated_stream(
+    tmp_path: pathlib.Path, muse_cli_db_session: AsyncSession
+) -> None:
+    root = _init_repo(tmp_path / "repo")
+    data = await _pack_bytes([_commit_payload("c1", None)], [])
+
+    with pytest.raises(PackFormatError):
+        await _store_pack(
+            muse_cli_db_session, root, "test-repo-id", iter_pack_frames(_chunks(data[:-3]))
+        )
+
+
+# ---------------------------------------------------------------------------
+# End to end through _pull_async
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.anyio
+async def test_pull_uses_pack_when_offered(
+    tmp_path: pathlib.Path,
+    muse_cli_db_session: AsyncSession,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    root = _init_repo(tmp_path / "repo")
+    (root / ".muse" / "refs" / "heads" / "main").write_text("c1")
+    hub_dir = tmp_path / "hub"
+    hub_dir.mkdir()
+    oid, obj = _hub_object(hub_dir, b"bassline")
+    data = await _pack_bytes([_commit_payload("c2", "c1")], [obj])
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        assert json.loads(request.content)["have_tips"] == ["c1"]
+        return httpx.Response(200, content=data, headers={"content-type": PACK_MEDIA_TYPE})
+
+    with (
+        patch("maestro.muse_cli.commands.pull.MuseHubClient", lambda **_: _MockHub(handler)),
+        patch("maestro.muse_cli.commands.pull.open_session", _session_ctx(muse_cli_db_session)),
+        patch("maestro.muse_cli.commands.pull.get_all_object_ids", new=AsyncMock()) as all_ids,
+    ):
+        await _pull_async(root=root, remote_name="origin", branch=None)
+
+    assert paths == ["/r/pull/pack"]
+    all_ids.assert_not_called()
+    assert read_object(root, oid) == b"bassline"
+    assert (root / ".muse" / "remotes" / "origin" / "main").read_text().strip() == "c2"
+    assert "Pulled 1 new commit(s), 1 new object(s)" in capsys.readouterr().out
+
+
+@pytest.mark.anyio
+async def test_pull_falls_back_to_json(
+    tmp_path: pathlib.Path, muse_cli_db_session: AsyncSession
+) -> None:
+    root = _init_repo(tmp_path / "repo")
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("/pull/pack"):
+            return httpx.Response(405, json={"detail": "Method Not Allowed"})
+        body = json.loads(request.content)
+        assert "have_objects" in body
+        return httpx.Response(
+            200,
+            json={
+                "commits": [_commit_payload("c1", None)],
+                "objects": [],
+                "remote_head": "c1",
+                "diverged": False,
+            },
+        )
+
+    with (
+        patch("maestro.muse_cli.commands.pull.MuseHubClient", lambda **_: _MockHub(handler)),
+        patch("maestro.muse_cli.commands.pull.open_session", _session_ctx(muse_cli_db_session)),
+    ):
+        await _pull_async(root=root, remote_name="origin", branch=None)
+
+    assert paths == ["/r/pull/pack", "/r/pull"]
+    assert await muse_cli_db_session.get(MuseCliCommit, "c1") is not None
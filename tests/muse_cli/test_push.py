@@ -2,6 +2,8 @@
 
 Covers acceptance criteria:
 - ``muse push`` with no remote configured exits 1 with instructive message.
+- ``muse push`` streams a pack to ``POST <remote>/push/pack`` and falls back
+  to ``POST <remote>/push`` with the JSON payload only when the Hub answers 404.
 - ``muse push`` calls ``POST <remote>/push`` with correct payload structure.
 - ``muse push`` updates ``.muse/remotes/origin/<branch>`` after a successful push.
 - ``muse push`` when branch has no commits exits 1.
@@ -23,15 +25,18 @@ import asyncio
 import datetime
 import json
 import pathlib
+from collections.abc import AsyncIterable
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from maestro.muse_cli.commands.push import (
+    _build_pack_objects,
     _build_push_request,
     _collect_tag_refs,
     _compute_push_delta,
     _push_async,
+    _remote_snapshot_id,
 )
 from maestro.muse_cli.config import get_remote_head, get_upstream, set_remote
 from maestro.muse_cli.errors import ExitCode
@@ -74,6 +79,13 @@ def _make_commit(
     )
 
 
+def _not_found_response() -> MagicMock:
+    """Hub response for a server without the ``/push/pack`` endpoint."""
+    response = MagicMock()
+    response.status_code = 404
+    return response
+
+
 def _write_branch_ref(root: pathlib.Path, branch: str, commit_id: str) -> None:
     """Write .muse/refs/heads/<branch> with the given commit ID."""
     ref_path = root / ".muse" / "refs" / "heads" / branch
@@ -176,6 +188,7 @@ async def test_push_calls_hub_endpoint(tmp_path: pathlib.Path) -> None:
         return mock_response
 
     mock_hub.post = _fake_post
+    mock_hub.push_pack = AsyncMock(return_value=_not_found_response())
 
     with (
         patch(
@@ -186,6 +199,10 @@ async def test_push_calls_hub_endpoint(tmp_path: pathlib.Path) -> None:
             "maestro.muse_cli.commands.push.get_all_object_ids",
             new=AsyncMock(return_value=["obj-001"]),
         ),
+        patch(
+            "maestro.muse_cli.commands.push.load_snapshot_manifests",
+            new=AsyncMock(return_value={}),
+        ),
         patch("maestro.muse_cli.commands.push.open_session") as mock_open_session,
         patch("maestro.muse_cli.commands.push.MuseHubClient", return_value=mock_hub),
     ):
@@ -231,7 +248,7 @@ async def test_push_updates_remote_head_file(tmp_path: pathlib.Path) -> None:
     mock_hub = MagicMock()
     mock_hub.__aenter__ = AsyncMock(return_value=mock_hub)
     mock_hub.__aexit__ = AsyncMock(return_value=None)
-    mock_hub.post = AsyncMock(return_value=mock_response)
+    mock_hub.push_pack = AsyncMock(return_value=mock_response)
 
     with (
         patch(
@@ -242,6 +259,10 @@ async def test_push_updates_remote_head_file(tmp_path: pathlib.Path) -> None:
             "maestro.muse_cli.commands.push.get_all_object_ids",
             new=AsyncMock(return_value=[]),
         ),
+        patch(
+            "maestro.muse_cli.commands.push.load_snapshot_manifests",
+            new=AsyncMock(return_value={}),
+        ),
         patch("maestro.muse_cli.commands.push.open_session") as mock_open_session,
         patch("maestro.muse_cli.commands.push.MuseHubClient", return_value=mock_hub),
     ):
@@ -467,7 +488,7 @@ async def test_push_force_with_lease_rejects_mismatch(
     mock_hub = MagicMock()
     mock_hub.__aenter__ = AsyncMock(return_value=mock_hub)
     mock_hub.__aexit__ = AsyncMock(return_value=None)
-    mock_hub.post = AsyncMock(return_value=mock_response)
+    mock_hub.push_pack = AsyncMock(return_value=mock_response)
 
     with (
         patch(
@@ -478,6 +499,10 @@ async def test_push_force_with_lease_rejects_mismatch(
             "maestro.muse_cli.commands.push.get_all_object_ids",
             new=AsyncMock(return_value=[]),
         ),
+        patch(
+            "maestro.muse_cli.commands.push.load_snapshot_manifests",
+            new=AsyncMock(return_value={}),
+        ),
         patch("maestro.muse_cli.commands.push.open_session") as mock_open_session,
         patch("maestro.muse_cli.commands.push.MuseHubClient", return_value=mock_hub),
     ):
@@ -539,6 +564,7 @@ async def test_push_tags_includes_tags(tmp_path: pathlib.Path) -> None:
         return mock_response
 
     mock_hub.post = _fake_post
+    mock_hub.push_pack = AsyncMock(return_value=_not_found_response())
 
     with (
         patch(
@@ -549,6 +575,10 @@ async def test_push_tags_includes_tags(tmp_path: pathlib.Path) -> None:
             "maestro.muse_cli.commands.push.get_all_object_ids",
             new=AsyncMock(return_value=[]),
         ),
+        patch(
+            "maestro.muse_cli.commands.push.load_snapshot_manifests",
+            new=AsyncMock(return_value={}),
+        ),
         patch("maestro.muse_cli.commands.push.open_session") as mock_open_session,
         patch("maestro.muse_cli.commands.push.MuseHubClient", return_value=mock_hub),
     ):
@@ -595,7 +625,7 @@ async def test_push_set_upstream_writes_config(tmp_path: pathlib.Path) -> None:
     mock_hub = MagicMock()
     mock_hub.__aenter__ = AsyncMock(return_value=mock_hub)
     mock_hub.__aexit__ = AsyncMock(return_value=None)
-    mock_hub.post = AsyncMock(return_value=mock_response)
+    mock_hub.push_pack = AsyncMock(return_value=mock_response)
 
     with (
         patch(
@@ -606,6 +636,10 @@ async def test_push_set_upstream_writes_config(tmp_path: pathlib.Path) -> None:
             "maestro.muse_cli.commands.push.get_all_object_ids",
             new=AsyncMock(return_value=[]),
         ),
+        patch(
+            "maestro.muse_cli.commands.push.load_snapshot_manifests",
+            new=AsyncMock(return_value={}),
+        ),
         patch("maestro.muse_cli.commands.push.open_session") as mock_open_session,
         patch("maestro.muse_cli.commands.push.MuseHubClient", return_value=mock_hub),
     ):
@@ -656,6 +690,7 @@ async def test_push_force_flag_sends_force_in_payload(tmp_path: pathlib.Path) ->
         return mock_response
 
     mock_hub.post = _fake_post
+    mock_hub.push_pack = AsyncMock(return_value=_not_found_response())
 
     with (
         patch(
@@ -666,6 +701,10 @@ async def test_push_force_flag_sends_force_in_payload(tmp_path: pathlib.Path) ->
             "maestro.muse_cli.commands.push.get_all_object_ids",
             new=AsyncMock(return_value=[]),
         ),
+        patch(
+            "maestro.muse_cli.commands.push.load_snapshot_manifests",
+            new=AsyncMock(return_value={}),
+        ),
         patch("maestro.muse_cli.commands.push.open_session") as mock_open_session,
         patch("maestro.muse_cli.commands.push.MuseHubClient", return_value=mock_hub),
     ):
@@ -678,3 +717,160 @@ async def test_push_force_flag_sends_force_in_payload(tmp_path: pathlib.Path) ->
 
     assert len(captured_payloads) == 1
     assert captured_payloads[0].get("force") is True
+
+
+# ---------------------------------------------------------------------------
+# Pack push (POST /push/pack) and JSON fallback
+# ---------------------------------------------------------------------------
+
+
+def _pack_push_repo(tmp_path: pathlib.Path) -> tuple[pathlib.Path, str]:
+    """Repo with a remote, an auth token and one loose object on disk."""
+    from maestro.muse_cli.object_store import write_object
+
+    head_id = "feedface" * 8
+    root = _init_repo(tmp_path)
+    _write_branch_ref(root, "main", head_id)
+    (root / ".muse" / "config.toml").write_text(
+        '[auth]\ntoken = "tok"\n\n[remotes.origin]\nurl = "https://hub.example.com/r"\n',
+        encoding="utf-8",
+    )
+    write_object(root, "ab" * 32, b"MThd-drums")
+    return root, head_id
+
+
+async def _run_pack_push(
+    root: pathlib.Path,
+    head_id: str,
+    mock_hub: MagicMock,
+) -> None:
+    commit = _make_commit(head_id)
+    manifests = {commit.snapshot_id: {"tracks/drums.mid": "ab" * 32, "gone.mid": "cd" * 32}}
+    with (
+        patch(
+            "maestro.muse_cli.commands.push.get_commits_for_branch",
+            new=AsyncMock(return_value=[commit]),
+        ),
+        patch(
+            "maestro.muse_cli.commands.push.get_all_object_ids",
+            new=AsyncMock(return_value=["ab" * 32]),
+        ),
+        patch(
+            "maestro.muse_cli.commands.push.load_snapshot_manifests",
+            new=AsyncMock(return_value=manifests),
+        ),
+        patch("maestro.muse_cli.commands.push.open_session") as mock_open_session,
+        patch("maestro.muse_cli.commands.push.MuseHubClient", return_value=mock_hub),
+    ):
+        mock_session_ctx = MagicMock()
+        mock_session_ctx.__aenter__ = AsyncMock(return_value=MagicMock())
+        mock_session_ctx.__aexit__ = AsyncMock(return_value=None)
+        mock_open_session.return_value = mock_session_ctx
+
+        await _push_async(root=root, remote_name="origin", branch=None)
+
+
+@pytest.mark.anyio
+async def test_push_streams_pack_when_hub_supports_it(tmp_path: pathlib.Path) -> None:
+    """The delta and its snapshot's object bytes go to /push/pack; no JSON push."""
+    from maestro.services.musehub_pack import (
+        FRAME_COMMIT,
+        FRAME_DATA,
+        FRAME_END,
+        FRAME_HEADER,
+        FRAME_OBJECT,
+        iter_pack_frames,
+    )
+
+    root, head_id = _pack_push_repo(tmp_path)
+    frames: list[tuple[bytes, bytes]] = []
+    ok = MagicMock()
+    ok.status_code = 200
+
+    async def _fake_push_pack(path: str, body: AsyncIterable[bytes]) -> MagicMock:
+        assert path == "/push/pack"
+        async for frame in iter_pack_frames(body):
+            frames.append((frame.kind, frame.payload))
+        return ok
+
+    mock_hub = MagicMock()
+    mock_hub.__aenter__ = AsyncMock(return_value=mock_hub)
+    mock_hub.__aexit__ = AsyncMock(return_value=None)
+    mock_hub.push_pack = _fake_push_pack
+    mock_hub.post = AsyncMock()
+
+    await _run_pack_push(root, head_id, mock_hub)
+
+    mock_hub.post.assert_not_called()
+    kinds = [kind for kind, _ in frames]
+    # The object missing from the local store is skipped, not fatal.
+    assert kinds == [FRAME_HEADER, FRAME_COMMIT, FRAME_OBJECT, FRAME_DATA, FRAME_END]
+    header = json.loads(frames[0][1])
+    assert header["branch"] == "main"
+    assert header["head_commit_id"] == head_id
+    commit = json.loads(frames[1][1])
+    assert commit["commit_id"] == head_id
+    assert commit["parent_ids"] == []
+    obj = json.loads(frames[2][1])
+    assert obj == {"object_id": "ab" * 32, "path": "tracks/drums.mid", "size_bytes": 10}
+    assert frames[3][1] == b"MThd-drums"
+    assert json.loads(frames[4][1]) == {"commits": 1, "objects": 1}
+    assert get_remote_head("origin", "main", root) == head_id
+
+
+def test_pack_skips_objects_in_remote_head_snapshot(tmp_path: pathlib.Path) -> None:
+    """Objects already in the remote head's snapshot are not re-sent in the pack."""
+    old_id, new_id = "a" * 64, "b" * 64
+    old = _make_commit(old_id)
+    new = _make_commit(new_id, parent_id=old_id)
+    manifests = {
+        old.snapshot_id: {"drums.mid": "ab" * 32},
+        new.snapshot_id: {"drums.mid": "ab" * 32, "bass.mid": "cd" * 32},
+    }
+    commits = [new, old]
+    delta = _compute_push_delta(commits, old_id)
+    remote_snapshot_id = _remote_snapshot_id(commits, old_id)
+    assert remote_snapshot_id == old.snapshot_id
+    assert _remote_snapshot_id(commits, "f" * 64) is None
+
+    objects = _build_pack_objects(
+        tmp_path, delta, manifests, manifests[remote_snapshot_id].values(),
+    )
+
+    assert [(o.object_id, o.path) for o in objects] == [("cd" * 32, "bass.mid")]
+
+
+@pytest.mark.anyio
+async def test_push_falls_back_to_json_only_on_404(tmp_path: pathlib.Path) -> None:
+    """A 404 from /push/pack retries as JSON; any other error is final."""
+    import typer
+
+    (tmp_path / "old-hub").mkdir()
+    (tmp_path / "broken-hub").mkdir()
+    root, head_id = _pack_push_repo(tmp_path / "old-hub")
+    ok = MagicMock()
+    ok.status_code = 200
+
+    mock_hub = MagicMock()
+    mock_hub.__aenter__ = AsyncMock(return_value=mock_hub)
+    mock_hub.__aexit__ = AsyncMock(return_value=None)
+    mock_hub.push_pack = AsyncMock(return_value=_not_found_response())
+    mock_hub.post = AsyncMock(return_value=ok)
+
+    await _run_pack_push(root, head_id, mock_hub)
+
+    mock_hub.post.assert_awaited_once()
+    assert mock_hub.post.await_args.args[0] == "/push"
+
+    server_error = MagicMock()
+    server_error.status_code = 500
+    server_error.text = "boom"
+    mock_hub.push_pack = AsyncMock(return_value=server_error)
+    mock_hub.post = AsyncMock(return_value=ok)
+    root, head_id = _pack_push_repo(tmp_path / "broken-hub")
+
+    with pytest.raises(typer.Exit) as exc_info:
+        await _run_pack_push(root, head_id, mock_hub)
+
+    assert exc_info.value.exit_code == int(ExitCode.INTERNAL_ERROR)
+    mock_hub.post.assert_not_called()
@@ -7,7 +7,10 @@ snapshot.py's module docstring.
 from __future__ import annotations
 
 import hashlib
+import json
+import os
 import pathlib
+from unittest.mock import patch
 
 import pytest
 
@@ -85,6 +88,76 @@ def test_build_snapshot_manifest_same_as_walk_workdir(tmp_path: pathlib.Path) ->
     assert build_snapshot_manifest(tmp_path) == walk_workdir(tmp_path)
 
 
+# ---------------------------------------------------------------------------
+# walk_workdir stat cache (.muse/index.json)
+# ---------------------------------------------------------------------------
+
+
+def _make_repo_workdir(tmp_path: pathlib.Path, files: dict[str, bytes]) -> pathlib.Path:
+    """Create ``.muse/`` + ``muse-work/`` with *files* aged past the racy window."""
+    (tmp_path / ".muse").mkdir()
+    workdir = tmp_path / "muse-work"
+    workdir.mkdir()
+    old = 1_700_000_000
+    for rel, data in files.items():
+        path = workdir / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        os.utime(path, (old, old))
+    return workdir
+
+
+def test_walk_workdir_reuses_index_for_unchanged_files(tmp_path: pathlib.Path) -> None:
+    workdir = _make_repo_workdir(tmp_path, {"bass.mid": b"bass", "loops/beat.mid": b"beat"})
+    first = walk_workdir(workdir)
+    assert (tmp_path / ".muse" / "index.json").exists()
+
+    with patch("maestro.muse_cli.snapshot.hash_file") as mock_hash:
+        second = walk_workdir(workdir)
+    mock_hash.assert_not_called()
+    assert second == first
+
+
+def test_walk_workdir_rehashes_only_changed_files(tmp_path: pathlib.Path) -> None:
+    workdir = _make_repo_workdir(tmp_path, {"bass.mid": b"bass", "keys.mid": b"keys"})
+    walk_workdir(workdir)
+
+    (workdir / "keys.mid").write_bytes(b"new keys take")
+    (workdir / "bass.mid").unlink()
+    with patch(
+        "maestro.muse_cli.snapshot.hash_file", wraps=hash_file,
+    ) as spy:
+        result = walk_workdir(workdir)
+
+    assert [c.args[0].name for c in spy.call_args_list] == ["keys.mid"]
+    assert result == {"keys.mid": hashlib.sha256(b"new keys take").hexdigest()}
+    index = json.loads((tmp_path / ".muse" / "index.json").read_text())
+    assert "bass.mid" not in index["entries"]
+
+
+def test_walk_workdir_does_not_persist_racy_entries(tmp_path: pathlib.Path) -> None:
+    workdir = _make_repo_workdir(tmp_path, {"old.mid": b"old"})
+    (workdir / "fresh.mid").write_bytes(b"just written")
+    walk_workdir(workdir)
+
+    index = json.loads((tmp_path / ".muse" / "index.json").read_text())
+    assert set(index["entries"]) == {"old.mid"}
+
+
+def test_walk_workdir_threaded_hashing_matches_sequential(tmp_path: pathlib.Path) -> None:
+    files = {f"stems/take_{i}.wav": bytes([i]) * 1000 for i in range(12)}
+    workdir = _make_repo_workdir(tmp_path, files)
+    threaded = walk_workdir(workdir, use_index=False, hash_workers=4)
+    assert threaded == walk_workdir(workdir, use_index=False, hash_workers=1)
+    assert list(threaded) == sorted(threaded)
+
+
+def test_walk_workdir_ignores_corrupt_index(tmp_path: pathlib.Path) -> None:
+    workdir = _make_repo_workdir(tmp_path, {"a.mid": b"A"})
+    (tmp_path / ".muse" / "index.json").write_text("{not json")
+    assert walk_workdir(workdir) == {"a.mid": hashlib.sha256(b"A").hexdigest()}
+
+
 # ---------------------------------------------------------------------------
 # compute_snapshot_id
 # ---------------------------------------------------------------------------
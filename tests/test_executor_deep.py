@@ -1277,20 +1277,21 @@ class TestStateStoreCCPitchBend:
         store = StateStore(conversation_id="s4", project_id="p")
         assert store.get_region_pitch_bends("nonexistent") == []
 
-    def test_cc_survives_snapshot_restore(self) -> None:
+    def test_cc_survives_rollback(self) -> None:
 
         store = StateStore(conversation_id="s5", project_id="p")
         cc_data: list[CCEventDict] = [{"cc": 64, "beat": 0, "value": 127}]
         store.add_cc("r1", cc_data)
         pb_data: list[PitchBendDict] = [{"beat": 1.0, "value": 8191}]
         store.add_pitch_bends("r1", pb_data)
-        snap = store._take_snapshot()
-        store._region_cc.clear()
-        store._region_pitch_bends.clear()
-        assert store.get_region_cc("r1") == []
-        store._restore_snapshot(snap)
+        tx = store.begin_transaction()
+        store.add_cc("r1", [{"cc": 64, "beat": 2, "value": 0}])
+        store.add_pitch_bends("r2", pb_data)
+        assert len(store.get_region_cc("r1")) == 2
+        store.rollback(tx)
         assert len(store.get_region_cc("r1")) == 1
         assert len(store.get_region_pitch_bends("r1")) == 1
+        assert store.get_region_pitch_bends("r2") == []
 
 
 class TestVariationServiceCC:
@@ -1575,15 +1576,14 @@ class TestAftertouchPipeline:
         assert result[0]["pitch"] == 60
         assert store.get_region_aftertouch("nonexistent") == []
 
-    def test_aftertouch_survives_snapshot_restore(self) -> None:
+    def test_aftertouch_survives_rollback(self) -> None:
 
         store = StateStore(conversation_id="at4", project_id="p")
         at_data: list[AftertouchDict] = [{"beat": 0, "value": 100}]
         store.add_aftertouch("r1", at_data)
-        snap = store._take_snapshot()
-        store._region_aftertouch.clear()
-        assert store.get_region_aftertouch("r1") == []
-        store._restore_snapshot(snap)
+        tx = store.begin_transaction()
+        store.add_aftertouch("r1", [{"beat": 1, "value": 50}])
+        store.rollback(tx)
         assert len(store.get_region_aftertouch("r1")) == 1
 
     def test_variation_service_aftertouch_in_phrases(self) -> None:
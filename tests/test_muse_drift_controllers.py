@@ -502,6 +502,26 @@ class TestEventMatching:
         assert len(added) == 1
         assert len(removed) == 1
 
+    def test_at_channel_pressure_matches_without_pitch(self) -> None:
+
+        matches = match_aftertouch(
+            [{"beat": 2.0, "value": 80}],
+            [{"beat": 2.02, "value": 90}],
+        )
+        assert len(matches) == 1
+        assert matches[0].is_modified
+
+    def test_each_event_takes_first_unmatched_in_window(self) -> None:
+
+        matches = match_cc_events(
+            [{"cc": 64, "beat": 1.0, "value": 0}, {"cc": 64, "beat": 1.0, "value": 1}],
+            [{"cc": 64, "beat": 1.03, "value": 0}, {"cc": 64, "beat": 1.0, "value": 1}],
+        )
+        assert [(m.base_event, m.proposed_event) for m in matches] == [
+            ({"cc": 64, "beat": 1.0, "value": 0}, {"cc": 64, "beat": 1.03, "value": 0}),
+            ({"cc": 64, "beat": 1.0, "value": 1}, {"cc": 64, "beat": 1.0, "value": 1}),
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Boundary seal
@@ -0,0 +1,131 @@
+"""Tests for the shared, content-addressed Muse Hub blob store.
+
+Covers:
+- The same bytes pushed to two repos are stored once and referenced twice
+- copy_repo_objects gives a fork every object without writing bytes
+- sweep_blobs deletes unreferenced blobs but spares referenced and recent ones
+
+Service tests use the ``db_session`` fixture; blobs live in ``tmp_path``.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import os
+import pathlib
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from maestro.db import musehub_models as db
+from maestro.models.musehub import CommitInput, ObjectInput
+from maestro.services import musehub_repository, musehub_sync
+from maestro.services.musehub_blobs import blob_disk_path, sweep_blobs, write_blob_sync
+
+_SEED = b"MIDI-seed"
+_SEED_SHA = hashlib.sha256(_SEED).hexdigest()
+
+
+async def _repo(session: AsyncSession, slug: str) -> str:
+    repo = db.MusehubRepo(name=slug, owner="tester", slug=slug, owner_user_id="u1")
+    session.add(repo)
+    await session.flush()
+    return repo.repo_id
+
+
+async def _push_seed(session: AsyncSession, repo_id: str, objects_dir: pathlib.Path) -> None:
+    with patch("maestro.services.musehub_sync.settings") as cfg:
+        cfg.musehub_objects_dir = str(objects_dir)
+        cfg.musehub_object_write_workers = 2
+        await musehub_sync.ingest_push(
+            session,
+            repo_id=repo_id,
+            branch="main",
+            head_commit_id=f"c-{repo_id[:8]}",
+            commits=[
+                CommitInput(
+                    commit_id=f"c-{repo_id[:8]}",
+                    parent_ids=[],
+                    message="seed",
+                    timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+                )
+            ],
+            objects=[
+                ObjectInput(
+                    object_id=f"sha256:{_SEED_SHA}",
+                    path="tracks/seed.mid",
+                    content_b64=base64.b64encode(_SEED).decode(),
+                )
+            ],
+            force=False,
+            author="tester",
+        )
+
+
+async def _rows(session: AsyncSession) -> list[db.MusehubObject]:
+    return list((await session.execute(select(db.MusehubObject))).scalars().all())
+
+
+def _blob_files(objects_dir: pathlib.Path) -> list[pathlib.Path]:
+    return [p for p in (objects_dir / "blobs").rglob("*") if p.is_file()]
+
+
+@pytest.mark.anyio
+async def test_same_bytes_in_two_repos_share_one_blob(
+    db_session: AsyncSession, tmp_path: pathlib.Path
+) -> None:
+    repo_a = await _repo(db_session, "a")
+    repo_b = await _repo(db_session, "b")
+
+    await _push_seed(db_session, repo_a, tmp_path)
+    await _push_seed(db_session, repo_b, tmp_path)
+
+    rows = await _rows(db_session)
+    assert {r.repo_id for r in rows} == {repo_a, repo_b}
+    assert {r.blob_sha256 for r in rows} == {_SEED_SHA}
+    assert {r.disk_path for r in rows} == {str(blob_disk_path(tmp_path, _SEED_SHA))}
+    assert _blob_files(tmp_path) == [blob_disk_path(tmp_path, _SEED_SHA)]
+
+
+@pytest.mark.anyio
+async def test_fork_copies_rows_not_bytes(
+    db_session: AsyncSession, tmp_path: pathlib.Path
+) -> None:
+    source = await _repo(db_session, "source")
+    fork = await _repo(db_session, "fork")
+    await _push_seed(db_session, source, tmp_path)
+
+    copied = await musehub_repository.copy_repo_objects(
+        db_session, source_repo_id=source, target_repo_id=fork
+    )
+
+    assert copied == 1
+    forked = await musehub_repository.get_object_row(db_session, fork, f"sha256:{_SEED_SHA}")
+    assert forked is not None
+    assert forked.blob_sha256 == _SEED_SHA
+    assert pathlib.Path(forked.disk_path).read_bytes() == _SEED
+    assert len(_blob_files(tmp_path)) == 1
+
+
+@pytest.mark.anyio
+async def test_sweep_removes_only_old_unreferenced_blobs(
+    db_session: AsyncSession, tmp_path: pathlib.Path
+) -> None:
+    repo_id = await _repo(db_session, "sweep")
+    await _push_seed(db_session, repo_id, tmp_path)
+    orphan = write_blob_sync(tmp_path, b"orphan").disk_path
+    young = write_blob_sync(tmp_path, b"young").disk_path
+    an_hour_ago = time.time() - 7200
+    for path in (orphan, blob_disk_path(tmp_path, _SEED_SHA)):
+        os.utime(path, (an_hour_ago, an_hour_ago))
+
+    removed = await sweep_blobs(db_session, tmp_path, grace=timedelta(hours=1))
+
+    assert removed == 1
+    assert not orphan.exists()
+    assert young.exists()
+    assert blob_disk_path(tmp_path, _SEED_SHA).exists()
@@ -4,7 +4,8 @@ Covers every acceptance criterion:
 - POST /musehub/repos/{repo_id}/issues creates an issue in open state
 - Issue numbers are sequential per repo starting at 1
 - GET /musehub/repos/{repo_id}/issues returns open issues by default
-- GET .../issues?label=<label> filters by label
+- GET .../issues?label=<label> filters by label (whole labels only)
+- GET .../issues?cursor=<number>&limit=N pages by issue number
 - POST .../issues/{number}/close sets state to closed
 - GET .../issues/{number} returns 404 for unknown issue numbers
 - All endpoints require valid JWT
@@ -191,6 +192,51 @@ async def test_list_issues_label_filter(
         assert "bug" in issue["labels"]
 
 
+@pytest.mark.anyio
+async def test_list_issues_label_filter_matches_whole_label(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+) -> None:
+    """?label=jazz does not match an issue labelled only 'jazz-fusion'."""
+    repo_id = await _create_repo(client, auth_headers, "label-exact-repo")
+    await _create_issue(client, auth_headers, repo_id, title="Jazz", labels=["jazz"])
+    await _create_issue(client, auth_headers, repo_id, title="Fusion", labels=["jazz-fusion"])
+
+    response = await client.get(
+        f"/api/v1/musehub/repos/{repo_id}/issues?label=jazz", headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [i["title"] for i in body["issues"]] == ["Jazz"]
+    assert body["total"] == 1
+
+
+@pytest.mark.anyio
+async def test_list_issues_cursor_pagination(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+) -> None:
+    """?cursor=<last number> returns the next issues and a rel="next" link while pages are full."""
+    repo_id = await _create_repo(client, auth_headers, "cursor-repo")
+    for title in ("one", "two", "three"):
+        await _create_issue(client, auth_headers, repo_id, title=title)
+
+    first = await client.get(
+        f"/api/v1/musehub/repos/{repo_id}/issues?cursor=0&limit=2", headers=auth_headers
+    )
+    assert first.status_code == 200
+    assert [i["number"] for i in first.json()["issues"]] == [1, 2]
+    assert first.json()["total"] == 3
+    assert "cursor=2" in first.headers["link"]
+
+    second = await client.get(
+        f"/api/v1/musehub/repos/{repo_id}/issues?cursor=2&limit=2", headers=auth_headers
+    )
+    assert [i["number"] for i in second.json()["issues"]] == [3]
+    assert "link" not in second.headers
+
+
 # ---------------------------------------------------------------------------
 # GET /musehub/repos/{repo_id}/issues/{issue_number}
 # ---------------------------------------------------------------------------
@@ -376,6 +422,37 @@ async def test_list_issues_closed_state_filter(db_session: AsyncSession) -> None
     assert len(all_list) == 2
 
 
+@pytest.mark.anyio
+async def test_list_issues_most_commented_sort_and_counts(db_session: AsyncSession) -> None:
+    """sort='most-commented' orders by batched comment counts, which ignore deleted comments."""
+    repo = await musehub_repository.create_repo(
+        db_session,
+        name="comment-sort-repo",
+        owner="testuser",
+        visibility="private",
+        owner_user_id="user-xyz",
+    )
+    quiet = await musehub_issues.create_issue(
+        db_session, repo_id=repo.repo_id, title="Quiet", body="", labels=[]
+    )
+    busy = await musehub_issues.create_issue(
+        db_session, repo_id=repo.repo_id, title="Busy", body="", labels=[]
+    )
+    for _ in range(2):
+        await musehub_issues.create_comment(
+            db_session, issue_id=busy.issue_id, repo_id=repo.repo_id, body="+1", author="a"
+        )
+    removed = await musehub_issues.create_comment(
+        db_session, issue_id=quiet.issue_id, repo_id=repo.repo_id, body="oops", author="a"
+    )
+    await musehub_issues.delete_comment(db_session, removed.comment_id, quiet.issue_id)
+    await db_session.commit()
+
+    ranked = await musehub_issues.list_issues(db_session, repo.repo_id, sort="most-commented")
+
+    assert [(i.title, i.comment_count) for i in ranked] == [("Busy", 2), ("Quiet", 0)]
+
+
 # ---------------------------------------------------------------------------
 # Regression tests — author field on Issue, PR, Release
 # ---------------------------------------------------------------------------
@@ -0,0 +1,391 @@
+"""Tests for the negotiated pull — pack wire format and Hub-side planning.
+
+Covers:
+- encode_pack → PackDecoder round-trips regardless of how the stream is split
+- Truncated, unknown-kind and wrong-magic streams are rejected
+- plan_pull_pack walks ancestry from the branch head and stops at known tips,
+  and sends objects linked to any missing push head, whichever push uploaded them
+- Unknown tips are ignored; no known tip means every object is sent
+- Objects are limited to those linked to missing commits (plus legacy rows)
+- POST /pull/pack streams an application/x-muse-pack body
+- ingest_push_pack spools objects to disk, verifies SHA-256 and bulk-inserts rows
+- A digest mismatch or truncated push stores nothing; POST /push/pack maps errors
+
+Service tests use the ``db_session`` fixture; object bytes live in ``tmp_path``.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import pathlib
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from maestro.db import musehub_models as db
+from maestro.models.musehub import CommitInput, ObjectInput
+from maestro.services import musehub_sync
+from maestro.services.musehub_pack import (
+    CHUNK_SIZE,
+    FRAME_COMMIT,
+    FRAME_DATA,
+    FRAME_END,
+    FRAME_HEADER,
+    FRAME_OBJECT,
+    PACK_MEDIA_TYPE,
+    PackDecoder,
+    PackFormatError,
+    PackFrame,
+    PackObject,
+    encode_frame,
+    encode_pack,
+)
+
+
+async def _collect(header: dict[str, object], commits: list[dict[str, object]],
+                   objects: list[PackObject]) -> bytes:
+    return b"".join([chunk async for chunk in encode_pack(header, commits, objects)])
+
+
+def _decode(data: bytes, step: int) -> list[PackFrame]:
+    decoder = PackDecoder()
+    frames: list[PackFrame] = []
+    for start in range(0, len(data), step):
+        frames.extend(decoder.feed(data[start:start + step]))
+    decoder.close()
+    return frames
+
+
+# ---------------------------------------------------------------------------
+# Wire format
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.anyio
+async def test_pack_round_trip_any_split(tmp_path: pathlib.Path) -> None:
+    big = bytes(range(256)) * (CHUNK_SIZE // 128)  # two full data frames
+    (tmp_path / "big").write_bytes(big)
+    (tmp_path / "small").write_bytes(b"kick")
+    data = await _collect(
+        {"branch": "main", "remote_head": "c2"},
+        [{"commit_id": "c1"}, {"commit_id": "c2"}],
+        [
+            PackObject("o-big", "tracks/big.mid", str(tmp_path / "big")),
+            PackObject("o-missing", "gone.mid", str(tmp_path / "missing")),
+            PackObject("o-small", "tracks/kick.mid", str(tmp_path / "small")),
+        ],
+    )
+
+    for step in (1, 7, 4096, len(data)):
+        frames = _decode(data, step)
+        kinds = [f.kind for f in frames]
+        assert kinds == [
+            FRAME_HEADER, FRAME_COMMIT, FRAME_COMMIT,
+            FRAME_OBJECT, FRAME_DATA, FRAME_DATA,
+            FRAME_OBJECT, FRAME_DATA,
+            FRAME_END,
+        ]
+        assert frames[0].json()["remote_head"] == "c2"
+        assert frames[3].json() == {
+            "object_id": "o-big", "path": "tracks/big.mid", "size_bytes": len(big),
+        }
+        assert frames[4].payload + frames[5].payload == big
+        assert frames[7].payload == b"kick"
+        assert frames[-1].json() == {"commits": 2, "objects": 2}
+
+
+@pytest.mark.anyio
+async def test_pack_decoder_rejects_bad_streams() -> None:
+    data = await _collect({"branch": "main", "remote_head": None}, [], [])
+
+    with pytest.raises(PackFormatError):
+        _decode(data[:-1], len(data))
+    with pytest.raises(PackFormatError):
+        PackDecoder().feed(b"NOTAPACK\x01")
+    with pytest.raises(PackFormatError):
+        PackDecoder().feed(data[:9] + encode_frame(b"Z", b""))
+    with pytest.raises(PackFormatError):
+        PackDecoder().feed(data + b"trailing")
+
+
+# ---------------------------------------------------------------------------
+# plan_pull_pack
+# ---------------------------------------------------------------------------
+
+
+def _commit(cid: str, *parents: str, day: int) -> CommitInput:
+    return CommitInput(
+        commit_id=cid,
+        parent_ids=list(parents),
+        message=cid,
+        timestamp=datetime(2025, 1, day, tzinfo=timezone.utc),
+    )
+
+
+def _object(label: str) -> ObjectInput:
+    content = f"MIDI-{label}".encode()
+    return ObjectInput(
+        object_id=f"sha256:{hashlib.sha256(content).hexdigest()}",
+        path=f"tracks/{label}.mid",
+        content_b64=base64.b64encode(content).decode(),
+    )
+
+
+async def _seed_repo(session: AsyncSession, objects_dir: pathlib.Path) -> str:
+    """Two pushes: c1←c2 with object a, then c3 with object b."""
+    repo = db.MusehubRepo(name="pack", owner="tester", slug="pack", owner_user_id="u1")
+    session.add(repo)
+    await session.flush()
+    with patch("maestro.services.musehub_sync.settings") as cfg:
+        cfg.musehub_objects_dir = str(objects_dir)
+        cfg.musehub_object_write_workers = 2
+        await musehub_sync.ingest_push(
+            session, repo_id=repo.repo_id, branch="main", head_commit_id="c2",
+            commits=[_commit("c1", day=1), _commit("c2", "c1", day=2)],
+            objects=[_object("a")], force=False, author="tester",
+        )
+        await musehub_sync.ingest_push(
+            session, repo_id=repo.repo_id, branch="main", head_commit_id="c3",
+            commits=[_commit("c3", "c2", day=3)],
+            objects=[_object("b")], force=False, author="tester",
+        )
+    return repo.repo_id
+
+
+@pytest.mark.anyio
+async def test_plan_first_pull_sends_everything(
+    db_session: AsyncSession, tmp_path: pathlib.Path
+) -> None:
+    repo_id = await _seed_repo(db_session, tmp_path)
+
+    plan = await musehub_sync.plan_pull_pack(
+        db_session, repo_id=repo_id, branch="main", have_tips=["local-only"]
+    )
+
+    assert plan.remote_head == "c3"
+    assert [c["commit_id"] for c in plan.commits] == ["c1", "c2", "c3"]
+    assert plan.commits[1]["parent_commit_id"] == "c1"
+    assert {o.path for o in plan.objects} == {"tracks/a.mid", "tracks/b.mid"}
+
+
+@pytest.mark.anyio
+async def test_plan_stops_at_known_tip(
+    db_session: AsyncSession, tmp_path: pathlib.Path
+) -> None:
+    repo_id = await _seed_repo(db_session, tmp_path)
+
+    plan = await musehub_sync.plan_pull_pack(
+        db_session, repo_id=repo_id, branch="main", have_tips=["c2", "local-only"]
+    )
+
+    assert [c["commit_id"] for c in plan.commits] == ["c3"]
+    assert [o.path for o in plan.objects] == ["tracks/b.mid"]
+
+    up_to_date = await musehub_sync.plan_pull_pack(
+        db_session, repo_id=repo_id, branch="main", have_tips=["c3"]
+    )
+    assert up_to_date.commits == []
+    assert up_to_date.objects == []
+
+
+@pytest.mark.anyio
+async def test_plan_sends_object_first_uploaded_on_another_branch(
+    db_session: AsyncSession, tmp_path: pathlib.Path
+) -> None:
+    """An object reused by a branch is sent even though another push uploaded it."""
+    repo_id = await _seed_repo(db_session, tmp_path)
+    with patch("maestro.services.musehub_sync.settings") as cfg:
+        cfg.musehub_objects_dir = str(tmp_path)
+        cfg.musehub_object_write_workers = 2
+        await musehub_sync.ingest_push(
+            db_session, repo_id=repo_id, branch="feat", head_commit_id="f1",
+            commits=[_commit("f1", "c3", day=4)],
+            objects=[_object("shared")], force=False, author="tester",
+        )
+        await musehub_sync.ingest_push(
+            db_session, repo_id=repo_id, branch="main", head_commit_id="c4",
+            commits=[_commit("c4", "c3", day=5)],
+            objects=[_object("shared")], force=False, author="tester",
+        )
+
+    plan = await musehub_sync.plan_pull_pack(
+        db_session, repo_id=repo_id, branch="main", have_tips=["c3"]
+    )
+
+    assert [c["commit_id"] for c in plan.commits] == ["c4"]
+    assert [o.path for o in plan.objects] == ["tracks/shared.mid"]
+
+
+@pytest.mark.anyio
+async def test_plan_unknown_branch_is_empty(
+    db_session: AsyncSession, tmp_path: pathlib.Path
+) -> None:
+    repo_id = await _seed_repo(db_session, tmp_path)
+
+    plan = await musehub_sync.plan_pull_pack(
+        db_session, repo_id=repo_id, branch="nope", have_tips=[]
+    )
+
+    assert plan.remote_head is None
+    assert plan.commits == [] and plan.objects == []
+
+
+@pytest.mark.anyio
+async def test_pull_pack_route_streams_pack(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_session: AsyncSession,
+    tmp_path: pathlib.Path,
+) -> None:
+    repo_id = await _seed_repo(db_session, tmp_path)
+    await db_session.commit()
+
+    resp = await client.post(
+        f"/api/v1/musehub/repos/{repo_id}/pull/pack",
+        json={"branch": "main", "haveTips": ["c2"]},
+        headers=auth_headers,
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith(PACK_MEDIA_TYPE)
+    frames = _decode(resp.content, len(resp.content))
+    assert [f.json()["commit_id"] for f in frames if f.kind == FRAME_COMMIT] == ["c3"]
+    data = b"".join(f.payload for f in frames if f.kind == FRAME_DATA)
+    assert data == b"MIDI-b"
+
+
+# ---------------------------------------------------------------------------
+# ingest_push_pack
+# ---------------------------------------------------------------------------
+
+
+def _push_header(head: str, *, force: bool = False) -> dict[str, object]:
+    return {"branch": "main", "head_commit_id": head, "force": force}
+
+
+def _push_commit(cid: str, *parents: str) -> dict[str, object]:
+    return {
+        "commit_id": cid,
+        "parent_ids": list(parents),
+        "message": cid,
+        "timestamp": "2025-01-01T00:00:00+00:00",
+    }
+
+
+def _source_object(src: pathlib.Path, label: str, content: bytes) -> PackObject:
+    path = src / label
+    path.write_bytes(content)
+    return PackObject(
+        f"sha256:{hashlib.sha256(content).hexdigest()}", f"tracks/{label}.mid", str(path)
+    )
+
+
+async def _chunks(data: bytes, step: int = 1000) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), step):
+        yield data[start:start + step]
+
+
+async def _new_repo(session: AsyncSession) -> str:
+    repo = db.MusehubRepo(name="push", owner="tester", slug="push", owner_user_id="u1")
+    session.add(repo)
+    await session.flush()
+    return repo.repo_id
+
+
+@pytest.mark.anyio
+async def test_push_pack_spools_and_verifies_objects(
+    db_session: AsyncSession, tmp_path: pathlib.Path
+) -> None:
+    src, store = tmp_path / "src", tmp_path / "store"
+    src.mkdir()
+    big = bytes(range(256)) * (CHUNK_SIZE // 64)
+    objects = [_source_object(src, "big", big), _source_object(src, "kick", b"kick")]
+    data = await _collect(
+        _push_header("c2"), [_push_commit("c1"), _push_commit("c2", "c1")], objects
+    )
+    repo_id = await _new_repo(db_session)
+
+    with patch("maestro.services.musehub_sync.settings") as cfg:
+        cfg.musehub_objects_dir = str(store)
+        cfg.musehub_object_write_workers = 2
+        result = await musehub_sync.ingest_push_pack(
+            db_session, repo_id=repo_id, chunks=_chunks(data), author="tester"
+        )
+
+    assert result.response.remote_head == "c2"
+    assert [c.commit_id for c in result.commits] == ["c1", "c2"]
+    rows = (await db_session.execute(
+        select(db.MusehubObject).where(db.MusehubObject.repo_id == repo_id)
+    )).scalars().all()
+    by_path = {r.path: r for r in rows}
+    assert by_path["tracks/big.mid"].size_bytes == len(big)
+    assert by_path["tracks/big.mid"].introduced_by == "c2"
+    assert pathlib.Path(by_path["tracks/big.mid"].disk_path).read_bytes() == big
+    assert pathlib.Path(by_path["tracks/kick.mid"].disk_path).read_bytes() == b"kick"
+    assert not list(store.rglob(".*.part"))
+
+
+@pytest.mark.anyio
+async def test_push_pack_rejects_digest_mismatch(
+    db_session: AsyncSession, tmp_path: pathlib.Path
+) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    good = _source_object(src, "a", b"MIDI-a")
+    forged = PackObject(good.object_id, good.path, str(src / "forged"))
+    (src / "forged").write_bytes(b"MIDI-evil")
+    data = await _collect(_push_header("c1"), [_push_commit("c1")], [forged])
+    repo_id = await _new_repo(db_session)
+
+    with patch("maestro.services.musehub_sync.settings") as cfg:
+        cfg.musehub_objects_dir = str(tmp_path / "store")
+        cfg.musehub_object_write_workers = 2
+        with pytest.raises(ValueError, match="object_digest_mismatch"):
+            await musehub_sync.ingest_push_pack(
+                db_session, repo_id=repo_id, chunks=_chunks(data), author="tester"
+            )
+        with pytest.raises(PackFormatError):
+            await musehub_sync.ingest_push_pack(
+                db_session, repo_id=repo_id, chunks=_chunks(data[:-1]), author="tester"
+            )
+
+    assert not [p for p in (tmp_path / "store").rglob("*") if p.is_file()]
+
+
+@pytest.mark.anyio
+async def test_push_pack_route(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_session: AsyncSession,
+    tmp_path: pathlib.Path,
+) -> None:
+    repo_id = await _new_repo(db_session)
+    await db_session.commit()
+    src = tmp_path / "src"
+    src.mkdir()
+    obj = _source_object(src, "a", b"MIDI-a")
+    data = await _collect(_push_header("c1"), [_push_commit("c1")], [obj])
+
+    with patch("maestro.services.musehub_sync.settings") as cfg:
+        cfg.musehub_objects_dir = str(tmp_path / "store")
+        cfg.musehub_object_write_workers = 2
+        resp = await client.post(
+            f"/api/v1/musehub/repos/{repo_id}/push/pack",
+            content=data,
+            headers={**auth_headers, "Content-Type": PACK_MEDIA_TYPE},
+        )
+        bad = await client.post(
+            f"/api/v1/musehub/repos/{repo_id}/push/pack",
+            content=b"NOTAPACK\x01",
+            headers={**auth_headers, "Content-Type": PACK_MEDIA_TYPE},
+        )
+
+    assert resp.status_code == 200
+    assert resp.json() == {"ok": True, "remoteHead": "c1"}
+    assert bad.status_code == 400
+    assert bad.json()["detail"]["error"] == "bad_pack"
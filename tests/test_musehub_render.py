@@ -5,8 +5,10 @@ Covers the acceptance criteria from the issue:
   test_render_creates_mp3_objects — Render creates MP3 objects in store
   test_render_creates_piano_roll_images — Render creates PNG objects in store
   test_render_idempotent — Re-push does not duplicate renders
+  test_render_reuses_cached_piano_roll — Identical MIDI is rasterized once
   test_render_failure_does_not_block_push — Failed render still allows push to complete
   test_render_status_endpoint — Render status queryable by commit SHA
+  test_render_pool_does_not_fork_and_is_closed — Pool uses forkserver/spawn and shuts down
 
 Unit tests (service-level, no HTTP client):
   test_piano_roll_render_note_events — Valid MIDI produces non-blank PNG
@@ -44,6 +46,7 @@ from maestro.models.musehub import ObjectInput
 from maestro.services.musehub_piano_roll_renderer import (
     PianoRollRenderResult,
     render_piano_roll,
+    render_piano_roll_png,
 )
 from maestro.services.musehub_render_pipeline import (
     RenderPipelineResult,
@@ -276,6 +279,7 @@ async def test_render_creates_mp3_objects(
     with tempfile.TemporaryDirectory() as tmpdir:
         with patch("maestro.services.musehub_render_pipeline.settings") as mock_settings:
             mock_settings.musehub_objects_dir = tmpdir
+            mock_settings.musehub_render_workers = 0
             await trigger_render_background(
                 repo_id=repo_id,
                 commit_id=commit_id,
@@ -311,6 +315,7 @@ async def test_render_creates_piano_roll_images(
     with tempfile.TemporaryDirectory() as tmpdir:
         with patch("maestro.services.musehub_render_pipeline.settings") as mock_settings:
             mock_settings.musehub_objects_dir = tmpdir
+            mock_settings.musehub_render_workers = 0
             await trigger_render_background(
                 repo_id=repo_id,
                 commit_id=commit_id,
@@ -346,6 +351,7 @@ async def test_render_idempotent(
     with tempfile.TemporaryDirectory() as tmpdir:
         with patch("maestro.services.musehub_render_pipeline.settings") as mock_settings:
             mock_settings.musehub_objects_dir = tmpdir
+            mock_settings.musehub_render_workers = 0
             # First call
             await trigger_render_background(
                 repo_id=repo_id,
@@ -368,6 +374,50 @@ async def test_render_idempotent(
     assert count == 1
 
 
+@pytest.mark.anyio
+async def test_render_reuses_cached_piano_roll(
+    db_session: AsyncSession,
+) -> None:
+    """The same MIDI pushed in a second commit reuses the cached piano roll."""
+    from maestro.services import musehub_render_pipeline as pipeline_mod
+
+    repo_id, _ = await _seed_repo(db_session)
+    objects = [
+        ObjectInput(
+            object_id="sha256:midi005",
+            path="tracks/pad.mid",
+            content_b64=_make_midi_b64(),
+        )
+    ]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with patch("maestro.services.musehub_render_pipeline.settings") as mock_settings:
+            mock_settings.musehub_objects_dir = tmpdir
+            mock_settings.musehub_render_workers = 0
+            with patch.object(
+                pipeline_mod,
+                "render_piano_roll_png",
+                wraps=render_piano_roll_png,
+            ) as renderer:
+                for commit_id in ("e" * 64, "f" * 64):
+                    await trigger_render_background(
+                        repo_id=repo_id,
+                        commit_id=commit_id,
+                        objects=objects,
+                    )
+
+    from sqlalchemy import select as sa_select
+    from maestro.db.musehub_models import MusehubRenderJob as RJ
+    jobs = (
+        await db_session.execute(sa_select(RJ).where(RJ.repo_id == repo_id))
+    ).scalars().all()
+
+    assert renderer.call_count == 1
+    assert len(jobs) == 2
+    assert jobs[0].image_object_ids == jobs[1].image_object_ids
+    assert len(jobs[0].image_object_ids) == 1
+
+
 @pytest.mark.anyio
 async def test_render_no_midi_objects(
     db_session: AsyncSession,
@@ -387,6 +437,7 @@ async def test_render_no_midi_objects(
     with tempfile.TemporaryDirectory() as tmpdir:
         with patch("maestro.services.musehub_render_pipeline.settings") as mock_settings:
             mock_settings.musehub_objects_dir = tmpdir
+            mock_settings.musehub_render_workers = 0
             await trigger_render_background(
                 repo_id=repo_id,
                 commit_id=commit_id,
@@ -664,6 +715,7 @@ async def test_render_pipeline_internal_error_is_logged(
     with tempfile.TemporaryDirectory() as tmpdir:
         with patch("maestro.services.musehub_render_pipeline.settings") as mock_settings:
             mock_settings.musehub_objects_dir = tmpdir
+            mock_settings.musehub_render_workers = 0
             with patch.object(pipeline_mod, "_render_commit", side_effect=exploding_render):
                 # Must not raise — errors are swallowed inside trigger_render_background
                 await trigger_render_background(
@@ -681,3 +733,48 @@ async def test_render_pipeline_internal_error_is_logged(
     assert job.status == "failed"
     assert job.error_message is not None
     assert "simulated internal render error" in job.error_message
+
+
+@pytest.mark.anyio
+async def test_render_pool_does_not_fork_and_is_closed() -> None:
+    """Pool workers start via forkserver/spawn and close_render_pool tears the pool down."""
+    from maestro.services import musehub_render_pipeline as pipeline_mod
+
+    with patch("maestro.services.musehub_render_pipeline.settings") as mock_settings:
+        mock_settings.musehub_render_workers = 1
+        pool = pipeline_mod._render_pool()
+        assert pool is not None
+        try:
+            mp_context = pool._mp_context
+            assert mp_context is not None
+            assert mp_context.get_start_method() in ("forkserver", "spawn")
+            image = await pipeline_mod._rasterize(base64.b64decode(_make_midi_b64()), 200)
+            assert image.png_bytes.startswith(b"\x89PNG")
+        finally:
+            await pipeline_mod.close_render_pool()
+
+    assert pipeline_mod._RENDER_POOL is None
+    with pytest.raises(RuntimeError):
+        pool.submit(len, b"")
+
+
+@pytest.mark.anyio
+async def test_broken_render_pool_is_shut_down_and_replaced() -> None:
+    """A broken pool is shut down before it is dropped; the render finishes in-process."""
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    from maestro.services import musehub_render_pipeline as pipeline_mod
+
+    broken = MagicMock(spec=ProcessPoolExecutor)
+    broken.submit.side_effect = BrokenProcessPool("worker died")
+    with (
+        patch("maestro.services.musehub_render_pipeline.settings") as mock_settings,
+        patch.object(pipeline_mod, "_RENDER_POOL", broken),
+    ):
+        mock_settings.musehub_render_workers = 1
+        image = await pipeline_mod._rasterize(base64.b64decode(_make_midi_b64()), 200)
+        assert pipeline_mod._RENDER_POOL is None
+
+    assert image.png_bytes.startswith(b"\x89PNG")
+    broken.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
@@ -0,0 +1,153 @@
+"""Tests for the materialized Muse Hub repo stats table.
+
+Covers:
+- A new repo gets a zeroed stats row on flush
+- Stars, unstars, watches, forks and commits adjust counters in the same flush
+- latest_commit_at only moves forward; deleting a commit triggers a rebuild
+- recompute_repo_stats rebuilds a row that drifted or is missing
+- Explore sorts by the materialized commit count
+
+Service tests use the ``db_session`` fixture (in-memory SQLite).
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from maestro.db import musehub_models as db
+from maestro.db.musehub_stats_models import MusehubRepoStats, recompute_repo_stats
+from maestro.services import musehub_discover
+
+
+async def _repo(session: AsyncSession, slug: str) -> str:
+    repo = db.MusehubRepo(
+        name=slug, owner="tester", slug=slug, owner_user_id="u1", visibility="public"
+    )
+    session.add(repo)
+    await session.flush()
+    return repo.repo_id
+
+
+def _commit(repo_id: str, commit_id: str, day: int) -> db.MusehubCommit:
+    return db.MusehubCommit(
+        commit_id=commit_id,
+        repo_id=repo_id,
+        branch="main",
+        parent_ids=[],
+        message=commit_id,
+        author="tester",
+        timestamp=datetime(2025, 1, day, tzinfo=timezone.utc),
+    )
+
+
+async def _stats(session: AsyncSession, repo_id: str) -> MusehubRepoStats:
+    row = (
+        await session.execute(
+            select(MusehubRepoStats)
+            .where(MusehubRepoStats.repo_id == repo_id)
+            .execution_options(populate_existing=True)
+        )
+    ).scalar_one()
+    return row
+
+
+@pytest.mark.anyio
+async def test_new_repo_gets_zeroed_row(db_session: AsyncSession) -> None:
+    repo_id = await _repo(db_session, "fresh")
+
+    stats = await _stats(db_session, repo_id)
+
+    assert (stats.star_count, stats.commit_count, stats.fork_count, stats.watcher_count) == (0, 0, 0, 0)
+    assert stats.latest_commit_at is None
+
+
+@pytest.mark.anyio
+async def test_star_and_unstar_adjust_star_count(db_session: AsyncSession) -> None:
+    repo_id = await _repo(db_session, "starry")
+
+    await musehub_discover.star_repo(db_session, repo_id, "alice")
+    await musehub_discover.star_repo(db_session, repo_id, "bob")
+    assert (await _stats(db_session, repo_id)).star_count == 2
+
+    await musehub_discover.unstar_repo(db_session, repo_id, "alice")
+    assert (await _stats(db_session, repo_id)).star_count == 1
+
+
+@pytest.mark.anyio
+async def test_watches_and_forks_adjust_counts(db_session: AsyncSession) -> None:
+    source = await _repo(db_session, "source")
+    fork = await _repo(db_session, "fork")
+
+    db_session.add(db.MusehubWatch(user_id="alice", repo_id=source))
+    db_session.add(db.MusehubFork(source_repo_id=source, fork_repo_id=fork, forked_by="alice"))
+    await db_session.flush()
+
+    stats = await _stats(db_session, source)
+    assert (stats.watcher_count, stats.fork_count) == (1, 1)
+    assert (await _stats(db_session, fork)).fork_count == 0
+
+
+@pytest.mark.anyio
+async def test_commits_advance_latest_and_delete_rebuilds(db_session: AsyncSession) -> None:
+    repo_id = await _repo(db_session, "busy")
+    newest = _commit(repo_id, "c3", 3)
+    db_session.add_all([_commit(repo_id, "c1", 1), newest])
+    await db_session.flush()
+    db_session.add(_commit(repo_id, "c2", 2))
+    await db_session.flush()
+
+    stats = await _stats(db_session, repo_id)
+    assert stats.commit_count == 3
+    assert stats.latest_commit_at is not None
+    assert stats.latest_commit_at.replace(tzinfo=None) == datetime(2025, 1, 3)
+
+    await db_session.delete(newest)
+    await db_session.flush()
+
+    stats = await _stats(db_session, repo_id)
+    assert stats.commit_count == 2
+    assert stats.latest_commit_at is not None
+    assert stats.latest_commit_at.replace(tzinfo=None) == datetime(2025, 1, 2)
+
+
+@pytest.mark.anyio
+async def test_recompute_repairs_missing_row(db_session: AsyncSession) -> None:
+    repo_id = await _repo(db_session, "drifted")
+    db_session.add(db.MusehubStar(repo_id=repo_id, user_id="alice"))
+    await db_session.flush()
+    await db_session.execute(delete(MusehubRepoStats).where(MusehubRepoStats.repo_id == repo_id))
+
+    await db_session.run_sync(lambda session: recompute_repo_stats(session.connection(), [repo_id]))
+
+    assert (await _stats(db_session, repo_id)).star_count == 1
+
+
+@pytest.mark.anyio
+async def test_explore_sorts_by_materialized_commit_count(db_session: AsyncSession) -> None:
+    quiet = await _repo(db_session, "quiet")
+    busy = await _repo(db_session, "busy")
+    db_session.add_all([_commit(busy, "b1", 1), _commit(busy, "b2", 2), _commit(quiet, "q1", 1)])
+    await db_session.flush()
+
+    result = await musehub_discover.list_public_repos(db_session, sort="commits")
+
+    assert [r.repo_id for r in result.repos] == [busy, quiet]
+    assert [r.commit_count for r in result.repos] == [2, 1]
+
+
+@pytest.mark.anyio
+async def test_explore_lists_repo_without_stats_row(db_session: AsyncSession) -> None:
+    starred = await _repo(db_session, "starred")
+    orphan = await _repo(db_session, "orphan")
+    db_session.add(db.MusehubStar(repo_id=starred, user_id="alice"))
+    await db_session.flush()
+    await db_session.execute(delete(MusehubRepoStats).where(MusehubRepoStats.repo_id == orphan))
+
+    result = await musehub_discover.list_public_repos(db_session, sort="stars")
+
+    assert result.total == 2
+    assert [r.repo_id for r in result.repos] == [starred, orphan]
+    assert [r.star_count for r in result.repos] == [1, 0]
@@ -746,6 +746,110 @@ async def test_graph_json_response_has_required_fields(
     for field in ("commitId", "message", "author", "timestamp", "branch", "parentIds", "isHead"):
         assert field in node, f"Missing field '{field}' in DAG node"
 
+
+def _dag_commit(
+    repo_id: str, commit_id: str, parents: list[str], hour: int, branch: str = "main"
+) -> MusehubCommit:
+    from datetime import datetime, timezone
+
+    return MusehubCommit(
+        commit_id=commit_id,
+        repo_id=repo_id,
+        branch=branch,
+        parent_ids=parents,
+        message=commit_id,
+        author="tester",
+        timestamp=datetime(2025, 1, 1, hour, tzinfo=timezone.utc),
+    )
+
+
+@pytest.mark.anyio
+async def test_graph_dag_window_pages_back_from_newest(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_session: AsyncSession,
+) -> None:
+    """?limit returns the newest rows; ?before pages back with stable row numbers."""
+    create = await client.post(
+        "/api/v1/musehub/repos",
+        json={"name": "dag-window", "owner": "testuser", "initialize": False},
+        headers=auth_headers,
+    )
+    repo_id = create.json()["repoId"]
+    ids = [f"win-{i}" for i in range(5)]
+    db_session.add_all(
+        _dag_commit(repo_id, cid, [ids[i - 1]] if i else [], i) for i, cid in enumerate(ids)
+    )
+    await db_session.commit()
+
+    newest = (
+        await client.get(f"/api/v1/musehub/repos/{repo_id}/dag?limit=2", headers=auth_headers)
+    ).json()
+    assert [n["commitId"] for n in newest["nodes"]] == ["win-3", "win-4"]
+    assert [n["row"] for n in newest["nodes"]] == [3, 4]
+    assert (newest["total"], newest["windowStart"]) == (5, 3)
+    # The edge to a parent outside the window is still reported.
+    assert {"source": "win-3", "target": "win-2"} in newest["edges"]
+
+    older = (
+        await client.get(
+            f"/api/v1/musehub/repos/{repo_id}/dag?limit=2&before=win-3", headers=auth_headers
+        )
+    ).json()
+    assert [n["commitId"] for n in older["nodes"]] == ["win-1", "win-2"]
+    assert older["windowStart"] == 1
+
+    missing = await client.get(
+        f"/api/v1/musehub/repos/{repo_id}/dag?limit=2&around=nope", headers=auth_headers
+    )
+    assert missing.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_dag_layout_extends_cached_rows_and_lanes(db_session: AsyncSession) -> None:
+    """New commits are appended to the cached layout; existing rows and lanes stay put."""
+    from maestro.services.musehub_dag import get_dag_layout
+
+    repo = await musehub_repository.create_repo(
+        db_session, name="dag-cache", owner="testuser", visibility="public", owner_user_id="u1"
+    )
+    db_session.add_all([
+        _dag_commit(repo.repo_id, "lay-a", [], 1),
+        _dag_commit(repo.repo_id, "lay-b", ["lay-a"], 2, branch="feature"),
+    ])
+    await db_session.flush()
+    first = await get_dag_layout(db_session, repo.repo_id)
+    assert first.order == ["lay-a", "lay-b"]
+    assert first.lanes == [0, 1]
+
+    db_session.add(_dag_commit(repo.repo_id, "lay-c", ["lay-a", "lay-b"], 3))
+    await db_session.flush()
+    second = await get_dag_layout(db_session, repo.repo_id)
+
+    assert second is first
+    assert second.order == ["lay-a", "lay-b", "lay-c"]
+    assert second.lanes == [0, 1, 0]
+
+
+@pytest.mark.anyio
+async def test_dag_layout_rebuilds_when_missing_parent_arrives(db_session: AsyncSession) -> None:
+    """A pushed commit that an existing commit names as parent forces a rebuild."""
+    from maestro.services.musehub_dag import get_dag_layout
+
+    repo = await musehub_repository.create_repo(
+        db_session, name="dag-orphan", owner="testuser", visibility="public", owner_user_id="u1"
+    )
+    db_session.add(_dag_commit(repo.repo_id, "orph-child", ["orph-root"], 2))
+    await db_session.flush()
+    first = await get_dag_layout(db_session, repo.repo_id)
+
+    db_session.add(_dag_commit(repo.repo_id, "orph-root", [], 1))
+    await db_session.flush()
+    second = await get_dag_layout(db_session, repo.repo_id)
+
+    assert second is not first
+    assert second.order == ["orph-root", "orph-child"]
+
 # ---------------------------------------------------------------------------
 # GET /musehub/repos/{repo_id}/credits
 # ---------------------------------------------------------------------------
@@ -1285,3 +1285,39 @@ async def test_search_limit_respected(
     data = response.json()
     assert len(data["matches"]) <= 3
     assert data["limit"] == 3
+
+
+@pytest.mark.anyio
+async def test_search_keyword_candidates_ranked_by_match_count(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    auth_headers: dict[str, str],
+) -> None:
+    """With the candidate cap at 1, the commit matching more tokens still wins over newer ones."""
+    repo_id = await _make_search_repo(db_session)
+    await db_session.commit()
+
+    await _make_search_commit(
+        db_session,
+        repo_id=repo_id,
+        message="café bassline",
+        committed_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    for day in range(2, 6):
+        await _make_search_commit(
+            db_session,
+            repo_id=repo_id,
+            message=f"bassline take {day}",
+            committed_at=datetime(2024, 1, day, tzinfo=timezone.utc),
+        )
+    await db_session.commit()
+
+    with patch("maestro.services.musehub_search._OVERLAP_CANDIDATES", 1):
+        response = await client.get(
+            f"/api/v1/musehub/repos/{repo_id}/search?mode=keyword&q=café+bassline&limit=1",
+            headers=auth_headers,
+        )
+    assert response.status_code == 200
+    matches = response.json()["matches"]
+    assert [m["message"] for m in matches] == ["café bassline"]
+    assert matches[0]["score"] == 1.0
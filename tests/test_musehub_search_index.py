@@ -0,0 +1,169 @@
+"""Tests for the Muse Hub full-text search index.
+
+Covers:
+- A pushed commit is indexed on flush and found by global search
+- Keyword mode matches word prefixes and repo names
+- Making a repo private hides its documents from global search
+- Deleting a commit drops its document
+- The issue and PR ``query`` filters use the index
+- reindex_search_documents rebuilds missing documents
+
+Service tests use the ``db_session`` fixture (in-memory SQLite, FTS5).
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from maestro.db import musehub_models as db
+from maestro.db.musehub_search_models import (
+    KIND_COMMIT,
+    MusehubSearchDocument,
+    reindex_search_documents,
+)
+from maestro.services import musehub_issues, musehub_pull_requests, musehub_repository
+from maestro.services.musehub_search_index import query_terms
+
+
+async def _repo(session: AsyncSession, slug: str, *, visibility: str = "public") -> db.MusehubRepo:
+    repo = db.MusehubRepo(
+        name=slug, owner="tester", slug=slug, owner_user_id="u1", visibility=visibility
+    )
+    session.add(repo)
+    await session.flush()
+    return repo
+
+
+def _commit(repo_id: str, commit_id: str, message: str, day: int = 1) -> db.MusehubCommit:
+    return db.MusehubCommit(
+        commit_id=commit_id,
+        repo_id=repo_id,
+        branch="main",
+        parent_ids=[],
+        message=message,
+        author="tester",
+        timestamp=datetime(2025, 1, day, tzinfo=timezone.utc),
+    )
+
+
+async def _search(session: AsyncSession, query: str, mode: str = "keyword") -> dict[str, list[str]]:
+    result = await musehub_repository.global_search(session, query=query, mode=mode)
+    return {g.repo_id: [m.commit_id for m in g.matches] for g in result.groups}
+
+
+@pytest.mark.anyio
+async def test_commit_indexed_on_flush_and_found(db_session: AsyncSession) -> None:
+    repo = await _repo(db_session, "grooves")
+    db_session.add_all([
+        _commit(repo.repo_id, "c1", "walking bass in F minor", day=1),
+        _commit(repo.repo_id, "c2", "drum fill on the bridge", day=2),
+    ])
+    await db_session.flush()
+
+    assert await _search(db_session, "bass") == {repo.repo_id: ["c1"]}
+
+
+@pytest.mark.anyio
+async def test_keyword_matches_prefixes_and_repo_names(db_session: AsyncSession) -> None:
+    named = await _repo(db_session, "jazz-lab")
+    other = await _repo(db_session, "misc")
+    db_session.add_all([
+        _commit(named.repo_id, "n1", "first sketch", day=1),
+        _commit(named.repo_id, "n2", "second sketch", day=2),
+        _commit(other.repo_id, "o1", "jazzy chords on the verse"),
+    ])
+    await db_session.flush()
+
+    groups = await _search(db_session, "jazz")
+
+    assert groups[named.repo_id] == ["n2", "n1"]
+    assert groups[other.repo_id] == ["o1"]
+
+
+@pytest.mark.anyio
+async def test_keyword_matches_non_ascii_terms(db_session: AsyncSession) -> None:
+    repo = await _repo(db_session, "chanson")
+    db_session.add(_commit(repo.repo_id, "u1", "mélodie pour piano"))
+    await db_session.flush()
+
+    assert query_terms("Mélodie, café!") == ["mélodie", "café"]
+    assert await _search(db_session, "mélodie") == {repo.repo_id: ["u1"]}
+
+
+@pytest.mark.anyio
+async def test_private_repo_hidden_after_visibility_flip(db_session: AsyncSession) -> None:
+    repo = await _repo(db_session, "secret-sauce")
+    db_session.add(_commit(repo.repo_id, "s1", "ambient pad texture"))
+    await db_session.flush()
+    assert repo.repo_id in await _search(db_session, "ambient")
+
+    repo.visibility = "private"
+    await db_session.flush()
+
+    assert await _search(db_session, "ambient") == {}
+
+
+@pytest.mark.anyio
+async def test_deleted_commit_drops_document(db_session: AsyncSession) -> None:
+    repo = await _repo(db_session, "scratch")
+    commit = _commit(repo.repo_id, "d1", "temporary reverb experiment")
+    db_session.add(commit)
+    await db_session.flush()
+
+    await db_session.delete(commit)
+    await db_session.flush()
+
+    assert await _search(db_session, "reverb") == {}
+    assert await _search(db_session, "%reverb%", mode="pattern") == {}
+
+
+@pytest.mark.anyio
+async def test_issue_and_pr_query_filters(db_session: AsyncSession) -> None:
+    repo = await _repo(db_session, "tracker")
+    await musehub_issues.create_issue(
+        db_session, repo_id=repo.repo_id, title="Bass too loud", body="", labels=[]
+    )
+    await musehub_issues.create_issue(
+        db_session, repo_id=repo.repo_id, title="Drums", body="hi-hat clipping", labels=[]
+    )
+    db_session.add(
+        db.MusehubPullRequest(
+            repo_id=repo.repo_id, title="Tame the bassline", from_branch="mix", to_branch="main"
+        )
+    )
+    await db_session.flush()
+
+    issues = await musehub_issues.list_issues(db_session, repo.repo_id, query="clip")
+    assert [i.title for i in issues] == ["Drums"]
+    assert await musehub_issues.count_issues(db_session, repo.repo_id, query="bass") == 1
+    prs = await musehub_pull_requests.list_prs(db_session, repo.repo_id, query="bass")
+    assert [p.title for p in prs] == ["Tame the bassline"]
+    assert await musehub_pull_requests.count_prs(db_session, repo.repo_id, query="drums") == 0
+
+
+@pytest.mark.anyio
+async def test_reindex_rebuilds_missing_documents(db_session: AsyncSession) -> None:
+    repo = await _repo(db_session, "legacy")
+    db_session.add(_commit(repo.repo_id, "l1", "old string section"))
+    await db_session.flush()
+    await db_session.execute(
+        delete(MusehubSearchDocument).where(MusehubSearchDocument.repo_id == repo.repo_id)
+    )
+    assert await _search(db_session, "string") == {}
+
+    await db_session.run_sync(
+        lambda session: reindex_search_documents(session.connection(), [repo.repo_id])
+    )
+
+    count = (
+        await db_session.execute(
+            select(func.count())
+            .select_from(MusehubSearchDocument)
+            .where(MusehubSearchDocument.kind == KIND_COMMIT)
+        )
+    ).scalar_one()
+    assert count == 1
+    assert await _search(db_session, "string") == {repo.repo_id: ["l1"]}
@@ -0,0 +1,123 @@
+"""Tests for maestro.core.note_index.RegionNoteIndex.
+
+Covers:
+  1. Ordering — notes sorted by start beat; same-beat notes keep insertion order
+  2. Matching — remove_matching honours pitch/start/duration and the tolerance
+  3. Undo — discard/restore reverse add/remove_matching exactly
+  4. Range queries — between() returns notes sounding inside the range
+  5. Bulk paths — large batches give the same result as small ones
+"""
+from __future__ import annotations
+
+from maestro.contracts.json_types import InternalNoteDict
+from maestro.core.note_index import NOTE_MATCH_TOLERANCE, RegionNoteIndex
+
+
+def _n(pitch: int, start: float, dur: float = 1.0, vel: int = 100) -> InternalNoteDict:
+    return InternalNoteDict(pitch=pitch, start_beat=start, duration_beats=dur, velocity=vel)
+
+
+def _pitches(index: RegionNoteIndex) -> list[int]:
+    return [n["pitch"] for n in index]
+
+
+class TestOrdering:
+
+    def test_notes_sorted_by_start(self) -> None:
+
+        index = RegionNoteIndex([_n(64, 2.0), _n(60, 0.0), _n(62, 1.0)])
+        assert _pitches(index) == [60, 62, 64]
+
+    def test_same_beat_keeps_insertion_order(self) -> None:
+
+        index = RegionNoteIndex([_n(67, 0.0), _n(60, 0.0)])
+        index.add([_n(64, 0.0)])
+        assert _pitches(index) == [67, 60, 64]
+
+    def test_camel_case_notes_ordered_by_start(self) -> None:
+
+        index = RegionNoteIndex([
+            InternalNoteDict(pitch=62, startBeat=1.0, durationBeats=1.0),
+            InternalNoteDict(pitch=60, startBeat=0.0, durationBeats=1.0),
+        ])
+        assert _pitches(index) == [60, 62]
+
+
+class TestMatching:
+
+    def test_removes_every_match(self) -> None:
+
+        index = RegionNoteIndex([_n(60, 0.0), _n(60, 0.0, vel=20), _n(60, 1.0)])
+        removed = index.remove_matching([_n(60, 0.0)])
+        assert len(removed) == 2
+        assert [n["start_beat"] for n in index] == [1.0]
+
+    def test_duration_must_match(self) -> None:
+
+        index = RegionNoteIndex([_n(60, 0.0, dur=2.0)])
+        assert index.remove_matching([_n(60, 0.0, dur=1.0)]) == []
+        assert len(index) == 1
+
+    def test_match_within_tolerance_across_buckets(self) -> None:
+
+        start = 3 * NOTE_MATCH_TOLERANCE
+        index = RegionNoteIndex([_n(60, start)])
+        criteria = _n(60, start - NOTE_MATCH_TOLERANCE * 0.9)
+        assert len(index.remove_matching([criteria])) == 1
+
+    def test_overlapping_criteria_remove_once(self) -> None:
+
+        index = RegionNoteIndex([_n(60, 0.0)])
+        removed = index.remove_matching([_n(60, 0.0), _n(60, 0.0)])
+        assert len(removed) == 1
+        assert len(index) == 0
+
+
+class TestUndo:
+
+    def test_restore_reinstates_original_order(self) -> None:
+
+        index = RegionNoteIndex([_n(60, 0.0), _n(62, 0.0), _n(64, 0.0)])
+        removed = index.remove_matching([_n(62, 0.0)])
+        index.add([_n(65, 0.0)])
+        index.restore(removed)
+        assert _pitches(index) == [60, 62, 64, 65]
+
+    def test_discard_reverses_add(self) -> None:
+
+        index = RegionNoteIndex([_n(60, 0.0)])
+        added = index.add([_n(60, 0.0), _n(72, 4.0)])
+        index.discard(added)
+        assert _pitches(index) == [60]
+        assert len(index.remove_matching([_n(60, 0.0)])) == 1
+
+
+class TestBetween:
+
+    def test_includes_notes_overlapping_range_start(self) -> None:
+
+        index = RegionNoteIndex([_n(60, 0.0, dur=4.0), _n(62, 1.0), _n(64, 3.0), _n(65, 4.0)])
+        assert [n["pitch"] for n in index.between(2.0, 4.0)] == [60, 64]
+
+    def test_empty_range(self) -> None:
+
+        index = RegionNoteIndex([_n(60, 0.0)])
+        assert index.between(8.0, 12.0) == []
+
+
+class TestBulk:
+
+    def test_bulk_add_and_remove_match_incremental(self) -> None:
+
+        notes = [_n(60 + i % 12, (i * 7) % 64 * 0.5) for i in range(200)]
+        bulk = RegionNoteIndex(notes)
+        incremental = RegionNoteIndex()
+        for note in notes:
+            incremental.add([note])
+        assert bulk.notes() == incremental.notes()
+
+        criteria = notes[::3]
+        bulk.remove_matching(criteria)
+        for criterion in criteria:
+            incremental.remove_matching([criterion])
+        assert bulk.notes() == incremental.notes()
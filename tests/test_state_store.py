@@ -11,10 +11,11 @@ writes through. Zero test coverage previously. This file covers:
   5. Nested / double transaction guards
   6. State modification — set_tempo, set_key, add_notes, remove_notes, add_effect
   7. Note materialization — add accumulates, remove filters, get returns copy
-  8. _notes_match helper — pitch/start_beat/duration_beats matching + tolerance
+  8. notes_match helper — pitch/start_beat/duration_beats matching + tolerance
   9. sync_from_client — clears stale state, populates registry + notes + metadata
- 10. Snapshot / restore — rollback restores entities, notes, tempo, key
- 11. Event log — version increments, get_events_since, get_entity_events
+ 10. Undo log — rollback restores entities, notes, tempo, key
+ 11. Event log — version increments, get_events_since, get_entity_events,
+     compaction
  12. Serialization — to_dict shape
  13. Optimistic concurrency — get_state_id, check_state_id
  14. Store registry — get_or_create_store, clear_store, clear_all_stores
@@ -33,13 +34,14 @@ from maestro.core.state_store import (
     Transaction,
     EventType,
     StateEvent,
-    _notes_match,
+    _EVENT_LOG_LIMIT,
     get_or_create_store,
     clear_store,
     clear_all_stores,
 )
 from maestro.contracts.json_types import InternalNoteDict, NoteDict
 from maestro.core.entity_registry import EntityType
+from maestro.core.note_index import notes_match
 
 
 # ---------------------------------------------------------------------------
@@ -409,6 +411,77 @@ class TestTransactionAtomicity:
         # Bass from tx2 must not
         assert store.registry.resolve_track("Bass") is None
 
+    def test_rollback_restores_removed_notes(self) -> None:
+
+        store = _fresh()
+        tid = store.create_track("Keys")
+        rid = store.create_region("Verse", parent_track_id=tid)
+        store.add_notes(rid, [_note(60), _note(64)])
+
+        tx = store.begin_transaction()
+        store.remove_notes(rid, [InternalNoteDict(pitch=60, start_beat=0.0, duration_beats=1.0)])
+        store.add_notes(rid, [_note(67)])
+        store.rollback(tx)
+
+        assert [n["pitch"] for n in store.get_region_notes(rid)] == [60, 64]
+
+    def test_rollback_undoes_midi_expression_and_new_regions(self) -> None:
+
+        store = _fresh()
+        tid = store.create_track("Lead")
+        rid = store.create_region("A", parent_track_id=tid)
+        store.add_cc(rid, [{"cc": 64, "beat": 0.0, "value": 127}])
+
+        tx = store.begin_transaction()
+        store.add_cc(rid, [{"cc": 64, "beat": 2.0, "value": 0}])
+        new_rid = store.create_region("B", parent_track_id=tid, transaction=tx)
+        store.add_pitch_bends(new_rid, [{"beat": 0.0, "value": 4096}])
+        store.rollback(tx)
+
+        assert store.get_region_cc(rid) == [{"cc": 64, "beat": 0.0, "value": 127}]
+        assert not store.registry.exists_region(new_rid)
+        assert new_rid not in store._region_pitch_bends
+        assert [r.id for r in store.registry.get_track_regions(tid)] == [rid]
+
+    def test_rollback_restores_shadowed_name(self) -> None:
+
+        """A same-named track created in the transaction must not keep the name."""
+        store = _fresh()
+        tid = store.create_track("Drums")
+        tx = store.begin_transaction()
+        store.create_track("Drums", transaction=tx)
+        store.rollback(tx)
+        assert store.registry.resolve_track("drums") == tid
+
+    def test_rollback_undoes_sync_from_client(self) -> None:
+
+        store = _fresh()
+        tid = store.create_track("Old")
+        rid = store.create_region("R", parent_track_id=tid)
+        store.add_notes(rid, [_note(60)])
+        store.set_tempo(100)
+
+        tx = store.begin_transaction()
+        store.sync_from_client({"tempo": 150, "timeSignature": "6/8", "tracks": []})
+        assert not store.registry.exists_track(tid)
+        store.rollback(tx)
+
+        assert store.registry.exists_track(tid)
+        assert store.registry.exists_region(rid)
+        assert len(store.get_region_notes(rid)) == 1
+        assert store.tempo == 100
+        assert store.time_signature == (4, 4)
+
+    def test_add_notes_does_not_alias_caller_dicts(self) -> None:
+
+        store = _fresh()
+        tid = store.create_track("T")
+        rid = store.create_region("R", parent_track_id=tid)
+        note = _note(60)
+        store.add_notes(rid, [note])
+        note["pitch"] = 72
+        assert store.get_region_notes(rid)[0]["pitch"] == 60
+
 
 # ===========================================================================
 # 5. Nested / double transaction guards
@@ -618,63 +691,93 @@ class TestNoteMaterialization:
         store.add_notes("phantom-region-id", [_note(60)])
         assert len(store.get_region_notes("phantom-region-id")) == 1
 
+    def test_notes_returned_in_start_order(self) -> None:
+
+        store, _, rid = self._setup()
+        store.add_notes(rid, [_note(64, 2.0), _note(60, 0.0)])
+        store.add_notes(rid, [_note(62, 1.0)])
+        assert [n["pitch"] for n in store.get_region_notes(rid)] == [60, 62, 64]
+
+    def test_get_region_notes_in_range(self) -> None:
+
+        store, _, rid = self._setup()
+        store.add_notes(rid, [_note(60, 0.0, 4.0), _note(62, 1.0), _note(64, 4.0)])
+        in_range = store.get_region_notes_in_range(rid, 2.0, 4.0)
+        assert [n["pitch"] for n in in_range] == [60]
+        assert store.get_region_notes_in_range("nonexistent", 0.0, 4.0) == []
+
+    def test_get_region_note_count(self) -> None:
+
+        store, _, rid = self._setup()
+        assert store.get_region_note_count(rid) == 0
+        store.add_notes(rid, [_note(60), _note(62)])
+        assert store.get_region_note_count(rid) == 2
+
+    def test_get_all_region_notes_returns_copies(self) -> None:
+
+        store, _, rid = self._setup()
+        store.add_notes(rid, [_note(60)])
+        snapshot = store.get_all_region_notes()
+        snapshot[rid][0]["pitch"] = 72
+        assert store.get_region_notes(rid)[0]["pitch"] == 60
+
 
 # ===========================================================================
-# 8. _notes_match helper
+# 8. notes_match helper
 # ===========================================================================
 
 class TestNotesMatch:
-    """_notes_match uses pitch + start_beat + duration_beats with float tolerance."""
+    """notes_match uses pitch + start_beat + duration_beats with float tolerance."""
 
     def test_exact_match(self) -> None:
 
         n: InternalNoteDict = {"pitch": 60, "start_beat": 0.0, "duration_beats": 1.0}
         c: InternalNoteDict = {"pitch": 60, "start_beat": 0.0, "duration_beats": 1.0}
-        assert _notes_match(n, c)
+        assert notes_match(n, c)
 
     def test_pitch_mismatch(self) -> None:
 
         n: InternalNoteDict = {"pitch": 60, "start_beat": 0.0, "duration_beats": 1.0}
         c: InternalNoteDict = {"pitch": 62, "start_beat": 0.0, "duration_beats": 1.0}
-        assert not _notes_match(n, c)
+        assert not notes_match(n, c)
 
     def test_start_beat_mismatch(self) -> None:
 
         n: InternalNoteDict = {"pitch": 60, "start_beat": 0.0, "duration_beats": 1.0}
         c: InternalNoteDict = {"pitch": 60, "start_beat": 0.5, "duration_beats": 1.0}
-        assert not _notes_match(n, c)
+        assert not notes_match(n, c)
 
     def test_duration_mismatch(self) -> None:
 
         n: InternalNoteDict = {"pitch": 60, "start_beat": 0.0, "duration_beats": 1.0}
         c: InternalNoteDict = {"pitch": 60, "start_beat": 0.0, "duration_beats": 2.0}
-        assert not _notes_match(n, c)
+        assert not notes_match(n, c)
 
     def test_float_tolerance_passes(self) -> None:
 
         """Differences within 1e-6 are treated as equal."""
         n: InternalNoteDict = {"pitch": 60, "start_beat": 0.0, "duration_beats": 1.0}
         c: InternalNoteDict = {"pitch": 60, "start_beat": 1e-7, "duration_beats": 1.0 + 1e-7}
-        assert _notes_match(n, c)
+        assert notes_match(n, c)
 
     def test_float_outside_tolerance_fails(self) -> None:
 
         n: InternalNoteDict = {"pitch": 60, "start_beat": 0.0, "duration_beats": 1.0}
         c: InternalNoteDict = {"pitch": 60, "start_beat": 1e-5, "duration_beats": 1.0}
-        assert not _notes_match(n, c)
+        assert not notes_match(n, c)
 
     def test_velocity_not_matched(self) -> None:
 
         """velocity difference must NOT prevent a match."""
         n: InternalNoteDict = {"pitch": 60, "start_beat": 0.0, "duration_beats": 1.0, "velocity": 100}
         c: InternalNoteDict = {"pitch": 60, "start_beat": 0.0, "duration_beats": 1.0, "velocity": 50}
-        assert _notes_match(n, c)
+        assert notes_match(n, c)
 
     def test_missing_fields_default_to_zero(self) -> None:
 
         n: InternalNoteDict = {"pitch": 60}
         c: InternalNoteDict = {"pitch": 60}
-        assert _notes_match(n, c)
+        assert notes_match(n, c)
 
 
 # ===========================================================================
@@ -906,6 +1009,30 @@ class TestEventLog:
         assert all(e.transaction_id == tx.id for e in events)
         store.commit(tx)
 
+    def test_event_log_is_bounded(self) -> None:
+
+        store = _fresh()
+        for i in range(3 * _EVENT_LOG_LIMIT):
+            store.set_tempo(100 + i % 50)
+        assert len(store._events) <= 2 * _EVENT_LOG_LIMIT
+        assert store._events[-1].version == store.version
+        newest = store.get_events_since(store.version - 5)
+        assert [e.version for e in newest] == list(range(store.version - 4, store.version + 1))
+
+    def test_compaction_keeps_active_transaction_events(self) -> None:
+
+        store = _fresh()
+        store.set_tempo(90)
+        tx = store.begin_transaction()
+        for _ in range(3 * _EVENT_LOG_LIMIT):
+            store.set_tempo(140, transaction=tx)
+        assert store._events[0].event_type == EventType.TRANSACTION_START
+        store.rollback(tx)
+
+        assert store.tempo == 90
+        assert all(e.transaction_id != tx.id for e in store._events)
+        assert store._events[-1].event_type == EventType.TRANSACTION_ROLLBACK
+
 
 # ===========================================================================
 # 11. Serialization
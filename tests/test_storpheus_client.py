@@ -1,16 +1,19 @@
 """Tests for app.services.storpheus.StorpheusClient (mocked HTTP)."""
 from __future__ import annotations
 
-from collections.abc import Generator
+import asyncio
+from collections.abc import AsyncIterator, Generator
+import json
 import time as _time
 from typing import TYPE_CHECKING
 
+import httpx
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from maestro.contracts.generation_types import GenerationContext
 from maestro.contracts.json_types import JSONObject, JSONValue, NoteDict
-from maestro.services.storpheus import StorpheusClient
+from maestro.services.storpheus import JobStreamLost, StorpheusClient
 
 if TYPE_CHECKING:
     from maestro.services.backends.storpheus import StorpheusBackend
@@ -27,6 +30,7 @@ def _patch_settings(m: MagicMock) -> None:
     m.storpheus_cb_cooldown = 60
     m.storpheus_poll_timeout = 30
     m.storpheus_poll_max_attempts = 10
+    m.storpheus_job_stream = False
 
 
 _JOB_ID = "test-job-00000000"
@@ -1002,3 +1006,215 @@ class TestCircuitBreaker:
 
         await client.generate(genre="pop", tempo=120, bars=4)
         assert client.circuit_breaker_open
+
+
+# =============================================================================
+# Job stream (results pushed over /jobs/events)
+# =============================================================================
+
+
+class _FakeStorpheus:
+    """httpx handler serving /generate, /jobs/events and /jobs/{id}/wait.
+
+    Job stream events are fed through ``events``; ``None`` ends the stream.
+    """
+
+    def __init__(self, *, events_status: int = 200, send_ready: bool = True) -> None:
+        self.events_status = events_status
+        self.send_ready = send_ready
+        self.events: asyncio.Queue[str | None] = asyncio.Queue()
+        self.submit_headers: list[str | None] = []
+        self.on_submit: list[str] = []
+        self.waits = 0
+        self.canceled_waiters: list[str] = []
+
+    def push(self, job_id: str, status: str, result: JSONObject | None = None) -> str:
+        data: JSONObject = {"jobId": job_id, "status": status}
+        if result is not None:
+            data["result"] = result
+        return f"event: job\ndata: {json.dumps(data)}\n\n"
+
+    async def _stream(self, stream_id: str) -> AsyncIterator[bytes]:
+        if self.send_ready:
+            yield f"event: ready\ndata: {json.dumps({'stream': stream_id})}\n\n".encode()
+        while (chunk := await self.events.get()) is not None:
+            yield chunk.encode()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/jobs/events":
+            if self.events_status != 200:
+                return httpx.Response(self.events_status)
+            return httpx.Response(200, content=self._stream(request.url.params["stream"]))
+        if request.url.path == "/generate":
+            self.submit_headers.append(request.headers.get("x-job-stream"))
+            for chunk in self.on_submit:
+                self.events.put_nowait(chunk)
+            return httpx.Response(
+                200, json={"jobId": _JOB_ID, "status": "queued", "position": 1, "waiter": "w-1"},
+            )
+        if request.url.path == f"/jobs/{_JOB_ID}/cancel":
+            self.canceled_waiters.append(request.url.params["waiter"])
+            return httpx.Response(200, json={"jobId": _JOB_ID, "status": "canceled"})
+        assert request.url.path == f"/jobs/{_JOB_ID}/wait"
+        self.waits += 1
+        return httpx.Response(
+            200, json={"jobId": _JOB_ID, "status": "complete", "result": _ok_gen_result()},
+        )
+
+
+class TestJobStream:
+    """generate() awaits results pushed over one shared stream, polling as fallback."""
+
+    @pytest.fixture
+    def client(self) -> Generator[StorpheusClient, None, None]:
+
+        with patch("maestro.services.storpheus.settings") as m:
+            _patch_settings(m)
+            m.storpheus_job_stream = True
+            yield StorpheusClient()
+
+    def _attach(self, client: StorpheusClient, fake: _FakeStorpheus) -> None:
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(fake.handler))
+
+    @pytest.mark.asyncio
+    async def test_pushed_result_completes_without_polling(self, client: StorpheusClient) -> None:
+
+        fake = _FakeStorpheus()
+        fake.on_submit = [
+            fake.push(_JOB_ID, "running"),
+            fake.push(_JOB_ID, "complete", _ok_gen_result()),
+        ]
+        self._attach(client, fake)
+        assert await client._jobs.wait_ready(2.0)
+
+        result = await client.generate(genre="trap", tempo=140, bars=4)
+        await client.close()
+
+        assert result["success"] is True
+        assert result["notes"][0]["pitch"] == 60
+        assert fake.submit_headers == [client._jobs.stream_id]
+        assert fake.waits == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_jobs_share_one_stream(self, client: StorpheusClient) -> None:
+
+        fake = _FakeStorpheus()
+        self._attach(client, fake)
+        assert await client._jobs.wait_ready(2.0)
+
+        first = client._jobs.expect("job-a")
+        second = client._jobs.expect("job-b")
+        fake.events.put_nowait(fake.push("job-b", "failed", {"success": False, "error": "OOM"}))
+        fake.events.put_nowait(fake.push("job-a", "complete", _ok_gen_result()))
+
+        a, b = await asyncio.gather(first, second)
+        await client.close()
+
+        assert a["jobId"] == "job-a" and a["status"] == "complete"
+        assert b["jobId"] == "job-b" and b["status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_result_pushed_before_expect_is_kept(self, client: StorpheusClient) -> None:
+
+        fake = _FakeStorpheus()
+        self._attach(client, fake)
+        assert await client._jobs.wait_ready(2.0)
+
+        fake.events.put_nowait(fake.push("job-a", "complete", _ok_gen_result()))
+        for _ in range(20):
+            if client._jobs._early:
+                break
+            await asyncio.sleep(0.01)
+
+        payload = await client._jobs.expect("job-a")
+        await client.close()
+        assert payload["status"] == "complete"
+
+    @pytest.mark.asyncio
+    async def test_stream_drop_falls_back_to_polling(self, client: StorpheusClient) -> None:
+
+        fake = _FakeStorpheus()
+        fake.on_submit = [fake.push(_JOB_ID, "running")]
+        self._attach(client, fake)
+        assert await client._jobs.wait_ready(2.0)
+        pending = client._jobs.expect("other-job")
+
+        async def _drop() -> None:
+            await asyncio.sleep(0.05)
+            fake.events.put_nowait(None)
+
+        dropper = asyncio.create_task(_drop())
+        result = await client.generate(genre="jazz", tempo=120, bars=4)
+        await dropper
+        await client.close()
+
+        assert result["success"] is True
+        assert fake.waits == 1
+        with pytest.raises(JobStreamLost):
+            await pending
+
+    @pytest.mark.asyncio
+    async def test_missing_endpoint_polls_without_stream_header(self, client: StorpheusClient) -> None:
+
+        fake = _FakeStorpheus(events_status=404)
+        self._attach(client, fake)
+
+        first = await client.generate(genre="house", tempo=128, bars=4)
+        second = await client.generate(genre="house", tempo=128, bars=4)
+        await client.close()
+
+        assert first["success"] is True and second["success"] is True
+        assert fake.submit_headers == [None, None]
+        assert fake.waits == 2
+
+    @pytest.mark.asyncio
+    async def test_submit_does_not_wait_for_stream_to_connect(self, client: StorpheusClient) -> None:
+
+        """Until ``ready`` arrives, jobs are submitted without the header and polled."""
+        fake = _FakeStorpheus(send_ready=False)
+        self._attach(client, fake)
+
+        result = await asyncio.wait_for(client.generate(genre="funk", tempo=100, bars=4), timeout=1.0)
+        await client.close()
+
+        assert result["success"] is True
+        assert fake.submit_headers == [None]
+        assert fake.waits == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_pushed_wait_releases_waiter(self, client: StorpheusClient) -> None:
+
+        fake = _FakeStorpheus()
+        fake.on_submit = [fake.push(_JOB_ID, "running")]
+        self._attach(client, fake)
+        assert await client._jobs.wait_ready(2.0)
+
+        task = asyncio.create_task(client.generate(genre="soul", tempo=90, bars=4))
+        for _ in range(50):
+            if _JOB_ID in client._jobs._waiters:
+                break
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await client.close()
+
+        assert fake.canceled_waiters == ["w-1"]
+        assert fake.waits == 0
+
+    @pytest.mark.asyncio
+    async def test_timed_out_pushed_wait_releases_waiter(self, client: StorpheusClient) -> None:
+
+        fake = _FakeStorpheus()
+        self._attach(client, fake)
+        assert await client._jobs.wait_ready(2.0)
+
+        with (
+            patch("maestro.services.storpheus.settings.storpheus_poll_timeout", 0.05),
+            patch("maestro.services.storpheus.settings.storpheus_poll_max_attempts", 1),
+        ):
+            result = await client.generate(genre="soul", tempo=90, bars=4)
+        await client.close()
+
+        assert result["success"] is False
+        assert fake.canceled_waiters == ["w-1"]
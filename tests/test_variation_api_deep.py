@@ -342,6 +342,33 @@ class TestStreamVariation:
         assert resp.status_code == 200
         assert "text/event-stream" in resp.headers.get("content-type", "")
 
+    @pytest.mark.anyio
+    async def test_stream_resumes_from_last_event_id(self, var_client: AsyncClient) -> None:
+
+        """Last-Event-ID resumes after that sequence, and each event carries its sequence as id."""
+        from maestro.variation.core.event_envelope import build_done_envelope
+        from maestro.variation.streaming.sse_broadcaster import SSEBroadcaster
+
+        broadcaster = SSEBroadcaster()
+        await broadcaster.publish(build_done_envelope("var-remote", "proj-1", "0", sequence=3))
+        await broadcaster.publish(build_done_envelope("var-remote", "proj-1", "0", sequence=4))
+        await broadcaster.close_stream("var-remote")
+
+        with (
+            patch("maestro.api.routes.variation.stream.get_variation_store") as mock_vs,
+            patch("maestro.api.routes.variation.stream.get_sse_broadcaster", return_value=broadcaster),
+        ):
+            # No local record: the variation was generated on another worker.
+            mock_vs.return_value.get.return_value = None
+            resp = await var_client.get(
+                "/api/v1/variation/stream?variation_id=var-remote&from_sequence=1",
+                headers={"Last-Event-ID": "3"},
+            )
+
+        assert resp.status_code == 200
+        assert resp.text.startswith("id: 4\ndata: ")
+        assert resp.text.count("data: ") == 1
+
 
 # ---------------------------------------------------------------------------
 # POST /variation/propose
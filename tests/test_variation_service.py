@@ -4,7 +4,7 @@ Tests for app.services.variation and app.models.variation.
 These cover every public class and function with zero prior test coverage:
   1. NoteMatch properties (is_added, is_removed, is_modified, is_unchanged, _has_changes)
   2. _notes_match (pitch tolerance, timing tolerance)
-  3. match_notes (all-add, all-remove, matched pairs, mixed, empty inputs)
+  3. match_notes (all-add, all-remove, matched pairs, mixed, empty inputs, scan equivalence, comparison-count bound)
   4. _beat_to_bar / _generate_bar_label helpers
   5. _detect_change_tags (pitch, rhythm, velocity, articulation, harmony, scale, register, density)
   6. VariationService.compute_variation (no changes, adds, removes, modifications, phrase grouping)
@@ -17,6 +17,11 @@ These cover every public class and function with zero prior test coverage:
 """
 from __future__ import annotations
 
+import bisect
+import math
+import random
+from collections.abc import Callable, Sequence
+
 import pytest
 
 from maestro.contracts.json_types import NoteDict
@@ -31,6 +36,7 @@ from maestro.services.variation import (
     get_variation_service,
     match_notes,
 )
+from maestro.services.variation import note_matching
 from maestro.models.variation import (
     MidiNoteSnapshot,
     NoteChange,
@@ -226,6 +232,104 @@ class TestMatchNotes:
         assert len(added) == 1
         assert len(unchanged) == 1
 
+    def test_first_proposed_in_list_order_wins(self) -> None:
+
+        """Among several candidates, the earliest in the proposed list is taken, not the closest."""
+        base = [_note(60, 1.0)]
+        proposed = [_note(60, 1.04), _note(60, 1.0)]
+        matches = match_notes(base, proposed)
+        assert matches[0].proposed_index == 0
+        assert matches[1].is_added and matches[1].proposed_index == 1
+
+    def test_tolerance_boundary(self) -> None:
+
+        base = [_note(60, 0.0), _note(62, 0.0)]
+        proposed = [_note(60, TIMING_TOLERANCE_BEATS), _note(62, TIMING_TOLERANCE_BEATS * 1.01)]
+        matches = match_notes(base, proposed)
+        paired = [(m.base_index, m.proposed_index) for m in matches]
+        assert paired == [(0, 0), (1, None), (None, 1)]
+
+    def test_matches_nested_scan(self) -> None:
+
+        """Output is identical to the pairwise scan it replaces, order included."""
+        rng = random.Random(7)
+        for _ in range(200):
+            base = [_note(rng.randint(60, 63), rng.choice([0.0, 0.03, 0.05, 0.1, rng.random()])) for _ in range(rng.randint(0, 25))]
+            proposed = [_note(rng.randint(60, 63), rng.choice([0.0, 0.03, 0.05, 0.1, rng.random()])) for _ in range(rng.randint(0, 25))]
+            got = [(m.base_index, m.proposed_index) for m in match_notes(base, proposed)]
+            assert got == _scan_match(base, proposed)
+
+
+def _scan_match(base: list[NoteDict], proposed: list[NoteDict]) -> list[tuple[int | None, int | None]]:
+    """Reference O(n·m) greedy alignment."""
+    pairs: list[tuple[int | None, int | None]] = []
+    taken: set[int] = set()
+    for bi, b in enumerate(base):
+        for pi, p in enumerate(proposed):
+            if pi not in taken and _notes_match(b, p):
+                pairs.append((bi, pi))
+                taken.add(pi)
+                break
+    matched_base = {bi for bi, _ in pairs}
+    pairs += [(bi, None) for bi in range(len(base)) if bi not in matched_base]
+    pairs += [(None, pi) for pi in range(len(proposed)) if pi not in taken]
+    return pairs
+
+
+def _count_timing_probes(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Count every start-time comparison ``match_notes`` makes while aligning."""
+    probes = [0]
+
+    def _bisect_left(
+        a: Sequence[float],
+        x: bool,
+        lo: int = 0,
+        hi: int | None = None,
+        *,
+        key: Callable[[float], bool],
+    ) -> int:
+        def _probe(t: float) -> bool:
+            probes[0] += 1
+            return key(t)
+
+        return bisect.bisect_left(a, x, lo, len(a) if hi is None else hi, key=_probe)
+
+    monkeypatch.setattr(note_matching, "bisect_left", _bisect_left)
+    return probes
+
+
+class TestMatchNotesPerformance:
+    """Dense regions align in O(n log n) start-time comparisons, not a nested scan.
+
+    Counted rather than timed, so the bound holds on any machine.
+    """
+
+    _NOTES = 64 * 4 * 8  # a 64-bar region of 32nd notes
+
+    def _bound(self) -> int:
+        # Two bisects per base note, each ~log2(m) + 1 probes.
+        return 2 * self._NOTES * (math.ceil(math.log2(self._NOTES)) + 1)
+
+    def test_dense_drum_region(self, monkeypatch: pytest.MonkeyPatch) -> None:
+
+        """With every note moved past tolerance, nothing matches (a nested scan's worst case)."""
+        base = [_note(pitch=36 + i % 8, start=i * 0.125, dur=0.1) for i in range(self._NOTES)]
+        proposed = [_note(pitch=n["pitch"], start=n["start_beat"] + 0.06) for n in base]
+        probes = _count_timing_probes(monkeypatch)
+        matches = match_notes(base, proposed)
+        assert sum(m.is_removed for m in matches) == len(base)
+        assert 0 < probes[0] <= self._bound(), f"{probes[0]} comparisons"
+        assert probes[0] * 100 < len(base) * len(proposed)
+
+    def test_dense_drum_region_all_matched(self, monkeypatch: pytest.MonkeyPatch) -> None:
+
+        base = [_note(pitch=36 + i % 8, start=i * 0.125, dur=0.1) for i in range(self._NOTES)]
+        proposed = [_note(pitch=n["pitch"], start=n["start_beat"] + 0.01) for n in reversed(base)]
+        probes = _count_timing_probes(monkeypatch)
+        matches = match_notes(base, proposed)
+        assert len(matches) == len(base)
+        assert 0 < probes[0] <= self._bound(), f"{probes[0]} comparisons"
+
 
 # ===========================================================================
 # 4. _beat_to_bar and _generate_bar_label
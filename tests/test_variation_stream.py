@@ -2,12 +2,15 @@
 Tests for the SSE Broadcaster.
 
 Covers event publishing, subscription, replay, late-join,
-end-of-stream signaling, and cleanup.
+end-of-stream signaling, cleanup, bounded history, slow-consumer
+catch-up, and multi-worker fan-out.
 """
 from __future__ import annotations
 
 from collections.abc import Generator
+from pathlib import Path
 import asyncio
+import json
 import pytest
 
 from maestro.variation.core.event_envelope import (
@@ -19,8 +22,10 @@ from maestro.variation.core.event_envelope import (
     build_error_envelope,
     build_meta_envelope,
     build_phrase_envelope,
+    envelope_from_dict,
     EventEnvelope,
 )
+from maestro.variation.streaming.fanout import UnixSocketFanout
 from maestro.variation.streaming.sse_broadcaster import (
     SSEBroadcaster,
     get_sse_broadcaster,
@@ -402,6 +407,255 @@ class TestFullStreamSimulation:
         assert done_env.payload["status"] == "failed"
 
 
+# =============================================================================
+# Bounded History
+# =============================================================================
+
+
+class TestBoundedHistory:
+    """History is a ring buffer bounded by event count, bytes, and age."""
+
+    @pytest.mark.asyncio
+    async def test_event_limit_evicts_oldest(self) -> None:
+
+        broadcaster = SSEBroadcaster(max_history_events=3)
+        for seq in range(1, 6):
+            await broadcaster.publish(_make_phrase(seq=seq))
+
+        assert [e.sequence for e in broadcaster.get_history("v-1")] == [3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_byte_limit_evicts_oldest_but_keeps_newest(self) -> None:
+
+        size = len(_make_phrase(seq=1).to_json())
+        broadcaster = SSEBroadcaster(max_history_bytes=size * 2)
+        for seq in range(1, 5):
+            await broadcaster.publish(_make_phrase(seq=seq))
+        assert [e.sequence for e in broadcaster.get_history("v-1")] == [3, 4]
+
+        tiny = SSEBroadcaster(max_history_bytes=1)
+        await tiny.publish(_make_meta())
+        assert len(tiny.get_history("v-1")) == 1
+
+    @pytest.mark.asyncio
+    async def test_age_limit_evicts_expired_events(self) -> None:
+
+        broadcaster = SSEBroadcaster(max_history_seconds=60)
+        old = _make_meta()
+        await broadcaster.publish(EventEnvelope(
+            type=old.type, sequence=1, variation_id="v-1", project_id="p-1",
+            base_state_id="0", payload=old.payload, timestamp_ms=old.timestamp_ms - 120_000,
+        ))
+        await broadcaster.publish(_make_phrase(seq=2))
+
+        assert [e.sequence for e in broadcaster.get_history("v-1")] == [2]
+
+    @pytest.mark.asyncio
+    async def test_resume_before_retained_history_replays_what_is_left(self) -> None:
+
+        broadcaster = SSEBroadcaster(max_history_events=2)
+        for seq in range(1, 5):
+            await broadcaster.publish(_make_phrase(seq=seq))
+
+        queue = broadcaster.subscribe("v-1", from_sequence=1)
+        received = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert [e.sequence for e in received if e is not None] == [3, 4]
+
+
+# =============================================================================
+# Slow Consumers
+# =============================================================================
+
+
+class TestSlowConsumer:
+    """A full subscriber queue catches up from history instead of dropping events."""
+
+    @pytest.mark.asyncio
+    async def test_lagging_subscriber_receives_every_event_in_order(self) -> None:
+
+        broadcaster = SSEBroadcaster(queue_size=2)
+        queue = broadcaster.subscribe("v-1")
+
+        for seq in range(1, 11):
+            delivered = await broadcaster.publish(_make_phrase(seq=seq))
+            assert delivered == 1
+        await broadcaster.close_stream("v-1")
+
+        received: list[int] = []
+        while True:
+            item = await asyncio.wait_for(queue.get(), timeout=1.0)
+            if item is None:
+                break
+            received.append(item.sequence)
+        assert received == list(range(1, 11))
+
+    @pytest.mark.asyncio
+    async def test_replay_larger_than_queue_is_delivered(self) -> None:
+
+        broadcaster = SSEBroadcaster(queue_size=2)
+        for seq in range(1, 7):
+            await broadcaster.publish(_make_phrase(seq=seq))
+
+        queue = broadcaster.subscribe("v-1")
+        received = [(await asyncio.wait_for(queue.get(), timeout=1.0)) for _ in range(6)]
+        assert [e.sequence for e in received if e is not None] == [1, 2, 3, 4, 5, 6]
+
+    @pytest.mark.asyncio
+    async def test_subscriber_behind_evicted_history_is_ended(self) -> None:
+
+        broadcaster = SSEBroadcaster(queue_size=1, max_history_events=2)
+        queue = broadcaster.subscribe("v-1")
+        for seq in range(1, 6):
+            await broadcaster.publish(_make_phrase(seq=seq))
+
+        first = queue.get_nowait()
+        assert first is not None and first.sequence == 1
+        assert await asyncio.wait_for(queue.get(), timeout=1.0) is None
+        assert broadcaster.active_streams == 0
+
+
+# =============================================================================
+# Multi-Worker Fan-out
+# =============================================================================
+
+
+async def _ignore_message(message: bytes) -> None:
+    return None
+
+
+class TestFanout:
+    """Events published on one worker reach subscribers on another."""
+
+    def test_envelope_round_trips_through_dict(self) -> None:
+
+        envelope = _make_done(seq=7)
+        decoded = envelope_from_dict(json.loads(envelope.to_json()))
+        assert decoded == envelope
+
+    def test_unknown_envelope_type_rejected(self) -> None:
+
+        data = json.loads(_make_meta().to_json())
+        data["type"] = "bogus"
+        with pytest.raises(ValueError, match="Unknown envelope type"):
+            envelope_from_dict(data)
+
+    def test_malformed_envelope_rejected(self) -> None:
+
+        data = json.loads(_make_meta().to_json())
+        data["payload"] = ["not", "an", "object"]
+        with pytest.raises(ValueError, match="Malformed meta"):
+            envelope_from_dict(data)
+        data = json.loads(_make_done(seq=2).to_json())
+        del data["sequence"]
+        with pytest.raises(ValueError):
+            envelope_from_dict(data)
+
+    @pytest.mark.asyncio
+    async def test_unix_socket_fanout_between_workers(self, tmp_path: Path) -> None:
+
+        worker_a = SSEBroadcaster(UnixSocketFanout(tmp_path))
+        worker_b = SSEBroadcaster(UnixSocketFanout(tmp_path))
+        await worker_a.start()
+        await worker_b.start()
+        try:
+            queue = worker_b.subscribe("v-1")
+            await worker_a.publish(_make_meta())
+            await worker_a.publish(_make_phrase(seq=2))
+            await worker_a.close_stream("v-1")
+
+            received: list[AnyEnvelope] = []
+            while True:
+                item = await asyncio.wait_for(queue.get(), timeout=2.0)
+                if item is None:
+                    break
+                received.append(item)
+
+            assert [e.sequence for e in received] == [1, 2]
+            assert received[0].payload == _make_meta().payload
+            assert worker_b.is_closed("v-1")
+            assert worker_b.has_stream("v-1")
+        finally:
+            await worker_a.stop()
+            await worker_b.stop()
+        assert list(tmp_path.glob("*.sock")) == []
+
+    @pytest.mark.asyncio
+    async def test_stale_peer_socket_is_removed(self, tmp_path: Path) -> None:
+
+        stale = tmp_path / "999999-dead.sock"
+        dead = await asyncio.start_unix_server(lambda r, w: None, path=str(stale))
+        dead.close()
+        await dead.wait_closed()
+        stale.touch(exist_ok=True)
+
+        worker = SSEBroadcaster(UnixSocketFanout(tmp_path))
+        await worker.start()
+        try:
+            await worker.publish(_make_meta())
+        finally:
+            await worker.stop()
+        assert not stale.exists()
+
+    @pytest.mark.asyncio
+    async def test_peer_list_is_cached_between_sends(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+
+        fanout = UnixSocketFanout(tmp_path)
+        scans: list[list[Path]] = []
+        scan = fanout._scan_peers
+
+        def _counting_scan() -> list[Path]:
+            scans.append(scan())
+            return scans[-1]
+
+        monkeypatch.setattr(fanout, "_scan_peers", _counting_scan)
+        peer = UnixSocketFanout(tmp_path)
+        received: list[bytes] = []
+
+        async def _on_message(message: bytes) -> None:
+            received.append(message)
+
+        await peer.start(_on_message)
+        await fanout.start(_on_message)
+        try:
+            for i in range(5):
+                await fanout.send(b"m%d" % i)
+            assert len(scans) == 1
+            assert scans[0] == [peer.path]
+        finally:
+            await fanout.stop()
+            await peer.stop()
+        assert received == [b"m0", b"m1", b"m2", b"m3", b"m4"]
+
+    @pytest.mark.asyncio
+    async def test_send_does_not_wait_for_a_stalled_peer(self, tmp_path: Path) -> None:
+
+        stalled = tmp_path / "1-stalled.sock"
+        held: list[asyncio.StreamWriter] = []
+
+        async def _never_read(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            held.append(writer)
+
+        server = await asyncio.start_unix_server(_never_read, path=str(stalled))
+        fanout = UnixSocketFanout(tmp_path, send_timeout=30.0, max_pending=2)
+        await fanout.start(_ignore_message)
+        try:
+            # Each message is larger than a socket buffer, so a synchronous
+            # drain would block on the first one for the full send_timeout.
+            payload = b"x" * (4 * 1024 * 1024)
+            await asyncio.wait_for(
+                asyncio.gather(*(fanout.send(payload) for _ in range(5))), timeout=5.0
+            )
+        finally:
+            fanout._send_timeout = 0.1
+            await fanout.stop()
+            for writer in held:
+                writer.close()
+            server.close()
+            await server.wait_closed()
+
+
 # =============================================================================
 # Singleton
 # =============================================================================